@@ -0,0 +1,471 @@
+"""
+Benchmark cases of every generator in geco.mips and geco.graphs.
+
+Each case splits generation into the parameter sampling stage (`params`), the model
+building stage (`build`) and optionally a sparse building stage (`sparse`) that returns
+a MIPInstance. Graph generators only have a parameter stage.
+"""
+
+import collections
+
+import networkx as nx
+
+import geco.graphs.biqmac as biqmac
+import geco.graphs.chimera as chimera
+import geco.graphs.lavrov_graph as lavrov_graph
+import geco.graphs.pegasus as pegasus
+import geco.mips.combinatorial_auction as combinatorial_auction
+import geco.mips.facility_location as facility_location
+import geco.mips.graph_coloring as graph_coloring
+import geco.mips.independent_set as independent_set
+import geco.mips.knapsack as knapsack
+import geco.mips.max_cut as max_cut
+import geco.mips.packing as packing
+import geco.mips.production_planning.generic as production_planning
+import geco.mips.production_planning.tang as production_planning_tang
+import geco.mips.scheduling as scheduling
+import geco.mips.set_cover as set_cover
+import geco.mips.set_packing as set_packing
+
+SCALES = ("small", "medium", "large")
+
+Case = collections.namedtuple("Case", ["params", "build", "sparse", "sizes"])
+"""
+params: function (seed, **size) -> params
+build: function (params, **size) -> scip.Model, or None
+sparse: function (params, **size) -> MIPInstance, or None
+sizes: dict mapping each scale to the keyword arguments of params, build and sparse
+"""
+
+CASES = {}
+
+
+def _register(name, params, build=None, sparse=None, **sizes):
+    assert set(sizes) == set(SCALES)
+    CASES[name] = Case(params, build, sparse, sizes)
+
+
+def _sizes(*values, keys):
+    return {scale: dict(zip(keys, value)) for scale, value in zip(SCALES, values)}
+
+
+# knapsack
+
+_register(
+    "knapsack/yang",
+    lambda seed, n: knapsack.yang_params(n, seed=seed),
+    lambda params, n: knapsack.knapsack(*params),
+    lambda params, n: knapsack.knapsack_sparse(*params),
+    **_sizes((1000,), (10000,), (100000,), keys=["n"]),
+)
+
+for _distribution in (
+    "uncorrelated",
+    "weakly_correlated",
+    "strongly_correlated",
+    "inverse_strongly_correlated",
+    "almost_strongly_correlated",
+    "subset_sum",
+    "uncorrelated_with_similar_weights",
+):
+    _register(
+        f"knapsack/pisinger_{_distribution}",
+        lambda seed, n, distribution=_distribution: knapsack.generate_from_distribution(
+            n, **getattr(knapsack, f"{distribution}_distribution")(1000, seed=seed)
+        ),
+        lambda params, n: knapsack.knapsack(*params, 250 * n),
+        lambda params, n: knapsack.knapsack_sparse(*params, 250 * n),
+        **_sizes((1000,), (10000,), (100000,), keys=["n"]),
+    )
+
+for _name, _distribution in (
+    ("profit_ceiling", lambda seed: knapsack.profit_ceiling_distribution(seed=seed)),
+    ("circle", lambda seed: knapsack.circle_distribution(seed=seed)),
+    (
+        "multiple_strongly_correlated",
+        lambda seed: knapsack.multiple_strongly_correlated_distribution(
+            300, 200, 6, seed=seed
+        ),
+    ),
+):
+    _register(
+        f"knapsack/pisinger_{_name}",
+        lambda seed, n, distribution=_distribution: knapsack.generate_from_distribution(
+            n, **distribution(seed)
+        ),
+        lambda params, n: knapsack.knapsack(*params, 250 * n),
+        lambda params, n: knapsack.knapsack_sparse(*params, 250 * n),
+        **_sizes((1000,), (10000,), (100000,), keys=["n"]),
+    )
+
+# spanner instances draw their items while building, so the params are only the seed
+_register(
+    "knapsack/pisinger_spanner",
+    lambda seed, n: seed,
+    lambda seed, n: knapsack.spanner(
+        2, 10, n, knapsack.uncorrelated_distribution, 250 * n, seed=seed
+    ),
+    **_sizes((1000,), (10000,), (100000,), keys=["n"]),
+)
+
+# set cover
+
+_register(
+    "set_cover/yang",
+    lambda seed, m: set_cover.yang_params(m, seed=seed),
+    lambda params, m: set_cover.set_cover(*params),
+    lambda params, m: set_cover.set_cover_sparse(*params),
+    **_sizes((100,), (500,), (2000,), keys=["m"]),
+)
+_register(
+    "set_cover/sun",
+    lambda seed, n, m: set_cover.sun_params(n, m, seed=seed),
+    lambda params, n, m: set_cover.set_cover(*params),
+    lambda params, n, m: set_cover.set_cover_sparse(*params),
+    **_sizes((100, 50), (1000, 500), (4000, 2000), keys=["n", "m"]),
+)
+_register(
+    "set_cover/gasse",
+    lambda seed, nrows, ncols, density: set_cover.gasse_params(
+        nrows, ncols, density, seed=seed
+    ),
+    lambda params, **size: set_cover.set_cover(*params),
+    lambda params, **size: set_cover.set_cover_sparse(*params),
+    **_sizes(
+        (250, 500, 0.05),
+        (1000, 2000, 0.05),
+        (2000, 4000, 0.05),
+        keys=["nrows", "ncols", "density"],
+    ),
+)
+
+# set packing and packing
+
+_register(
+    "set_packing/yang",
+    lambda seed, m: set_packing.yang_parameters(m, seed=seed),
+    lambda params, m: set_packing.set_packing(m, *params),
+    lambda params, m: set_packing.set_packing_sparse(m, *params),
+    **_sizes((100,), (500,), (2000,), keys=["m"]),
+)
+_register(
+    "packing/tang",
+    lambda seed, n, m, binary: packing.tang_params(n, m, binary, seed=seed),
+    lambda params, n, m, binary: packing.packing(n, m, *params, binary),
+    lambda params, n, m, binary: packing.packing_sparse(n, m, *params, binary),
+    **_sizes(
+        (60, 60, False),
+        (300, 300, False),
+        (1000, 1000, False),
+        keys=["n", "m", "binary"],
+    ),
+)
+
+# combinatorial auction
+
+_register(
+    "combinatorial_auction/gasse",
+    lambda seed, n_items, n_bids: combinatorial_auction.gasse_params(
+        n_items, n_bids, seed=seed
+    ),
+    lambda params, **size: combinatorial_auction.combinatorial_auction(
+        *params, size["n_items"]
+    ),
+    lambda params, **size: combinatorial_auction.combinatorial_auction_sparse(
+        *params, size["n_items"]
+    ),
+    **_sizes((50, 250), (100, 500), (200, 1000), keys=["n_items", "n_bids"]),
+)
+
+# facility location
+
+_register(
+    "facility_location/cornuejols",
+    lambda seed, n_customers, n_facilities, ratio: facility_location.cornuejols_params(
+        n_customers, n_facilities, ratio, seed=seed
+    ),
+    lambda params, n_customers, n_facilities, ratio: (
+        facility_location.capacitated_facility_location(
+            n_customers, n_facilities, *params
+        )
+    ),
+    lambda params, n_customers, n_facilities, ratio: (
+        facility_location.capacitated_facility_location_sparse(
+            n_customers, n_facilities, *params
+        )
+    ),
+    **_sizes(
+        (50, 20, 2),
+        (200, 100, 2),
+        (1000, 200, 2),
+        keys=["n_customers", "n_facilities", "ratio"],
+    ),
+)
+_register(
+    "facility_location/cornuejols_warehouse",
+    lambda seed, n_customers, n_facilities, ratio: facility_location.cornuejols_params(
+        n_customers, n_facilities, ratio, seed=seed
+    ),
+    lambda params, n_customers, n_facilities, ratio: (
+        facility_location.capacitated_warehouse_location(
+            n_customers, n_facilities, *params
+        )
+    ),
+    lambda params, n_customers, n_facilities, ratio: (
+        facility_location.capacitated_warehouse_location_sparse(
+            n_customers, n_facilities, *params
+        )
+    ),
+    **_sizes(
+        (50, 20, 2),
+        (200, 100, 2),
+        (1000, 200, 2),
+        keys=["n_customers", "n_facilities", "ratio"],
+    ),
+)
+
+# independent set
+
+_register(
+    "independent_set/barabasi_albert",
+    lambda seed, n, m: independent_set.barabasi_albert_params(n, m, seed=seed),
+    lambda graph, **size: independent_set.independent_set(graph),
+    lambda graph, **size: independent_set.independent_set_sparse(graph),
+    **_sizes((100, 4), (1000, 4), (10000, 4), keys=["n", "m"]),
+)
+_register(
+    "independent_set/gasse",
+    lambda seed, n, p: independent_set.gasse_params(n, p, seed=seed),
+    lambda graph, **size: independent_set.clique_independent_set(graph),
+    lambda graph, **size: independent_set.clique_independent_set_sparse(graph),
+    **_sizes((100, 0.05), (500, 0.02), (1500, 0.01), keys=["n", "p"]),
+)
+
+# max cut
+
+
+def _max_cut_graph(seed, n, m):
+    graph = nx.generators.gnm_random_graph(n, m, seed=seed)
+    weights = max_cut.tang_params(graph, seed=seed)
+    for (_, _, data), weight in zip(graph.edges(data=True), weights):
+        data["weight"] = weight
+    return graph
+
+
+_register(
+    "max_cut/tang_naive",
+    _max_cut_graph,
+    lambda graph, **size: max_cut.naive(graph)[1],
+    lambda graph, **size: max_cut.naive_sparse(graph),
+    **_sizes((100, 500), (1000, 5000), (10000, 50000), keys=["n", "m"]),
+)
+_register(
+    "max_cut/tang_triangle",
+    _max_cut_graph,
+    lambda graph, **size: max_cut.triangle(graph)[1],
+    lambda graph, **size: max_cut.triangle_sparse(graph),
+    **_sizes((10, 20), (20, 60), (30, 150), keys=["n", "m"]),
+)
+
+# production planning
+
+_register(
+    "production_planning/tang",
+    lambda seed, T: production_planning_tang.tang_params(T, seed=seed),
+    lambda params, T: production_planning.uncapacitated_lot_sizing(T, *params),
+    lambda params, T: production_planning.uncapacitated_lot_sizing_sparse(T, *params),
+    **_sizes((100,), (1000,), (10000,), keys=["T"]),
+)
+
+# scheduling
+
+_register(
+    "scheduling/heinz",
+    lambda seed, n_facilities, n_tasks: scheduling.heinz_params(
+        n_facilities, n_tasks, seed=seed
+    ),
+    lambda params, n_facilities, n_tasks: scheduling.heinz_formulation(
+        n_facilities, n_tasks, *params
+    ),
+    lambda params, n_facilities, n_tasks: scheduling.heinz_formulation_sparse(
+        n_facilities, n_tasks, *params
+    ),
+    **_sizes((2, 10), (3, 20), (5, 40), keys=["n_facilities", "n_tasks"]),
+)
+_register(
+    "scheduling/hooker_cost",
+    lambda seed, n_facilities, n_tasks: scheduling.heinz_params(
+        n_facilities, n_tasks, seed=seed
+    ),
+    lambda params, n_facilities, n_tasks: scheduling.hooker_cost_formulation(
+        n_facilities, n_tasks, *params
+    ),
+    lambda params, n_facilities, n_tasks: scheduling.hooker_cost_formulation_sparse(
+        n_facilities, n_tasks, *params
+    ),
+    **_sizes((2, 10), (3, 20), (5, 40), keys=["n_facilities", "n_tasks"]),
+)
+_register(
+    "scheduling/hooker_late_tasks",
+    lambda seed, n_facilities, n_tasks, time_steps: scheduling.hooker_params(
+        n_facilities, n_tasks, seed=seed
+    ),
+    lambda params, n_facilities, n_tasks, time_steps: (
+        scheduling.late_tasks_formulation(n_facilities, n_tasks, time_steps, *params)
+    ),
+    lambda params, n_facilities, n_tasks, time_steps: (
+        scheduling.late_tasks_formulation_sparse(
+            n_facilities, n_tasks, time_steps, *params
+        )
+    ),
+    **_sizes(
+        (2, 10, 10),
+        (3, 20, 20),
+        (5, 40, 40),
+        keys=["n_facilities", "n_tasks", "time_steps"],
+    ),
+)
+
+# graph coloring
+
+_register(
+    "graph_coloring/assignment",
+    lambda seed, n, p, colors: nx.erdos_renyi_graph(n, p, seed=seed),
+    lambda graph, colors, **size: graph_coloring.assignment(graph, colors),
+    lambda graph, colors, **size: graph_coloring.assignment_sparse(graph, colors),
+    **_sizes(
+        (50, 0.1, 10), (200, 0.05, 20), (500, 0.05, 40), keys=["n", "p", "colors"]
+    ),
+)
+_register(
+    "graph_coloring/partial_ordering",
+    lambda seed, n, p, colors: nx.erdos_renyi_graph(n, p, seed=seed),
+    lambda graph, colors, **size: graph_coloring.partial_ordering(graph, colors),
+    lambda graph, colors, **size: graph_coloring.partial_ordering_sparse(graph, colors),
+    **_sizes(
+        (50, 0.1, 10), (200, 0.05, 20), (500, 0.05, 40), keys=["n", "p", "colors"]
+    ),
+)
+
+_register(
+    "graph_coloring/assignment_asymmetric",
+    lambda seed, n, p, colors: nx.erdos_renyi_graph(n, p, seed=seed),
+    lambda graph, colors, **size: graph_coloring.assignment_asymmetric(graph, colors),
+    lambda graph, colors, **size: graph_coloring.assignment_asymmetric_sparse(
+        graph, colors
+    ),
+    **_sizes(
+        (50, 0.1, 10), (200, 0.05, 20), (500, 0.05, 40), keys=["n", "p", "colors"]
+    ),
+)
+_register(
+    "graph_coloring/hybrid_partial_ordering",
+    lambda seed, n, p, colors: nx.erdos_renyi_graph(n, p, seed=seed),
+    lambda graph, colors, **size: graph_coloring.hybrid_partial_ordering(graph, colors),
+    lambda graph, colors, **size: graph_coloring.hybrid_partial_ordering_sparse(
+        graph, colors
+    ),
+    **_sizes(
+        (50, 0.1, 10), (200, 0.05, 20), (500, 0.05, 40), keys=["n", "p", "colors"]
+    ),
+)
+# the representatives formulation has a row per node and edge
+_register(
+    "graph_coloring/representatives",
+    lambda seed, n, p: nx.erdos_renyi_graph(n, p, seed=seed),
+    lambda graph, **size: graph_coloring.representatives(graph),
+    lambda graph, **size: graph_coloring.representatives_sparse(graph),
+    **_sizes((30, 0.1), (60, 0.1), (100, 0.1), keys=["n", "p"]),
+)
+
+
+def _set_covering_params(seed, n, p, n_subsets):
+    # maximal independent sets from different seeds, the nodes themselves make sure
+    # every node is covered
+    graph = nx.erdos_renyi_graph(n, p, seed=seed)
+    subsets = {
+        frozenset(nx.maximal_independent_set(graph, seed=seed + i))
+        for i in range(n_subsets)
+    }
+    subsets |= {frozenset([node]) for node in graph.nodes}
+    return graph, [set(subset) for subset in subsets]
+
+
+_register(
+    "graph_coloring/set_covering",
+    _set_covering_params,
+    lambda params, **size: graph_coloring.set_covering(*params),
+    lambda params, **size: graph_coloring.set_covering_sparse(*params),
+    **_sizes(
+        (50, 0.1, 100),
+        (200, 0.05, 500),
+        (500, 0.05, 2000),
+        keys=["n", "p", "n_subsets"],
+    ),
+)
+
+# graphs
+
+_register(
+    "graphs/biqmac_g05",
+    lambda seed, n: biqmac.g05_graph(n, seed=seed),
+    **_sizes((50,), (200,), (500,), keys=["n"]),
+)
+_register(
+    "graphs/biqmac_pm1s",
+    lambda seed, n: biqmac.pm1s_graph(n, seed=seed),
+    **_sizes((50,), (200,), (500,), keys=["n"]),
+)
+_register(
+    "graphs/biqmac_pm1d",
+    lambda seed, n: biqmac.pm1d_graph(n, seed=seed),
+    **_sizes((50,), (200,), (500,), keys=["n"]),
+)
+_register(
+    "graphs/biqmac_wd",
+    lambda seed, n, d: biqmac.wd_graph(n, d, seed=seed),
+    **_sizes((50, 0.5), (200, 0.5), (500, 0.5), keys=["n", "d"]),
+)
+_register(
+    "graphs/biqmac_pwd",
+    lambda seed, n, d: biqmac.pwd_graph(n, d, seed=seed),
+    **_sizes((50, 0.5), (200, 0.5), (500, 0.5), keys=["n", "d"]),
+)
+for _name in ("pwk", "wk", "mk"):
+    _register(
+        f"graphs/biqmac_{_name}",
+        lambda seed, n, k, name=_name: getattr(biqmac, f"{name}_graph")(
+            n, k, seed=seed
+        ),
+        **_sizes((50, 3), (200, 3), (500, 3), keys=["n", "k"]),
+    )
+_register(
+    "graphs/biqmac_t2g",
+    lambda seed, n: biqmac.t2g_graph(n, seed=seed),
+    **_sizes((10,), (30,), (100,), keys=["n"]),
+)
+_register(
+    "graphs/biqmac_t2g_one",
+    lambda seed, n: biqmac.t2g_one(n, seed=seed),
+    **_sizes((10,), (30,), (100,), keys=["n"]),
+)
+_register(
+    "graphs/chimera_selby",
+    lambda seed, m: chimera.selby_c(m, seed=seed),
+    **_sizes((4,), (8,), (16,), keys=["m"]),
+)
+_register(
+    "graphs/chimera_mgw",
+    lambda seed, m, faulty: chimera.mgw(m, faulty, seed=seed),
+    **_sizes((4, 5), (8, 73), (16, 200), keys=["m", "faulty"]),
+)
+_register(
+    "graphs/pegasus",
+    lambda seed, size: pegasus.dwave_pegasus_graph(size, seed=seed),
+    **_sizes((4,), (8,), (16,), keys=["size"]),
+)
+_register(
+    "graphs/lavrov",
+    lambda seed, k: lavrov_graph.lavrov_graph(k),
+    **_sizes((50,), (500,), (5000,), keys=["k"]),
+)
@@ -0,0 +1,90 @@
+"""
+Compares two benchmark result files written by benchmarks.run or benchmarks.imports.
+
+Prints the ratio new / base of every timing and the peak RSS for each case and scale,
+and exits with status 1 if any ratio exceeds 1 + threshold.
+
+Usage:
+
+    python -m benchmarks.compare base.json new.json --threshold 0.2
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.run import TIMINGS
+
+METRICS = TIMINGS + ("import_time", "peak_rss_mb")
+
+
+def compare(base, new, metrics=METRICS, min_time=0.01):
+    """
+    Computes the ratios new / base of the results present in both files.
+
+    Parameters
+    ----------
+    base: dict
+        Results of the baseline, as loaded from the JSON file
+    new: dict
+        Results to compare, as loaded from the JSON file
+    metrics: tuple[str]
+        Metrics to compare
+    min_time: float
+        Timings below this many seconds in both results are too noisy and are skipped
+
+    Returns
+    -------
+    ratios: dict
+        Maps "case:scale" to a dict mapping each metric to its ratio
+    """
+    ratios = {}
+    for key, base_result in base["results"].items():
+        new_result = new["results"].get(key)
+        if new_result is None or "error" in base_result or "error" in new_result:
+            continue
+        ratios[key] = {}
+        for metric in metrics:
+            if metric not in base_result or metric not in new_result:
+                continue
+            base_value, new_value = base_result[metric], new_result[metric]
+            if metric != "peak_rss_mb" and max(base_value, new_value) < min_time:
+                continue
+            ratios[key][metric] = new_value / base_value if base_value > 0 else 1.0
+    return ratios
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--metrics", nargs="*", default=list(METRICS), choices=METRICS)
+    parser.add_argument("--min-time", type=float, default=0.01)
+    args = parser.parse_args(argv)
+
+    with open(args.base) as base_file, open(args.new) as new_file:
+        base, new = json.load(base_file), json.load(new_file)
+    print(
+        f"base: {base['metadata'].get('commit')}  new: {new['metadata'].get('commit')}"
+    )
+
+    ratios = compare(base, new, tuple(args.metrics), args.min_time)
+    regressions = 0
+    for key, metric_ratios in ratios.items():
+        cells = []
+        for metric, ratio in metric_ratios.items():
+            regression = ratio > 1 + args.threshold
+            regressions += regression
+            cells.append(f"{metric}={ratio:.2f}{'!' if regression else ''}")
+        print(f"{key:55} {' '.join(cells)}")
+
+    missing = sorted(set(base["results"]) ^ set(new["results"]))
+    if missing:
+        print(f"only in one of the files: {', '.join(missing)}")
+    print(f"{regressions} regressions above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
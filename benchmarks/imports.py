@@ -0,0 +1,121 @@
+"""
+Measures the time it takes to import GeCO modules in a fresh interpreter.
+
+Each import runs in a new process with `python -X importtime`, the reported time is the
+cumulative import time of the module including all its dependencies, the minimum over
+all repetitions. Results use the same format as benchmarks.run, so they can be compared
+with benchmarks.compare.
+
+Usage:
+
+    python -m benchmarks.imports --output imports.json
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import sys
+
+from benchmarks.run import _commit
+
+MODULES = (
+    "geco",
+    "geco.mips",
+    "geco.graphs",
+    "geco.mips.knapsack",
+    "geco.mips.set_cover",
+    "geco.mips.independent_set",
+    "geco.mips.scheduling",
+    "geco.graphs.chimera",
+    "geco.generator",
+    "geco.cache",
+)
+
+
+def measure_import(module, repeat=5):
+    """
+    Measures the import time of a module.
+
+    Parameters
+    ----------
+    module: str
+        Name of the module
+    repeat: int
+        Number of fresh interpreters to import the module in
+
+    Returns
+    -------
+    result: dict
+        The import time in seconds and the number of modules the import loaded
+    """
+    times = []
+    for _ in range(repeat):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        entries = _parse_importtime(stderr)
+        # top level entries of the statement, the interpreter's startup imports come first
+        times.append(
+            sum(cumulative for name, cumulative, depth in entries if depth == 0)
+        )
+    return {
+        "case": f"import/{module}",
+        "scale": "cold",
+        "import_time": min(times),
+        "n_modules": len(entries),
+    }
+
+
+def _parse_importtime(stderr):
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), int(cumulative) / 1e6, depth))
+    return _after_startup(entries)
+
+
+def _after_startup(entries):
+    # the interpreter imports site and its dependencies before running the statement
+    for i, (name, _, depth) in enumerate(entries):
+        if name == "site" and depth == 0:
+            return entries[i + 1 :]
+    return entries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default="import_results.json")
+    parser.add_argument("--modules", nargs="*", default=list(MODULES))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = {}
+    for module in args.modules:
+        result = measure_import(module, args.repeat)
+        results[f"{result['case']}:{result['scale']}"] = result
+        print(
+            f"{module:30} {result['import_time'] * 1000:8.1f}ms "
+            f"{result['n_modules']:5} modules",
+            flush=True,
+        )
+    metadata = {
+        "commit": _commit(),
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+    }
+    with open(args.output, "w") as file:
+        json.dump({"metadata": metadata, "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Runs the benchmark cases and writes the results to a JSON file.
+
+Every case and scale runs in a fresh process, so the peak resident set size of one case
+isn't influenced by the others. Timings are the minimum over all repetitions.
+
+Usage:
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --scales small medium --cases knapsack set_cover/gasse
+"""
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import pyscipopt as scip
+
+from benchmarks.cases import CASES, SCALES
+from geco.generator import _write_quietly
+from geco.mips.utilities.writing import write_problem
+
+TIMINGS = (
+    "params_time",
+    "build_time",
+    "write_time",
+    "sparse_build_time",
+    "sparse_write_time",
+    "wall_time",
+)
+
+
+def measure(name, scale, repeat=1, seed=0):
+    """
+    Measures one case at one scale in the current process.
+
+    Parameters
+    ----------
+    name: str
+        Name of the case in benchmarks.cases.CASES
+    scale: str
+        One of SCALES
+    repeat: int
+        Number of repetitions, timings are the minimum over all of them
+    seed: int
+        Seed passed to the parameter stage
+
+    Returns
+    -------
+    result: dict
+        Timings in seconds, peak RSS in MiB and the size of the generated instance
+    """
+    case = CASES[name]
+    size = case.sizes[scale]
+    result = {"case": name, "scale": scale, "size": size}
+    timings = {timing: [] for timing in TIMINGS}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "instance.mps")
+        for _ in range(repeat):
+            wall_start = time.perf_counter()
+            start = time.perf_counter()
+            params = case.params(seed, **size)
+            timings["params_time"].append(time.perf_counter() - start)
+
+            if case.build is not None:
+                start = time.perf_counter()
+                model = case.build(params, **size)
+                timings["build_time"].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                _write_quietly(model, path)
+                timings["write_time"].append(time.perf_counter() - start)
+                result["nvars"], result["ncons"] = model.getNVars(), model.getNConss()
+                del model
+            timings["wall_time"].append(time.perf_counter() - wall_start)
+
+            if case.sparse is not None:
+                start = time.perf_counter()
+                instance = case.sparse(params, **size)
+                timings["sparse_build_time"].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                write_problem(instance, path, free_mps=True)
+                timings["sparse_write_time"].append(time.perf_counter() - start)
+                result["nnz"] = instance.nnz
+                del instance
+
+    for timing, values in timings.items():
+        if values:
+            result[timing] = min(values)
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def select_cases(patterns):
+    """
+    Returns the names of all cases starting with one of the patterns, all cases if there are none.
+    """
+    if not patterns:
+        return list(CASES)
+    return [name for name in CASES if any(name.startswith(p) for p in patterns)]
+
+
+def run(names, scales, repeat=1, seed=0, timeout=None):
+    """
+    Measures every case at every scale, each in a fresh process.
+
+    Returns
+    -------
+    results: dict
+        Maps "case:scale" to the result of `measure` or an error description
+    """
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for name in names:
+        for scale in scales:
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_measure_in_child, args=(sender, name, scale, repeat, seed)
+            )
+            process.start()
+            sender.close()
+            try:
+                if receiver.poll(timeout):
+                    result = receiver.recv()
+                else:
+                    result = {"error": f"timeout after {timeout}s"}
+            except EOFError:
+                result = {"error": "process died, e.g. out of memory"}
+            if process.is_alive():
+                process.terminate()
+            process.join()
+            result = {"case": name, "scale": scale, **result}
+            results[f"{name}:{scale}"] = result
+            print(_summary(result), flush=True)
+    return results
+
+
+def _measure_in_child(sender, *args):
+    try:
+        result = measure(*args)
+    except Exception as error:
+        result = {"error": repr(error)}
+    sender.send(result)
+    sender.close()
+
+
+def _summary(result):
+    key = f"{result['case']}:{result['scale']}"
+    if "error" in result:
+        return f"{key:55} ERROR {result['error']}"
+    stages = " ".join(
+        f"{timing[: -len('_time')]}={result[timing]:.3f}s"
+        for timing in TIMINGS
+        if timing in result
+    )
+    return f"{key:55} {stages} rss={result['peak_rss_mb']:.0f}MiB"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--cases", nargs="*", default=[], help="case name prefixes")
+    parser.add_argument("--scales", nargs="*", default=list(SCALES), choices=SCALES)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--timeout", type=float, default=None, help="seconds per case and scale"
+    )
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    names = select_cases(args.cases)
+    if args.list:
+        print("\n".join(names))
+        return
+
+    results = run(names, args.scales, args.repeat, args.seed, args.timeout)
+    metadata = {
+        "commit": _commit(),
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pyscipopt": getattr(scip, "__version__", None),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+    }
+    with open(args.output, "w") as file:
+        json.dump({"metadata": metadata, "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
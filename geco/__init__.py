@@ -1 +1,32 @@
-from geco.mips import *
+"""
+Everything in geco.mips is also accessible from geco, e.g. geco.set_cover. Like the
+subpackages themselves, it is only imported on first access.
+"""
+
+import importlib
+
+import geco.mips as mips
+
+_submodules = (
+    "mips",
+    "graphs",
+    "cache",
+    "generator",
+    "parallel",
+    "profiling",
+    "async_generator",
+)
+
+__all__ = list(mips.__all__)
+
+
+def __getattr__(name):
+    if name in mips.__all__:
+        return getattr(mips, name)
+    if name in _submodules:
+        return importlib.import_module(f"geco.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__, *_submodules})
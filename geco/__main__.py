@@ -0,0 +1,3 @@
+from geco.cli import main
+
+main()
@@ -0,0 +1,165 @@
+"""
+Asynchronous counterparts of `generate` and `generate_n` for asyncio applications.
+
+Instances are built in an executor, by default a process pool, so the event loop keeps
+running while they are generated.
+"""
+
+import asyncio
+import collections
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pyscipopt as scip
+
+from geco.mips.utilities.instance import MIPInstance
+from geco.parallel import seed_stream, spawn_seeds
+
+
+async def async_generate(
+    generating_function, seed=0, executor=None, n_jobs=None, max_in_flight=None
+):
+    """
+    Asynchronous version of `generate` that builds the instances in an executor.
+
+    Every instance gets its own child seed derived from the root seed, like in
+    `parallel_generate_n`.
+
+    Parameters
+    ----------
+    generating_function:
+        A picklable (module level) function that accepts a seed and returns an
+        instance, pyscipopt models are converted to MIPInstances in the worker.
+    seed: int, random state or None
+        Root seed for randomization.
+    executor: concurrent.futures.Executor or None
+        Executor building the instances, e.g. a process pool shared by all requests of
+        a server. None creates a process pool that is shut down with the generator.
+    n_jobs: int or None
+        Number of worker processes of the created pool, None uses all cores.
+    max_in_flight: int or None
+        Maximum number of instances built ahead of the consumer, defaults to twice
+        n_jobs or the number of cores.
+
+    Returns
+    -------
+     Asynchronous generator of instances
+
+    Examples
+    --------
+    >>> instances = async_generate(build, executor=pool)
+    >>> try:
+    ...     async for instance in instances:
+    ...         ...
+    ... finally:
+    ...     await instances.aclose()
+    """
+    async for _, instance in _async_map(
+        generating_function, seed_stream(seed), executor, n_jobs, max_in_flight, True
+    ):
+        yield instance
+
+
+async def async_generate_n(
+    generating_function,
+    n,
+    seed=0,
+    executor=None,
+    n_jobs=None,
+    max_in_flight=None,
+    ordered=True,
+):
+    """
+    Asynchronous version of `generate_n` that builds the instances in an executor.
+
+    At most `max_in_flight` instances are pending at any time. When the consumer stops
+    iterating, e.g. because its task is cancelled, instances that haven't started yet
+    are cancelled. Close the generator (`await generator.aclose()`) when stopping
+    early, so this happens right away instead of when it is garbage collected.
+
+    Parameters
+    ----------
+    generating_function:
+        A picklable (module level) function that accepts a seed and returns an
+        instance, pyscipopt models are converted to MIPInstances in the worker.
+    n: int
+        Number of instances to generate.
+    seed: int, random state or None
+        Root seed for randomization, each instance gets its own child seed.
+    executor: concurrent.futures.Executor or None
+        Executor building the instances, e.g. a process pool shared by all requests of
+        a server. None creates a process pool that is shut down with the generator.
+    n_jobs: int or None
+        Number of worker processes of the created pool, None uses all cores.
+    max_in_flight: int or None
+        Maximum number of instances built ahead of the consumer, defaults to twice
+        n_jobs or the number of cores.
+    ordered: bool
+        Whether instances are yielded in order or as soon as they are completed.
+
+    Returns
+    -------
+     Asynchronous generator of tuples (instance_number, instance)
+    """
+    async for item in _async_map(
+        generating_function,
+        spawn_seeds(seed, n),
+        executor,
+        n_jobs,
+        max_in_flight,
+        ordered,
+    ):
+        yield item
+
+
+async def _async_map(function, seeds, executor, n_jobs, max_in_flight, ordered):
+    if max_in_flight is None:
+        max_in_flight = 2 * (n_jobs or os.cpu_count() or 1)
+    assert max_in_flight >= 1
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=n_jobs)
+
+    loop = asyncio.get_running_loop()
+    tasks = enumerate(seeds)
+    pending = collections.OrderedDict()
+
+    def submit():
+        for index, task_seed in itertools.islice(tasks, 1):
+            future = loop.run_in_executor(executor, _build, function, task_seed)
+            pending[future] = index
+
+    try:
+        for _ in range(max_in_flight):
+            submit()
+
+        while pending:
+            if ordered:
+                future = next(iter(pending))
+                await asyncio.wait([future])
+                done = [future]
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                done = sorted(done, key=pending.get)
+
+            for future in done:
+                index = pending.pop(future)
+                # the next instance is built while the consumer handles this one
+                submit()
+                yield index, future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=False)
+
+
+def _build(function, seed):
+    # pyscipopt models can't be sent back to the event loop's process
+    instance = function(seed)
+    if isinstance(instance, scip.Model):
+        instance = MIPInstance.from_scip(instance)
+    return instance
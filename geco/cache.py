@@ -0,0 +1,300 @@
+import functools
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import os
+import pickle
+import random
+import tempfile
+
+import networkx as nx
+import numpy as np
+import pyscipopt as scip
+
+from geco.generator import _write_quietly
+from geco.mips.utilities.instance import MIPInstance
+
+_EXTENSIONS = (".cip", ".npz", ".pkl")
+_TEMP_PREFIX = ".tmp-"
+
+
+class InstanceCache:
+    """
+    Content addressed on-disk cache of generated instances.
+
+    Entries are keyed by the SHA-256 hash of the generator's fully qualified name, its
+    normalized arguments (defaults included) and the installed GeCO version. pyscipopt
+    models are stored in SCIP's CIP format, MIPInstances in npz format and everything
+    else (e.g. params) is pickled. Entries are written to a temporary file first and
+    atomically renamed, so several processes can share a cache directory.
+
+    Calls that can't be identified reliably, i.e. with None as seed, a random state
+    object or an argument of another unsupported type, bypass the cache.
+
+    Parameters
+    ----------
+    directory: str
+        Directory of the cache entries, created if missing
+    max_size: int or None
+        Maximum total size in bytes, the least recently used entries are evicted
+        once it is exceeded. None doesn't limit the size.
+
+    Examples
+    --------
+    >>> cache = InstanceCache("geco_cache", max_size=2**30)
+    >>> cached_gasse_instance = cache(set_cover.gasse_instance)
+    >>> model = cached_gasse_instance(500, 1000, 0.05, seed=0)
+    """
+
+    def __init__(self, directory, max_size=None):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def __call__(self, function):
+        """
+        Wraps a generator so its results are cached.
+
+        Parameters
+        ----------
+        function: function
+            A generator function, e.g. set_cover.gasse_instance
+
+        Returns
+        -------
+        wrapped: function
+            Function with the same signature that uses the cache
+        """
+
+        @functools.wraps(function)
+        def wrapped(*args, **kwargs):
+            return self.get_or_generate(function, *args, **kwargs)
+
+        wrapped.cache = self
+        return wrapped
+
+    def get_or_generate(self, function, *args, **kwargs):
+        """
+        Returns the cached result of function(*args, **kwargs), generating and storing it on a miss.
+
+        Parameters
+        ----------
+        function: function
+            A generator function
+        args, kwargs:
+            Arguments of the call
+
+        Returns
+        -------
+        result:
+            The (possibly cached) return value of the call
+        """
+        key = cache_key(function, *args, **kwargs)
+        if key is None:
+            return function(*args, **kwargs)
+
+        path = self._find(key)
+        if path is not None:
+            try:
+                result = _load(path)
+            except OSError:
+                # evicted by another process in the meantime
+                pass
+            else:
+                self.hits += 1
+                _touch(path)
+                return result
+
+        self.misses += 1
+        result = function(*args, **kwargs)
+        self._store(key, result)
+        return result
+
+    def size(self):
+        """
+        Returns
+        -------
+        size: int
+            Total size of all entries in bytes
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self):
+        """
+        Removes all entries and resets the hit and miss counters.
+        """
+        for path, _, _ in self._entries():
+            _remove(path)
+        self.hits = 0
+        self.misses = 0
+
+    def _find(self, key):
+        for extension in _EXTENSIONS:
+            path = os.path.join(self.directory, key + extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _store(self, key, result):
+        extension = _extension(result)
+        fd, temp_path = tempfile.mkstemp(
+            prefix=_TEMP_PREFIX, suffix=extension, dir=self.directory
+        )
+        os.close(fd)
+        try:
+            _dump(result, temp_path)
+            os.replace(temp_path, os.path.join(self.directory, key + extension))
+        finally:
+            _remove(temp_path)
+        if self.max_size is not None:
+            self._evict()
+
+    def _entries(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith(_TEMP_PREFIX) or not entry.name.endswith(
+                _EXTENSIONS
+            ):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_size:
+                break
+            _remove(path)
+            total -= size
+
+
+def cache_key(function, *args, **kwargs):
+    """
+    Computes the cache key of a call.
+
+    Parameters
+    ----------
+    function: function
+        A generator function, arguments bound with functools.partial are taken into
+        account
+    args, kwargs:
+        Arguments of the call
+
+    Returns
+    -------
+    key: str or None
+        Hex digest identifying the call, None if the call isn't reproducible
+    """
+    while isinstance(function, functools.partial):
+        args = (*function.args, *args)
+        kwargs = {**function.keywords, **kwargs}
+        function = function.func
+    # other callables, e.g. instances of classes defining __call__, have no stable name
+    if not hasattr(function, "__qualname__"):
+        return None
+    bound = inspect.signature(function).bind(*args, **kwargs)
+    bound.apply_defaults()
+    if "seed" in bound.arguments and bound.arguments["seed"] is None:
+        return None
+    try:
+        arguments = {name: _normalize(value) for name, value in bound.arguments.items()}
+    except _NotReproducible:
+        return None
+    description = {
+        "function": f"{function.__module__}.{function.__qualname__}",
+        "arguments": arguments,
+        "version": _version(),
+    }
+    encoded = json.dumps(description, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class _NotReproducible(Exception):
+    pass
+
+
+def _normalize(value):
+    if isinstance(value, (random.Random, np.random.RandomState, np.random.Generator)):
+        raise _NotReproducible()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return {"ndarray": _normalize(value.tolist()), "dtype": str(value.dtype)}
+    if isinstance(value, (list, tuple, range)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return {"set": sorted((_normalize(v) for v in value), key=json.dumps)}
+    if isinstance(value, dict):
+        items = ([_normalize(k), _normalize(v)] for k, v in value.items())
+        return {"dict": sorted(items, key=json.dumps)}
+    if isinstance(value, nx.Graph):
+        return {
+            "graph": type(value).__name__,
+            "nodes": _normalize(list(value.nodes(data=True))),
+            "edges": _normalize(list(value.edges(data=True))),
+        }
+    # without a content based representation the call can't be identified safely
+    raise _NotReproducible()
+
+
+@functools.lru_cache(maxsize=None)
+def _version():
+    try:
+        return importlib.metadata.version("GeCO")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _extension(result):
+    if isinstance(result, scip.Model):
+        return ".cip"
+    if isinstance(result, MIPInstance):
+        return ".npz"
+    return ".pkl"
+
+
+def _dump(result, path):
+    if path.endswith(".cip"):
+        _write_quietly(result, path)
+    elif path.endswith(".npz"):
+        with open(path, "wb") as file:
+            result.save(file)
+    else:
+        with open(path, "wb") as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load(path):
+    if path.endswith(".cip"):
+        model = scip.Model()
+        model.hideOutput()
+        model.readProblem(path)
+        return model
+    if path.endswith(".npz"):
+        return MIPInstance.load(path)
+    with open(path, "rb") as file:
+        return pickle.load(file)
+
+
+def _touch(path):
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,415 @@
+"""
+Command line interface of GeCO.
+
+Usage:
+
+    geco generate set_cover.gasse_instance --param nrows=500 --param ncols=1000,2000 \\
+        --param density=0.05 --seeds 0:100 --output instances --shard 0/4
+"""
+
+import argparse
+import ast
+import importlib
+import itertools
+import json
+import os
+import re
+import sys
+
+from geco.generator import write_instance
+from geco.mips.utilities.size import select_by_size
+from geco.parallel import pool_map
+
+
+def resolve_generator(path):
+    """
+    Imports a generator function from its dotted path.
+
+    Parameters
+    ----------
+    path: str
+        Dotted path of the function, either absolute (e.g. "geco.mips.set_cover.gasse_instance"),
+        relative to geco.mips (e.g. "set_cover.gasse_instance") or "module:function"
+
+    Returns
+    -------
+    function: function
+        The generator function
+    """
+    if ":" in path:
+        module_name, function_name = path.split(":", 1)
+        candidates = [module_name]
+    else:
+        module_name, _, function_name = path.rpartition(".")
+        if not module_name:
+            raise ValueError(f"{path} is not a dotted path to a function")
+        candidates = [module_name, f"geco.mips.{module_name}", f"geco.{module_name}"]
+
+    for candidate in candidates:
+        try:
+            module = importlib.import_module(candidate)
+        except ModuleNotFoundError as error:
+            # only skip the candidate if it doesn't exist, not if one of its imports fails
+            if error.name is None or not candidate.startswith(error.name):
+                raise
+            continue
+        if hasattr(module, function_name):
+            return getattr(module, function_name)
+    raise ValueError(f"Can't find generator {path}")
+
+
+def parse_param(text):
+    """
+    Parses a "name=value1,value2,..." parameter specification.
+
+    Values are parsed as Python literals (e.g. 10, 0.5, True, None) and fall back to
+    strings. Lists and tuples are single values, e.g. "sizes=[1,2],[3,4]" has two values.
+
+    Parameters
+    ----------
+    text: str
+        The specification
+
+    Returns
+    -------
+    name: str
+        The parameter name
+    values: list
+        All values of the parameter
+    """
+    name, separator, values = text.partition("=")
+    if not separator or not name:
+        raise ValueError(f"Parameter {text} isn't of the form name=value1,value2,...")
+    return name.strip(), [_parse_value(value) for value in _split_values(values)]
+
+
+def _split_values(text):
+    # commas inside brackets belong to the value, e.g. "[1,2],[3,4]"
+    values, depth, start = [], 0, 0
+    for i, character in enumerate(text):
+        if character in "([{":
+            depth += 1
+        elif character in ")]}":
+            depth -= 1
+        elif character == "," and depth == 0:
+            values.append(text[start:i])
+            start = i + 1
+    values.append(text[start:])
+    return [value.strip() for value in values]
+
+
+def _parse_value(text):
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def parse_seeds(text):
+    """
+    Parses a seed range, either "start:stop" or "n" for the seeds 0 to n - 1.
+
+    Parameters
+    ----------
+    text: str
+        The seed range
+
+    Returns
+    -------
+    seeds: range
+    """
+    if ":" in text:
+        start, stop = text.split(":", 1)
+        return range(int(start), int(stop))
+    return range(int(text))
+
+
+def parse_shard(text):
+    """
+    Parses a shard specification "i/N" with 0 <= i < N.
+
+    Parameters
+    ----------
+    text: str
+        The shard specification
+
+    Returns
+    -------
+    shard: tuple[int, int]
+        Index of the shard and number of shards
+    """
+    index, _, count = text.partition("/")
+    index, count = int(index), int(count)
+    if not 0 <= index < count:
+        raise ValueError(f"Shard {text} isn't of the form i/N with 0 <= i < N")
+    return index, count
+
+
+def generation_tasks(parameter_lists, seeds, shard=(0, 1)):
+    """
+    Enumerates every combination of params and seed in a fixed order and keeps the tasks of one shard.
+
+    Tasks are distributed round-robin, so every shard gets a similar mix of params.
+
+    Parameters
+    ----------
+    parameter_lists: dict[str, list]
+        Maps parameter name to all values it might take
+    seeds: iterable[int]
+        Seeds to generate every parameter combination with
+    shard: tuple[int, int]
+        Index of the shard and number of shards
+
+    Returns
+    -------
+    tasks: generator
+        Tuples (params, seed) of the shard
+    """
+    index, count = shard
+    names = list(parameter_lists)
+    combinations = itertools.product(
+        itertools.product(*parameter_lists.values()), seeds
+    )
+    for i, (values, seed) in enumerate(combinations):
+        if i % count == index:
+            yield dict(zip(names, values)), seed
+
+
+def sized_generation_tasks(
+    generating_function,
+    parameter_lists,
+    seeds,
+    shard=(0, 1),
+    size_limits=None,
+    size_order=None,
+):
+    """
+    The tasks of `generation_tasks` without the params whose predicted instance exceeds
+    size limits, optionally sorted by predicted size.
+
+    Parameters
+    ----------
+    generating_function: function
+        Generator with a size estimator, see geco.mips.utilities.size
+    parameter_lists: dict[str, list]
+        Maps parameter name to all values it might take
+    seeds: iterable[int]
+        Seeds to generate every parameter combination with
+    shard: tuple[int, int]
+        Index of the shard and number of shards
+    size_limits: dict or None
+        Keyword arguments of geco.mips.utilities.size.exceeds, e.g. {"max_nnz": 10**7}
+    size_order: str or None
+        "smallest" or "largest" to start with the smallest or largest instances, None
+        keeps the order of generation_tasks
+
+    Returns
+    -------
+    tasks: list
+        Tuples (params, seed) of the shard
+    """
+    tasks = list(generation_tasks(parameter_lists, seeds, shard))
+    return _select_tasks(generating_function, tasks, size_limits, size_order)
+
+
+def _select_tasks(generating_function, tasks, size_limits, size_order):
+    selected = select_by_size(
+        generating_function, [params for params, _ in tasks], size_limits, size_order
+    )
+    return [tasks[i] for i in selected]
+
+
+def instance_file_name(generator_name, params, seed, extension):
+    """
+    Deterministic file name of an instance, e.g. "gasse_instance-nrows=500-density=0.05-seed=3.mps".
+    """
+    parts = [generator_name]
+    parts += [f"{name}={_slug(value)}" for name, value in params.items()]
+    parts.append(f"seed={seed}")
+    return "-".join(parts) + extension
+
+
+def _slug(value):
+    return re.sub(
+        r"[^A-Za-z0-9_.+]+", "_", repr(value) if not isinstance(value, str) else value
+    )
+
+
+def generate(
+    generating_function,
+    parameter_lists,
+    seeds,
+    directory,
+    shard=(0, 1),
+    file_format="mps",
+    compress=False,
+    n_jobs=None,
+    size_limits=None,
+    size_order=None,
+    tasks=None,
+):
+    """
+    Writes one instance per combination of params and seed of a shard into a directory.
+
+    Instances whose file already exists are skipped, so an interrupted run can simply be
+    restarted. Files are written atomically, see `write_instance`. Records of the written
+    instances are appended to the JSON lines manifest "manifest.jsonl", or
+    "manifest-i-of-N.jsonl" for shard i of N.
+
+    Parameters
+    ----------
+    generating_function: function
+        A module level function that accepts the params as keywords and a seed, returning
+        a pyscipopt model or MIPInstance
+    parameter_lists: dict[str, list]
+        Maps parameter name to all values it might take
+    seeds: iterable[int]
+        Seeds to generate every parameter combination with
+    directory: str
+        Output directory, created if it doesn't exist
+    shard: tuple[int, int]
+        Index of the shard and number of shards
+    file_format: str
+        "mps", "lp" or any other file extension SCIP can write
+    compress: bool
+        Whether to gzip the written files
+    n_jobs: int or None
+        Number of worker processes, None uses all cores
+    size_limits: dict or None
+        Skips params whose predicted instance is too large, e.g. {"max_nnz": 10**7}, see
+        `sized_generation_tasks`
+    size_order: str or None
+        "smallest" or "largest" to generate the instances by predicted size
+    tasks: list or None
+        Tuples (params, seed) already selected with `sized_generation_tasks` from the
+        same arguments, None selects them here
+
+    Returns
+    -------
+    records: generator
+        Manifest records of the written instances, in order of completion
+    """
+    os.makedirs(directory, exist_ok=True)
+    extension = f".{file_format}.gz" if compress else f".{file_format}"
+    index, count = shard
+    manifest = "manifest.jsonl" if count == 1 else f"manifest-{index}-of-{count}.jsonl"
+
+    if tasks is None:
+        tasks = sized_generation_tasks(
+            generating_function, parameter_lists, seeds, shard, size_limits, size_order
+        )
+
+    missing = []
+    for params, seed in tasks:
+        file_name = instance_file_name(
+            generating_function.__name__, params, seed, extension
+        )
+        path = os.path.join(directory, file_name)
+        if not os.path.exists(path):
+            missing.append((generating_function, params, seed, path))
+    if not missing:
+        return
+
+    results = pool_map(write_instance, missing, n_jobs=n_jobs, ordered=False)
+    with open(os.path.join(directory, manifest), "a") as manifest_file:
+        for _, record in results:
+            manifest_file.write(json.dumps(record, default=repr) + "\n")
+            manifest_file.flush()
+            yield record
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="geco", description="GeCO instance generation"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser(
+        "generate", help="write instances for a parameter grid and seed range"
+    )
+    generate_parser.add_argument(
+        "generator", help="e.g. set_cover.gasse_instance or my_module:my_generator"
+    )
+    generate_parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2,...",
+        help="parameter values, the grid is the product of all parameters",
+    )
+    generate_parser.add_argument(
+        "--grid", help="JSON file mapping parameter names to lists of values"
+    )
+    generate_parser.add_argument(
+        "--seeds", default="1", help="'start:stop' or 'n' for the seeds 0 to n - 1"
+    )
+    generate_parser.add_argument("--output", "-o", required=True)
+    generate_parser.add_argument("--shard", default="0/1", metavar="i/N")
+    generate_parser.add_argument("--format", default="mps", dest="file_format")
+    generate_parser.add_argument("--compress", action="store_true")
+    generate_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="worker processes, default all cores",
+    )
+    limits = [("vars", "variables"), ("conss", "constraints"), ("nnz", "nonzeros")]
+    for limit, name in limits:
+        generate_parser.add_argument(
+            f"--max-{limit}",
+            type=int,
+            default=None,
+            help=f"skip params whose predicted number of {name} is larger",
+        )
+    generate_parser.add_argument(
+        "--size-order",
+        choices=["smallest", "largest"],
+        default=None,
+        help="generate instances by predicted size instead of grid order",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        generating_function = resolve_generator(args.generator)
+        parameter_lists = {}
+        if args.grid is not None:
+            with open(args.grid) as file:
+                parameter_lists.update(json.load(file))
+        parameter_lists.update(parse_param(param) for param in args.param)
+        seeds = parse_seeds(args.seeds)
+        shard = parse_shard(args.shard)
+        size_limits = {
+            f"max_{limit}": getattr(args, f"max_{limit}")
+            for limit, _ in limits
+            if getattr(args, f"max_{limit}") is not None
+        }
+        candidates = list(generation_tasks(parameter_lists, seeds, shard))
+        tasks = _select_tasks(
+            generating_function, candidates, size_limits, args.size_order
+        )
+    except ValueError as error:
+        parser.error(str(error))
+
+    written = 0
+    for record in generate(
+        generating_function,
+        parameter_lists,
+        seeds,
+        args.output,
+        shard=shard,
+        file_format=args.file_format,
+        compress=args.compress,
+        n_jobs=args.jobs,
+        tasks=tasks,
+    ):
+        written += 1
+        print(record["path"], flush=True)
+    message = f"wrote {written} instances, {len(tasks) - written} already existed"
+    if len(tasks) < len(candidates):
+        message += f", {len(candidates) - len(tasks)} exceeded the size limits"
+    print(message, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+import glob
+import json
+import os
+
+import numpy as np
+import pyscipopt as scip
+
+from geco.mips.utilities.instance import MIPInstance
+from geco.parallel import pool_map, spawn_seeds
+
+_ALIGNMENT = 64
+_DATA_SUFFIX = ".bin"
+_INDEX_SUFFIX = ".index.jsonl"
+
+
+def _instance_arrays(instance):
+    arrays = {
+        "c": instance.c,
+        "data": instance.A.data,
+        "indices": instance.A.indices,
+        "indptr": instance.A.indptr,
+        "senses": instance.senses,
+        "rhs": instance.rhs,
+        "lb": instance.lb,
+        "ub": instance.ub,
+        "vtypes": instance.vtypes,
+    }
+    if instance.var_names is not None:
+        arrays["var_names"] = np.asarray(instance.var_names, dtype=str)
+    if instance.cons_names is not None:
+        arrays["cons_names"] = np.asarray(instance.cons_names, dtype=str)
+    return arrays
+
+
+class DatasetWriter:
+    """
+    Writes MIPInstances into a sharded binary dataset.
+
+    A dataset is a directory of shards. Each shard consists of a data file holding the
+    raw arrays of many instances (CSR constraint matrix, objective, bounds, ...) back to
+    back in NumPy's native binary layout, and a JSON lines index mapping every instance
+    id to the byte offset, dtype and shape of its arrays and its metadata. A new shard is
+    started once the current one exceeds `shard_size` bytes, and every writer starts a
+    new shard, so an interrupted dataset can be extended by opening another writer.
+
+    Parameters
+    ----------
+    directory: str
+        Dataset directory, created if it doesn't exist
+    shard_size: int
+        Size in bytes after which a new shard is started
+
+    Examples
+    --------
+    >>> with DatasetWriter("dataset") as writer:
+    ...     for seed in range(1000):
+    ...         writer.append(set_cover.gasse_instance(500, 1000, 0.05, seed=seed))
+    """
+
+    def __init__(self, directory, shard_size=2**28):
+        self.directory = directory
+        self.shard_size = shard_size
+        os.makedirs(directory, exist_ok=True)
+        self._ids = set()
+        shard_numbers = [-1]
+        for index_path in _index_paths(directory):
+            shard_numbers.append(_shard_number(index_path))
+            self._ids.update(entry["id"] for entry in _read_index(index_path))
+        self._next_shard = max(shard_numbers) + 1
+        self._data_file = None
+        self._index_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __contains__(self, instance_id):
+        return instance_id in self._ids
+
+    def append(self, instance, instance_id=None, metadata=None):
+        """
+        Appends an instance to the current shard.
+
+        Parameters
+        ----------
+        instance: MIPInstance or scip.Model
+            The instance, pyscipopt models are converted with MIPInstance.from_scip
+        instance_id: int, str or None
+            Unique id of the instance, None uses the number of instances in the dataset
+        metadata: dict or None
+            JSON serializable metadata stored with the instance, e.g. params and seed
+
+        Returns
+        -------
+        instance_id: int or str
+            The id of the appended instance
+        """
+        if isinstance(instance, scip.Model):
+            instance = MIPInstance.from_scip(instance)
+        if instance_id is None:
+            instance_id = len(self._ids)
+        if instance_id in self._ids:
+            raise ValueError(f"Instance {instance_id!r} is already in the dataset")
+        if self._data_file is None or self._data_file.tell() >= self.shard_size:
+            self._open_shard()
+
+        offset = self._data_file.tell()
+        arrays = {}
+        for name, array in _instance_arrays(instance).items():
+            array = np.ascontiguousarray(array)
+            self._pad()
+            arrays[name] = [
+                self._data_file.tell() - offset,
+                array.dtype.str,
+                array.shape,
+            ]
+            self._data_file.write(array.tobytes())
+        entry = {
+            "id": instance_id,
+            "offset": offset,
+            "size": self._data_file.tell() - offset,
+            "shape": list(instance.A.shape),
+            "sense": instance.sense,
+            "name": instance.name,
+            "arrays": arrays,
+            "metadata": {} if metadata is None else metadata,
+        }
+        # the data has to be on disk before the index refers to it
+        self._data_file.flush()
+        self._index_file.write(json.dumps(entry) + "\n")
+        self._index_file.flush()
+        self._ids.add(instance_id)
+        return instance_id
+
+    def close(self):
+        """
+        Closes the files of the current shard.
+        """
+        for file in (self._data_file, self._index_file):
+            if file is not None:
+                file.close()
+        self._data_file = self._index_file = None
+
+    def _open_shard(self):
+        self.close()
+        stem = os.path.join(self.directory, f"shard-{self._next_shard:05d}")
+        self._data_file = open(stem + _DATA_SUFFIX, "wb")
+        self._index_file = open(stem + _INDEX_SUFFIX, "w")
+        self._next_shard += 1
+
+    def _pad(self):
+        padding = -self._data_file.tell() % _ALIGNMENT
+        self._data_file.write(b"\0" * padding)
+
+
+class DatasetReader:
+    """
+    Reads instances from a dataset written by DatasetWriter.
+
+    Shards are memory mapped on first access, reading an instance only touches the pages
+    of its own arrays. All arrays returned by the reader are read-only views of the
+    mapped shards, nothing is parsed or copied per access, so repeated reads (e.g. every
+    epoch of training) are served from the page cache.
+
+    Readers can be passed to other processes, e.g. DataLoader workers. Pickling a reader
+    only transfers its index, every process maps the shards itself and all of them share
+    the same page cache.
+
+    Parameters
+    ----------
+    directory: str
+        Dataset directory
+
+    Examples
+    --------
+    >>> class GeCODataset(torch.utils.data.Dataset):
+    ...     def __init__(self, directory):
+    ...         self.reader = DatasetReader(directory)
+    ...         self.ids = self.reader.ids()
+    ...     def __len__(self):
+    ...         return len(self.ids)
+    ...     def __getitem__(self, i):
+    ...         arrays = self.reader.arrays(self.ids[i])
+    ...         return arrays["c"], self.reader.matrix(self.ids[i])
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._entries = {}
+        self._shard_paths = []
+        for index_path in _index_paths(directory):
+            shard = len(self._shard_paths)
+            self._shard_paths.append(index_path[: -len(_INDEX_SUFFIX)] + _DATA_SUFFIX)
+            for entry in _read_index(index_path):
+                self._entries[entry["id"]] = (shard, entry)
+        self._buffers = {}
+
+    def __getstate__(self):
+        # memory maps would be pickled as copies of the whole shards
+        state = self.__dict__.copy()
+        state["_buffers"] = {}
+        return state
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, instance_id):
+        return instance_id in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __getitem__(self, instance_id):
+        return self.instance(instance_id)
+
+    def ids(self):
+        """
+        Returns
+        -------
+        ids: list
+            Ids of all instances, in the order they were written per shard
+        """
+        return list(self._entries)
+
+    def metadata(self, instance_id):
+        """
+        Returns
+        -------
+        metadata: dict
+            The metadata stored with the instance
+        """
+        return self._entry(instance_id)[1]["metadata"]
+
+    def arrays(self, instance_id):
+        """
+        Returns the arrays of an instance as read-only views of the memory mapped shard.
+
+        Parameters
+        ----------
+        instance_id: int or str
+            Id of the instance
+
+        Returns
+        -------
+        arrays: dict
+            Maps "c", "data", "indices", "indptr", "senses", "rhs", "lb", "ub", "vtypes"
+            and optionally "var_names" and "cons_names" to NumPy arrays
+        """
+        shard, entry = self._entry(instance_id)
+        buffer = self._buffer(shard)
+        arrays = {}
+        for name, (offset, dtype, shape) in entry["arrays"].items():
+            dtype = np.dtype(dtype)
+            start = entry["offset"] + offset
+            count = int(np.prod(shape))
+            arrays[name] = np.frombuffer(
+                buffer, dtype=dtype, count=count, offset=start
+            ).reshape(shape)
+        return arrays
+
+    def matrix(self, instance_id):
+        """
+        Returns the constraint matrix of an instance without copying its arrays.
+
+        Parameters
+        ----------
+        instance_id: int or str
+            Id of the instance
+
+        Returns
+        -------
+        A: scipy.sparse.csr_matrix
+            Constraint matrix whose data, indices and indptr are views of the mapped shard
+        """
+        return self._matrix(self._entry(instance_id)[1], self.arrays(instance_id))
+
+    def instance(self, instance_id):
+        """
+        Returns the instance with the given id, its arrays are views of the mapped shard.
+
+        Parameters
+        ----------
+        instance_id: int or str
+            Id of the instance
+
+        Returns
+        -------
+        instance: MIPInstance
+            The instance with the given id
+        """
+        _, entry = self._entry(instance_id)
+        arrays = self.arrays(instance_id)
+        return MIPInstance(
+            c=arrays["c"],
+            A=self._matrix(entry, arrays),
+            senses=arrays["senses"],
+            rhs=arrays["rhs"],
+            lb=arrays["lb"],
+            ub=arrays["ub"],
+            vtypes=arrays["vtypes"],
+            var_names=arrays["var_names"].tolist() if "var_names" in arrays else None,
+            cons_names=(
+                arrays["cons_names"].tolist() if "cons_names" in arrays else None
+            ),
+            sense=entry["sense"],
+            name=entry["name"],
+        )
+
+    def close(self):
+        """
+        Unmaps all shards, they are mapped again on the next access.
+        """
+        self._buffers = {}
+
+    @staticmethod
+    def _matrix(entry, arrays):
+        import scipy.sparse
+
+        return scipy.sparse.csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=tuple(entry["shape"]),
+            copy=False,
+        )
+
+    def _entry(self, instance_id):
+        try:
+            return self._entries[instance_id]
+        except KeyError:
+            raise KeyError(f"Instance {instance_id!r} isn't in the dataset") from None
+
+    def _buffer(self, shard):
+        if shard not in self._buffers:
+            self._buffers[shard] = np.memmap(
+                self._shard_paths[shard], dtype=np.uint8, mode="r"
+            )
+        return self._buffers[shard]
+
+
+def write_dataset(
+    generating_function,
+    n,
+    directory,
+    seed=0,
+    params=None,
+    n_jobs=None,
+    shard_size=2**28,
+):
+    """
+    Generates n instances in worker processes and writes them into a dataset.
+
+    Instance i gets the i-th child seed of the root seed and the id i, like in `write_n`.
+    Ids already in the dataset are skipped, so an interrupted call can be repeated.
+
+    Parameters
+    ----------
+    generating_function:
+        A picklable (module level) function that accepts the params as keywords and a seed,
+        returning a pyscipopt model or MIPInstance.
+    n: int
+        Number of instances to generate.
+    directory: str
+        Dataset directory, created if it doesn't exist.
+    seed: int, random state or None
+        Root seed for randomization, each instance gets its own child seed.
+    params: dict or None
+        Keyword arguments passed to the generating function.
+    n_jobs: int or None
+        Number of worker processes, None uses all cores.
+    shard_size: int
+        Size in bytes after which a new shard is started.
+
+    Returns
+    -------
+     Tuple (instance_number, metadata) in order of completion
+    """
+    params = {} if params is None else dict(params)
+    seeds = spawn_seeds(seed, n)
+    with DatasetWriter(directory, shard_size) as writer:
+        missing = [i for i in range(n) if i not in writer]
+        tasks = ((generating_function, params, seeds[i]) for i in missing)
+        for task_number, (instance, metadata) in pool_map(
+            _generate_instance, tasks, n_jobs=n_jobs, ordered=False
+        ):
+            i = missing[task_number]
+            writer.append(instance, i, metadata)
+            yield i, metadata
+
+
+def _generate_instance(generating_function, params, seed):
+    # pyscipopt models can't be sent back to the parent process
+    instance = generating_function(seed=seed, **params)
+    if isinstance(instance, scip.Model):
+        instance = MIPInstance.from_scip(instance)
+    return instance, {"params": params, "seed": seed}
+
+
+def _index_paths(directory):
+    return sorted(glob.glob(os.path.join(directory, "shard-*" + _INDEX_SUFFIX)))
+
+
+def _shard_number(index_path):
+    return int(os.path.basename(index_path)[len("shard-") : -len(_INDEX_SUFFIX)])
+
+
+def _read_index(index_path):
+    entries = []
+    with open(index_path) as file:
+        for line in file:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # the last line of an interrupted writer, its instance is incomplete
+                continue
+    return entries
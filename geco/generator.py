@@ -1,5 +1,18 @@
+import contextlib
+import gzip
+import io
+import json
+import os
+import shutil
+import time
+
 from networkx.utils import py_random_state
 
+from geco.mips.utilities.instance import InstanceBuilder, MIPInstance
+from geco.mips.utilities.writing import write_problem
+from geco.parallel import pool_map, spawn_seeds
+from geco.profiling import stage
+
 
 @py_random_state("seed")
 def generate(generating_function, seed=0):
@@ -43,6 +56,194 @@ def generate_n(generating_function, n, seed=0):
         yield i, generating_function(seed)
 
 
+def parallel_generate_n(generating_function, n, seed=0, n_jobs=None, ordered=True):
+    """
+    Parallel version of `generate_n` that builds the instances in a process pool.
+
+    Every instance gets its own child seed derived from the root seed, so the i-th
+    instance is the same regardless of the number of workers or completion order.
+
+    Parameters
+    ----------
+    generating_function:
+        A picklable (module level) function that accepts a seed and returns a
+        picklable instance, e.g. instance params. Use `write_n` for pyscipopt models.
+    n: int
+        Number of instances to generate.
+    seed: int, random state or None
+        Root seed for randomization.
+    n_jobs: int or None
+        Number of worker processes, None uses all cores.
+    ordered: bool
+        Whether instances are yielded in order or as soon as they are completed.
+
+    Returns
+    -------
+     Tuple (instance_number, instance)
+    """
+    seeds = spawn_seeds(seed, n)
+    yield from pool_map(
+        generating_function,
+        ((instance_seed,) for instance_seed in seeds),
+        n_jobs=n_jobs,
+        ordered=ordered,
+    )
+
+
+def write_instance(generating_function, params, seed, path):
+    """
+    Builds an instance and writes it to disk, meant to be run inside a worker process.
+
+    Parameters
+    ----------
+    generating_function:
+        A function that accepts the params as keywords and a seed, returning a pyscipopt model
+        or a MIPInstance. MIPInstances are written directly without building a pyscipopt model.
+    params: dict
+        Keyword arguments passed to the generating function.
+    seed: int
+        Seed passed to the generating function.
+    path: str
+        File to write to, the extension defines the format (e.g. ".mps", ".lp"),
+        an additional ".gz" extension compresses the file.
+
+    Returns
+    -------
+    record: dict
+        Manifest record with the path, params, seed, nvars, ncons, nnz,
+        build_time and write_time of the instance
+    """
+    start = time.perf_counter()
+    model = generating_function(seed=seed, **params)
+    build_time = time.perf_counter() - start
+
+    # written under a temporary name first, so an interrupted write never leaves a
+    # partial file at path
+    directory, file_name = os.path.split(path)
+    temp_path = os.path.join(directory, f".tmp-{os.getpid()}-{file_name}")
+    start = time.perf_counter()
+    try:
+        if isinstance(model, MIPInstance):
+            write_problem(model, temp_path, free_mps=True)
+        else:
+            _write_scip_problem(model, temp_path)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    write_time = time.perf_counter() - start
+
+    if isinstance(model, MIPInstance):
+        size = {"nvars": model.nvars, "ncons": model.ncons, "nnz": model.nnz}
+    else:
+        size = {
+            "nvars": model.getNVars(),
+            "ncons": model.getNConss(),
+            "nnz": sum(len(model.getValsLinear(cons)) for cons in model.getConss()),
+        }
+
+    return {
+        "path": path,
+        "params": params,
+        "seed": seed,
+        **size,
+        "build_time": build_time,
+        "write_time": write_time,
+    }
+
+
+@stage("write")
+def _write_scip_problem(model, path):
+    if path.endswith(".gz"):
+        # SCIP can't write compressed files itself
+        uncompressed_path = path[: -len(".gz")]
+        _write_quietly(model, uncompressed_path)
+        with open(uncompressed_path, "rb") as source, gzip.open(path, "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.remove(uncompressed_path)
+    else:
+        _write_quietly(model, path)
+
+
+def _write_quietly(model, path):
+    # pyscipopt prints a message for every written file, only newer versions can turn
+    # it off with the verbose keyword
+    with contextlib.redirect_stdout(io.StringIO()):
+        model.writeProblem(path)
+
+
+def write_n(
+    generating_function,
+    n,
+    directory,
+    seed=0,
+    params=None,
+    file_format="mps",
+    compress=False,
+    n_jobs=None,
+    ordered=True,
+    manifest="manifest.jsonl",
+):
+    """
+    Generates n instances in worker processes that write them straight into a directory.
+
+    Only small manifest records travel back to the parent process, which appends them
+    to a JSON lines manifest in the directory.
+
+    Parameters
+    ----------
+    generating_function:
+        A picklable (module level) function that accepts the params as keywords and a seed,
+        returning a pyscipopt model.
+    n: int
+        Number of instances to generate.
+    directory: str
+        Output directory, created if it doesn't exist.
+    seed: int, random state or None
+        Root seed for randomization, each instance gets its own child seed.
+    params: dict or None
+        Keyword arguments passed to the generating function.
+    file_format: str
+        Any file extension SCIP can write, e.g. "mps", "lp" or "cip".
+    compress: bool
+        Whether to gzip the written files.
+    n_jobs: int or None
+        Number of worker processes, None uses all cores.
+    ordered: bool
+        Whether records are yielded in order or as soon as they are completed.
+    manifest: str or None
+        File name of the manifest inside the directory, None disables it.
+
+    Returns
+    -------
+     Tuple (instance_number, record)
+    """
+    params = {} if params is None else dict(params)
+    os.makedirs(directory, exist_ok=True)
+    extension = f".{file_format}.gz" if compress else f".{file_format}"
+
+    tasks = (
+        (
+            generating_function,
+            params,
+            instance_seed,
+            os.path.join(directory, f"instance_{i}{extension}"),
+        )
+        for i, instance_seed in enumerate(spawn_seeds(seed, n))
+    )
+    results = pool_map(write_instance, tasks, n_jobs=n_jobs, ordered=ordered)
+
+    if manifest is None:
+        yield from results
+        return
+
+    with open(os.path.join(directory, manifest), "a") as manifest_file:
+        for i, record in results:
+            manifest_file.write(json.dumps({"instance_number": i, **record}) + "\n")
+            manifest_file.flush()
+            yield i, record
+
+
 @py_random_state("seed")
 def common_substructure_generator(
     instance_generation_function,
@@ -70,3 +271,60 @@ def common_substructure_generator(
     """
     while True:
         yield instance_generation_function(*expand_params_function(backbone, seed=seed))
+
+
+@py_random_state("seed")
+def incremental_substructure_generator(
+    instance_generation_function,
+    backbone,
+    expand_instance_function,
+    seed=0,
+    reuse=None,
+):
+    """
+    Generates instances that have common substructure, building the backbone only once.
+
+    Unlike `common_substructure_generator`, which builds every instance from scratch,
+    the backbone instance is built once and every instance starts from an
+    InstanceBuilder holding it, to which only the expansion is appended.
+
+    Parameters
+    ----------
+    instance_generation_function:
+        function building the MIPInstance of the backbone from its params,
+        e.g. set_cover_sparse
+    backbone:
+        instance parameters of the common substructure
+    expand_instance_function:
+        function taking an InstanceBuilder created from the backbone instance, the
+        backbone params and a seed, that appends the expanded variables, constraints
+        and nonzeros to the builder, e.g. expand_sun_instance
+    seed: int, random object or None
+        for randomization
+    reuse: dict or None
+        Updated after every generated instance with the total number of "instances"
+        and of reused and added variables, constraints and nonzeros
+        ("reused_vars", "added_vars", "reused_conss", "added_conss", "reused_nnz",
+        "added_nnz")
+
+    Returns
+    -------
+        generator object of MIPInstances
+    """
+    backbone_instance = instance_generation_function(*backbone)
+    while True:
+        builder = InstanceBuilder.from_instance(backbone_instance)
+        expand_instance_function(builder, backbone, seed=seed)
+        instance = builder.build(backbone_instance.sense)
+        if reuse is not None:
+            _count_reuse(reuse, backbone_instance, instance)
+        yield instance
+
+
+def _count_reuse(reuse, backbone_instance, instance):
+    reuse["instances"] = reuse.get("instances", 0) + 1
+    for name, size in (("vars", "nvars"), ("conss", "ncons"), ("nnz", "nnz")):
+        reused = getattr(backbone_instance, size)
+        added = getattr(instance, size) - reused
+        reuse[f"reused_{name}"] = reuse.get(f"reused_{name}", 0) + reused
+        reuse[f"added_{name}"] = reuse.get(f"added_{name}", 0) + added
@@ -1,5 +1,28 @@
-import geco.graphs.chimera as chimera
-import geco.graphs.pegasus as pegasus
-import geco.graphs.utilities as utilities
-import geco.graphs.lavrov_graph as lavrov_graphs
-import geco.graphs.biqmac as biqmac_rudy
\ No newline at end of file
+"""
+Graph generators are imported on first attribute access, so dwave_networkx is only
+imported when the chimera or pegasus generators are used.
+"""
+
+import importlib
+
+_submodules = {
+    "chimera": "geco.graphs.chimera",
+    "pegasus": "geco.graphs.pegasus",
+    "utilities": "geco.graphs.utilities",
+    "lavrov_graphs": "geco.graphs.lavrov_graph",
+    "biqmac_rudy": "geco.graphs.biqmac",
+}
+
+__all__ = list(_submodules)
+
+
+def __getattr__(name):
+    if name not in _submodules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_submodules[name])
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -74,10 +74,10 @@ def test_pm1s_no_zeros():
     assert g_info["num_of_zero_edgeweights"] == 0
 
 
-def test_pm1s_save():
+def test_pm1s_save(tmp_path):
     i = 140
     g = pm1s_graph(i, 0, False)
-    nx.write_weighted_edgelist(g, f"pm1s_{i}.el")
+    nx.write_weighted_edgelist(g, str(tmp_path / f"pm1s_{i}.el"))
 
 
 def test_pm1d():
@@ -1,12 +1,50 @@
-import geco.mips.facility_location as facility_location
-import geco.mips.scheduling as scheduling
-import geco.mips.set_packing as set_packing
-import geco.mips.set_cover as set_cover
-import geco.mips.independent_set as independent_set
-import geco.mips.knapsack as knapsack
-import geco.mips.max_cut as max_cut
-import geco.mips.production_planning as production_planning
-import geco.mips.packing as packing
-import geco.mips.graph_coloring as graph_coloring
-import geco.mips.loading as miplib
-import geco.mips.combinatorial_auction as combinatorial_auction
+"""
+Problem families are imported on first attribute access, so importing geco.mips
+doesn't import every family and their dependencies up front.
+"""
+
+import importlib
+
+_submodules = {
+    "facility_location": "geco.mips.facility_location",
+    "scheduling": "geco.mips.scheduling",
+    "set_packing": "geco.mips.set_packing",
+    "set_cover": "geco.mips.set_cover",
+    "independent_set": "geco.mips.independent_set",
+    "knapsack": "geco.mips.knapsack",
+    "max_cut": "geco.mips.max_cut",
+    "production_planning": "geco.mips.production_planning",
+    "packing": "geco.mips.packing",
+    "graph_coloring": "geco.mips.graph_coloring",
+    "miplib": "geco.mips.loading",
+    "combinatorial_auction": "geco.mips.combinatorial_auction",
+}
+
+_attributes = {
+    "MIPInstance": "geco.mips.utilities.instance",
+    "InstanceBuilder": "geco.mips.utilities.instance",
+    "write_mps": "geco.mips.utilities.writing",
+    "write_lp": "geco.mips.utilities.writing",
+    "write_problem": "geco.mips.utilities.writing",
+    "bipartite_graph": "geco.mips.utilities.features",
+    "instance_properties": "geco.mips.utilities.properties",
+    "fingerprint": "geco.mips.utilities.fingerprint",
+    "estimate_size": "geco.mips.utilities.size",
+}
+
+__all__ = [*_submodules, *_attributes]
+
+
+def __getattr__(name):
+    if name in _submodules:
+        value = importlib.import_module(_submodules[name])
+    elif name in _attributes:
+        value = getattr(importlib.import_module(_attributes[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -2,8 +2,11 @@ import numpy as np
 from networkx.utils import np_random_state
 
 from geco.mips.combinatorial_auction.generic import combinatorial_auction
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
+@stage("instance")
 @np_random_state("seed")
 def gasse_instance(
     n_items=100,
@@ -84,6 +87,29 @@ def gasse_instance(
     )
 
 
+@size_estimator(gasse_instance)
+def _gasse_instance_size(
+    n_items=100,
+    n_bids=500,
+    min_value=1,
+    max_value=100,
+    value_deviation=0.5,
+    add_item_prob=0.9,
+    max_n_sub_bids=5,
+    additivity=0.2,
+    budget_factor=1.5,
+    resale_factor=0.5,
+    integers=False,
+    warnings=False,
+    seed=0,
+):
+    # a bundle has at most every item and a dummy item, which is only added for bidders
+    # with at least three bids
+    n_dummy_items = n_bids // 3
+    return InstanceSize(n_bids, n_items + n_dummy_items, n_bids * (n_items + 1), False)
+
+
+@stage("params")
 @np_random_state("seed")
 def gasse_params(
     n_items=100,
@@ -1,6 +1,12 @@
+import numpy as np
 import pyscipopt as scip
 
+from geco.mips.utilities.instance import InstanceBuilder
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
+
+@stage("build")
 def combinatorial_auction(bids, n_dummy_items, n_items, name="Combinatorial Auction"):
     model = scip.Model(name)
 
@@ -21,3 +27,52 @@ def combinatorial_auction(bids, n_dummy_items, n_items, name="Combinatorial Auct
             model.addCons(scip.quicksum(vars) <= 1)
     model.setMaximize()
     return model
+
+
+@stage("build")
+def combinatorial_auction_sparse(
+    bids, n_dummy_items, n_items, name="Combinatorial Auction"
+):
+    """
+    Generates the sparse representation of the formulation in `combinatorial_auction`.
+
+    Parameters
+    ----------
+    bids: list[tuple[list, float]]
+        A list of bids each represented by a tuple of a bundle and the price proposed
+    n_dummy_items: int
+        Number of dummy items added to each bid
+    n_items: int
+        The number of items
+    name: str
+        Name of the model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder(name)
+    prices = [price for _, price in bids]
+    names = [f"x_{i + 1}" for i in range(len(bids))]
+    builder.add_vars(len(bids), obj=prices, lb=0, ub=1, vtype="B", names=names)
+
+    items = np.array([item for bundle, _ in bids for item in bundle], dtype=np.int64)
+    bid_indices = np.repeat(np.arange(len(bids)), [len(bundle) for bundle, _ in bids])
+    assert len(items) == 0 or items.max() < n_items + n_dummy_items
+
+    # one row per item with at least one bid, in item order
+    used_items, rows = np.unique(items, return_inverse=True)
+    builder.add_conss(
+        rows, bid_indices, coefs=1, senses="<", rhs=np.ones(len(used_items))
+    )
+    return builder.build("maximize")
+
+
+@size_estimator(combinatorial_auction)
+@size_estimator(combinatorial_auction_sparse)
+def _combinatorial_auction_size(bids, n_dummy_items, n_items, name=None):
+    # one row per item with at least one bid
+    items = {item for bundle, _ in bids for item in bundle}
+    nnz = sum(len(bundle) for bundle, _ in bids)
+    return InstanceSize(len(bids), len(items), nnz, True)
@@ -1,10 +1,17 @@
 import numpy as np
-from geco.mips.facility_location.generic import capacitated_facility_location
+from geco.mips.facility_location.generic import (
+    _capacitated_facility_location_size,
+    capacitated_facility_location,
+)
+from geco.mips.utilities.sampling import integers, numpy_generator
+from geco.mips.utilities.size import InstanceSize, size_estimator
 from networkx.utils import py_random_state
+from geco.profiling import stage
 
 
+@stage("instance")
 @py_random_state("seed")
-def cornuejols_instance(n_customers, n_facilities, ratio, seed=0):
+def cornuejols_instance(n_customers, n_facilities, ratio, seed=0, fast=False):
     """
     Generates a Capacitated Facility Location MIP formulation following [1].
 
@@ -18,6 +25,8 @@ def cornuejols_instance(n_customers, n_facilities, ratio, seed=0):
         Capacity / demand ratio
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -33,12 +42,13 @@ def cornuejols_instance(n_customers, n_facilities, ratio, seed=0):
     return capacitated_facility_location(
         n_customers,
         n_facilities,
-        *cornuejols_params(n_customers, n_facilities, ratio, seed),
+        *cornuejols_params(n_customers, n_facilities, ratio, seed, fast),
     )
 
 
+@stage("params")
 @py_random_state("seed")
-def cornuejols_params(n_customers, n_facilities, ratio, seed=0):
+def cornuejols_params(n_customers, n_facilities, ratio, seed=0, fast=False):
     """
     Generates a Capacitated Facility Location instance params following [1].
 
@@ -55,6 +65,8 @@ def cornuejols_params(n_customers, n_facilities, ratio, seed=0):
         Capacity / demand ratio
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -77,21 +89,31 @@ def cornuejols_params(n_customers, n_facilities, ratio, seed=0):
         A Comparison of Heuristics and Relaxations for the Capacitated Plant Location Problem.
         European Journal of Operations Research 50:280-297.
     """
-    # locations for customers
-    c_x = np.array([seed.random() for _ in range(n_customers)])
-    c_y = np.array([seed.random() for _ in range(n_customers)])
-
-    # locations for facilities
-    f_x = np.array([seed.random() for _ in range(n_facilities)])
-    f_y = np.array([seed.random() for _ in range(n_facilities)])
-
-    demands = np.array([seed.randint(5, 35 + 1) for _ in range(n_customers)])
-    capacities = np.array([seed.randint(10, 160 + 1) for _ in range(n_facilities)])
-    fixed_costs = np.array(
-        [seed.randint(100, 110 + 1) for _ in range(n_facilities)]
-    ) * np.sqrt(capacities) + np.array(
-        [seed.randint(0, 90 + 1) for _ in range(n_facilities)]
-    )
+    if fast:
+        rng = numpy_generator(seed)
+        c_x, c_y = rng.random((2, n_customers))
+        f_x, f_y = rng.random((2, n_facilities))
+        demands = integers(rng, 5, 35 + 1, size=n_customers)
+        capacities = integers(rng, 10, 160 + 1, size=n_facilities)
+        fixed_costs = integers(rng, 100, 110 + 1, size=n_facilities) * np.sqrt(
+            capacities
+        ) + integers(rng, 0, 90 + 1, size=n_facilities)
+    else:
+        # locations for customers
+        c_x = np.array([seed.random() for _ in range(n_customers)])
+        c_y = np.array([seed.random() for _ in range(n_customers)])
+
+        # locations for facilities
+        f_x = np.array([seed.random() for _ in range(n_facilities)])
+        f_y = np.array([seed.random() for _ in range(n_facilities)])
+
+        demands = np.array([seed.randint(5, 35 + 1) for _ in range(n_customers)])
+        capacities = np.array([seed.randint(10, 160 + 1) for _ in range(n_facilities)])
+        fixed_costs = np.array(
+            [seed.randint(100, 110 + 1) for _ in range(n_facilities)]
+        ) * np.sqrt(capacities) + np.array(
+            [seed.randint(0, 90 + 1) for _ in range(n_facilities)]
+        )
     fixed_costs = fixed_costs.astype(int)
 
     # adjust capacities according to ratio
@@ -110,3 +132,10 @@ def cornuejols_params(n_customers, n_facilities, ratio, seed=0):
         * demands.reshape((-1, 1))
     )
     return trans_costs, demands, fixed_costs, capacities
+
+
+@size_estimator(cornuejols_instance)
+def _cornuejols_instance_size(n_customers, n_facilities, ratio, seed=0, fast=False):
+    return _capacitated_facility_location_size(
+        n_customers, n_facilities, None, None, None, None
+    )
@@ -1,8 +1,14 @@
 import itertools
 
+import numpy as np
 import pyscipopt as scip
 
+from geco.mips.utilities.instance import InstanceBuilder
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
+
+@stage("build")
 def capacitated_facility_location(
     n_customers,
     n_facilities,
@@ -91,6 +97,7 @@ def capacitated_facility_location(
     return model
 
 
+@stage("build")
 def capacitated_warehouse_location(
     n_customers,
     n_facilities,
@@ -179,3 +186,195 @@ def capacitated_warehouse_location(
         )
 
     return model
+
+
+@stage("build")
+def capacitated_facility_location_sparse(
+    n_customers,
+    n_facilities,
+    transportation_cost,
+    demands,
+    fixed_costs,
+    capacities,
+    name="Capacitated Facility Location",
+):
+    """
+    Generates the sparse representation of the formulation in `capacitated_facility_location`.
+
+    Parameters
+    ----------
+    n_customers: int
+        The desired number of customers
+    n_facilities: int
+        The desired number of facilities
+    transportation_cost: numpy array [float]
+        Matrix of transportation costs from customer i to facility j [i,j]
+    demands: numpy array [int]
+        Demands of each customer
+    fixed_costs: numpy array [int]
+        Fixed costs of operating each facility
+    capacities: numpy array [int]
+        Capacities of each facility
+    name: str
+        Name of the model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder(name)
+    demands = np.asarray(demands, dtype=float)[:n_customers]
+    capacities = np.asarray(capacities, dtype=float)[:n_facilities]
+    x, y = _facility_vars(
+        builder, n_customers, n_facilities, transportation_cost, fixed_costs, "B"
+    )
+    customers, facilities = np.divmod(
+        np.arange(n_customers * n_facilities), n_facilities
+    )
+
+    # demand constraints
+    builder.add_conss(customers, x, 1, ">", np.ones(n_customers))
+    # capacity constraints
+    _capacity_constraints(builder, x, y, customers, facilities, demands, capacities)
+    # total capacity constraint
+    builder.add_conss(np.zeros(n_facilities), y, capacities, ">", [demands.sum()])
+    # affectation constraints
+    rows = np.repeat(np.arange(len(x)), 2)
+    cols = np.column_stack([x, y[facilities]]).ravel()
+    coefs = np.tile([1.0, -1.0], len(x))
+    builder.add_conss(rows, cols, coefs, "<", np.zeros(len(x)))
+
+    return builder.build("minimize")
+
+
+@stage("build")
+def capacitated_warehouse_location_sparse(
+    n_customers,
+    n_facilities,
+    transportation_cost,
+    demands,
+    fixed_costs,
+    capacities,
+    name="Capacitated Warehouse Location",
+):
+    """
+    Generates the sparse representation of the formulation in `capacitated_warehouse_location`.
+
+    Parameters
+    ----------
+    n_customers: int
+        The desired number of customers
+    n_facilities: int
+        The desired number of warehouses
+    transportation_cost: numpy array [float]
+        Matrix of transportation costs from customer i to warehouse j [i,j]
+    demands: numpy array [int]
+        Demands of each customer
+    fixed_costs: numpy array [int]
+        Fixed costs of operating each warehouse
+    capacities: numpy array [int]
+        Capacities of each warehouse
+    name: str
+        Name of the model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder(name)
+    demands = np.asarray(demands, dtype=float)[:n_customers]
+    capacities = np.asarray(capacities, dtype=float)[:n_facilities]
+    x, y = _facility_vars(
+        builder, n_customers, n_facilities, transportation_cost, fixed_costs, "C"
+    )
+    customers, facilities = np.divmod(
+        np.arange(n_customers * n_facilities), n_facilities
+    )
+
+    # constraints (2)
+    builder.add_conss(customers, x, 1, ">", np.ones(n_customers))
+    # constraints (3)
+    _capacity_constraints(builder, x, y, customers, facilities, demands, capacities)
+    # constraints (6)
+    rows = np.repeat(np.arange(len(x)), 2)
+    cols = np.column_stack([x, y[facilities]]).ravel()
+    ratios = np.minimum(1, capacities[facilities] / demands[customers])
+    coefs = np.column_stack([np.ones(len(x)), -ratios]).ravel()
+    builder.add_conss(rows, cols, coefs, "<", np.zeros(len(x)))
+
+    return builder.build("minimize")
+
+
+def _facility_vars(
+    builder, n_customers, n_facilities, transportation_cost, fixed_costs, x_vtype
+):
+    pairs = list(itertools.product(range(n_customers), range(n_facilities)))
+    x = builder.add_vars(
+        len(pairs),
+        obj=[transportation_cost[i, j] for i, j in pairs],
+        lb=0,
+        ub=1,
+        vtype=x_vtype,
+        names=[f"x_{i}_{j}" for i, j in pairs],
+    )
+    y = builder.add_vars(
+        n_facilities,
+        obj=[fixed_costs[j] for j in range(n_facilities)],
+        lb=0,
+        ub=1,
+        vtype="B",
+        names=[f"y_{j}" for j in range(n_facilities)],
+    )
+    return x, y
+
+
+def _capacity_constraints(builder, x, y, customers, facilities, demands, capacities):
+    n_facilities = len(y)
+    rows = np.concatenate([facilities, np.arange(n_facilities)])
+    cols = np.concatenate([x, y])
+    coefs = np.concatenate([demands[customers], -capacities])
+    builder.add_conss(rows, cols, coefs, "<", np.zeros(n_facilities))
+
+
+@size_estimator(capacitated_facility_location)
+@size_estimator(capacitated_facility_location_sparse)
+def _capacitated_facility_location_size(
+    n_customers,
+    n_facilities,
+    transportation_cost,
+    demands,
+    fixed_costs,
+    capacities,
+    name=None,
+):
+    # exact for positive demands and capacities
+    n_pairs = n_customers * n_facilities
+    return InstanceSize(
+        n_pairs + n_facilities,
+        n_customers + n_facilities + 1 + n_pairs,
+        4 * n_pairs + 2 * n_facilities,
+        True,
+    )
+
+
+@size_estimator(capacitated_warehouse_location)
+@size_estimator(capacitated_warehouse_location_sparse)
+def _capacitated_warehouse_location_size(
+    n_customers,
+    n_facilities,
+    transportation_cost,
+    demands,
+    fixed_costs,
+    capacities,
+    name=None,
+):
+    # exact for positive demands and capacities
+    n_pairs = n_customers * n_facilities
+    return InstanceSize(
+        n_pairs + n_facilities,
+        n_customers + n_facilities + n_pairs,
+        4 * n_pairs + n_facilities,
+        True,
+    )
@@ -2,7 +2,12 @@ import pyscipopt as scip
 import itertools
 import networkx as nx
 
+from geco.mips.utilities.instance import InstanceBuilder
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
+
+@stage("build")
 def assignment(
     graph, color_upperbound, name="Assignment Graph Coloring", with_variables=False
 ):
@@ -63,6 +68,7 @@ def assignment(
         return model
 
 
+@stage("build")
 def assignment_asymmetric(
     graph, color_upperbound, name="Assignment Extended Graph Coloring"
 ):
@@ -104,6 +110,7 @@ def assignment_asymmetric(
     return model
 
 
+@stage("build")
 def representatives(graph, name="Representatives Graph Coloring"):
     """
     Generates a graph coloring ILP formulation (REP) as described in [1].
@@ -130,7 +137,7 @@ def representatives(graph, name="Representatives Graph Coloring"):
 
     # add variables and their cost
     x = {}
-    for (u, v) in itertools.product(graph.nodes, graph.nodes):
+    for u, v in itertools.product(graph.nodes, graph.nodes):
         if not graph.has_edge(u, v) or u == v:
             obj = 1 if u == v else 0
             x[u, v] = model.addVar(lb=0, ub=1, obj=obj, name=f"x_{u}_{v}", vtype="B")
@@ -151,6 +158,7 @@ def representatives(graph, name="Representatives Graph Coloring"):
     return model
 
 
+@stage("build")
 def set_covering(graph, subsets, name="Set Covering Graph Coloring"):
     """
     Generates a graph coloring ILP formulation (COV) as described in [1].
@@ -228,6 +236,7 @@ def _partial_ordering_base_model(graph, colors, model):
     return model, y, z
 
 
+@stage("build")
 def partial_ordering(graph, color_upperbound, name="Partial Ordering Graph Coloring"):
     """
     Generates a graph coloring ILP formulation (POP) as described in [1].
@@ -264,6 +273,7 @@ def partial_ordering(graph, color_upperbound, name="Partial Ordering Graph Color
     return model
 
 
+@stage("build")
 def hybrid_partial_ordering(
     graph, color_upperbound, name="Hybrid Partial Ordering Graph Coloring"
 ):
@@ -312,3 +322,385 @@ def hybrid_partial_ordering(
         model.addCons(x[u, c] + x[v, c] <= 1)
 
     return model
+
+
+@stage("build")
+def assignment_sparse(graph, color_upperbound, name="Assignment Graph Coloring"):
+    """
+    Generates the sparse representation of the `assignment` formulation.
+
+    Parameters
+    ----------
+    graph: networkx graph
+        Input graph
+    color_upperbound: int
+        Maximum number of colors to use
+    name: str
+        Name of the model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder, graph, x, w = _assignment_builder(graph, color_upperbound, name)
+    return builder.build("minimize")
+
+
+@stage("build")
+def assignment_asymmetric_sparse(
+    graph, color_upperbound, name="Assignment Extended Graph Coloring"
+):
+    """
+    Generates the sparse representation of the `assignment_asymmetric` formulation.
+
+    Parameters
+    ----------
+    graph: networkx graph
+        Input graph
+    color_upperbound: int
+        Maximum number of colors to use
+    name: str
+        Name of the model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder, graph, x, w = _assignment_builder(graph, color_upperbound, name)
+    colors = list(range(color_upperbound))
+
+    # add constraint (5)
+    for color in colors:
+        nodes = list(graph.nodes)
+        builder.add_cons(
+            [w[color]] + [x[v, color] for v in nodes], [1] + [-1] * len(nodes), "<", 0
+        )
+
+    # add constraint (6)
+    for color in colors[1:]:
+        builder.add_cons([w[color], w[color - 1]], [1, -1], "<", 0)
+
+    return builder.build("minimize")
+
+
+def _assignment_builder(graph, color_upperbound, name):
+    builder = InstanceBuilder(name)
+
+    graph = nx.convert_node_labels_to_integers(graph, first_label=0)
+    colors = range(color_upperbound)
+
+    vertex_colors = list(itertools.product(graph.nodes, colors))
+    x = dict(
+        zip(
+            vertex_colors,
+            builder.add_vars(
+                len(vertex_colors),
+                obj=0,
+                lb=0,
+                ub=1,
+                vtype="B",
+                names=[f"x_{vertex}_{color}" for vertex, color in vertex_colors],
+            ).tolist(),
+        )
+    )
+    w = builder.add_vars(
+        len(colors),
+        obj=1,
+        lb=0,
+        ub=1,
+        vtype="B",
+        names=[f"w_{color}" for color in colors],
+    ).tolist()
+
+    # add constraint (2)
+    for v in graph.nodes:
+        builder.add_cons([x[v, color] for color in colors], 1, "=", 1)
+
+    # add constraint (3)
+    for u, v in graph.edges:
+        for color in colors:
+            builder.add_cons([x[u, color], x[v, color], w[color]], [1, 1, -1], "<", 0)
+
+    return builder, graph, x, w
+
+
+@stage("build")
+def representatives_sparse(graph, name="Representatives Graph Coloring"):
+    """
+    Generates the sparse representation of the `representatives` formulation.
+
+    Parameters
+    ----------
+    graph: networkx graph
+        Input graph
+    name: str
+        Name of the model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder(name)
+
+    graph = nx.convert_node_labels_to_integers(graph, first_label=0)
+
+    # add variables and their cost
+    x = {}
+    for u, v in itertools.product(graph.nodes, graph.nodes):
+        if not graph.has_edge(u, v) or u == v:
+            obj = 1 if u == v else 0
+            x[u, v] = builder.add_var(obj=obj, lb=0, ub=1, vtype="B", name=f"x_{u}_{v}")
+
+    # add constraint (8)
+    for v in graph.nodes:
+        non_adjacent_vertices = (graph.nodes - graph.neighbors(v)).union({v})
+        builder.add_cons([x[u, v] for u in non_adjacent_vertices], 1, ">", 1)
+
+    # add constraint (9)
+    for u in graph.nodes:
+        non_adjacent_vertices = graph.nodes - graph.neighbors(u) - {u}
+        for v, w in graph.edges:
+            if v in non_adjacent_vertices and w in non_adjacent_vertices:
+                builder.add_cons([x[u, v], x[u, w], x[u, u]], [1, 1, -1], "<", 0)
+
+    return builder.build("minimize")
+
+
+@stage("build")
+def set_covering_sparse(graph, subsets, name="Set Covering Graph Coloring"):
+    """
+    Generates the sparse representation of the `set_covering` formulation.
+
+    Parameters
+    ----------
+    graph: networkx graph
+        Input graph
+    subsets: Iterable of sets
+        Independent Sets of nodes
+    name: str
+        Name of the model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder(name)
+
+    graph = nx.convert_node_labels_to_integers(graph, first_label=0)
+
+    x = {}
+    for s in subsets:
+        if tuple(s) not in x:
+            x[tuple(s)] = builder.add_var(obj=1, lb=0, ub=1, vtype="B", name=f"x_{s}")
+
+    for v in graph.nodes:
+        builder.add_cons([x[tuple(s)] for s in subsets if v in s], 1, ">", 1)
+
+    return builder.build("minimize")
+
+
+def _partial_ordering_base_builder(graph, colors, builder):
+    q = 0
+
+    # add variables and their cost
+    vertex_colors = list(itertools.product(graph.nodes, colors))
+    y = dict(
+        zip(
+            [(color, vertex) for vertex, color in vertex_colors],
+            builder.add_vars(
+                len(vertex_colors),
+                obj=[1 if vertex == q else 0 for vertex, _ in vertex_colors],
+                lb=0,
+                ub=1,
+                vtype="B",
+                names=[f"y_{color}_{vertex}" for vertex, color in vertex_colors],
+            ).tolist(),
+        )
+    )
+    z = dict(
+        zip(
+            vertex_colors,
+            builder.add_vars(
+                len(vertex_colors),
+                obj=0,
+                lb=0,
+                ub=1,
+                vtype="B",
+                names=[f"z_{vertex}_{color}" for vertex, color in vertex_colors],
+            ).tolist(),
+        )
+    )
+
+    # add constraint (16) and (17)
+    for v in graph.nodes:
+        builder.add_cons([z[v, 1]], 1, "=", 0)
+        builder.add_cons([y[colors[-1], v]], 1, "=", 0)
+
+    # add constraint (18), (19) and (21)
+    for v, c in itertools.product(graph.nodes, colors[:-1]):
+        builder.add_cons([y[c, v], y[c + 1, v]], [1, -1], ">", 0)
+        builder.add_cons([y[c, v], z[v, c + 1]], 1, "=", 1)
+        builder.add_cons([y[c, q], y[c, v]], [1, -1], ">", 0)
+
+    return builder, y, z
+
+
+@stage("build")
+def partial_ordering_sparse(
+    graph, color_upperbound, name="Partial Ordering Graph Coloring"
+):
+    """
+    Generates the sparse representation of the `partial_ordering` formulation.
+
+    Parameters
+    ----------
+    graph: networkx graph
+        Input graph
+    color_upperbound: int
+        Maximum number of colors to use
+    name: str
+        Name of the model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    graph = nx.convert_node_labels_to_integers(graph, first_label=0)
+    colors = list(range(color_upperbound))
+
+    builder, y, z = _partial_ordering_base_builder(graph, colors, InstanceBuilder(name))
+
+    # add constraint (20)
+    for (u, v), c in itertools.product(graph.edges, colors[:-1]):
+        builder.add_cons([y[c, u], z[u, c], y[c, v], z[v, c]], 1, ">", 1)
+
+    return builder.build("minimize")
+
+
+@stage("build")
+def hybrid_partial_ordering_sparse(
+    graph, color_upperbound, name="Hybrid Partial Ordering Graph Coloring"
+):
+    """
+    Generates the sparse representation of the `hybrid_partial_ordering` formulation.
+
+    Parameters
+    ----------
+    graph: networkx graph
+        Input graph
+    color_upperbound: int
+        Maximum number of colors to use
+    name: str
+        Name of the model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder(name)
+
+    graph = nx.convert_node_labels_to_integers(graph, first_label=0)
+    colors = list(range(color_upperbound))
+
+    # add variables and their cost
+    vertex_colors = list(itertools.product(graph.nodes, colors))
+    x = dict(
+        zip(
+            vertex_colors,
+            builder.add_vars(
+                len(vertex_colors),
+                obj=0,
+                lb=0,
+                ub=1,
+                vtype="B",
+                names=[f"x_{vertex}_{color}" for vertex, color in vertex_colors],
+            ).tolist(),
+        )
+    )
+
+    builder, y, z = _partial_ordering_base_builder(graph, colors, builder)
+
+    # add constraint (14)
+    for v, c in itertools.product(graph.nodes, colors):
+        builder.add_cons([x[v, c], y[c, v], z[v, c]], 1, "=", 1)
+
+    # add constraint (23)
+    for (u, v), c in itertools.product(graph.edges, colors):
+        builder.add_cons([x[u, c], x[v, c]], 1, "<", 1)
+
+    return builder.build("minimize")
+
+
+@size_estimator(assignment)
+@size_estimator(assignment_sparse)
+def _assignment_size(graph, color_upperbound, name=None, with_variables=False):
+    n, m, k = len(graph), graph.number_of_edges(), color_upperbound
+    return InstanceSize(n * k + k, n + m * k, n * k + 3 * m * k, True)
+
+
+@size_estimator(assignment_asymmetric)
+@size_estimator(assignment_asymmetric_sparse)
+def _assignment_asymmetric_size(graph, color_upperbound, name=None):
+    n, k = len(graph), color_upperbound
+    n_vars, n_conss, nnz, _ = _assignment_size(graph, k)
+    # constraints (5) and (6)
+    n_conss += k + max(k - 1, 0)
+    nnz += k * (n + 1) + 2 * max(k - 1, 0)
+    return InstanceSize(n_vars, n_conss, nnz, True)
+
+
+@size_estimator(representatives)
+@size_estimator(representatives_sparse)
+def _representatives_size(graph, name=None):
+    n, m = len(graph), graph.number_of_edges()
+    # constraint (9) has a row for every edge that isn't adjacent to u, counting them
+    # depends on the structure of the graph, but at least the edges of u are adjacent
+    n_triangle_rows = max(n * m - 2 * m, 0)
+    return InstanceSize(
+        n * n - 2 * m,
+        n + n_triangle_rows,
+        n * n - 2 * m + 3 * n_triangle_rows,
+        False,
+    )
+
+
+@size_estimator(set_covering)
+@size_estimator(set_covering_sparse)
+def _set_covering_size(graph, subsets, name=None):
+    # exact for distinct subsets, nodes are relabeled to 0, ..., n-1
+    nodes = set(range(len(graph)))
+    nnz = sum(len(nodes.intersection(s)) for s in subsets)
+    return InstanceSize(len(subsets), len(graph), nnz, True)
+
+
+def _partial_ordering_base_size(n, k):
+    # constraints (16) to (19) and (21), where (21) is empty for the vertex q
+    n_conss = 2 * n + 3 * n * (k - 1)
+    nnz = 2 * n + 4 * n * (k - 1) + 2 * (n - 1) * (k - 1)
+    return 2 * n * k, n_conss, nnz
+
+
+@size_estimator(partial_ordering)
+@size_estimator(partial_ordering_sparse)
+def _partial_ordering_size(graph, color_upperbound, name=None):
+    n, m, k = len(graph), graph.number_of_edges(), color_upperbound
+    n_vars, n_conss, nnz = _partial_ordering_base_size(n, k)
+    # constraint (20)
+    return InstanceSize(n_vars, n_conss + m * (k - 1), nnz + 4 * m * (k - 1), True)
+
+
+@size_estimator(hybrid_partial_ordering)
+@size_estimator(hybrid_partial_ordering_sparse)
+def _hybrid_partial_ordering_size(graph, color_upperbound, name=None):
+    n, m, k = len(graph), graph.number_of_edges(), color_upperbound
+    n_vars, n_conss, nnz = _partial_ordering_base_size(n, k)
+    # x variables, constraints (14) and (23)
+    return InstanceSize(
+        n_vars + n * k, n_conss + n * k + m * k, nnz + 3 * n * k + 2 * m * k, True
+    )
@@ -2,8 +2,11 @@ import networkx as nx
 import pyscipopt as scip
 
 from geco.mips.independent_set.generic import independent_set
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
+@stage("params")
 def barabasi_albert_params(n, m, seed=0):
     """
     Generates a maximum independent set instance params of graphs described in [1].
@@ -29,6 +32,7 @@ def barabasi_albert_params(n, m, seed=0):
     return nx.generators.barabasi_albert_graph(n, m, seed)
 
 
+@stage("instance")
 def barabasi_albert_instance(n, m, seed=0):
     """
     Generates a maximum independent set instance of graphs described in [1].
@@ -54,3 +58,9 @@ def barabasi_albert_instance(n, m, seed=0):
     return independent_set(
         barabasi_albert_params(n, m, seed), name="Barabasi-Albert Independent Set"
     )
+
+
+@size_estimator(barabasi_albert_instance)
+def _barabasi_albert_instance_size(n, m, seed=0):
+    # every node after the first m brings m edges
+    return InstanceSize(n, (n - m) * m, 2 * (n - m) * m, True)
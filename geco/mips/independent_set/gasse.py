@@ -2,8 +2,11 @@ import networkx as nx
 import pyscipopt as scip
 
 from geco.mips.independent_set.generic import clique_independent_set
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
+@stage("params")
 def gasse_params(n, p, seed=0):
     """
     Generates a maximum independent set instance as described in [1].
@@ -31,6 +34,7 @@ def gasse_params(n, p, seed=0):
     return nx.generators.erdos_renyi_graph(n, p, seed)
 
 
+@stage("instance")
 def gasse_instance(n, p, seed=0):
     """
     Generates a maximum independent set instance as described in [1].
@@ -58,3 +62,9 @@ def gasse_instance(n, p, seed=0):
     return clique_independent_set(
         gasse_params(n, p, seed), name="Gasse Independent Set"
     )
+
+
+@size_estimator(gasse_instance)
+def _gasse_instance_size(n, p, seed=0):
+    # the cliques partition the nodes, so there are at most as many as nodes
+    return InstanceSize(n, n, n, False)
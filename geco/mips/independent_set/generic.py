@@ -1,7 +1,13 @@
 import networkx as nx
+import numpy as np
 import pyscipopt as scip
 
+from geco.mips.utilities.instance import InstanceBuilder
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
+
+@stage("build")
 def independent_set(graph, name="Independent Set"):
     """
     Generates an independent set instance according to [1].
@@ -78,6 +84,7 @@ def _get_cliques(graph):
     return cliques
 
 
+@stage("build")
 def clique_independent_set(graph, name="Clique Independent Set"):
     """
     Generates an independent set instance according to [1, 4.6.4].
@@ -115,3 +122,78 @@ def clique_independent_set(graph, name="Clique Independent Set"):
     model.setMaximize()
 
     return model
+
+
+@stage("build")
+def independent_set_sparse(graph, name="Independent Set"):
+    """
+    Generates the sparse representation of the formulation in `independent_set`.
+
+    Parameters
+    ----------
+    graph: nx.Graph
+        Networkx undirected graph
+    name: str
+        Name of the generated model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    graph = nx.relabel.convert_node_labels_to_integers(graph)
+    builder = _node_vars(graph, name)
+    edges = np.array(graph.edges, dtype=np.int64).reshape(-1, 2)
+    rows = np.repeat(np.arange(len(edges)), 2)
+    builder.add_conss(rows, edges.ravel(), 1, "<", np.ones(len(edges)))
+    return builder.build("maximize")
+
+
+@stage("build")
+def clique_independent_set_sparse(graph, name="Clique Independent Set"):
+    """
+    Generates the sparse representation of the formulation in `clique_independent_set`.
+
+    Parameters
+    ----------
+    graph: nx.Graph
+        Networkx undirected graph
+    name: str
+        Name of the generated model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    graph = nx.relabel.convert_node_labels_to_integers(graph)
+    cliques = _get_cliques(graph)
+    builder = _node_vars(graph, name)
+    rows = np.repeat(np.arange(len(cliques)), [len(clique) for clique in cliques])
+    cols = np.array([node for clique in cliques for node in clique], dtype=np.int64)
+    builder.add_conss(rows, cols, 1, "<", np.ones(len(cliques)))
+    return builder.build("maximize")
+
+
+@size_estimator(independent_set)
+@size_estimator(independent_set_sparse)
+def _independent_set_size(graph, name=None):
+    m = graph.number_of_edges()
+    return InstanceSize(len(graph), m, 2 * m, True)
+
+
+@size_estimator(clique_independent_set)
+@size_estimator(clique_independent_set_sparse)
+def _clique_independent_set_size(graph, name=None):
+    # the cliques partition the nodes, so there are at most as many as nodes
+    return InstanceSize(len(graph), len(graph), len(graph), False)
+
+
+def _node_vars(graph, name):
+    # nodes are labeled 0 to n-1, so node labels are column indices
+    builder = InstanceBuilder(name)
+    n = graph.number_of_nodes()
+    builder.add_vars(
+        n, obj=1, lb=0, ub=1, vtype="B", names=[str(node) for node in range(n)]
+    )
+    return builder
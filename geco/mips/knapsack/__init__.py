@@ -1,3 +1,7 @@
 from geco.mips.knapsack.generic import *
 from geco.mips.knapsack.yang import *
 from geco.mips.knapsack.pisinger import *
+from geco.mips.knapsack.solver import *
+from geco.mips.knapsack.hardness import *
+from geco.mips.knapsack.multi import *
+from geco.mips.knapsack.batch import *
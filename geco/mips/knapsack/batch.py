@@ -0,0 +1,171 @@
+"""
+Generation of many knapsack instances at once as stacked arrays, e.g. as training data.
+
+All instances of a batch are drawn in a single vectorized call, SCIP models are only
+built for the instances a consumer asks for.
+"""
+
+import numpy as np
+from networkx.utils import py_random_state
+
+from geco.mips.knapsack.generic import knapsack, knapsack_sparse
+from geco.mips.utilities.sampling import integers, numpy_generator
+from geco.profiling import stage
+
+
+class KnapsackBatch:
+    """
+    Knapsack instances with the same number of items stored as stacked arrays.
+
+    A batch is a sequence of (profits, weights, capacity) tuples in the order returned
+    by the parameter generators, so it can be passed to functions taking instance
+    params, e.g. `parallel_solve_knapsack(batch)`.
+
+    Parameters
+    ----------
+    profits: numpy.ndarray of dimensions (B x n)
+        Profit of each item of each instance
+    weights: numpy.ndarray of dimensions (B x n)
+        Weight of each item of each instance
+    capacities: numpy.ndarray of size B
+        Capacity of each instance
+    """
+
+    def __init__(self, profits, weights, capacities):
+        self.profits = np.asarray(profits)
+        self.weights = np.asarray(weights)
+        self.capacities = np.asarray(capacities)
+        assert self.profits.ndim == 2
+        assert self.profits.shape == self.weights.shape
+        assert self.capacities.shape == (len(self.profits),)
+
+    def __len__(self):
+        return len(self.capacities)
+
+    def __getitem__(self, i):
+        if not -len(self) <= i < len(self):
+            raise IndexError(f"Instance {i} of a batch of {len(self)}")
+        return (
+            self.profits[i].tolist(),
+            self.weights[i].tolist(),
+            self.capacities[i].item(),
+        )
+
+    def __repr__(self):
+        batch_size, n = self.profits.shape
+        return f"KnapsackBatch({batch_size} instances, {n} items)"
+
+    def instance(self, i):
+        """
+        Builds the knapsack model of one instance.
+
+        Parameters
+        ----------
+        i: int
+            Index of the instance
+
+        Returns
+        -------
+        model: scip.Model
+            A pyscipopt model of the instance
+        """
+        profits, weights, capacity = self[i]
+        return knapsack(weights=weights, profits=profits, capacity=capacity)
+
+    def sparse_instance(self, i):
+        """
+        Builds the sparse representation of one instance.
+
+        Parameters
+        ----------
+        i: int
+            Index of the instance
+
+        Returns
+        -------
+        instance: MIPInstance
+            A sparse representation of the instance
+        """
+        profits, weights, capacity = self[i]
+        return knapsack_sparse(weights=weights, profits=profits, capacity=capacity)
+
+    def instances(self):
+        """
+        Builds the knapsack models of all instances one at a time.
+
+        Returns
+        -------
+        models: generator
+            Generator of the pyscipopt models of the instances in order
+        """
+        for i in range(len(self)):
+            yield self.instance(i)
+
+
+@stage("params")
+@py_random_state("seed")
+def yang_batch(batch_size, n, seed=0):
+    """
+    Generates a batch of knapsack instances according to [1], drawn like
+    `yang_params(n, fast=True)`.
+
+    Parameters
+    ----------
+    batch_size: int
+        Number of instances
+    n: int
+        Number of items
+    seed: integer, random_state, or None
+        Indicator of random number generation state
+
+    Returns
+    -------
+    batch: KnapsackBatch
+        The generated instances
+
+    References
+    ----------
+    .. [1] Yu Yang, Natashia Boland, Bistra Dilkina, Martin Savelsbergh,
+        "Learning Generalized Strong Branching for Set Covering,
+        Set Packing, and 0-1 Knapsack Problems", 2020.
+    """
+    rng = numpy_generator(seed)
+    profits = integers(rng, 1, 10 * n, size=(batch_size, n))
+    weights = integers(rng, 1, 10 * n, size=(batch_size, n))
+    return KnapsackBatch(profits, weights, weights.sum(axis=1) // 5)
+
+
+@stage("params")
+@py_random_state("seed")
+def pisinger_batch(batch_size, n, distribution, capacity_ratio=0.5, R=1000, seed=0):
+    """
+    Generates a batch of knapsack instances with items of a Pisinger distribution,
+    drawn with the array sampler of the distribution.
+
+    Parameters
+    ----------
+    batch_size: int
+        Number of instances
+    n: int
+        Number of items
+    distribution: function
+        One of the distribution functions of geco.mips.knapsack.pisinger, called with
+        the R and seed keywords
+    capacity_ratio: float
+        Capacity of each instance as a fraction of the sum of its weights
+    R: int
+        Bound for randomization range
+    seed: integer, random_state, or None
+        Indicator of random number generation state
+
+    Returns
+    -------
+    batch: KnapsackBatch
+        The generated instances
+    """
+    assert 0 < capacity_ratio <= 1
+    rng = numpy_generator(seed)
+    profits, weights = distribution(R=R, seed=seed)["sampler"](rng, batch_size * n)
+    profits = profits.reshape(batch_size, n)
+    weights = weights.reshape(batch_size, n)
+    return KnapsackBatch(profits, weights, capacity_ratio * weights.sum(axis=1))
@@ -1,6 +1,12 @@
+import numpy as np
 import pyscipopt as scip
 
+from geco.mips.utilities.instance import MIPInstance
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
+
+@stage("build")
 def knapsack(weights, profits, capacity, name="Knapsack"):
     """Generates a knapsack MIP formulation.
 
@@ -35,3 +41,231 @@ def knapsack(weights, profits, capacity, name="Knapsack"):
     model.setMaximize()
 
     return model
+
+
+@stage("build")
+def knapsack_sparse(weights, profits, capacity, name="Knapsack"):
+    """Generates the sparse representation of the knapsack formulation in `knapsack`.
+
+    Parameters:
+    ----------
+        profits: list[float]
+            List of profits of each item
+        weights: list[float]
+            List of weights of each item
+        capacity: float
+            Capacity of knapsack
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    import scipy.sparse
+
+    weights = np.asarray(weights, dtype=float)
+    profits = np.asarray(profits, dtype=float)
+    assert len(weights) == len(profits)
+    assert capacity >= 0
+    assert (weights >= 0).all()
+    assert (profits >= 0).all()
+
+    n = len(profits)
+    nonzero = np.flatnonzero(weights)
+    A = scipy.sparse.csr_matrix(
+        (weights[nonzero], nonzero, [0, len(nonzero)]), shape=(1, n)
+    )
+    return MIPInstance(
+        c=profits,
+        A=A,
+        senses=["<"],
+        rhs=[capacity],
+        lb=np.zeros(n),
+        ub=np.ones(n),
+        vtypes=np.full(n, "B"),
+        sense="maximize",
+        name=name,
+    )
+
+
+@size_estimator(knapsack)
+@size_estimator(knapsack_sparse)
+def _knapsack_size(weights, profits, capacity, name=None):
+    nnz = sum(1 for weight in weights if weight != 0)
+    return InstanceSize(len(profits), 1, nnz, True)
+
+
+@stage("build")
+def multidimensional_knapsack(
+    weights, profits, capacities, name="Multidimensional Knapsack"
+):
+    """Generates a multidimensional knapsack MIP formulation, where every item has a
+    weight in each of the m dimensions and each dimension has its own capacity.
+
+    The model is built from `multidimensional_knapsack_sparse` with
+    `MIPInstance.to_scip`, which adds each row at once from the matrix.
+
+    Parameters:
+    ----------
+        weights: array-like of dimensions (m x n)
+            Weight of each item in each dimension
+        profits: list[float]
+            List of profits of each item
+        capacities: list[float]
+            Capacity of each dimension
+
+    Returns
+    -------
+    model: scip.Model
+        A pyscipopt model of the generated instance
+    """
+    return multidimensional_knapsack_sparse(
+        weights, profits, capacities, name
+    ).to_scip()
+
+
+@stage("build")
+def multidimensional_knapsack_sparse(
+    weights, profits, capacities, name="Multidimensional Knapsack"
+):
+    """Generates the sparse representation of the formulation in
+    `multidimensional_knapsack`.
+
+    Parameters:
+    ----------
+        weights: array-like of dimensions (m x n)
+            Weight of each item in each dimension
+        profits: list[float]
+            List of profits of each item
+        capacities: list[float]
+            Capacity of each dimension
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    import scipy.sparse
+
+    profits = np.asarray(profits, dtype=float)
+    n = len(profits)
+    weights = np.asarray(weights, dtype=float).reshape(-1, n)
+    capacities = np.asarray(capacities, dtype=float)
+    assert len(capacities) == len(weights)
+    assert (capacities >= 0).all()
+    assert (weights >= 0).all()
+    assert (profits >= 0).all()
+
+    A = scipy.sparse.csr_matrix(weights)
+    A.eliminate_zeros()
+    return MIPInstance(
+        c=profits,
+        A=A,
+        senses=np.full(len(capacities), "<"),
+        rhs=capacities,
+        lb=np.zeros(n),
+        ub=np.ones(n),
+        vtypes=np.full(n, "B"),
+        sense="maximize",
+        name=name,
+    )
+
+
+@size_estimator(multidimensional_knapsack)
+@size_estimator(multidimensional_knapsack_sparse)
+def _multidimensional_knapsack_size(weights, profits, capacities, name=None):
+    nnz = int(np.count_nonzero(np.asarray(weights)))
+    return InstanceSize(len(profits), len(capacities), nnz, True)
+
+
+@stage("build")
+def multiple_knapsack(weights, profits, capacities, name="Multiple Knapsack"):
+    """Generates a multiple knapsack MIP formulation, where each item is packed into at
+    most one of k knapsacks with their own capacities.
+
+    Variable x_i_j packs item i into knapsack j. The first k constraints are the
+    capacities of the knapsacks, the following n ones pack each item at most once. The
+    model is built from `multiple_knapsack_sparse` with `MIPInstance.to_scip`, which
+    adds each row at once from the matrix.
+
+    Parameters:
+    ----------
+        weights: list[float]
+            List of weights of each item
+        profits: list[float]
+            List of profits of each item
+        capacities: list[float]
+            Capacity of each knapsack
+
+    Returns
+    -------
+    model: scip.Model
+        A pyscipopt model of the generated instance
+    """
+    return multiple_knapsack_sparse(weights, profits, capacities, name).to_scip()
+
+
+@stage("build")
+def multiple_knapsack_sparse(weights, profits, capacities, name="Multiple Knapsack"):
+    """Generates the sparse representation of the formulation in `multiple_knapsack`.
+
+    Parameters:
+    ----------
+        weights: list[float]
+            List of weights of each item
+        profits: list[float]
+            List of profits of each item
+        capacities: list[float]
+            Capacity of each knapsack
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    import scipy.sparse
+
+    weights = np.asarray(weights, dtype=float)
+    profits = np.asarray(profits, dtype=float)
+    capacities = np.asarray(capacities, dtype=float)
+    assert len(weights) == len(profits)
+    assert (capacities >= 0).all()
+    assert (weights >= 0).all()
+    assert (profits >= 0).all()
+
+    n, k = len(profits), len(capacities)
+    # x_i_j is variable i * k + j
+    items = np.repeat(np.arange(n), k)
+    knapsacks = np.tile(np.arange(k), n)
+    variables = np.arange(n * k)
+    nonzero = weights[items] != 0
+    A = scipy.sparse.csr_matrix(
+        (
+            np.concatenate([weights[items][nonzero], np.ones(n * k)]),
+            (
+                np.concatenate([knapsacks[nonzero], k + items]),
+                np.concatenate([variables[nonzero], variables]),
+            ),
+        ),
+        shape=(k + n, n * k),
+    )
+    return MIPInstance(
+        c=profits[items],
+        A=A,
+        senses=np.full(k + n, "<"),
+        rhs=np.concatenate([capacities, np.ones(n)]),
+        lb=np.zeros(n * k),
+        ub=np.ones(n * k),
+        vtypes=np.full(n * k, "B"),
+        var_names=[f"x_{i}_{j}" for i in range(n) for j in range(k)],
+        sense="maximize",
+        name=name,
+    )
+
+
+@size_estimator(multiple_knapsack)
+@size_estimator(multiple_knapsack_sparse)
+def _multiple_knapsack_size(weights, profits, capacities, name=None):
+    n, k = len(profits), len(capacities)
+    nnz = int(np.count_nonzero(np.asarray(weights))) * k + n * k
+    return InstanceSize(n * k, k + n, nnz, True)
@@ -0,0 +1,215 @@
+"""
+Cheap hardness indicators of knapsack instances and generation of instances above a
+hardness threshold by rejection sampling.
+
+As shown in [1], only some distributions and capacities lead to hard instances. The
+indicators only need the LP relaxation, so whole batches of candidates are scored with
+a few array operations before any of them is solved.
+
+References
+----------
+.. [1] David Pisinger. 2005. Where are the hard knapsack problems?
+Comput. Oper. Res. 32, 9 (September 2005), 2271–2284.
+DOI:https://doi.org/10.1016/j.cor.2004.03.002
+"""
+
+import numpy as np
+from networkx.utils import py_random_state
+
+from geco.mips.utilities.sampling import numpy_generator
+from geco.profiling import stage
+
+
+def hardness_indicators(profits, weights, capacity):
+    """
+    Calculates cheap indicators of the hardness of a knapsack instance from its LP
+    relaxation.
+
+    Parameters
+    ----------
+    profits: list[float]
+        Profit of each item
+    weights: list[float]
+        Weight of each item
+    capacity: float
+        Capacity of knapsack
+
+    Returns
+    -------
+    indicators: dict
+        gap: relative gap between the Dantzig bound and the value of the greedy
+        solution, which packs every item that still fits by decreasing profit/weight
+        ratio.
+        core_size: number of items that the Dembo-Hammer reduction with these two bounds
+        can't fix, an estimate of the number of items a core based solver like
+        geco.mips.knapsack.solve_knapsack has to enumerate.
+        correlation: Pearson correlation of the profits and the weights.
+    """
+    indicators = _batch_indicators(
+        np.asarray([profits], dtype=float),
+        np.asarray([weights], dtype=float),
+        np.asarray([capacity], dtype=float),
+    )
+    return {name: values[0].item() for name, values in indicators.items()}
+
+
+@stage("params")
+@py_random_state("seed")
+def hardness_targeted_params(
+    n,
+    n_instances,
+    distribution,
+    capacity_ratio=0.5,
+    min_gap=None,
+    min_core_size=None,
+    min_correlation=None,
+    R=1000,
+    batch_size=1000,
+    max_candidates=10**6,
+    seed=0,
+):
+    """
+    Generates knapsack instance params of a Pisinger distribution whose hardness
+    indicators reach the given thresholds.
+
+    Candidates are drawn in batches with the array sampler of the distribution and
+    rejected unless all their `hardness_indicators` reach the thresholds.
+
+    Parameters
+    ----------
+    n: int
+        Number of items
+    n_instances: int
+        Number of instances to generate
+    distribution: function
+        One of the distribution functions of geco.mips.knapsack.pisinger, called with
+        the R and seed keywords
+    capacity_ratio: float
+        Capacity of each instance as a fraction of the sum of its weights
+    min_gap: float or None
+        Minimum relative gap between the Dantzig bound and the greedy solution
+    min_core_size: int or None
+        Minimum number of items the Dembo-Hammer reduction can't fix
+    min_correlation: float or None
+        Minimum correlation of profits and weights
+    R: int
+        Bound for randomization range
+    batch_size: int
+        Number of candidates drawn and scored at once
+    max_candidates: int
+        Maximum number of candidates drawn, fewer instances are returned if too few of
+        them are accepted
+    seed: integer, random_state, or None
+        Indicator of random number generation state
+
+    Returns
+    -------
+    instances: list[tuple]
+        Tuples (profits, weights, capacity) of the accepted instances
+    report: dict
+        Number of candidates drawn and accepted and the acceptance rate
+    """
+    assert 0 < capacity_ratio < 1
+    sampler = distribution(R=R, seed=seed)["sampler"]
+    rng = numpy_generator(seed)
+    thresholds = {
+        "gap": min_gap,
+        "core_size": min_core_size,
+        "correlation": min_correlation,
+    }
+
+    instances = []
+    candidates = 0
+    while len(instances) < n_instances and candidates < max_candidates:
+        size = min(batch_size, max_candidates - candidates)
+        profits, weights = sampler(rng, size * n)
+        profits = profits.reshape(size, n)
+        weights = weights.reshape(size, n)
+        capacities = capacity_ratio * weights.sum(axis=1)
+        candidates += size
+
+        indicators = _batch_indicators(profits, weights, capacities)
+        accepted = np.ones(size, dtype=bool)
+        for name, threshold in thresholds.items():
+            if threshold is not None:
+                accepted &= indicators[name] >= threshold
+        accepted = np.flatnonzero(accepted)[: n_instances - len(instances)]
+        if len(instances) + len(accepted) == n_instances:
+            # the candidates after the last accepted one weren't needed
+            candidates -= size - 1 - int(accepted[-1])
+        for i in accepted:
+            instances.append(
+                (profits[i].tolist(), weights[i].tolist(), capacities[i].item())
+            )
+
+    report = {
+        "candidates": candidates,
+        "accepted": len(instances),
+        "acceptance_rate": len(instances) / candidates if candidates else 0.0,
+    }
+    return instances, report
+
+
+def _batch_indicators(profits, weights, capacities):
+    # profits and weights have one row per instance, items that don't fit on their own
+    # or have no weight are ignored by the LP bounds
+    n = profits.shape[1]
+    if n == 0:
+        return {
+            "gap": np.zeros(len(profits)),
+            "core_size": np.zeros(len(profits), dtype=int),
+            "correlation": np.zeros(len(profits)),
+        }
+    usable = (weights > 0) & (weights <= capacities[:, None])
+    ratios = np.where(usable, profits / np.where(weights > 0, weights, 1), -np.inf)
+    order = np.argsort(-ratios, axis=1, kind="stable")
+    sorted_profits = np.where(usable, profits, 0)[
+        np.arange(len(profits))[:, None], order
+    ]
+    sorted_weights = np.where(usable, weights, 0)[
+        np.arange(len(profits))[:, None], order
+    ]
+
+    weight_sums = np.cumsum(sorted_weights, axis=1)
+    profit_sums = np.cumsum(sorted_profits, axis=1)
+    packed = (weight_sums <= capacities[:, None]).sum(axis=1)
+    has_break = packed < usable.sum(axis=1)
+
+    rows = np.arange(len(profits))
+    split = np.minimum(packed, n - 1)
+    used = np.where(packed > 0, weight_sums[rows, packed - 1], 0)
+    break_ratio = np.divide(
+        sorted_profits[rows, split],
+        sorted_weights[rows, split],
+        out=np.zeros(len(profits)),
+        where=has_break,
+    )
+    upper = np.where(packed > 0, profit_sums[rows, packed - 1], 0)
+    upper = upper + np.where(has_break, (capacities - used) * break_ratio, 0)
+
+    # the greedy solutions of all instances, one item at a time
+    lower = np.zeros(len(profits))
+    remaining = capacities.copy()
+    for j in range(n):
+        fits = sorted_weights[:, j] <= remaining
+        lower += np.where(fits, sorted_profits[:, j], 0)
+        remaining -= np.where(fits, sorted_weights[:, j], 0)
+
+    # Dembo-Hammer: flipping an item costs at least |p - r w| of the LP bound, so the
+    # items it can't fix are those with a smaller cost than the gap
+    costs = np.abs(profits - break_ratio[:, None] * weights)
+    unfixed = usable & (costs < (upper - lower)[:, None]) & has_break[:, None]
+
+    centered_profits = profits - profits.mean(axis=1, keepdims=True)
+    centered_weights = weights - weights.mean(axis=1, keepdims=True)
+    norms = np.sqrt(
+        (centered_profits**2).sum(axis=1) * (centered_weights**2).sum(axis=1)
+    )
+    covariance = (centered_profits * centered_weights).sum(axis=1)
+    return {
+        "gap": np.where(upper > 0, (upper - lower) / np.where(upper > 0, upper, 1), 0),
+        "core_size": unfixed.sum(axis=1),
+        "correlation": np.where(
+            norms > 0, covariance / np.where(norms > 0, norms, 1), 0
+        ),
+    }
@@ -0,0 +1,194 @@
+"""
+Multidimensional and multiple knapsack instances whose items follow the distributions
+of geco.mips.knapsack.pisinger.
+
+All values are drawn as arrays with the samplers of the distributions, see
+geco.mips.utilities.sampling for the reproducibility of NumPy draws.
+"""
+
+from networkx.utils import py_random_state
+
+from geco.mips.knapsack.generic import multidimensional_knapsack, multiple_knapsack
+from geco.mips.utilities.sampling import numpy_generator
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
+
+
+@stage("params")
+@py_random_state("seed")
+def multidimensional_params(n, m, distribution, capacity_ratio=0.5, R=1000, seed=0):
+    """
+    Generates multidimensional knapsack instance params with items of a Pisinger
+    distribution.
+
+    Every dimension draws the weights and profits of all items from the distribution,
+    the profit of an item is its average profit over the dimensions. So profits are
+    correlated with the average weight the same way they are correlated with the weight
+    in the distribution, like in the instances of [1]. The capacity of each dimension
+    is a fraction of its total weight.
+
+    Parameters
+    ----------
+    n: int
+        Number of items
+    m: int
+        Number of dimensions
+    distribution: function
+        One of the distribution functions of geco.mips.knapsack.pisinger, called with
+        the R and seed keywords
+    capacity_ratio: float
+        Capacity of each dimension as a fraction of its total weight
+    R: int
+        Bound for randomization range
+    seed: integer, random_state, or None
+        Indicator of random number generation state
+
+    Returns
+    -------
+    weights: numpy.ndarray of dimensions (m x n)
+        Weight of each item in each dimension
+    profits: numpy.ndarray
+        Profit of each item
+    capacities: numpy.ndarray
+        Capacity of each dimension
+
+    References
+    ----------
+    .. [1] P.C. Chu, J.E. Beasley. 1998. A Genetic Algorithm for the Multidimensional
+    Knapsack Problem. Journal of Heuristics 4, 63–86.
+    DOI:https://doi.org/10.1023/A:1009642405419
+    """
+    assert 0 < capacity_ratio <= 1
+    rng = numpy_generator(seed)
+    profits, weights = distribution(R=R, seed=seed)["sampler"](rng, m * n)
+    weights = weights.reshape(m, n)
+    profits = profits.reshape(m, n).mean(axis=0)
+    capacities = capacity_ratio * weights.sum(axis=1)
+    return weights, profits, capacities
+
+
+@stage("instance")
+@py_random_state("seed")
+def multidimensional_instance(n, m, distribution, capacity_ratio=0.5, R=1000, seed=0):
+    """
+    Generates a multidimensional knapsack instance with items of a Pisinger
+    distribution, see `multidimensional_params`.
+
+    Parameters
+    ----------
+    n: int
+        Number of items
+    m: int
+        Number of dimensions
+    distribution: function
+        One of the distribution functions of geco.mips.knapsack.pisinger, called with
+        the R and seed keywords
+    capacity_ratio: float
+        Capacity of each dimension as a fraction of its total weight
+    R: int
+        Bound for randomization range
+    seed: integer, random_state, or None
+        Indicator of random number generation state
+
+    Returns
+    -------
+    model: scip.Model
+        A pyscipopt model of the generated instance
+    """
+    return multidimensional_knapsack(
+        *multidimensional_params(n, m, distribution, capacity_ratio, R, seed)
+    )
+
+
+@size_estimator(multidimensional_instance)
+def _multidimensional_instance_size(
+    n, m, distribution, capacity_ratio=0.5, R=1000, seed=0
+):
+    # the distributions only draw positive weights
+    return InstanceSize(n, m, n * m, True)
+
+
+@stage("params")
+@py_random_state("seed")
+def multiple_params(n, k, distribution, capacity_ratio=0.5, R=1000, seed=0):
+    """
+    Generates multiple knapsack instance params with items of a Pisinger distribution.
+
+    The knapsacks have similar capacities as in [1]: their shares of the total capacity
+    are drawn uniformly from [0.8, 1.2] and normalized.
+
+    Parameters
+    ----------
+    n: int
+        Number of items
+    k: int
+        Number of knapsacks
+    distribution: function
+        One of the distribution functions of geco.mips.knapsack.pisinger, called with
+        the R and seed keywords
+    capacity_ratio: float
+        Total capacity of the knapsacks as a fraction of the total weight
+    R: int
+        Bound for randomization range
+    seed: integer, random_state, or None
+        Indicator of random number generation state
+
+    Returns
+    -------
+    weights: numpy.ndarray
+        Weight of each item
+    profits: numpy.ndarray
+        Profit of each item
+    capacities: numpy.ndarray
+        Capacity of each knapsack
+
+    References
+    ----------
+    .. [1] David Pisinger. 1999. An exact algorithm for large multiple knapsack
+    problems. European Journal of Operational Research 114, 3, 528–541.
+    DOI:https://doi.org/10.1016/S0377-2217(98)00120-9
+    """
+    assert 0 < capacity_ratio <= 1
+    rng = numpy_generator(seed)
+    profits, weights = distribution(R=R, seed=seed)["sampler"](rng, n)
+    shares = rng.uniform(0.8, 1.2, k)
+    capacities = capacity_ratio * weights.sum() * shares / shares.sum()
+    return weights, profits, capacities
+
+
+@stage("instance")
+@py_random_state("seed")
+def multiple_instance(n, k, distribution, capacity_ratio=0.5, R=1000, seed=0):
+    """
+    Generates a multiple knapsack instance with items of a Pisinger distribution, see
+    `multiple_params`.
+
+    Parameters
+    ----------
+    n: int
+        Number of items
+    k: int
+        Number of knapsacks
+    distribution: function
+        One of the distribution functions of geco.mips.knapsack.pisinger, called with
+        the R and seed keywords
+    capacity_ratio: float
+        Total capacity of the knapsacks as a fraction of the total weight
+    R: int
+        Bound for randomization range
+    seed: integer, random_state, or None
+        Indicator of random number generation state
+
+    Returns
+    -------
+    model: scip.Model
+        A pyscipopt model of the generated instance
+    """
+    return multiple_knapsack(
+        *multiple_params(n, k, distribution, capacity_ratio, R, seed)
+    )
+
+
+@size_estimator(multiple_instance)
+def _multiple_instance_size(n, k, distribution, capacity_ratio=0.5, R=1000, seed=0):
+    return InstanceSize(n * k, k + n, 2 * n * k, True)
@@ -1,12 +1,22 @@
 import math
 
+import numpy as np
 from networkx.utils import py_random_state
 
 from geco.mips.knapsack.generic import knapsack
+from geco.mips.utilities.sampling import numpy_generator
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
 def _correlated_knapsack_template(
-    number_of_items, capacity, profit_generator, weight_generator, profit_first
+    number_of_items,
+    capacity,
+    profit_generator,
+    weight_generator,
+    profit_first,
+    sampler=None,
+    rng=None,
 ):
     """A template for generating knapsack instances given a relation between the weights and the profits
 
@@ -22,6 +32,11 @@ def _correlated_knapsack_template(
         Takes a profit and generates a weight
     profit_first: bool
         Defines if the profits are to be generated first
+    sampler: function or None
+        Takes a numpy.random.Generator and a number of items and returns arrays of
+        profits and weights
+    rng: numpy.random.Generator or None
+        Generator to draw all items at once with the sampler
 
     Returns
     -------
@@ -29,14 +44,51 @@ def _correlated_knapsack_template(
         A pyscipopt model of the generated instance
     """
     profits, weights = generate_from_distribution(
-        number_of_items, profit_generator, weight_generator, profit_first
+        number_of_items, profit_generator, weight_generator, profit_first, sampler, rng
     )
     return knapsack(profits, weights, capacity)
 
 
+@stage("params")
 def generate_from_distribution(
-    number_of_items, profit_generator, weight_generator, profit_first
+    number_of_items,
+    profit_generator,
+    weight_generator,
+    profit_first,
+    sampler=None,
+    rng=None,
 ):
+    """
+    Generates the profits and weights of the items of a distribution.
+
+    Parameters
+    ----------
+    number_of_items: int
+        Number of items in knapsack
+    profit_generator: function
+        Takes a weight and generates a profit
+    weight_generator: function
+        Takes a profit and generates a weight
+    profit_first: bool
+        Defines if the profits are to be generated first
+    sampler: function or None
+        Takes a numpy.random.Generator and a number of items and returns arrays of
+        profits and weights
+    rng: numpy.random.Generator or None
+        Generator to draw all items at once with the sampler, None (or a distribution
+        without sampler) calls the generators once per item
+
+    Returns
+    -------
+    profits: list[float]
+        Profit of each item
+    weights: list[float]
+        Weight of each item
+    """
+    if rng is not None and sampler is not None:
+        profits, weights = sampler(rng, number_of_items)
+        return profits.tolist(), weights.tolist()
+
     if profit_first:
         profits = [profit_generator(None) for _ in range(number_of_items)]
         weights = [weight_generator(profit) for profit in profits]
@@ -47,6 +99,24 @@ def generate_from_distribution(
     return profits, weights
 
 
+def _profits_first_sampler(low, high, weight_function):
+    # profits are uniform in [low, high], weight_function(profits, rng) gives the weights
+    def sampler(rng, n):
+        profits = rng.uniform(low, high, n)
+        return profits, weight_function(profits, rng)
+
+    return sampler
+
+
+def _weights_first_sampler(low, high, profit_function):
+    # weights are uniform in [low, high], profit_function(weights, rng) gives the profits
+    def sampler(rng, n):
+        weights = rng.uniform(low, high, n)
+        return profit_function(weights, rng), weights
+
+    return sampler
+
+
 @py_random_state("seed")
 def uncorrelated_distribution(R, seed=0):
     """
@@ -67,6 +137,9 @@ def uncorrelated_distribution(R, seed=0):
         Takes a profit and generates a weight
     profit_first: bool
         Defines if the profits are to be generated first
+    sampler: function
+        Takes a numpy.random.Generator and a number of items and returns arrays of
+        profits and weights
 
     References
     ----------
@@ -78,11 +151,15 @@ def uncorrelated_distribution(R, seed=0):
         "weight_generator": lambda p: seed.uniform(1, R),
         "profit_generator": lambda w: seed.uniform(1, R),
         "profit_first": True,
+        "sampler": _profits_first_sampler(
+            1, R, lambda p, rng: rng.uniform(1, R, len(p))
+        ),
     }
 
 
+@stage("instance")
 @py_random_state("seed")
-def uncorrelated(n, c, R=1000, seed=0):
+def uncorrelated(n, c, R=1000, seed=0, fast=False):
     """
     Generates an uncorrelated distribution knapsack instance as described in section 3 of [1].
 
@@ -96,6 +173,8 @@ def uncorrelated(n, c, R=1000, seed=0):
         Bound for randomization range
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all items at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -109,7 +188,10 @@ def uncorrelated(n, c, R=1000, seed=0):
     DOI:https://doi.org/10.1016/j.cor.2004.03.002
     """
     return _correlated_knapsack_template(
-        number_of_items=n, capacity=c, **uncorrelated_distribution(R, seed)
+        number_of_items=n,
+        capacity=c,
+        rng=numpy_generator(seed) if fast else None,
+        **uncorrelated_distribution(R, seed),
     )
 
 
@@ -133,6 +215,9 @@ def weakly_correlated_distribution(R, seed=0):
         Takes a profit and generates a weight
     profit_first: bool
         Defines if the profits are to be generated first
+    sampler: function
+        Takes a numpy.random.Generator and a number of items and returns arrays of
+        profits and weights
 
     References
     ----------
@@ -144,11 +229,15 @@ def weakly_correlated_distribution(R, seed=0):
         "weight_generator": lambda p: seed.uniform(1, R),
         "profit_generator": lambda w: max(1, seed.uniform(w - R / 10, w + R / 10)),
         "profit_first": False,
+        "sampler": _weights_first_sampler(
+            1, R, lambda w, rng: np.maximum(1, rng.uniform(w - R / 10, w + R / 10))
+        ),
     }
 
 
+@stage("instance")
 @py_random_state("seed")
-def weakly_correlated(n, c, R=1000, seed=0):
+def weakly_correlated(n, c, R=1000, seed=0, fast=False):
     """
     Generates an weakly correlated distribution knapsack instance as described in section 3 of [1].
 
@@ -162,6 +251,8 @@ def weakly_correlated(n, c, R=1000, seed=0):
         Bound for randomization range
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all items at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -177,6 +268,7 @@ def weakly_correlated(n, c, R=1000, seed=0):
     return _correlated_knapsack_template(
         number_of_items=n,
         capacity=c,
+        rng=numpy_generator(seed) if fast else None,
         **weakly_correlated_distribution(R, seed),
     )
 
@@ -201,6 +293,9 @@ def strongly_correlated_distribution(R, seed=0):
         Takes a profit and generates a weight
     profit_first: bool
         Defines if the profits are to be generated first
+    sampler: function
+        Takes a numpy.random.Generator and a number of items and returns arrays of
+        profits and weights
 
     References
     ----------
@@ -212,11 +307,13 @@ def strongly_correlated_distribution(R, seed=0):
         "weight_generator": lambda p: seed.uniform(1, R),
         "profit_generator": lambda w: w + R / 10,
         "profit_first": False,
+        "sampler": _weights_first_sampler(1, R, lambda w, rng: w + R / 10),
     }
 
 
+@stage("instance")
 @py_random_state("seed")
-def strongly_correlated(n, c, R=1000, seed=0):
+def strongly_correlated(n, c, R=1000, seed=0, fast=False):
     """
     Generates a strongly correlated distribution knapsack instance as described in section 3 of [1].
 
@@ -230,6 +327,8 @@ def strongly_correlated(n, c, R=1000, seed=0):
         Bound for randomization range
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all items at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -245,6 +344,7 @@ def strongly_correlated(n, c, R=1000, seed=0):
     return _correlated_knapsack_template(
         number_of_items=n,
         capacity=c,
+        rng=numpy_generator(seed) if fast else None,
         **strongly_correlated_distribution(R, seed),
     )
 
@@ -269,6 +369,9 @@ def inverse_strongly_correlated_distribution(R, seed=0):
         Takes a profit and generates a weight
     profit_first: bool
         Defines if the profits are to be generated first
+    sampler: function
+        Takes a numpy.random.Generator and a number of items and returns arrays of
+        profits and weights
 
     References
     ----------
@@ -280,11 +383,13 @@ def inverse_strongly_correlated_distribution(R, seed=0):
         "weight_generator": lambda p: p + R / 10,
         "profit_generator": lambda w: seed.uniform(1, R),
         "profit_first": True,
+        "sampler": _profits_first_sampler(1, R, lambda p, rng: p + R / 10),
     }
 
 
+@stage("instance")
 @py_random_state("seed")
-def inverse_strongly_correlated(n, c, R=1000, seed=0):
+def inverse_strongly_correlated(n, c, R=1000, seed=0, fast=False):
     """
     Generates an inverse strongly correlated distribution knapsack instance as described in section 3 of [1].
 
@@ -298,6 +403,8 @@ def inverse_strongly_correlated(n, c, R=1000, seed=0):
         Bound for randomization range
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all items at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -313,6 +420,7 @@ def inverse_strongly_correlated(n, c, R=1000, seed=0):
     return _correlated_knapsack_template(
         number_of_items=n,
         capacity=c,
+        rng=numpy_generator(seed) if fast else None,
         **inverse_strongly_correlated_distribution(R, seed),
     )
 
@@ -337,6 +445,9 @@ def almost_strongly_correlated_distribution(R, seed=0):
         Takes a profit and generates a weight
     profit_first: bool
         Defines if the profits are to be generated first
+    sampler: function
+        Takes a numpy.random.Generator and a number of items and returns arrays of
+        profits and weights
 
     References
     ----------
@@ -350,11 +461,14 @@ def almost_strongly_correlated_distribution(R, seed=0):
             w + R / 10 - R / 500, w + R / 10 - R / 500
         ),
         "profit_first": False,
+        # the range of the profit generator is a single value
+        "sampler": _weights_first_sampler(1, R, lambda w, rng: w + R / 10 - R / 500),
     }
 
 
+@stage("instance")
 @py_random_state("seed")
-def almost_strongly_correlated(n, c, R=1000, seed=0):
+def almost_strongly_correlated(n, c, R=1000, seed=0, fast=False):
     """
     Generates an almost strongly correlated distribution knapsack instance as described in section 3 of [1].
 
@@ -368,6 +482,8 @@ def almost_strongly_correlated(n, c, R=1000, seed=0):
         Bound for randomization range
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all items at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -383,6 +499,7 @@ def almost_strongly_correlated(n, c, R=1000, seed=0):
     return _correlated_knapsack_template(
         number_of_items=n,
         capacity=c,
+        rng=numpy_generator(seed) if fast else None,
         **almost_strongly_correlated_distribution(R, seed),
     )
 
@@ -407,6 +524,9 @@ def subset_sum_distribution(R, seed=0):
         Takes a profit and generates a weight
     profit_first: bool
         Defines if the profits are to be generated first
+    sampler: function
+        Takes a numpy.random.Generator and a number of items and returns arrays of
+        profits and weights
 
     References
     ----------
@@ -418,11 +538,13 @@ def subset_sum_distribution(R, seed=0):
         "weight_generator": lambda p: seed.uniform(1, R),
         "profit_generator": lambda w: w,
         "profit_first": False,
+        "sampler": _weights_first_sampler(1, R, lambda w, rng: w.copy()),
     }
 
 
+@stage("instance")
 @py_random_state("seed")
-def subset_sum(n, c, R=1000, seed=0):
+def subset_sum(n, c, R=1000, seed=0, fast=False):
     """
     Generates an subset sum distribution knapsack instance as described in section 3 of [1].
 
@@ -436,6 +558,8 @@ def subset_sum(n, c, R=1000, seed=0):
         Bound for randomization range
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all items at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -449,7 +573,10 @@ def subset_sum(n, c, R=1000, seed=0):
     DOI:https://doi.org/10.1016/j.cor.2004.03.002
     """
     return _correlated_knapsack_template(
-        number_of_items=n, capacity=c, **subset_sum_distribution(R, seed)
+        number_of_items=n,
+        capacity=c,
+        rng=numpy_generator(seed) if fast else None,
+        **subset_sum_distribution(R, seed),
     )
 
 
@@ -473,6 +600,9 @@ def uncorrelated_with_similar_weights_distribution(R=None, seed=0):
         Takes a profit and generates a weight
     profit_first: bool
         Defines if the profits are to be generated first
+    sampler: function
+        Takes a numpy.random.Generator and a number of items and returns arrays of
+        profits and weights
 
     References
     ----------
@@ -484,11 +614,15 @@ def uncorrelated_with_similar_weights_distribution(R=None, seed=0):
         "weight_generator": lambda p: seed.uniform(100_000, 100_100),
         "profit_generator": lambda w: seed.uniform(1, 1000),
         "profit_first": False,
+        "sampler": _weights_first_sampler(
+            100_000, 100_100, lambda w, rng: rng.uniform(1, 1000, len(w))
+        ),
     }
 
 
+@stage("instance")
 @py_random_state("seed")
-def uncorrelated_with_similar_weights(n, c, R=1000, seed=0):
+def uncorrelated_with_similar_weights(n, c, R=1000, seed=0, fast=False):
     """
     Generates an uncorrelated with similar weights distribution knapsack instance as described in section 3 of [1].
 
@@ -502,6 +636,8 @@ def uncorrelated_with_similar_weights(n, c, R=1000, seed=0):
         Bound for randomization range
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all items at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -517,12 +653,14 @@ def uncorrelated_with_similar_weights(n, c, R=1000, seed=0):
     return _correlated_knapsack_template(
         number_of_items=n,
         capacity=c,
+        rng=numpy_generator(seed) if fast else None,
         **uncorrelated_with_similar_weights_distribution(R, seed),
     )
 
 
+@stage("instance")
 @py_random_state("seed")
-def spanner(v, m, n, distribution, capacity, R=1000, seed=0):
+def spanner(v, m, n, distribution, capacity, R=1000, seed=0, fast=False):
     """
     Generates a spanner knapsack instance as described in section 3 of [1].
 
@@ -534,14 +672,17 @@ def spanner(v, m, n, distribution, capacity, R=1000, seed=0):
         The multiplier limit
     n: int
         Number of items in knapsack
-    distribution: dict
-        As returned by one of the distribution functions defined in this module
+    distribution: function
+        One of the distribution functions defined in this module, called with the R and
+        seed keywords
     capacity: float
         Capacity of knapsack
     R: int
         Bound for randomization range
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all items at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -554,8 +695,15 @@ def spanner(v, m, n, distribution, capacity, R=1000, seed=0):
     Comput. Oper. Res. 32, 9 (September 2005), 2271–2284.
     DOI:https://doi.org/10.1016/j.cor.2004.03.002
     """
+    if fast:
+        spanner_distribution = distribution(R=R, seed=seed)
+        profits, weights = _fast_spanner_items(
+            v, m, n, spanner_distribution["sampler"], seed
+        )
+        return knapsack(profits, weights, capacity)
+
     # generate the spanner set of v items
-    profits, weights = generate_from_distribution(v, **distribution(R, seed))
+    profits, weights = generate_from_distribution(v, **distribution(R=R, seed=seed))
 
     # normalize the spanner set
     spanner_profits = [p / m + 1 for p in profits]
@@ -578,8 +726,62 @@ def spanner(v, m, n, distribution, capacity, R=1000, seed=0):
     return knapsack(profits, weights, capacity)
 
 
+def _fast_spanner_items(v, m, n, sampler, seed):
+    rng = numpy_generator(seed)
+    spanner_profits, spanner_weights = sampler(rng, v)
+    spanner_profits = spanner_profits / m + 1
+    spanner_weights = spanner_weights / m + 1
+
+    idx = rng.integers(0, v, n)
+    multiplier = rng.uniform(1, m, n)
+    profits = multiplier * spanner_profits[idx]
+    weights = multiplier * spanner_weights[idx]
+    return profits.tolist(), weights.tolist()
+
+
+@py_random_state("seed")
+def profit_ceiling_distribution(d=3, R=1000, seed=0):
+    """
+    Generates a profit ceiling distribution as described in section 3 of [1].
+
+    Parameters
+    ----------
+    d: float
+        All profits are multiples of this number
+    R: int
+        Bound for randomization range
+    seed: integer, random_state, or None
+        Indicator of random number generation state
+
+    Returns
+    -------
+    profit_generator: function
+        Takes a weight and generates a profit
+    weight_generator: function
+        Takes a profit and generates a weight
+    profit_first: bool
+        Defines if the profits are to be generated first
+    sampler: function
+        Takes a numpy.random.Generator and a number of items and returns arrays of
+        profits and weights
+
+    References
+    ----------
+    .. [1] David Pisinger. 2005. Where are the hard knapsack problems?
+    Comput. Oper. Res. 32, 9 (September 2005), 2271–2284.
+    DOI:https://doi.org/10.1016/j.cor.2004.03.002
+    """
+    return {
+        "weight_generator": lambda p: seed.uniform(1, R),
+        "profit_generator": lambda w: d * math.ceil(w / d),
+        "profit_first": False,
+        "sampler": _weights_first_sampler(1, R, lambda w, rng: d * np.ceil(w / d)),
+    }
+
+
+@stage("instance")
 @py_random_state("seed")
-def profit_ceiling(n, c, d=3, R=1000, seed=0):
+def profit_ceiling(n, c, d=3, R=1000, seed=0, fast=False):
     """
     Generates a profit ceiling knapsack instance as described in section 3 of [1].
 
@@ -595,6 +797,8 @@ def profit_ceiling(n, c, d=3, R=1000, seed=0):
         Bound for randomization range
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all items at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -610,14 +814,56 @@ def profit_ceiling(n, c, d=3, R=1000, seed=0):
     return _correlated_knapsack_template(
         number_of_items=n,
         capacity=c,
-        profit_generator=lambda w: d * math.ceil(w / d),
-        weight_generator=lambda p: seed.uniform(1, R),
-        profit_first=False,
+        rng=numpy_generator(seed) if fast else None,
+        **profit_ceiling_distribution(d, R, seed),
     )
 
 
 @py_random_state("seed")
-def circle(n, c, d=2 / 3, R=1000, seed=0):
+def circle_distribution(d=2 / 3, R=1000, seed=0):
+    """
+    Generates a circle distribution as described in section 3 of [1].
+
+    Parameters
+    ----------
+    d: float
+       profit factor
+    R: int
+        Bound for randomization range
+    seed: integer, random_state, or None
+        Indicator of random number generation state
+
+    Returns
+    -------
+    profit_generator: function
+        Takes a weight and generates a profit
+    weight_generator: function
+        Takes a profit and generates a weight
+    profit_first: bool
+        Defines if the profits are to be generated first
+    sampler: function
+        Takes a numpy.random.Generator and a number of items and returns arrays of
+        profits and weights
+
+    References
+    ----------
+    .. [1] David Pisinger. 2005. Where are the hard knapsack problems?
+    Comput. Oper. Res. 32, 9 (September 2005), 2271–2284.
+    DOI:https://doi.org/10.1016/j.cor.2004.03.002
+    """
+    return {
+        "weight_generator": lambda p: seed.uniform(1, R),
+        "profit_generator": lambda w: d * math.sqrt(4 * (R**2) - (w - 2 * R) ** 2),
+        "profit_first": False,
+        "sampler": _weights_first_sampler(
+            1, R, lambda w, rng: d * np.sqrt(4 * (R**2) - (w - 2 * R) ** 2)
+        ),
+    }
+
+
+@stage("instance")
+@py_random_state("seed")
+def circle(n, c, d=2 / 3, R=1000, seed=0, fast=False):
     """
     Generates a circle knapsack instance as described in section 3 of [1].
 
@@ -633,6 +879,8 @@ def circle(n, c, d=2 / 3, R=1000, seed=0):
         Bound for randomization range
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all items at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -648,14 +896,60 @@ def circle(n, c, d=2 / 3, R=1000, seed=0):
     return _correlated_knapsack_template(
         number_of_items=n,
         capacity=c,
-        profit_generator=lambda w: d * math.sqrt(4 * (R ** 2) - (w - 2 * R) ** 2),
-        weight_generator=lambda p: seed.uniform(1, R),
-        profit_first=False,
+        rng=numpy_generator(seed) if fast else None,
+        **circle_distribution(d, R, seed),
     )
 
 
 @py_random_state("seed")
-def multiple_strongly_correlated(n, c, k1, k2, d, R=1000, seed=0):
+def multiple_strongly_correlated_distribution(k1, k2, d, R=1000, seed=0):
+    """
+    Generates a multiple strongly correlated distribution as described in section 3 of [1].
+
+    Parameters
+    ----------
+    k1: float
+        First set profit offset
+    k2: float
+        Second set profit offset
+    d: int
+        Weight divisor
+    R: int
+        Bound for randomization range
+    seed: integer, random_state, or None
+        Indicator of random number generation state
+
+    Returns
+    -------
+    profit_generator: function
+        Takes a weight and generates a profit
+    weight_generator: function
+        Takes a profit and generates a weight
+    profit_first: bool
+        Defines if the profits are to be generated first
+    sampler: function
+        Takes a numpy.random.Generator and a number of items and returns arrays of
+        profits and weights
+
+    References
+    ----------
+    .. [1] David Pisinger. 2005. Where are the hard knapsack problems?
+    Comput. Oper. Res. 32, 9 (September 2005), 2271–2284.
+    DOI:https://doi.org/10.1016/j.cor.2004.03.002
+    """
+    return {
+        "weight_generator": lambda p: seed.uniform(1, R),
+        "profit_generator": lambda w: w + k1 if w % d == 0 else w + k2,
+        "profit_first": False,
+        "sampler": _weights_first_sampler(
+            1, R, lambda w, rng: np.where(w % d == 0, w + k1, w + k2)
+        ),
+    }
+
+
+@stage("instance")
+@py_random_state("seed")
+def multiple_strongly_correlated(n, c, k1, k2, d, R=1000, seed=0, fast=False):
     """
     Generates a multiple strongly correlated knapsack instance as described in section 3 of [1].
 
@@ -675,6 +969,8 @@ def multiple_strongly_correlated(n, c, k1, k2, d, R=1000, seed=0):
         Bound for randomization range
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all items at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -690,7 +986,34 @@ def multiple_strongly_correlated(n, c, k1, k2, d, R=1000, seed=0):
     return _correlated_knapsack_template(
         number_of_items=n,
         capacity=c,
-        profit_generator=lambda w: w + k1 if w % d == 0 else w + k2,
-        weight_generator=lambda p: seed.uniform(1, R),
-        profit_first=False,
+        rng=numpy_generator(seed) if fast else None,
+        **multiple_strongly_correlated_distribution(k1, k2, d, R, seed),
     )
+
+
+# the distributions only draw positive weights and profits, so every item has a nonzero
+@size_estimator(uncorrelated)
+@size_estimator(weakly_correlated)
+@size_estimator(strongly_correlated)
+@size_estimator(inverse_strongly_correlated)
+@size_estimator(almost_strongly_correlated)
+@size_estimator(subset_sum)
+@size_estimator(uncorrelated_with_similar_weights)
+def _pisinger_instance_size(n, c, R=1000, seed=0, fast=False):
+    return InstanceSize(n, 1, n, True)
+
+
+@size_estimator(profit_ceiling)
+@size_estimator(circle)
+def _pisinger_d_instance_size(n, c, d=None, R=1000, seed=0, fast=False):
+    return InstanceSize(n, 1, n, True)
+
+
+@size_estimator(multiple_strongly_correlated)
+def _multiple_strongly_correlated_size(n, c, k1, k2, d, R=1000, seed=0, fast=False):
+    return InstanceSize(n, 1, n, True)
+
+
+@size_estimator(spanner)
+def _spanner_size(v, m, n, distribution, capacity, R=1000, seed=0, fast=False):
+    return InstanceSize(n, 1, n, True)
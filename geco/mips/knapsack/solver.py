@@ -0,0 +1,297 @@
+"""
+Exact solver for the 0-1 knapsack instances of this package, e.g. to label generated
+instances with their optimal value and LP bound without building SCIP models.
+"""
+
+import collections
+
+import numpy as np
+
+from geco.parallel import pool_map
+
+KnapsackSolution = collections.namedtuple(
+    "KnapsackSolution",
+    ["value", "selected", "optimal", "upper_bound", "lp_bound", "greedy_value"],
+)
+"""
+value: float
+    Value of the best solution found, the optimal value if optimal
+selected: list[int]
+    Indices of the items of the best solution found, in increasing order
+optimal: bool
+    Whether the solution is proven optimal
+upper_bound: float
+    Upper bound of the optimal value, equal to value if optimal
+lp_bound: float
+    Value of the LP relaxation (Dantzig bound)
+greedy_value: float
+    Value of the greedy solution packing the items by decreasing profit/weight ratio
+"""
+
+# relative tolerance of the bound comparisons, guards against rounding errors
+_TOLERANCE = 1e-9
+
+
+def dantzig_bound(profits, weights, capacity):
+    """
+    Calculates the value of the LP relaxation of a knapsack instance, which packs the
+    items by decreasing profit/weight ratio and a fraction of the first one that
+    doesn't fit.
+
+    Parameters
+    ----------
+    profits: list[float]
+        Profit of each item
+    weights: list[float]
+        Weight of each item
+    capacity: float
+        Capacity of knapsack
+
+    Returns
+    -------
+    bound: float
+        Value of the LP relaxation
+    """
+    items = _Items(profits, weights, capacity)
+    return items.free_value + float(items.lp_bounds(0, np.array([capacity]))[0])
+
+
+def solve_knapsack(profits, weights, capacity, max_states=10**7):
+    """
+    Solves a 0-1 knapsack instance with a core based dynamic program.
+
+    The states of the dynamic program are the nondominated (weight, profit) pairs of
+    changes to the break solution, which packs the items by decreasing profit/weight
+    ratio until one doesn't fit. Starting at the break item, the core grows on both
+    sides by adding the next item after it or removing the next item before it, and
+    states whose LP bound can't beat the best solution are dropped. Items far from the
+    break item are decided after few steps, as in Pisinger's minknap algorithm.
+
+    With integer weights the number of states is bounded by the weight range of the
+    core. Fractional weights, like in the Pisinger instances, rarely lead to dominated
+    states, so strongly correlated and subset sum instances with fractional weights can
+    exceed max_states. The solver then stops and returns the best solution found with
+    an upper bound of the optimal value.
+
+    The parameters are in the order returned by the parameter generators, e.g.
+    `solve_knapsack(*yang_params(100))`.
+
+    Parameters
+    ----------
+    profits: list[float]
+        Profit of each item
+    weights: list[float]
+        Weight of each item
+    capacity: float
+        Capacity of knapsack
+    max_states: int
+        Maximum number of states kept over all steps, which bounds time and memory
+
+    Returns
+    -------
+    solution: KnapsackSolution
+        Best solution found, whether it is optimal, and bounds of the instance
+    """
+    items = _Items(profits, weights, capacity)
+    p, w = items.profits, items.weights
+    n = len(p)
+
+    greedy = items.greedy()
+    incumbent_value = float(p[greedy].sum())
+    incumbent = None
+    upper_bound = incumbent_value
+
+    first = items.break_item()
+    state_weights = items.weight_sums[first : first + 1]
+    state_profits = items.profit_sums[first : first + 1]
+    n_states = 0
+    # item decided in each step, the state of the previous step every state extends and
+    # whether it changes the item, enough to reconstruct a solution
+    decided = []
+    parents = []
+    changed = []
+    removed, added = first - 1, first
+    while removed >= 0 or added < n:
+        if added < n and (removed < 0 or added - first <= first - 1 - removed):
+            k, added = added, added + 1
+            candidate_weights = np.concatenate([state_weights, state_weights + w[k]])
+            candidate_profits = np.concatenate([state_profits, state_profits + p[k]])
+        else:
+            k, removed = removed, removed - 1
+            candidate_weights = np.concatenate([state_weights, state_weights - w[k]])
+            candidate_profits = np.concatenate([state_profits, state_profits - p[k]])
+        parent = np.tile(np.arange(len(state_weights), dtype=np.int32), 2)
+        change = np.repeat([False, True], len(state_weights))
+
+        # keep the states more profitable than every lighter one
+        order = np.lexsort((-candidate_profits, candidate_weights))
+        best_lighter = np.maximum.accumulate(candidate_profits[order])
+        dominated = np.concatenate(
+            [[False], candidate_profits[order][1:] <= best_lighter[:-1]]
+        )
+        order = order[~dominated]
+        candidate_weights = candidate_weights[order]
+        candidate_profits = candidate_profits[order]
+        parent = parent[order]
+        change = change[order]
+
+        feasible = candidate_weights <= capacity
+        if feasible.any():
+            best = np.flatnonzero(feasible)[-1]
+            if candidate_profits[best] > incumbent_value:
+                incumbent_value = float(candidate_profits[best])
+                incumbent = (len(decided), parent[best], change[best])
+
+        # feasible states can only gain from adding the items after the core, infeasible
+        # ones must remove items before it
+        bounds = np.empty(len(candidate_profits))
+        bounds[feasible] = candidate_profits[feasible] + items.lp_bounds(
+            added, capacity - candidate_weights[feasible]
+        )
+        bounds[~feasible] = candidate_profits[~feasible] - items.removal_costs(
+            removed + 1, candidate_weights[~feasible] - capacity
+        )
+        keep = items.can_improve(bounds, incumbent_value)
+
+        decided.append(k)
+        parents.append(parent[keep])
+        changed.append(change[keep])
+        state_weights = candidate_weights[keep]
+        state_profits = candidate_profits[keep]
+        n_states += len(state_weights)
+        if n_states > max_states and (removed >= 0 or added < n):
+            upper_bound = max(upper_bound, float(bounds[keep].max(initial=-np.inf)))
+            break
+        if len(state_weights) == 0:
+            break
+
+    if incumbent is None:
+        selected = set(greedy.tolist())
+    else:
+        step, state, change = incumbent
+        selected = set(range(first))
+        if change:
+            selected ^= {decided[step]}
+        for j in range(step - 1, -1, -1):
+            if changed[j][state]:
+                selected ^= {decided[j]}
+            state = parents[j][state]
+    selected = sorted(selected)
+
+    upper_bound = max(upper_bound, incumbent_value)
+    return KnapsackSolution(
+        value=items.free_value + incumbent_value,
+        selected=sorted(items.free + items.indices[selected].tolist()),
+        optimal=upper_bound == incumbent_value,
+        upper_bound=items.free_value + upper_bound,
+        lp_bound=items.free_value + float(items.lp_bounds(0, np.array([capacity]))[0]),
+        greedy_value=items.free_value + float(p[greedy].sum()),
+    )
+
+
+def parallel_solve_knapsack(instances, n_jobs=None, ordered=True, chunksize=16):
+    """
+    Solves many knapsack instances with `solve_knapsack` in a process pool.
+
+    Parameters
+    ----------
+    instances: iterable of tuple
+        Tuples (profits, weights, capacity), e.g. as returned by yang_params
+    n_jobs: int or None
+        Number of worker processes, None uses all cores, 1 solves in the current process
+    ordered: bool
+        Whether results are yielded in order or as soon as they are completed
+    chunksize: int
+        Number of instances sent to a worker at once, small instances solve faster than
+        they are sent to a worker
+
+    Returns
+    -------
+    solutions: generator
+        Tuples (index of the instance, KnapsackSolution)
+    """
+    return pool_map(
+        solve_knapsack, instances, n_jobs=n_jobs, ordered=ordered, chunksize=chunksize
+    )
+
+
+class _Items:
+    # the items that may be packed, by decreasing profit/weight ratio
+    def __init__(self, profits, weights, capacity):
+        profits = np.asarray(profits, dtype=float)
+        weights = np.asarray(weights, dtype=float)
+        assert profits.shape == weights.shape
+        assert capacity >= 0
+        assert (weights >= 0).all()
+        assert (profits >= 0).all()
+
+        # items without weight are always packed, items without profit never needed
+        self.free = np.flatnonzero(weights == 0).tolist()
+        self.free_value = float(profits[self.free].sum())
+        candidates = np.flatnonzero(
+            (weights > 0) & (weights <= capacity) & (profits > 0)
+        )
+        ratios = profits[candidates] / weights[candidates]
+        self.indices = candidates[np.argsort(-ratios, kind="stable")]
+        self.profits = profits[self.indices]
+        self.weights = weights[self.indices]
+        self.capacity = capacity
+        self.integral = bool((self.profits == np.floor(self.profits)).all())
+        self.profit_sums = np.concatenate([[0], np.cumsum(self.profits)])
+        self.weight_sums = np.concatenate([[0], np.cumsum(self.weights)])
+
+    def lp_bounds(self, start, capacities):
+        # Dantzig bounds of the items from start on, for each remaining capacity
+        n = len(self.profits)
+        if start == n:
+            return np.zeros(len(capacities))
+        end = np.searchsorted(
+            self.weight_sums, self.weight_sums[start] + capacities, side="right"
+        )
+        end = np.clip(end - 1, start, n)
+        bounds = self.profit_sums[end] - self.profit_sums[start]
+        split = np.minimum(end, n - 1)
+        rest = capacities - (self.weight_sums[end] - self.weight_sums[start])
+        fraction = np.where(
+            end < n, rest * self.profits[split] / self.weights[split], 0
+        )
+        return bounds + np.maximum(fraction, 0)
+
+    def removal_costs(self, stop, overweights):
+        # LP bounds of the profit lost by removing the items before stop to shed the
+        # overweights, infinite if they are too light
+        end = np.searchsorted(
+            self.weight_sums, self.weight_sums[stop] - overweights, side="right"
+        )
+        end = end - 1
+        possible = end >= 0
+        costs = np.full(len(overweights), np.inf)
+        end = end[possible]
+        whole = self.weight_sums[stop] - self.weight_sums[end + 1]
+        costs[possible] = (
+            self.profit_sums[stop]
+            - self.profit_sums[end + 1]
+            + (overweights[possible] - whole) * self.profits[end] / self.weights[end]
+        )
+        return costs
+
+    def can_improve(self, bounds, value):
+        tolerance = _TOLERANCE * max(1, abs(value))
+        if self.integral:
+            # rounding errors must not push a bound below the next integer
+            return np.floor(bounds + tolerance) > value
+        return bounds > value + tolerance
+
+    def break_item(self):
+        # number of items packed before the first one that doesn't fit
+        return int(np.searchsorted(self.weight_sums, self.capacity, side="right")) - 1
+
+    def greedy(self):
+        # packs every item that still fits, by decreasing ratio
+        selected = []
+        remaining = self.capacity
+        for i, weight in enumerate(self.weights):
+            if weight <= remaining:
+                selected.append(i)
+                remaining -= weight
+        return np.array(selected, dtype=int)
@@ -3,10 +3,14 @@ import math
 from networkx.utils import py_random_state
 
 from geco.mips.knapsack.generic import knapsack
+from geco.mips.utilities.sampling import integers, numpy_generator
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
+@stage("params")
 @py_random_state("seed")
-def yang_params(n, seed=0):
+def yang_params(n, seed=0, fast=False):
     """
     Generates knapsack instance params according to [1].
 
@@ -16,6 +20,8 @@ def yang_params(n, seed=0):
         Number of items
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -33,6 +39,12 @@ def yang_params(n, seed=0):
         Set Packing, and 0-1 Knapsack Problems", 2020.
     """
 
+    if fast:
+        rng = numpy_generator(seed)
+        profits = integers(rng, 1, 10 * n, size=n).tolist()
+        weights = integers(rng, 1, 10 * n, size=n).tolist()
+        return profits, weights, math.floor(sum(weights) / 5)
+
     def draw_value():
         return seed.randint(1, 10 * n)
 
@@ -43,8 +55,9 @@ def yang_params(n, seed=0):
     return profits, weights, capacity
 
 
+@stage("instance")
 @py_random_state("seed")
-def yang_instance(n, seed=0):
+def yang_instance(n, seed=0, fast=False):
     """
     Generates knapsack instance according to [1].
 
@@ -54,6 +67,8 @@ def yang_instance(n, seed=0):
         Number of items
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -66,4 +81,9 @@ def yang_instance(n, seed=0):
         "Learning Generalized Strong Branching for Set Covering,
         Set Packing, and 0-1 Knapsack Problems", 2020.
     """
-    return knapsack(*yang_params(n, seed))
+    return knapsack(*yang_params(n, seed, fast))
+
+
+@size_estimator(yang_instance)
+def _yang_instance_size(n, seed=0, fast=False):
+    return InstanceSize(n, 1, n, True)
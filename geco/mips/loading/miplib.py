@@ -3,7 +3,6 @@ from urllib.request import urlretrieve, urlopen
 from urllib.error import URLError
 import pyscipopt as scip
 import os
-import pandas as pd
 
 
 class Loader:
@@ -148,6 +147,8 @@ def custom_list(source, with_solution=False, loader=None):
     -------
     A generator for the instances
     """
+    import pandas as pd
+
     df = pd.read_csv(source, names=["instance"])
     if loader is None:
         loader = Loader()
@@ -1,9 +1,15 @@
 import itertools
+
+import numpy as np
 import pyscipopt as scip
 
 import geco.mips.utilities.naming as naming
+from geco.mips.utilities.instance import InstanceBuilder
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
+@stage("build")
 def naive(graph):
     model = scip.Model("Naive MaxCut")
 
@@ -43,6 +49,7 @@ def naive(graph):
     return (node_variables, edge_variables), model
 
 
+@stage("build")
 def triangle(graph):
     model = scip.Model("Triangle MaxCut")
 
@@ -73,3 +80,134 @@ def triangle(graph):
 def _get_edge_variable(u, v, edge_variables):
     edge_name = naming.undirected_edge_name(u, v)
     return edge_variables[edge_name]
+
+
+@stage("build")
+def naive_sparse(graph):
+    """
+    Generates the sparse representation of the `naive` max-cut formulation.
+
+    Parameters
+    ----------
+    graph: nx.Graph
+        Networkx graph with integer nodes and a "weight" on each edge
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder("Naive MaxCut")
+    nodes = list(graph.nodes())
+    node_index = dict(
+        zip(
+            nodes,
+            builder.add_vars(
+                len(nodes), obj=0, lb=0, ub=1, vtype="B", names=map(str, nodes)
+            ).tolist(),
+        )
+    )
+
+    edges = list(graph.edges(data=True))
+    weights = np.array([d["weight"] for _, _, d in edges], dtype=float)
+    edge_vars = builder.add_vars(
+        len(edges),
+        obj=weights,
+        lb=0,
+        ub=1,
+        vtype="B",
+        names=[naming.undirected_edge_name(u, v) for u, v, _ in edges],
+    )
+
+    u = np.array([node_index[u] for u, _, _ in edges], dtype=np.int64)
+    v = np.array([node_index[v] for _, v, _ in edges], dtype=np.int64)
+    signs = [(1, 1, 1, 2), (-1, -1, 1, 0)]
+    if (weights < 0).any():
+        signs += [(1, -1, -1, 0), (-1, 1, -1, 0)]
+
+    # the constraints of each edge are consecutive rows
+    rows = np.arange(len(edges) * len(signs)).reshape(len(edges), len(signs))
+    coefs = np.array(signs, dtype=float)
+    builder.add_conss(
+        np.repeat(rows.ravel(), 3),
+        np.stack([u, v, edge_vars], axis=1)[:, np.newaxis, :]
+        .repeat(len(signs), axis=1)
+        .ravel(),
+        np.tile(coefs[:, :3], (len(edges), 1)).ravel(),
+        "<",
+        np.tile(coefs[:, 3], len(edges)),
+    )
+    return builder.build("maximize")
+
+
+@stage("build")
+def triangle_sparse(graph):
+    """
+    Generates the sparse representation of the `triangle` max-cut formulation.
+
+    Parameters
+    ----------
+    graph: nx.Graph
+        Networkx graph with integer nodes and a "weight" on each edge
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder("Triangle MaxCut")
+    nodes = list(graph.nodes())
+    n = len(nodes)
+
+    pairs = list(itertools.combinations(nodes, 2))
+    builder.add_vars(
+        len(pairs),
+        obj=[
+            graph.get_edge_data(u, v)["weight"] if graph.has_edge(u, v) else 0
+            for u, v in pairs
+        ],
+        lb=0,
+        ub=1,
+        vtype="B",
+        names=[naming.undirected_edge_name(u, v) for u, v in pairs],
+    )
+
+    def pair_index(a, b):
+        # position of the pair of node positions a < b in itertools.combinations
+        a, b = np.minimum(a, b), np.maximum(a, b)
+        return a * n - a * (a + 1) // 2 + (b - a - 1)
+
+    triples = np.fromiter(
+        itertools.chain.from_iterable(itertools.combinations(range(n), 3)),
+        dtype=np.int64,
+    ).reshape(-1, 3)
+    i, j, k = triples.T
+    x_ij, x_ik, x_kj = pair_index(i, j), pair_index(i, k), pair_index(k, j)
+
+    # x_ij <= x_ik + x_kj and x_ij + x_ik + x_kj <= 2 are consecutive rows
+    rows = np.arange(2 * len(triples)).reshape(-1, 2)
+    builder.add_conss(
+        np.repeat(rows.ravel(), 3),
+        np.stack([x_ij, x_ik, x_kj] * 2, axis=1).ravel(),
+        np.tile([1.0, -1.0, -1.0, 1.0, 1.0, 1.0], len(triples)),
+        "<",
+        np.tile([0.0, 2.0], len(triples)),
+    )
+    return builder.build("maximize")
+
+
+@size_estimator(naive)
+@size_estimator(naive_sparse)
+def _naive_size(graph):
+    m = graph.number_of_edges()
+    negative = any(d["weight"] < 0 for _, _, d in graph.edges(data=True))
+    n_conss = (4 if negative else 2) * m
+    return InstanceSize(len(graph) + m, n_conss, 3 * n_conss, True)
+
+
+@size_estimator(triangle)
+@size_estimator(triangle_sparse)
+def _triangle_size(graph):
+    n = len(graph)
+    triples = n * (n - 1) * (n - 2) // 6
+    return InstanceSize(n * (n - 1) // 2, 2 * triples, 6 * triples, True)
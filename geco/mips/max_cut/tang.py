@@ -2,10 +2,14 @@ import networkx as nx
 from networkx.utils import py_random_state
 
 from geco.mips.max_cut.generic import naive
+from geco.mips.utilities.sampling import integers, numpy_generator
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
+@stage("instance")
 @py_random_state("seed")
-def tang_instance(n, m, seed=0):
+def tang_instance(n, m, seed=0, fast=False):
     """
     Generates a max-cut instance as described in A.2 in [1].
 
@@ -17,6 +21,8 @@ def tang_instance(n, m, seed=0):
         Number of edges
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all weights at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -29,15 +35,23 @@ def tang_instance(n, m, seed=0):
     programming: Learning to cut. arXiv preprint arXiv:1906.04859.
     """
     graph = nx.generators.gnm_random_graph(n, m, seed=seed)
-    weights = tang_params(graph, seed=0)
+    weights = tang_params(graph, seed=0, fast=fast)
     for (_, _, data), weight in zip(graph.edges(data=True), weights):
         data["weight"] = weight
     _, model = naive(graph)
     return model
 
 
+@size_estimator(tang_instance)
+def _tang_instance_size(n, m, seed=0, fast=False):
+    # gnm_random_graph returns the complete graph for too many edges, weights are >= 0
+    m = min(m, n * (n - 1) // 2)
+    return InstanceSize(n + m, 2 * m, 6 * m, True)
+
+
+@stage("params")
 @py_random_state("seed")
-def tang_params(graph, seed=0):
+def tang_params(graph, seed=0, fast=False):
     """
     Generates max-cut instance params as described in A.2 in [1].
 
@@ -47,6 +61,8 @@ def tang_params(graph, seed=0):
         Networkx graph
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all weights at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -58,6 +74,9 @@ def tang_params(graph, seed=0):
     .. [1] Tang, Y., Agrawal, S., & Faenza, Y. (2019). Reinforcement learning for integer
     programming: Learning to cut. arXiv preprint arXiv:1906.04859.
     """
+    if fast:
+        return integers(numpy_generator(seed), 0, 10, size=len(graph.edges)).tolist()
+
     weights = []
     for _ in graph.edges:
         weights.append(seed.randint(0, 10))
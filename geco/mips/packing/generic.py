@@ -1,6 +1,12 @@
+import numpy as np
 import pyscipopt as scip
 
+from geco.mips.utilities.instance import MIPInstance
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
+
+@stage("build")
 def packing(n, m, costs, constraint_coefficients, limits, binary, name="Packing"):
     """Generates a packing instance as described in A.2 in [1].
 
@@ -52,3 +58,58 @@ def packing(n, m, costs, constraint_coefficients, limits, binary, name="Packing"
     model.setMaximize()
 
     return model
+
+
+@stage("build")
+def packing_sparse(
+    n, m, costs, constraint_coefficients, limits, binary, name="Packing"
+):
+    """Generates the sparse representation of the packing formulation in `packing`.
+
+    Parameters:
+    ----------
+    n: int
+        Number of variables
+    m: int
+        Number of constraints
+    costs: list[number] of size n
+        Coefficients of objective function
+    constraint_coefficients: list[list[number]] of dimensions (m x n)
+        Coefficients of each variable for each constraint
+    limits: list[number] of size m
+        Limits of each constraint
+    name: str
+        Name of the model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    import scipy.sparse
+
+    A = scipy.sparse.csr_matrix(
+        np.asarray(constraint_coefficients, dtype=float).reshape(m, n)
+    )
+    A.eliminate_zeros()
+    return MIPInstance(
+        c=costs[:n],
+        A=A,
+        senses=np.full(m, "<"),
+        rhs=limits[:m],
+        lb=np.zeros(n),
+        ub=np.ones(n) if binary else np.full(n, np.inf),
+        vtypes=np.full(n, "B" if binary else "I"),
+        var_names=[f"v_{i}" for i in range(n)],
+        sense="maximize",
+        name=name,
+    )
+
+
+@size_estimator(packing)
+@size_estimator(packing_sparse)
+def _packing_size(n, m, costs, constraint_coefficients, limits, binary, name=None):
+    nnz = sum(
+        1 for row in constraint_coefficients[:m] for value in row[:n] if value != 0
+    )
+    return InstanceSize(n, m, nnz, True)
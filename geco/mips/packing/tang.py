@@ -1,10 +1,14 @@
 import pyscipopt as scip
 from networkx.utils import py_random_state
 from geco.mips.packing.generic import *
+from geco.mips.utilities.sampling import integers, numpy_generator
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
+@stage("instance")
 @py_random_state("seed")
-def tang_instance(n, m, binary=False, seed=0):
+def tang_instance(n, m, binary=False, seed=0, fast=False):
     """Generates a packing instance as described in A.2 in [1].
 
     Parameters:
@@ -15,6 +19,8 @@ def tang_instance(n, m, binary=False, seed=0):
         number of constraints
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -26,11 +32,14 @@ def tang_instance(n, m, binary=False, seed=0):
     .. [1] Tang, Y., Agrawal, S., & Faenza, Y. (2019). Reinforcement learning for integer
     programming: Learning to cut. arXiv preprint arXiv:1906.04859.
     """
-    return packing(n, m, *tang_params(n, m, binary, seed), binary, name="Tang Packing")
+    return packing(
+        n, m, *tang_params(n, m, binary, seed, fast), binary, name="Tang Packing"
+    )
 
 
+@stage("params")
 @py_random_state("seed")
-def tang_params(n, m, binary, seed=0):
+def tang_params(n, m, binary, seed=0, fast=False):
     """Generates a packing instance as described in A.2 in [1].
 
     Parameters:
@@ -43,6 +52,8 @@ def tang_params(n, m, binary, seed=0):
         Use binary variables coefficients or (non-negative) integer variables coefficients
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -58,6 +69,17 @@ def tang_params(n, m, binary, seed=0):
     .. [1] Tang, Y., Agrawal, S., & Faenza, Y. (2019). Reinforcement learning for integer
     programming: Learning to cut. arXiv preprint arXiv:1906.04859.
     """
+    if fast:
+        rng = numpy_generator(seed)
+        costs = integers(rng, 1, 10, size=n).tolist()
+        if binary:
+            constraint_coefficients = integers(rng, 5, 30, size=(m, n)).tolist()
+            limits = integers(rng, 10 * n, 20 * n, size=m).tolist()
+        else:
+            constraint_coefficients = integers(rng, 0, 5, size=(m, n)).tolist()
+            limits = integers(rng, 9 * n, 10 * n, size=m).tolist()
+        return costs, constraint_coefficients, limits
+
     costs = [seed.randint(1, 10) for _ in range(n)]
 
     if binary:
@@ -72,3 +94,9 @@ def tang_params(n, m, binary, seed=0):
         limits = [seed.randint(9 * n, 10 * n) for _ in range(m)]
 
     return costs, constraint_coefficients, limits
+
+
+@size_estimator(tang_instance)
+def _tang_instance_size(n, m, binary=False, seed=0, fast=False):
+    # coefficients of integer instances can be 0
+    return InstanceSize(n, m, n * m, binary)
@@ -1,6 +1,11 @@
 import pyscipopt as scip
 
+from geco.mips.utilities.instance import InstanceBuilder
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
+
+@stage("build")
 def uncapacitated_lot_sizing(
     T, M, initial_storage, final_storage, p, h, q, d, name="Production Planning"
 ):
@@ -69,3 +74,74 @@ def uncapacitated_lot_sizing(
     model.setMinimize()
 
     return model
+
+
+@stage("build")
+def uncapacitated_lot_sizing_sparse(
+    T, M, initial_storage, final_storage, p, h, q, d, name="Production Planning"
+):
+    """
+    Generates the sparse representation of the formulation in `uncapacitated_lot_sizing`.
+
+    Parameters
+    ----------
+    T: int
+        Time horizon
+    M: int
+        Maximum lot size at any time step
+    initial_storage: int
+        Initial available storage
+    final_storage: int
+        Storage available at the last time step
+    p: list[int]
+        Unit production cost at each time step
+    h: list[int]
+        Unit inventory cost at each time step
+    q: list[int]
+        Fixed production cost at each time step
+    d: list[int]
+        Demand at each time step
+    name: str
+        Name to be given to the generated model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder(name)
+    production_vars = [None]
+    produce_or_not_vars = []
+    storage_vars = []
+    for i in range(T + 1):
+        # the production variable of time step 0 is not needed
+        if i > 0:
+            production_vars.append(
+                builder.add_var(obj=p[i], lb=0, vtype="I", name=f"x_{i}")
+            )
+        produce_or_not_vars.append(
+            builder.add_var(obj=h[i], lb=0, ub=1, vtype="B", name=f"y_{i}")
+        )
+        storage_vars.append(builder.add_var(obj=q[i], lb=0, vtype="I", name=f"s_{i}"))
+
+    for i in range(1, T + 1):
+        builder.add_cons(
+            [storage_vars[i - 1], production_vars[i], storage_vars[i]],
+            [1, 1, -1],
+            "=",
+            d[i],
+        )
+        builder.add_cons([production_vars[i], produce_or_not_vars[i]], [1, -M], "<", 0)
+
+    builder.add_cons([storage_vars[0]], [1], "=", initial_storage)
+    builder.add_cons([storage_vars[T]], [1], "=", final_storage)
+
+    return builder.build("minimize")
+
+
+@size_estimator(uncapacitated_lot_sizing)
+@size_estimator(uncapacitated_lot_sizing_sparse)
+def _uncapacitated_lot_sizing_size(
+    T, M, initial_storage, final_storage, p, h, q, d, name=None
+):
+    return InstanceSize(3 * T + 2, 2 * T + 2, 5 * T + 2, True)
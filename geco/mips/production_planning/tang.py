@@ -1,10 +1,14 @@
 import pyscipopt as scip
 from networkx.utils import py_random_state
 from geco.mips.production_planning.generic import *
+from geco.mips.utilities.sampling import integers, numpy_generator
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
+@stage("instance")
 @py_random_state("seed")
-def tang_instance(T, seed=0):
+def tang_instance(T, seed=0, fast=False):
     """Generates a production planning instance as described in A.2 in [1].
 
     Parameters
@@ -13,6 +17,8 @@ def tang_instance(T, seed=0):
         Time horizon
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -25,12 +31,13 @@ def tang_instance(T, seed=0):
     programming: Learning to cut. arXiv preprint arXiv:1906.04859.
     """
     return uncapacitated_lot_sizing(
-        T, *tang_params(T, seed), name="Tang Production Planning"
+        T, *tang_params(T, seed, fast), name="Tang Production Planning"
     )
 
 
+@stage("params")
 @py_random_state("seed")
-def tang_params(T, seed=0):
+def tang_params(T, seed=0, fast=False):
     """Generates production planning instance params as described in A.2 in [1].
 
     Parameters
@@ -39,6 +46,8 @@ def tang_params(T, seed=0):
         Time horizon
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -65,6 +74,10 @@ def tang_params(T, seed=0):
     initial_storage = 0
     final_storage = 20
     M = 100
+    if fast:
+        p, h, q, d = integers(numpy_generator(seed), 1, 10, size=(4, T + 1)).tolist()
+        return M, initial_storage, final_storage, p, h, q, d
+
     p = []
     h = []
     q = []
@@ -75,3 +88,8 @@ def tang_params(T, seed=0):
         q.append(seed.randint(1, 10))
         d.append(seed.randint(1, 10))
     return M, initial_storage, final_storage, p, h, q, d
+
+
+@size_estimator(tang_instance)
+def _tang_instance_size(T, seed=0, fast=False):
+    return InstanceSize(3 * T + 2, 2 * T + 2, 5 * T + 2, True)
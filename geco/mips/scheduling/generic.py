@@ -1,9 +1,18 @@
+import collections
 import itertools
+import math
 
+import numpy as np
 from networkx.utils import py_random_state
 from pyscipopt import scip
 
+from geco.mips.utilities.instance import InstanceBuilder
+from geco.mips.utilities.sampling import integers, numpy_generator
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
+
+@stage("build")
 def late_tasks_formulation(
     number_of_facilities,
     number_of_tasks,
@@ -110,6 +119,7 @@ def late_tasks_formulation(
     return model
 
 
+@stage("build")
 def heinz_formulation(
     number_of_facilities,
     number_of_tasks,
@@ -222,6 +232,7 @@ def heinz_formulation(
     return model
 
 
+@stage("build")
 def hooker_cost_formulation(
     number_of_facilities,
     number_of_tasks,
@@ -311,8 +322,452 @@ def hooker_cost_formulation(
     return model
 
 
+@stage("build")
+def late_tasks_formulation_sparse(
+    number_of_facilities,
+    number_of_tasks,
+    time_steps,
+    processing_times,
+    capacities,
+    assignment_costs,
+    release_dates,
+    deadlines,
+    name="Hooker Scheduling Late Tasks Formulation",
+):
+    """Generates the sparse representation of `late_tasks_formulation`.
+
+    Parameters
+    ----------
+    number_of_facilities: int
+        the number of facilities to schedule on
+    number_of_tasks: int
+        the number of tasks to assign to facilities
+    time_steps:
+        the number of time steps starting from 0 (corresponds to "N" in the paper)
+    processing_times: dict[int,int]
+        time steps to process each task
+    capacities: list[int]
+        capacity of each facility
+    assignment_costs: dict[int,int]
+        cost of assigning a task to a facility
+    release_dates: list[int]
+        time step at which a job is released
+    deadlines: dict[int, float]
+        deadline (time step) to finish a job
+    name: str
+        assigned name to generated instance
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder(name)
+
+    start_time = min(release_dates)
+    time_steps = range(start_time, start_time + time_steps)
+
+    # add variables and their cost
+    L = builder.add_vars(
+        number_of_tasks,
+        obj=1,
+        lb=0,
+        ub=1,
+        vtype="B",
+        names=[f"L_{i}" for i in range(number_of_tasks)],
+    ).tolist()
+
+    # assignment vars
+    keys = list(
+        itertools.product(
+            range(number_of_tasks), range(number_of_facilities), time_steps
+        )
+    )
+    x = dict(
+        zip(
+            keys,
+            builder.add_vars(
+                len(keys),
+                obj=0,
+                lb=0,
+                ub=1,
+                vtype="B",
+                names=[f"x_{j}_{i}_{t}" for j, i, t in keys],
+            ).tolist(),
+        )
+    )
+
+    # add constraints
+    # constraint (a)
+    for j, t in itertools.product(range(number_of_tasks), time_steps):
+        builder.add_cons(
+            [L[j]] + [x[j, i, t] for i in range(number_of_facilities)],
+            [len(time_steps)]
+            + [-(t + processing_times[j, i]) for i in range(number_of_facilities)],
+            ">",
+            -number_of_facilities * deadlines[j],
+        )
+
+    # constraint (b)
+    for j in range(number_of_tasks):
+        builder.add_cons(
+            [
+                x[j, i, t]
+                for i, t in itertools.product(range(number_of_facilities), time_steps)
+            ],
+            1,
+            "=",
+            1,
+        )
+
+    # constraint (c)
+    for i, t in itertools.product(range(number_of_facilities), time_steps):
+        cols, coefs = [], []
+        for j in range(number_of_tasks):
+            for t_prime in range(t - processing_times[j, i] + 1, t + 1):
+                if (j, i, t_prime) in x:
+                    cols.append(x[j, i, t_prime])
+                    coefs.append(assignment_costs[j, i])
+        builder.add_cons(cols, coefs, "<", capacities[i])
+
+    # constraint (d)
+    for i, j, t in itertools.product(
+        range(number_of_facilities), range(number_of_tasks), time_steps
+    ):
+        if t < release_dates[j] or t > len(time_steps) - processing_times[j, i]:
+            builder.add_cons([x[j, i, t]], 1, "=", 0)
+
+    return builder.build("minimize")
+
+
+@size_estimator(late_tasks_formulation)
+@size_estimator(late_tasks_formulation_sparse)
+def _late_tasks_size(
+    number_of_facilities,
+    number_of_tasks,
+    time_steps,
+    processing_times,
+    capacities,
+    assignment_costs,
+    release_dates,
+    deadlines,
+    name=None,
+):
+    # exact for positive processing times and assignment costs
+    start, end = min(release_dates), min(release_dates) + time_steps
+    n_fixed_vars, capacity_nnz = 0, 0
+    for j, i in itertools.product(range(number_of_tasks), range(number_of_facilities)):
+        p = processing_times[j, i]
+        # constraint (c) has a nonzero for every x[j, i, t'] with t - p < t' <= t
+        if p >= time_steps:
+            capacity_nnz += time_steps * (time_steps + 1) // 2
+        elif p > 0:
+            capacity_nnz += p * (p + 1) // 2 + (time_steps - p) * p
+        # constraint (d) fixes x[j, i, t] for t < release date or t > time_steps - p
+        late = max(start, time_steps - p + 1)
+        early = min(max(release_dates[j] - start, 0), time_steps)
+        overlap = max(min(release_dates[j], end) - late, 0)
+        n_fixed_vars += early + max(end - late, 0) - overlap
+
+    n_x = number_of_tasks * number_of_facilities * time_steps
+    n_conss = number_of_tasks * time_steps + number_of_tasks
+    n_conss += number_of_facilities * time_steps + n_fixed_vars
+    nnz = number_of_tasks * time_steps * (number_of_facilities + 1) + n_x
+    nnz += capacity_nnz + n_fixed_vars
+    return InstanceSize(number_of_tasks + n_x, n_conss, nnz, True)
+
+
+@stage("build")
+def heinz_formulation_sparse(
+    number_of_facilities,
+    number_of_tasks,
+    processing_times,
+    capacities,
+    assignment_costs,
+    release_dates,
+    deadlines,
+    resource_requirements,
+    name="Heinz Scheduling Formulation",
+):
+    """Generates the sparse representation of `heinz_formulation`.
+
+    Parameters
+    ----------
+    number_of_facilities: int
+        the number of facilities to schedule on
+    number_of_tasks: int
+        the number of tasks to assign to facilities
+    processing_times: dict[(int,int),int]
+        time steps to process each task
+    capacities: list[int]
+        capacity of each facility
+    assignment_costs: dict[(int,int),int]
+        cost of assigning a task to a facility
+    release_dates: list[int]
+        time step at which a job is released
+    deadlines: dict[int, float]
+        deadline (time step) to finish a job
+    resource_requirements: dict[(int,int),int]
+        resources required for each task assigned to a facility
+    name: str
+        assigned name to generated instance
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder(name)
+
+    time_steps = range(min(release_dates), int(max(deadlines)))
+
+    # objective function
+    x = {}
+    for j, k in itertools.product(range(number_of_tasks), range(number_of_facilities)):
+        x[j, k] = builder.add_var(
+            obj=assignment_costs[j, k], lb=0, ub=1, vtype="B", name=f"x_{j}_{k}"
+        )
+
+    # y vars
+    y = {}
+    for j, k, t in itertools.product(
+        range(number_of_tasks), range(number_of_facilities), time_steps
+    ):
+        if release_dates[j] <= t <= deadlines[j] - processing_times[j, k]:
+            y[j, k, t] = builder.add_var(
+                obj=0, lb=0, ub=1, vtype="B", name=f"y_{j}_{k}_{t}"
+            )
+
+    # add constraints
+    # constraint (12)
+    for j in range(number_of_tasks):
+        builder.add_cons([x[j, k] for k in range(number_of_facilities)], 1, "=", 1)
+
+    # constraint (13)
+    for j, k in itertools.product(range(number_of_tasks), range(number_of_facilities)):
+        y_vars = [
+            y[j, k, t]
+            for t in range(release_dates[j], int(deadlines[j]) - processing_times[j, k])
+            if t < len(time_steps)
+        ]
+        builder.add_cons(y_vars + [x[j, k]], [1] * len(y_vars) + [-1], "=", 0)
+
+    # constraint (14)
+    for k, t in itertools.product(range(number_of_facilities), time_steps):
+        cols, coefs = [], []
+        for j in range(number_of_tasks):
+            for t_prime in range(t - processing_times[j, k], t + 1):
+                if (j, k, t_prime) in y:
+                    cols.append(y[j, k, t_prime])
+                    coefs.append(resource_requirements[j, k])
+        builder.add_cons(cols, coefs, "<", capacities[k])
+
+    # constraint (15)
+    epsilon = filter(
+        lambda ts: ts[0] < ts[1], itertools.product(release_dates, deadlines)
+    )
+    for k, (t1, t2) in itertools.product(range(number_of_facilities), epsilon):
+        tasks = [
+            j
+            for j in range(number_of_tasks)
+            if t1 <= release_dates[j] and t2 >= deadlines[j]
+        ]
+        builder.add_cons(
+            [x[j, k] for j in tasks],
+            [processing_times[j, k] * resource_requirements[j, k] for j in tasks],
+            "<",
+            capacities[k] * (t2 - t1),
+        )
+
+    return builder.build("minimize")
+
+
+@stage("build")
+def hooker_cost_formulation_sparse(
+    number_of_facilities,
+    number_of_tasks,
+    processing_times,
+    capacities,
+    assignment_costs,
+    release_dates,
+    deadlines,
+    resource_requirements,
+    name="Hooker Cost Scheduling Formulation",
+):
+    """Generates the sparse representation of `hooker_cost_formulation`.
+
+    Parameters
+    ----------
+    number_of_facilities: int
+        the number of facilities to schedule on
+    number_of_tasks: int
+        the number of tasks to assign to facilities
+    processing_times: dict[(int,int),int]
+        time steps to process each task
+    capacities: list[int]
+        capacity of each facility
+    assignment_costs: dict[(int,int),int]
+        cost of assigning a task to a facility
+    release_dates: list[int]
+        time step at which a job is released
+    deadlines: dict[int, float]
+        deadline (time step) to finish a job
+    resource_requirements: dict[(int,int),int]
+        resources required for each task assigned to a facility
+    name: str
+        assigned name to generated instance
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder(name)
+
+    time_steps = range(min(release_dates), int(max(deadlines)))
+
+    # objective function
+    keys = list(
+        itertools.product(
+            range(number_of_tasks), range(number_of_facilities), time_steps
+        )
+    )
+    x = dict(
+        zip(
+            keys,
+            builder.add_vars(
+                len(keys),
+                obj=[assignment_costs[j, i] for j, i, _ in keys],
+                lb=0,
+                ub=1,
+                vtype="B",
+                names=[f"x_{j}_{i}_{t}" for j, i, t in keys],
+            ).tolist(),
+        )
+    )
+
+    # add constraints
+    # constraints (a)
+    for j in range(number_of_tasks):
+        builder.add_cons(
+            [
+                x[j, i, t]
+                for i, t in itertools.product(range(number_of_facilities), time_steps)
+            ],
+            1,
+            "=",
+            1,
+        )
+
+    # constraints (b)
+    for i, t in itertools.product(range(number_of_facilities), time_steps):
+        builder.add_cons(
+            [x[j, i, t] for j in range(number_of_tasks)],
+            [resource_requirements[j, i] for j in range(number_of_tasks)],
+            "<",
+            capacities[i],
+        )
+
+    # constraints (c)
+    for j, i, t in itertools.product(
+        range(number_of_tasks), range(number_of_facilities), time_steps
+    ):
+        if (
+            deadlines[j] - processing_times[j, i] < t < release_dates[j]
+            or t > number_of_tasks - processing_times[j, i]
+        ):
+            builder.add_cons([x[j, i, t]], 1, "=", 0)
+
+    return builder.build("minimize")
+
+
+@size_estimator(heinz_formulation)
+@size_estimator(heinz_formulation_sparse)
+def _heinz_size(
+    number_of_facilities,
+    number_of_tasks,
+    processing_times,
+    capacities,
+    assignment_costs,
+    release_dates,
+    deadlines,
+    resource_requirements,
+    name=None,
+):
+    # exact for positive processing times and resource requirements
+    start, end = min(release_dates), int(max(deadlines))
+    n_y, nnz = 0, 0
+    for j, k in itertools.product(range(number_of_tasks), range(number_of_facilities)):
+        p = processing_times[j, k]
+        # y[j, k, t] exists for release date <= t <= deadline - p
+        first = max(release_dates[j], start)
+        last = min(math.floor(deadlines[j]) - p, end - 1)
+        n_y += max(last - first + 1, 0)
+        # constraint (13) sums y[j, k, t] for release date <= t < deadline - p
+        nnz += 1 + _overlap(release_dates[j], int(deadlines[j]) - p, start, end - start)
+        # constraint (14) has a nonzero for every y[j, k, t'] with t - p <= t' <= t
+        full = min(last, end - 1 - p)
+        nnz += max(full - first + 1, 0) * (p + 1)
+        rest = range(max(first, full + 1), last + 1)
+        nnz += len(rest) * end - sum(rest)
+
+    # constraint (15) has a row per facility and pair of release date < deadline, with
+    # the tasks released after the release date and due before the deadline
+    n_pairs, n_tasks = 0, 0
+    deadlines = list(deadlines)
+    for t1, count in collections.Counter(release_dates).items():
+        later = np.flatnonzero(np.asarray(release_dates) >= t1)
+        due = np.sort(np.asarray(deadlines)[later])
+        t2 = np.asarray([t2 for t2 in deadlines if t1 < t2])
+        n_pairs += count * len(t2)
+        n_tasks += count * int(np.searchsorted(due, t2, side="right").sum())
+
+    n_x = number_of_tasks * number_of_facilities
+    n_conss = number_of_tasks + n_x + number_of_facilities * (end - start)
+    n_conss += number_of_facilities * n_pairs
+    nnz += n_x + number_of_facilities * n_tasks
+    return InstanceSize(n_x + n_y, n_conss, nnz, True)
+
+
+@size_estimator(hooker_cost_formulation)
+@size_estimator(hooker_cost_formulation_sparse)
+def _hooker_cost_size(
+    number_of_facilities,
+    number_of_tasks,
+    processing_times,
+    capacities,
+    assignment_costs,
+    release_dates,
+    deadlines,
+    resource_requirements,
+    name=None,
+):
+    # exact for positive resource requirements
+    start, end = min(release_dates), int(max(deadlines))
+    n_fixed_vars = 0
+    for j, i in itertools.product(range(number_of_tasks), range(number_of_facilities)):
+        p = processing_times[j, i]
+        # constraint (c) fixes x[j, i, t] for deadline - p < t < release date or
+        # t > number_of_tasks - p
+        early = math.floor(deadlines[j] - p) + 1
+        late = number_of_tasks - p + 1
+        n_fixed_vars += _overlap(early, release_dates[j], start, end)
+        n_fixed_vars += _overlap(late, end, start, end)
+        n_fixed_vars -= _overlap(max(early, late), release_dates[j], start, end)
+
+    n_x = number_of_tasks * number_of_facilities * (end - start)
+    n_conss = number_of_tasks + number_of_facilities * (end - start) + n_fixed_vars
+    return InstanceSize(n_x, n_conss, 2 * n_x + n_fixed_vars, True)
+
+
+def _overlap(first, stop, start, end):
+    # number of integers in [first, stop) and [start, end)
+    return max(min(stop, end) - max(first, start), 0)
+
+
+@stage("params")
 @py_random_state("seed")
-def generate_params(number_of_facilities, number_of_tasks, seed=0):
+def generate_params(number_of_facilities, number_of_tasks, seed=0, fast=False):
     """
     Generic instance parameter generator for heinz [1] and hooker [2] formulations.
     Parameters
@@ -323,6 +778,8 @@ def generate_params(number_of_facilities, number_of_tasks, seed=0):
         the number of tasks to assign to facilities
     seed: int, random object or None
         for randomization
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
     Returns
     -------
     processing_times: dict[int,int]
@@ -345,6 +802,11 @@ def generate_params(number_of_facilities, number_of_tasks, seed=0):
     .. [2] Hooker, John. (2005). Planning and Scheduling to Minimize
      Tardiness. 314-327. 10.1007/11564751_25.
     """
+    if fast:
+        return _fast_generate_params(
+            number_of_facilities, number_of_tasks, numpy_generator(seed)
+        )
+
     processing_times = {}
 
     for j, i in itertools.product(range(number_of_tasks), range(number_of_facilities)):
@@ -381,3 +843,38 @@ def generate_params(number_of_facilities, number_of_tasks, seed=0):
         deadlines,
         resource_requirements,
     )
+
+
+def _fast_generate_params(number_of_facilities, number_of_tasks, rng):
+    pairs = list(itertools.product(range(number_of_tasks), range(number_of_facilities)))
+    low = 2 if number_of_tasks < 22 else 5
+    highs = [20 + 5 * i for i in range(number_of_facilities)]
+    shape = (number_of_tasks, number_of_facilities)
+    processing_times = dict(
+        zip(pairs, integers(rng, low, highs, size=shape).ravel().tolist())
+    )
+
+    capacities = [10] * number_of_facilities
+
+    values = integers(rng, 1, 10, size=number_of_tasks)
+    assignment_costs = dict(zip(pairs, values.repeat(number_of_facilities).tolist()))
+
+    release_times = [0] * number_of_tasks
+
+    beta = 20 / 9
+    deadlines = rng.uniform(
+        beta * number_of_tasks / 4, beta * number_of_tasks, size=number_of_tasks
+    ).tolist()
+
+    resource_requirements = dict(
+        zip(pairs, integers(rng, 1, 9, size=shape).ravel().tolist())
+    )
+
+    return (
+        processing_times,
+        capacities,
+        assignment_costs,
+        release_times,
+        deadlines,
+        resource_requirements,
+    )
@@ -1,8 +1,13 @@
+import math
+
 from geco.mips.scheduling.generic import *
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
+@stage("params")
 @py_random_state("seed")
-def heinz_params(number_of_facilities, number_of_tasks, seed=0):
+def heinz_params(number_of_facilities, number_of_tasks, seed=0, fast=False):
     """Generates scheduling MIP instance params according to [1].
 
     Parameters
@@ -13,6 +18,8 @@ def heinz_params(number_of_facilities, number_of_tasks, seed=0):
         the number of tasks to assign to facilities
     seed: int, random object or None
         for randomization
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -35,11 +42,12 @@ def heinz_params(number_of_facilities, number_of_tasks, seed=0):
     In Integration of AI and OR Techniques in Constraint Programming for Combinatorial Optimization Problems
     (pp. 12–27). Springer Berlin Heidelberg.
     """
-    return generate_params(number_of_facilities, number_of_tasks, seed)
+    return generate_params(number_of_facilities, number_of_tasks, seed, fast)
 
 
+@stage("instance")
 @py_random_state("seed")
-def heinz_instance(number_of_facilities, number_of_tasks, seed=0):
+def heinz_instance(number_of_facilities, number_of_tasks, seed=0, fast=False):
     """Generates scheduling MIP instance according to [1].
 
     Parameters
@@ -50,6 +58,8 @@ def heinz_instance(number_of_facilities, number_of_tasks, seed=0):
         the number of tasks to assign to facilities
     seed: int, random object or None
         for randomization
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -64,6 +74,21 @@ def heinz_instance(number_of_facilities, number_of_tasks, seed=0):
     return heinz_formulation(
         number_of_facilities,
         number_of_tasks,
-        *heinz_params(number_of_facilities, number_of_tasks, seed),
+        *heinz_params(number_of_facilities, number_of_tasks, seed, fast),
         name="Heinz Scheduling Instance",
     )
+
+
+@size_estimator(heinz_instance)
+def _heinz_instance_size(number_of_facilities, number_of_tasks, seed=0, fast=False):
+    # deadlines are below 20 / 9 * number_of_tasks and processing times between
+    # min_time and max_time, so the time steps and y vars are bounded
+    n, m = number_of_tasks, number_of_facilities
+    time_steps = math.floor(20 / 9 * n)
+    min_time, max_time = (2 if n < 22 else 5), 20 + 5 * (m - 1)
+    n_y = n * m * max(time_steps - min_time + 1, 0)
+    # constraint (15) has a row per facility and pair of tasks, all released at 0, with
+    # the tasks due before the deadline of the second one
+    n_conss = n + n * m + m * time_steps + m * n * n
+    nnz = 2 * n * m + n_y * (1 + min(max_time + 1, time_steps)) + m * n * n
+    return InstanceSize(n * m + n_y, n_conss, nnz, False)
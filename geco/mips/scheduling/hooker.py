@@ -5,10 +5,14 @@ import pyscipopt as scip
 from geco.mips.scheduling.generic import generate_params
 from networkx.utils import py_random_state
 from geco.mips.scheduling.generic import *
+from geco.mips.scheduling.generic import _late_tasks_size
+from geco.mips.utilities.size import size_estimator
+from geco.profiling import stage
 
 
+@stage("params")
 @py_random_state("seed")
-def hooker_params(number_of_facilities, number_of_tasks, seed=0):
+def hooker_params(number_of_facilities, number_of_tasks, seed=0, fast=False):
     """Generates late tasks mip instance described in section 4 in [1].
 
     Parameters
@@ -19,6 +23,8 @@ def hooker_params(number_of_facilities, number_of_tasks, seed=0):
         the number of tasks to assign to facilities
     seed: int, random object or None
         for randomization
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -38,11 +44,14 @@ def hooker_params(number_of_facilities, number_of_tasks, seed=0):
     .. [1] Hooker, John. (2005). Planning and Scheduling to Minimize
      Tardiness. 314-327. 10.1007/11564751_25.
     """
-    return generate_params(number_of_facilities, number_of_tasks, seed)[:-1]
+    return generate_params(number_of_facilities, number_of_tasks, seed, fast)[:-1]
 
 
+@stage("instance")
 @py_random_state("seed")
-def hooker_instance(number_of_facilities, number_of_tasks, time_steps, seed=0):
+def hooker_instance(
+    number_of_facilities, number_of_tasks, time_steps, seed=0, fast=False
+):
     """Generates late tasks mip instance described in section 4 in [1].
 
     Parameters
@@ -53,6 +62,10 @@ def hooker_instance(number_of_facilities, number_of_tasks, time_steps, seed=0):
         the number of tasks to assign to facilities
     time_steps:
         the number of time steps starting from 0 (corresponds to "N" in the paper)
+    seed: int, random object or None
+        for randomization
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -67,11 +80,35 @@ def hooker_instance(number_of_facilities, number_of_tasks, time_steps, seed=0):
         number_of_facilities,
         number_of_tasks,
         time_steps,
-        *hooker_params(number_of_facilities, number_of_tasks, seed),
+        *hooker_params(number_of_facilities, number_of_tasks, seed, fast),
         name="Hooker Scheduling Instance",
     )
 
 
+@size_estimator(hooker_instance)
+def _hooker_instance_size(
+    number_of_facilities, number_of_tasks, time_steps, seed=0, fast=False
+):
+    # the size grows with the processing times, so their maxima give upper bounds
+    processing_times = {
+        (j, i): 20 + 5 * i
+        for j, i in itertools.product(
+            range(number_of_tasks), range(number_of_facilities)
+        )
+    }
+    size = _late_tasks_size(
+        number_of_facilities,
+        number_of_tasks,
+        time_steps,
+        processing_times,
+        None,
+        None,
+        [0] * number_of_tasks,
+        None,
+    )
+    return size._replace(exact=False)
+
+
 def generate_hookers_instances():
     number_of_tasks = [10 + 2 * i for i in range(7)]
     time_steps = [10, 100]
@@ -91,12 +128,14 @@ def _common_hooker_params(number_of_facilities, number_of_tasks, seed):
     return capacities, resource_requirements
 
 
+@stage("params")
 @py_random_state("seed")
 def c_instance_params(seed=0):
     for m, n in itertools.product(range(2, 4 + 1), range(10, 38 + 1, 2)):
         yield c_params_generator(m, n, seed)
 
 
+@stage("params")
 @py_random_state("seed")
 def c_params_generator(number_of_facilities, number_of_tasks, seed=0):
     """
@@ -167,12 +206,14 @@ def c_params_generator(number_of_facilities, number_of_tasks, seed=0):
     )
 
 
+@stage("params")
 @py_random_state("seed")
 def e_instance_params(seed=0):
     for m in range(2, 10 + 1):
         yield e_params_generator(m, 5 * m, seed)
 
 
+@stage("params")
 @py_random_state("seed")
 def e_params_generator(number_of_facilities, number_of_tasks, seed=0):
     """
@@ -244,12 +285,14 @@ def e_params_generator(number_of_facilities, number_of_tasks, seed=0):
     )
 
 
+@stage("params")
 @py_random_state("seed")
 def de_instance_params(seed=0):
     for n in range(14, 28 + 1, 2):
         yield de_params_generator(3, n, seed)
 
 
+@stage("params")
 @py_random_state("seed")
 def de_params_generator(number_of_facilities, number_of_tasks, seed=0):
     """
@@ -323,12 +366,14 @@ def de_params_generator(number_of_facilities, number_of_tasks, seed=0):
     )
 
 
+@stage("params")
 @py_random_state("seed")
 def df_instance_params(seed=0):
     for n in range(14, 28 + 1, 2):
         yield df_params_generator(3, n, seed)
 
 
+@stage("params")
 @py_random_state("seed")
 def df_params_generator(number_of_facilities, number_of_tasks, seed=0):
     """
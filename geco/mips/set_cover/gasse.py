@@ -1,11 +1,13 @@
 import numpy as np
 import pyscipopt as scip
 from networkx.utils import np_random_state
-import scipy.sparse
 
 from geco.mips.set_cover.generic import set_cover
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
+@stage("instance")
 @np_random_state("seed")
 def gasse_instance(nrows, ncols, density, max_coef=100, seed=0):
     """
@@ -40,6 +42,12 @@ def gasse_instance(nrows, ncols, density, max_coef=100, seed=0):
     )
 
 
+@size_estimator(gasse_instance)
+def _gasse_instance_size(nrows, ncols, density, max_coef=100, seed=0):
+    return InstanceSize(ncols, nrows, int(nrows * ncols * density), True)
+
+
+@stage("params")
 @np_random_state("seed")
 def gasse_params(nrows, ncols, density, max_coef=100, seed=0):
     """
@@ -111,6 +119,8 @@ def gasse_params(nrows, ncols, density, max_coef=100, seed=0):
     c = seed.randint(max_coef, size=ncols) + 1
 
     # sparse CSC to sparse CSR matrix
+    import scipy.sparse
+
     A = scipy.sparse.csc_matrix(
         (np.ones(len(indices), dtype=int), indices, indptr), shape=(nrows, ncols)
     ).tocsr()
@@ -1,6 +1,14 @@
+import itertools
+
+import numpy as np
 import pyscipopt as scip
 
+from geco.mips.utilities.instance import InstanceBuilder
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
+
 
+@stage("build")
 def set_cover(costs, sets, name="Set Cover"):
     """
     Generates basic set cover formulation.
@@ -33,3 +41,47 @@ def set_cover(costs, sets, name="Set Cover"):
     model.setMinimize()
 
     return model
+
+
+@stage("build")
+def set_cover_sparse(costs, sets, name="Set Cover"):
+    """
+    Generates the sparse representation of the set cover formulation in `set_cover`.
+
+    Parameters
+    ----------
+    costs: list[float]
+        Cost for covering each element
+    sets: list[set]
+        Set constraints for elements
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder(name)
+    builder.add_vars(
+        len(costs), obj=costs, lb=0, ub=1, vtype="B", names=_names("v", len(costs))
+    )
+    builder.add_conss(*_set_rows(sets), coefs=1, senses=">", rhs=np.ones(len(sets)))
+    return builder.build("minimize")
+
+
+def _names(prefix, n):
+    return [f"{prefix}_{i}" for i in range(n)]
+
+
+def _set_rows(sets):
+    lengths = [len(s) for s in sets]
+    cols = np.fromiter(
+        itertools.chain.from_iterable(sets), dtype=np.int64, count=sum(lengths)
+    )
+    rows = np.repeat(np.arange(len(sets)), lengths)
+    return rows, cols
+
+
+@size_estimator(set_cover)
+@size_estimator(set_cover_sparse)
+def _set_cover_size(costs, sets, name=None):
+    return InstanceSize(len(costs), len(sets), sum(len(s) for s in sets), True)
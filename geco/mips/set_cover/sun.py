@@ -1,34 +1,79 @@
+import math
+
+import numpy as np
 from networkx.utils import py_random_state
 
-from geco.mips.set_cover.generic import set_cover
+from geco.mips.set_cover.generic import _set_rows, set_cover
+from geco.mips.utilities.sampling import integers, numpy_generator
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
 def _sun_costs(n, seed):
     return [seed.randint(1, 100) for _ in range(n)]
 
 
-def _sun_sets(n, m, seed, initial_sets=None):
-    if not initial_sets:
-        sets = [set() for _ in range(m)]
-    else:
-        sets = list(initial_sets)
+def _sun_additions(n, m, seed):
+    additions = [set() for _ in range(m)]
 
     p = 0.05
     for e in range(n):
         # enforce element to appear in at least 2 sets
-        for s in (sets[i] for i in seed.sample(range(m), k=2)):
+        for s in (additions[i] for i in seed.sample(range(m), k=2)):
             s.add(e)
 
         # add element to set with probability p
-        for s in sets:
+        for s in additions:
             if seed.random() < p:
                 s.add(e)
 
-    return sets
+    return additions
+
+
+def _sun_sets(n, m, seed, initial_sets=None):
+    additions = _sun_additions(n, m, seed)
+    if not initial_sets:
+        return additions
+    # the initial sets are left untouched, they are shared by all expansions of a backbone
+    return [set(s) | added for s, added in zip(initial_sets, additions)]
+
+
+def _fast_sun_costs(n, rng):
+    return integers(rng, 1, 100, size=n).tolist()
 
 
+def _fast_sun_additions(n, m, rng):
+    p = 0.05
+    rows, columns = [], []
+    # elements are processed in blocks to bound the memory of the (m x block) masks
+    block = max(1, 2**22 // m)
+    for start in range(0, n, block):
+        size = min(block, n - start)
+        members = rng.random((m, size)) < p
+        # enforce element to appear in at least 2 sets
+        first = rng.integers(0, m, size=size)
+        second = (first + rng.integers(1, m, size=size)) % m
+        members[first, np.arange(size)] = True
+        members[second, np.arange(size)] = True
+        block_rows, block_columns = np.nonzero(members)
+        rows.append(block_rows)
+        columns.append(block_columns + start)
+    rows, columns = np.concatenate(rows), np.concatenate(columns)
+    order = np.argsort(rows, kind="stable")
+    ends = np.cumsum(np.bincount(rows, minlength=m))
+    return [elements.tolist() for elements in np.split(columns[order], ends[:-1])]
+
+
+def _fast_sun_sets(n, m, rng, initial_sets=None):
+    additions = _fast_sun_additions(n, m, rng)
+    if not initial_sets:
+        return [set(added) for added in additions]
+    return [set(s).union(added) for s, added in zip(initial_sets, additions)]
+
+
+@stage("instance")
 @py_random_state("seed")
-def sun_instance(n, m, seed=0):
+def sun_instance(n, m, seed=0, fast=False):
     """
     Generates instance for set cover generation as described in [1].
 
@@ -40,6 +85,8 @@ def sun_instance(n, m, seed=0):
         Number of set constraints
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -52,11 +99,12 @@ def sun_instance(n, m, seed=0):
          Improving Learning to Branch via Reinforcement Learning. In Submitted to
          International Conference on Learning
     """
-    return set_cover(*sun_params(n, m, seed))
+    return set_cover(*sun_params(n, m, seed, fast))
 
 
+@stage("params")
 @py_random_state("seed")
-def sun_params(n, m, seed=0):
+def sun_params(n, m, seed=0, fast=False):
     """
     Generates instance params for set cover generation as described in [1].
 
@@ -68,6 +116,8 @@ def sun_params(n, m, seed=0):
         Number of set constraints
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -82,11 +132,15 @@ def sun_params(n, m, seed=0):
          Improving Learning to Branch via Reinforcement Learning. In Submitted to
          International Conference on Learning
     """
+    if fast:
+        rng = numpy_generator(seed)
+        return _fast_sun_costs(n, rng), _fast_sun_sets(n, m, rng, initial_sets=None)
     return _sun_costs(n, seed), _sun_sets(n, m, seed, initial_sets=None)
 
 
+@stage("params")
 @py_random_state("seed")
-def expand_sun_params(new_params, base_result, seed=0):
+def expand_sun_params(new_params, base_result, seed=0, fast=False):
     """
     Implements the expansion from an existing set cover instance as described in [1].
 
@@ -98,6 +152,8 @@ def expand_sun_params(new_params, base_result, seed=0):
         Tuple of (costs, sets) that represent instance params of backbone
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -117,6 +173,82 @@ def expand_sun_params(new_params, base_result, seed=0):
     assert n > len(base_costs)
 
     costs = list(base_costs)
+    if fast:
+        rng = numpy_generator(seed)
+        costs += _fast_sun_costs(n - len(base_costs), rng)
+        return costs, _fast_sun_sets(n, len(base_sets), rng, initial_sets=base_sets)
+
     costs += _sun_costs(n - len(base_costs), seed)
 
     return costs, _sun_sets(n, len(base_sets), seed, initial_sets=base_sets)
+
+
+# not a stage, the builder it extends is neither a new instance nor a new model
+@py_random_state("seed")
+def expand_sun_instance(builder, new_params, base_result, seed=0, fast=False):
+    """
+    Appends the expansion of `expand_sun_params` to a builder holding the base instance.
+
+    Only the new variables and the nonzeros added to the base sets are appended, so
+    `builder.build("minimize")` is the same instance as
+    `set_cover_sparse(*expand_sun_params(new_params, base_result, seed))` without
+    rebuilding the base instance.
+
+    Parameters
+    ----------
+    builder: InstanceBuilder
+        Builder created with InstanceBuilder.from_instance from the base instance
+    new_params: tuple
+        New params for sun_params
+    base_result: tuple
+        Tuple of (costs, sets) that represent instance params of backbone
+    seed: integer, random_state, or None
+        Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
+
+    Returns
+    -------
+    builder: InstanceBuilder
+        The given builder
+    """
+    n, *_ = new_params
+    base_costs, base_sets = base_result
+    assert n > len(base_costs)
+    assert builder.nvars == len(base_costs) and builder.ncons == len(base_sets)
+
+    if fast:
+        rng = numpy_generator(seed)
+        costs = _fast_sun_costs(n - len(base_costs), rng)
+        additions = _fast_sun_additions(n, len(base_sets), rng)
+    else:
+        costs = _sun_costs(n - len(base_costs), seed)
+        additions = _sun_additions(n, len(base_sets), seed)
+
+    builder.add_vars(
+        len(costs),
+        obj=costs,
+        lb=0,
+        ub=1,
+        vtype="B",
+        names=[f"v_{i}" for i in range(len(base_costs), n)],
+    )
+    # elements already in a base set are nonzeros of the base instance
+    new_elements = [
+        [e for e in added if e not in base_set]
+        for base_set, added in zip(base_sets, additions)
+    ]
+    rows, cols = _set_rows(new_elements)
+    builder.add_coefs(rows, cols, 1)
+    return builder
+
+
+@size_estimator(sun_instance)
+def _sun_instance_size(n, m, seed=0, fast=False):
+    # every element is in 2 sets and in each of the other m - 2 with probability 0.05,
+    # the number of nonzeros exceeds its mean by 6 standard deviations with a
+    # probability of about 1e-9
+    p = 0.05
+    mean = n * (m - 2) * p
+    bound = 2 * n + math.ceil(mean + 6 * math.sqrt(mean * (1 - p)))
+    return InstanceSize(n, m, min(bound, n * m), False)
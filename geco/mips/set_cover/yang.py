@@ -1,10 +1,14 @@
 from networkx.utils import py_random_state
 
 from geco.mips.set_cover.generic import set_cover
+from geco.mips.utilities.sampling import integers, numpy_generator, random_subsets
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
+@stage("instance")
 @py_random_state("seed")
-def yang_instance(m, seed=0):
+def yang_instance(m, seed=0, fast=False):
     """
     Generates instance for set cover generation as described in [1].
 
@@ -14,6 +18,8 @@ def yang_instance(m, seed=0):
         Number of set constraints
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -26,11 +32,12 @@ def yang_instance(m, seed=0):
     "Learning Generalized Strong Branching for Set Covering,
     Set Packing, and 0-1 Knapsack Problems", 2020.
     """
-    return set_cover(*yang_params(m, seed))
+    return set_cover(*yang_params(m, seed, fast))
 
 
+@stage("params")
 @py_random_state("seed")
-def yang_params(m, seed=0):
+def yang_params(m, seed=0, fast=False):
     """
     Generates instance params for set cover generation as described in [1].
 
@@ -40,6 +47,8 @@ def yang_params(m, seed=0):
         Number of set constraints
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -56,6 +65,13 @@ def yang_params(m, seed=0):
     """
     n = 10 * m
 
+    if fast:
+        rng = numpy_generator(seed)
+        costs = integers(rng, 1, 100, size=n).tolist()
+        sizes = integers(rng, 2 * n // 25 + 1, 3 * n // 25 - 1, size=m)
+        sets = [set(s.tolist()) for s in random_subsets(rng, n, sizes)]
+        return costs, sets
+
     costs = [seed.randint(1, 100) for _ in range(n)]
 
     sets = []
@@ -64,3 +80,9 @@ def yang_params(m, seed=0):
         sets.append(set(j for j in seed.sample(range(n), k=num_nonzero)))
 
     return costs, sets
+
+
+@size_estimator(yang_instance)
+def _yang_instance_size(m, seed=0, fast=False):
+    n = 10 * m
+    return InstanceSize(n, m, m * (3 * n // 25 - 1), False)
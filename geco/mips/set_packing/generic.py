@@ -1,6 +1,13 @@
+import numpy as np
 import pyscipopt as scip
 
+from geco.mips.set_cover.generic import _names, _set_rows
+from geco.mips.utilities.instance import InstanceBuilder
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
+
+@stage("build")
 def set_packing(m, n, values, nonzero_vars_for_constraint, name="Set Packing"):
     """
     Generates a set packing formulation following [1].
@@ -45,3 +52,40 @@ def set_packing(m, n, values, nonzero_vars_for_constraint, name="Set Packing"):
     model.setMaximize()
 
     return model
+
+
+@stage("build")
+def set_packing_sparse(m, n, values, nonzero_vars_for_constraint, name="Set Packing"):
+    """
+    Generates the sparse representation of the set packing formulation in `set_packing`.
+
+    Parameters
+    ----------
+    m: int
+        Number of constraints
+    n: int
+        Number of elements
+    values: list[int]
+        Value you get for packing each item
+    nonzero_vars_for_constraint: list[list[int]]
+        Nonzero variables list for each constraint
+    name: str
+        Name of the model
+
+    Returns
+    -------
+    instance: MIPInstance
+        A sparse representation of the generated instance
+    """
+    builder = InstanceBuilder(name)
+    builder.add_vars(n, obj=values[:n], lb=0, ub=1, vtype="B", names=_names("v", n))
+    rows, cols = _set_rows(nonzero_vars_for_constraint[:m])
+    builder.add_conss(rows, cols, coefs=1, senses="<", rhs=np.ones(m))
+    return builder.build("maximize")
+
+
+@size_estimator(set_packing)
+@size_estimator(set_packing_sparse)
+def _set_packing_size(m, n, values, nonzero_vars_for_constraint, name=None):
+    nnz = sum(len(variables) for variables in nonzero_vars_for_constraint[:m])
+    return InstanceSize(n, m, nnz, True)
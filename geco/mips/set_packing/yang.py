@@ -1,10 +1,14 @@
 import pyscipopt as scip
 from networkx.utils import py_random_state
 from geco.mips.set_packing.generic import *
+from geco.mips.utilities.sampling import integers, numpy_generator, random_subsets
+from geco.mips.utilities.size import InstanceSize, size_estimator
+from geco.profiling import stage
 
 
+@stage("instance")
 @py_random_state("seed")
-def yang_instance(m, seed=0):
+def yang_instance(m, seed=0, fast=False):
     """
     Generates a set packing instance following [1].
 
@@ -14,6 +18,8 @@ def yang_instance(m, seed=0):
         Number of constraints
     seed: int, random state or None
         Seed for randomizatio.
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -26,11 +32,12 @@ def yang_instance(m, seed=0):
     "Learning Generalized Strong Branching for Set Covering,
     Set Packing, and 0-1 Knapsack Problems", 2020.
     """
-    return set_packing(m, *yang_parameters(m, seed), name="Yang Set Packing")
+    return set_packing(m, *yang_parameters(m, seed, fast), name="Yang Set Packing")
 
 
+@stage("params")
 @py_random_state("seed")
-def yang_parameters(m, seed=0):
+def yang_parameters(m, seed=0, fast=False):
     """
     Generates a set packing instance following [1].
 
@@ -40,6 +47,8 @@ def yang_parameters(m, seed=0):
         Number of constraints
     seed: integer, random_state, or None
         Indicator of random number generation state
+    fast: bool
+        Whether to draw all values at once with NumPy, see geco.mips.utilities.sampling
 
     Returns
     -------
@@ -57,6 +66,11 @@ def yang_parameters(m, seed=0):
     Set Packing, and 0-1 Knapsack Problems", 2020.
     """
     n = 5 * m
+    if fast:
+        rng = numpy_generator(seed)
+        values = integers(rng, 1, 100, size=n).tolist()
+        sizes = integers(rng, 2 * n // 25 + 1, 3 * n // 25 - 1, size=m)
+        return n, values, [s.tolist() for s in random_subsets(rng, n, sizes)]
     values = [seed.randint(1, 100) for _ in range(n)]
     num_nonzero_vars_for_constraint = [
         seed.randint(2 * n // 25 + 1, 3 * n // 25 - 1) for _ in range(m)
@@ -65,3 +79,9 @@ def yang_parameters(m, seed=0):
         seed.sample(range(n), k=num) for num in num_nonzero_vars_for_constraint
     ]
     return n, values, nonzero_vars_for_constraint
+
+
+@size_estimator(yang_instance)
+def _yang_instance_size(m, seed=0, fast=False):
+    n = 5 * m
+    return InstanceSize(n, m, m * (3 * n // 25 - 1), False)
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+import geco.mips.set_cover as set_cover
+from geco.mips.facility_location.cornuejols import cornuejols_instance
+from geco.mips.tests.test_writing import _bounds_instance
+from geco.mips.utilities.features import *
+from geco.mips.utilities.instance import InstanceBuilder, MIPInstance
+
+
+def _python_features(model):
+    # reference implementation iterating over the pyscipopt rows
+    variables = model.getVars()
+    index = {var.name: j for j, var in enumerate(variables)}
+    objective = np.array([var.getObj() for var in variables])
+    objective_norm = np.linalg.norm(objective) or 1
+    degrees = np.zeros(len(variables))
+    constraint_rows, edges = [], []
+    for i, cons in enumerate(model.getConss()):
+        coefficients = model.getValsLinear(cons)
+        norm = np.linalg.norm(list(coefficients.values())) or 1
+        lhs, rhs = model.getLhs(cons), model.getRhs(cons)
+        if lhs == rhs:
+            sense, value = "=", rhs
+        elif lhs <= -model.infinity():
+            sense, value = "<", rhs
+        else:
+            sense, value = ">", lhs
+        cosine = sum(
+            coef * objective[index[name]] for name, coef in coefficients.items()
+        )
+        constraint_rows.append(
+            [value / norm, sense == "<", sense == ">", sense == "=", norm]
+            + [cosine / norm / objective_norm, len(coefficients)]
+        )
+        for name, coef in coefficients.items():
+            edges.append((i, index[name], coef / norm))
+            degrees[index[name]] += 1
+    return objective / objective_norm, degrees, np.array(constraint_rows), edges
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        cornuejols_instance(10, 5, 2, seed=0),
+        set_cover.gasse_instance(30, 50, 0.1, seed=1),
+    ],
+)
+def test_matches_python_loop(model):
+    graph = bipartite_graph(model, dtype=np.float64)
+    objective, degrees, constraint_features, edges = _python_features(model)
+    assert graph.variable_features.shape == (model.getNVars(), len(VARIABLE_FEATURES))
+    assert np.allclose(graph.variable_features[:, 0], objective)
+    assert np.allclose(graph.variable_features[:, -1], degrees)
+    assert np.allclose(graph.constraint_features, constraint_features)
+    computed = sorted(
+        zip(*graph.edge_index.tolist(), graph.edge_features[:, 0].tolist())
+    )
+    assert np.allclose(computed, sorted(edges))
+
+
+def test_variable_features():
+    graph = bipartite_graph(_bounds_instance(), normalize=False)
+    features = dict(zip(VARIABLE_FEATURES, graph.variable_features.T))
+    assert features["objective"].tolist() == pytest.approx([1, -2.5, 0, 0, 1e-7, 3])
+    assert features["is_binary"].tolist() == [1, 0, 0, 0, 0, 0]
+    assert features["is_integer"].tolist() == [0, 0, 1, 0, 1, 1]
+    assert features["has_lower_bound"].tolist() == [1, 0, 0, 1, 1, 1]
+    assert features["has_upper_bound"].tolist() == [1, 0, 1, 1, 1, 0]
+    assert features["lower_bound"].tolist() == [0, 0, 0, 2, -3, 4]
+    assert features["upper_bound"].tolist() == [1, 0, 7, 2, 10.5, 0]
+    assert features["degree"].tolist() == [2, 2, 2, 2, 1, 1]
+    assert graph.variable_features.dtype == np.float32
+
+
+def test_batch():
+    instances = [
+        MIPInstance.from_scip(set_cover.yang_instance(m, seed=m)) for m in (5, 8, 6)
+    ]
+    empty = InstanceBuilder().build()
+    batch = bipartite_graph(instances[:2] + [empty] + instances[2:])
+    assert batch.n_variables.tolist() == [i.nvars for i in instances[:2]] + [
+        0,
+        instances[2].nvars,
+    ]
+    assert batch.n_constraints.tolist() == [5, 8, 0, 6]
+
+    variable_offset = constraint_offset = edge_offset = 0
+    for instance in instances:
+        single = bipartite_graph(instance)
+        n, m, nnz = instance.nvars, instance.ncons, instance.nnz
+        assert np.array_equal(
+            batch.variable_features[variable_offset : variable_offset + n],
+            single.variable_features,
+        )
+        assert np.array_equal(
+            batch.constraint_features[constraint_offset : constraint_offset + m],
+            single.constraint_features,
+        )
+        edges = batch.edge_index[:, edge_offset : edge_offset + nnz]
+        assert np.array_equal(
+            edges - [[constraint_offset], [variable_offset]], single.edge_index
+        )
+        variable_offset, constraint_offset = variable_offset + n, constraint_offset + m
+        edge_offset += nnz
+
+
+def test_empty_batch():
+    graph = bipartite_graph([])
+    assert graph.variable_features.shape == (0, len(VARIABLE_FEATURES))
+    assert graph.edge_index.shape == (2, 0)
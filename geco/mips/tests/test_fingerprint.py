@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+import geco.mips.knapsack as knapsack
+import geco.mips.set_cover as set_cover
+from geco.generator import generate_n
+from geco.mips.tests.test_writing import _bounds_instance
+from geco.mips.utilities.fingerprint import *
+from geco.mips.utilities.instance import InstanceBuilder, MIPInstance
+
+
+def _set_cover_instance(seed=0):
+    return set_cover.set_cover_sparse(*set_cover.gasse_params(50, 80, 0.1, seed=seed))
+
+
+def _with_names(instance, var_names, cons_names):
+    return MIPInstance(
+        instance.c,
+        instance.A,
+        instance.senses,
+        instance.rhs,
+        instance.lb,
+        instance.ub,
+        instance.vtypes,
+        var_names,
+        cons_names,
+        instance.sense,
+        instance.name,
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_permutation_invariance(seed):
+    rng = np.random.default_rng(seed)
+    for instance in (_bounds_instance(), _set_cover_instance(seed)):
+        permuted = instance.permute(
+            rng.permutation(instance.nvars), rng.permutation(instance.ncons)
+        )
+        assert fingerprint(permuted) == fingerprint(instance)
+
+
+def test_naming_invariance():
+    instance = _bounds_instance()
+    renamed = _with_names(
+        instance,
+        [f"y{j}" for j in range(instance.nvars)],
+        [f"row{i}" for i in range(instance.ncons)],
+    )
+    assert fingerprint(renamed) == fingerprint(instance)
+
+
+def test_scip_model_same_as_instance():
+    costs, sets = set_cover.yang_params(10, seed=0)
+    model = set_cover.set_cover(costs, sets)
+    assert fingerprint(model) == fingerprint(set_cover.set_cover_sparse(costs, sets))
+
+
+def test_different_instances():
+    fingerprints = {fingerprint(_set_cover_instance(seed)) for seed in range(20)}
+    assert len(fingerprints) == 20
+
+
+@pytest.mark.parametrize(
+    "change",
+    ["c", "rhs", "lb", "ub", "vtypes", "senses", "coefficient", "sense"],
+)
+def test_sensitive_to_data(change):
+    instance = _bounds_instance()
+    arrays = {
+        "c": instance.c.copy(),
+        "rhs": instance.rhs.copy(),
+        "lb": instance.lb.copy(),
+        "ub": instance.ub.copy(),
+        "vtypes": instance.vtypes.copy(),
+        "senses": instance.senses.copy(),
+    }
+    A, sense = instance.A.copy(), instance.sense
+    if change == "coefficient":
+        A.data[1] += 1
+    elif change == "sense":
+        sense = "minimize"
+    elif change in ("vtypes", "senses"):
+        arrays[change][1] = "I" if change == "vtypes" else "="
+    else:
+        arrays[change][0] += 1
+    changed = MIPInstance(
+        arrays["c"],
+        A,
+        arrays["senses"],
+        arrays["rhs"],
+        arrays["lb"],
+        arrays["ub"],
+        arrays["vtypes"],
+        sense=sense,
+    )
+    assert fingerprint(changed) != fingerprint(instance)
+
+
+def test_structure_matters():
+    # same rows and columns degrees, but a path and two disjoint edges
+    def instance(rows):
+        builder = InstanceBuilder()
+        x = builder.add_vars(4, vtype="B")
+        for i, j in rows:
+            builder.add_cons([x[i], x[j]], [1, 1], "<", 1)
+        return builder.build()
+
+    path = instance([(0, 1), (1, 2), (2, 3)])
+    star = instance([(0, 1), (1, 2), (1, 3)])
+    assert fingerprint(path) != fingerprint(star)
+
+
+def test_empty_instance():
+    assert fingerprint(InstanceBuilder().build()) == fingerprint(
+        InstanceBuilder().build()
+    )
+
+
+def test_deduplicate():
+    rng = np.random.default_rng(0)
+    instances = [_set_cover_instance(seed % 3) for seed in range(9)]
+    instances = [
+        instance.permute(
+            rng.permutation(instance.nvars), rng.permutation(instance.ncons)
+        )
+        for instance in instances
+    ]
+    unique = list(deduplicate(enumerate(instances)))
+    assert [i for i, _ in unique] == [0, 1, 2]
+
+    seen = set()
+    assert len(list(deduplicate(instances[:2], seen))) == 2
+    assert len(list(deduplicate(instances, seen))) == 1
+
+
+def test_deduplicate_generate_n():
+    stream = generate_n(lambda seed: knapsack.yang_instance(5, seed), 20, seed=0)
+    unique = list(deduplicate(stream))
+    assert 0 < len(unique) <= 20
+    assert len({fingerprint(instance) for _, instance in unique}) == len(unique)
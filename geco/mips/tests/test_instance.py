@@ -0,0 +1,261 @@
+import networkx as nx
+import numpy as np
+import pytest
+import scipy.sparse
+
+import geco.mips.combinatorial_auction as combinatorial_auction
+import geco.mips.facility_location as facility_location
+import geco.mips.packing as packing
+import geco.mips.production_planning as production_planning
+import geco.mips.production_planning.tang as lot_sizing
+import geco.mips.scheduling as scheduling
+import geco.mips.set_cover as set_cover
+import geco.mips.set_packing as set_packing
+from geco.mips.graph_coloring import *
+from geco.mips.independent_set.generic import *
+from geco.mips.knapsack import knapsack, knapsack_sparse, yang_params
+from geco.mips.max_cut.generic import *
+from geco.mips.utilities.instance import *
+
+
+def assert_equivalent(model, instance):
+    """
+    Asserts that a SCIP model and a MIPInstance describe the same problem,
+    variables are matched by name and constraints by position.
+    """
+    expected = MIPInstance.from_scip(model)
+    assert instance.nvars == expected.nvars
+    assert instance.ncons == expected.ncons
+    assert instance.sense == expected.sense
+
+    # unnamed variables get SCIP's default names
+    var_names = instance.var_names or [f"x{j + 1}" for j in range(instance.nvars)]
+    index = {name: j for j, name in enumerate(expected.var_names)}
+    order = [index[name] for name in var_names]
+    assert np.array_equal(instance.c, expected.c[order])
+    assert np.array_equal(instance.lb, expected.lb[order])
+    assert np.array_equal(instance.ub, expected.ub[order])
+    assert np.array_equal(instance.vtypes, expected.vtypes[order])
+
+    senses, rhs, A = _canonical_rows(instance.senses, instance.rhs, instance.A)
+    expected_senses, expected_rhs, expected_A = _canonical_rows(
+        expected.senses, expected.rhs, expected.A[:, order]
+    )
+    assert np.array_equal(senses, expected_senses)
+    assert np.array_equal(rhs, expected_rhs)
+    assert (A != expected_A).nnz == 0
+
+
+def _canonical_rows(senses, rhs, A):
+    # ">" rows are flipped to "<" and equalities get a positive leading coefficient
+    A = A.tocsr()
+    A.sort_indices()
+    leading = np.array(
+        [
+            A.data[start] if start < end else 1
+            for start, end in zip(A.indptr, A.indptr[1:])
+        ]
+    )
+    flip = (senses == ">") | ((senses == "=") & (leading < 0))
+    signs = np.where(flip, -1.0, 1.0)
+    senses = np.where(senses == ">", "<", senses)
+    return senses, signs * rhs, scipy.sparse.diags(signs) @ A
+
+
+def _weighted(graph):
+    for u, v, data in graph.edges(data=True):
+        data["weight"] = (u + 2 * v) % 5 - 1
+    return graph
+
+
+_cycle = nx.cycle_graph(5)
+_scheduling_params = scheduling.generate_params(2, 4, seed=0)
+_heinz_params = scheduling.heinz_params(2, 4, seed=0)
+
+equivalence_cases = {
+    "knapsack": (knapsack, knapsack_sparse, yang_params(20, seed=0)),
+    "set_cover": (
+        set_cover.set_cover,
+        set_cover.set_cover_sparse,
+        set_cover.sun_params(20, 30, seed=0),
+    ),
+    "set_packing": (
+        set_packing.set_packing,
+        set_packing.set_packing_sparse,
+        (10,) + set_packing.yang_parameters(10, seed=0),
+    ),
+    "packing": (
+        packing.packing,
+        packing.packing_sparse,
+        (20, 10, *packing.tang_params(20, 10, False, seed=0), False),
+    ),
+    "binary_packing": (
+        packing.packing,
+        packing.packing_sparse,
+        (20, 10, *packing.tang_params(20, 10, True, seed=0), True),
+    ),
+    "combinatorial_auction": (
+        combinatorial_auction.combinatorial_auction,
+        combinatorial_auction.combinatorial_auction_sparse,
+        combinatorial_auction.gasse_params(n_items=20, n_bids=40, seed=0) + (20,),
+    ),
+    "capacitated_facility_location": (
+        facility_location.capacitated_facility_location,
+        facility_location.capacitated_facility_location_sparse,
+        (10, 5) + facility_location.cornuejols_params(10, 5, 2, seed=0),
+    ),
+    "capacitated_warehouse_location": (
+        facility_location.capacitated_warehouse_location,
+        facility_location.capacitated_warehouse_location_sparse,
+        (10, 5) + facility_location.cornuejols_params(10, 5, 2, seed=0),
+    ),
+    "independent_set": (
+        independent_set,
+        independent_set_sparse,
+        (nx.barabasi_albert_graph(20, 3, seed=0),),
+    ),
+    "clique_independent_set": (
+        clique_independent_set,
+        clique_independent_set_sparse,
+        (nx.barabasi_albert_graph(20, 3, seed=0),),
+    ),
+    "uncapacitated_lot_sizing": (
+        production_planning.uncapacitated_lot_sizing,
+        production_planning.uncapacitated_lot_sizing_sparse,
+        (10,) + lot_sizing.tang_params(10, seed=0),
+    ),
+    "assignment": (assignment, assignment_sparse, (_cycle, 4)),
+    "assignment_asymmetric": (
+        assignment_asymmetric,
+        assignment_asymmetric_sparse,
+        (_cycle, 4),
+    ),
+    "representatives": (representatives, representatives_sparse, (_cycle,)),
+    "set_covering": (
+        set_covering,
+        set_covering_sparse,
+        (_cycle, [{0, 1}, {2, 3}, {4}]),
+    ),
+    "partial_ordering": (partial_ordering, partial_ordering_sparse, (_cycle, 4)),
+    "hybrid_partial_ordering": (
+        hybrid_partial_ordering,
+        hybrid_partial_ordering_sparse,
+        (_cycle, 4),
+    ),
+    "late_tasks_formulation": (
+        scheduling.late_tasks_formulation,
+        scheduling.late_tasks_formulation_sparse,
+        (2, 4, 10) + _scheduling_params[:-1],
+    ),
+    "heinz_formulation": (
+        scheduling.heinz_formulation,
+        scheduling.heinz_formulation_sparse,
+        (2, 4) + _heinz_params,
+    ),
+    "hooker_cost_formulation": (
+        scheduling.hooker_cost_formulation,
+        scheduling.hooker_cost_formulation_sparse,
+        (2, 4) + _heinz_params,
+    ),
+}
+
+
+@pytest.mark.parametrize("case", equivalence_cases)
+def test_sparse_formulation_equivalence(case):
+    formulation, sparse_formulation, params = equivalence_cases[case]
+    assert_equivalent(formulation(*params), sparse_formulation(*params))
+
+
+@pytest.mark.parametrize("formulation", [naive, triangle])
+def test_max_cut_equivalence(formulation):
+    graph = _weighted(nx.complete_graph(6))
+    sparse_formulation = {naive: naive_sparse, triangle: triangle_sparse}[formulation]
+    _, model = formulation(graph)
+    assert_equivalent(model, sparse_formulation(graph))
+
+
+def test_to_scip_round_trip():
+    instance = set_cover.set_cover_sparse(*set_cover.sun_params(20, 30, seed=0))
+    model = instance.to_scip()
+    assert model.getNVars() == instance.nvars
+    assert model.getNConss() == instance.ncons
+    assert_equivalent(model, instance)
+
+
+def test_solution_matches():
+    params = yang_params(30, seed=0)
+    model, instance_model = knapsack(*params), knapsack_sparse(*params).to_scip()
+    for m in (model, instance_model):
+        m.hideOutput()
+        m.optimize()
+    assert model.getObjVal() == pytest.approx(instance_model.getObjVal())
+
+
+def test_builder():
+    builder = InstanceBuilder("test")
+    x = builder.add_vars(3, obj=[1, 2, 3], ub=1, vtype="B", names=["a", "b", "c"])
+    y = builder.add_var(obj=-1, lb=-np.inf, name="y")
+    builder.add_conss([0, 0, 1, 1], [x[0], x[1], x[2], y], [1, 2, 3, 4], "<=", [5, 6])
+    builder.add_cons([x[0], x[0], y], [1, 1, -1], "==", 0)
+    instance = builder.build("maximize")
+
+    assert instance.nvars == 4 and instance.ncons == 3 and instance.nnz == 6
+    assert instance.var_names == ["a", "b", "c", "y"]
+    assert instance.vtypes.tolist() == ["B", "B", "B", "C"]
+    assert instance.lb.tolist() == [0, 0, 0, -np.inf]
+    assert instance.ub.tolist() == [1, 1, 1, np.inf]
+    assert instance.senses.tolist() == ["<", "<", "="]
+    assert instance.rhs.tolist() == [5, 6, 0]
+    assert instance.A.toarray().tolist() == [[1, 2, 0, 0], [0, 0, 3, 4], [2, 0, 0, -1]]
+    assert_equivalent(instance.to_scip(), instance)
+
+
+def test_builder_from_instance():
+    base = InstanceBuilder("test")
+    x = base.add_vars(2, obj=[1, 2], ub=1, vtype="B", names=["a", "b"])
+    base.add_cons(x, [1, 1], "<", 1)
+    base_instance = base.build("maximize")
+    base_A = base_instance.A.copy()
+
+    builder = InstanceBuilder.from_instance(base_instance)
+    y = builder.add_var(obj=3, name="y")
+    builder.add_coefs([0, 0], [y, x[0]], [4, 1])
+    builder.add_cons([x[1], y], [1, -1], ">", 0)
+    instance = builder.build("maximize")
+
+    assert instance.var_names == ["a", "b", "y"]
+    assert instance.c.tolist() == [1, 2, 3]
+    assert instance.senses.tolist() == ["<", ">"]
+    assert instance.rhs.tolist() == [1, 0]
+    assert instance.A.toarray().tolist() == [[2, 1, 4], [0, 1, -1]]
+    assert (base_instance.A != base_A).nnz == 0
+    assert_equivalent(instance.to_scip(), instance)
+
+
+def test_builder_from_instance_keeps_cons_names():
+    instance = set_cover.set_cover_sparse(*set_cover.sun_params(5, 5, seed=0))
+    instance = MIPInstance.from_scip(instance.to_scip())
+    builder = InstanceBuilder.from_instance(instance)
+    builder.add_cons([0], [1], "<", 1)
+    extended = builder.build()
+    assert extended.cons_names == instance.cons_names + ["c6"]
+
+
+def test_from_scip_rejects_nonlinear():
+    model = set_cover.set_cover_sparse(*set_cover.sun_params(5, 5, seed=0)).to_scip()
+    x = model.getVars()
+    model.addCons(x[0] * x[1] <= 1)
+    with pytest.raises(ValueError):
+        MIPInstance.from_scip(model)
+
+
+@pytest.mark.parametrize("case", ["knapsack", "set_cover", "late_tasks_formulation"])
+def test_save_load(tmp_path, case):
+    _, sparse_formulation, params = equivalence_cases[case]
+    instance = sparse_formulation(*params)
+    instance.save(str(tmp_path / "instance.npz"))
+    loaded = MIPInstance.load(str(tmp_path / "instance.npz"))
+    assert loaded.var_names == instance.var_names
+    assert loaded.cons_names == instance.cons_names
+    assert (loaded.name, loaded.sense) == (instance.name, instance.sense)
+    assert_equivalent(instance.to_scip(), loaded)
@@ -1,10 +1,19 @@
 import itertools
+import math
+import random
 import types
 
+import numpy as np
 import pytest
 
+from geco.mips.knapsack.batch import *
+from geco.mips.knapsack.generic import *
+from geco.mips.knapsack.hardness import *
+from geco.mips.knapsack.multi import *
 from geco.mips.knapsack.pisinger import *
+from geco.mips.knapsack.solver import *
 from geco.mips.knapsack.yang import *
+from geco.mips.utilities.instance import MIPInstance
 
 """
 Yang Generators Tests
@@ -52,21 +61,23 @@ Pisinger Generators Tests
 """
 
 
-def test_pisinger_creation_of_all():
+@pytest.mark.parametrize("fast", [False, True])
+def test_pisinger_creation_of_all(fast):
     n = 100
     c = 20
     models = [
-        uncorrelated(n, c),
-        weakly_correlated(n, c),
-        strongly_correlated(n, c),
-        inverse_strongly_correlated(n, c),
-        almost_strongly_correlated(n, c),
-        subset_sum(n, c),
-        uncorrelated_with_similar_weights(n, c),
-        profit_ceiling(n, c),
-        circle(n, c),
-        multiple_strongly_correlated(n, c, 7, 10, 3),
-        spanner(10, 100, 100, uncorrelated_distribution, 500),
+        uncorrelated(n, c, fast=fast),
+        weakly_correlated(n, c, fast=fast),
+        strongly_correlated(n, c, fast=fast),
+        inverse_strongly_correlated(n, c, fast=fast),
+        almost_strongly_correlated(n, c, fast=fast),
+        subset_sum(n, c, fast=fast),
+        uncorrelated_with_similar_weights(n, c, fast=fast),
+        profit_ceiling(n, c, fast=fast),
+        circle(n, c, fast=fast),
+        multiple_strongly_correlated(n, c, 7, 10, 3, fast=fast),
+        spanner(10, 100, 100, uncorrelated_distribution, 500, fast=fast),
+        spanner(10, 100, 100, circle_distribution, 500, fast=fast),
     ]
     for model in models:
         assert model.getNVars() == n
@@ -98,3 +109,282 @@ def test_pisinger_seeding(n, R, distribution: types.FunctionType, seed1, seed2):
     same_seeds_produce_same_params = seed1 == seed2 and params1 == params2
     different_seeds_produce_different_params = seed1 != seed2 and params1 != params2
     assert same_seeds_produce_same_params or different_seeds_produce_different_params
+
+
+"""
+Solver Tests
+"""
+
+
+def _brute_force_value(profits, weights, capacity):
+    best = 0
+    for packed in itertools.product([False, True], repeat=len(profits)):
+        if sum(w for w, x in zip(weights, packed) if x) <= capacity:
+            best = max(best, sum(p for p, x in zip(profits, packed) if x))
+    return best
+
+
+@pytest.mark.parametrize("seed", range(50))
+@pytest.mark.parametrize("integral", [True, False])
+def test_solver_brute_force(seed, integral):
+    rng = random.Random(seed)
+    draw = (lambda: rng.randint(0, 20)) if integral else (lambda: rng.uniform(0, 20))
+    n = rng.randint(0, 12)
+    profits = [draw() for _ in range(n)]
+    weights = [draw() for _ in range(n)]
+    capacity = rng.randint(0, 60)
+
+    solution = solve_knapsack(profits, weights, capacity)
+    assert solution.optimal
+    assert solution.value == pytest.approx(
+        _brute_force_value(profits, weights, capacity)
+    )
+    assert solution.value == pytest.approx(sum(profits[i] for i in solution.selected))
+    assert sum(weights[i] for i in solution.selected) <= capacity + 1e-9
+    assert solution.greedy_value <= solution.value + 1e-9
+    assert solution.value <= solution.lp_bound + 1e-9
+    assert solution.upper_bound == solution.value
+
+
+@pytest.mark.parametrize("n", [10, 50, 200])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_solver_scip(n, seed):
+    profits, weights, capacity = yang_params(n, seed=seed)
+    model = knapsack(weights, profits, capacity)
+    model.hideOutput()
+    model.optimize()
+    assert solve_knapsack(profits, weights, capacity).value == model.getObjVal()
+
+
+def test_dantzig_bound():
+    # the third item is the break item, half of it fits
+    assert dantzig_bound([10, 12, 4, 1], [2, 4, 4, 1], 8) == 24
+    assert dantzig_bound([10, 12], [2, 4], 100) == 22
+    assert dantzig_bound([], [], 5) == 0
+    assert solve_knapsack([10, 12, 4, 1], [2, 4, 4, 1], 8).lp_bound == 24
+
+
+def test_solver_free_items():
+    solution = solve_knapsack([5, 3, 7], [0, 10, 2], 1)
+    assert solution.value == 5
+    assert solution.selected == [0]
+
+
+def test_solver_max_states():
+    profits, weights = generate_from_distribution(
+        40, **subset_sum_distribution(R=1000, seed=0)
+    )
+    capacity = sum(weights) / 2
+    solution = solve_knapsack(profits, weights, capacity, max_states=1000)
+    assert not solution.optimal
+    assert solution.value < solution.upper_bound <= solution.lp_bound
+    assert solution.value == pytest.approx(sum(profits[i] for i in solution.selected))
+    assert sum(weights[i] for i in solution.selected) <= capacity
+
+
+def test_parallel_solve_knapsack():
+    instances = [yang_params(30, seed=seed) for seed in range(10)]
+    expected = [solve_knapsack(*instance) for instance in instances]
+    results = list(parallel_solve_knapsack(instances, n_jobs=2, chunksize=3))
+    assert [i for i, _ in results] == list(range(10))
+    assert [solution for _, solution in results] == expected
+
+
+"""
+Hardness Tests
+"""
+
+
+def test_hardness_indicators():
+    # greedy packs the first, second and fourth item, the third is the break item
+    indicators = hardness_indicators([10, 12, 4, 1], [2, 4, 4, 1], 8)
+    assert indicators["gap"] == pytest.approx(1 / 24)
+    assert indicators["core_size"] == 2
+    assert indicators["correlation"] == pytest.approx(
+        np.corrcoef([10, 12, 4, 1], [2, 4, 4, 1])[0, 1]
+    )
+
+
+def test_hardness_indicators_all_fit():
+    indicators = hardness_indicators([3, 5], [1, 2], 10)
+    assert indicators["gap"] == 0
+    assert indicators["core_size"] == 0
+
+
+def test_hardness_indicators_no_items():
+    assert hardness_indicators([], [], 5) == {
+        "gap": 0,
+        "core_size": 0,
+        "correlation": 0,
+    }
+
+
+@pytest.mark.parametrize(
+    "distribution",
+    [uncorrelated_distribution, strongly_correlated_distribution, circle_distribution],
+)
+def test_hardness_targeted_params(distribution):
+    instances, report = hardness_targeted_params(
+        50, 10, distribution, min_gap=0.001, min_core_size=20, batch_size=64, seed=0
+    )
+    assert len(instances) == report["accepted"] == 10
+    assert report["acceptance_rate"] == 10 / report["candidates"]
+    for profits, weights, capacity in instances:
+        assert len(profits) == len(weights) == 50
+        assert capacity == pytest.approx(sum(weights) / 2)
+        indicators = hardness_indicators(profits, weights, capacity)
+        assert indicators["gap"] >= 0.001
+        assert indicators["core_size"] >= 20
+    assert (instances, report) == hardness_targeted_params(
+        50, 10, distribution, min_gap=0.001, min_core_size=20, batch_size=64, seed=0
+    )
+
+
+def test_hardness_targeted_params_max_candidates():
+    instances, report = hardness_targeted_params(
+        50, 10, uncorrelated_distribution, min_core_size=51, max_candidates=100
+    )
+    assert instances == []
+    assert report == {"candidates": 100, "accepted": 0, "acceptance_rate": 0}
+
+
+def test_hardness_targeted_params_selective():
+    rates = [
+        hardness_targeted_params(
+            50, 20, uncorrelated_distribution, min_core_size=size, seed=0
+        )[1]["acceptance_rate"]
+        for size in [0, 10, 20]
+    ]
+    assert rates[0] == 1
+    assert rates[0] > rates[1] > rates[2]
+
+
+"""
+Multidimensional and Multiple Knapsack Tests
+"""
+
+
+def test_multidimensional_knapsack():
+    weights = [[1, 2, 0], [3, 0, 4]]
+    instance = multidimensional_knapsack_sparse(weights, [5, 6, 7], [2, 4])
+    assert (instance.A.toarray() == weights).all()
+    assert instance.A.nnz == 4
+    assert list(instance.rhs) == [2, 4]
+    assert list(instance.c) == [5, 6, 7]
+    assert instance.sense == "maximize"
+
+    model = multidimensional_knapsack(weights, [5, 6, 7], [2, 4])
+    model.hideOutput()
+    model.optimize()
+    assert model.getObjVal() == 13
+
+
+def test_multiple_knapsack():
+    weights, profits, capacities = [4, 3, 3, 2], [8, 5, 4, 3], [6, 5]
+    instance = multiple_knapsack_sparse(weights, profits, capacities)
+    assert (instance.nvars, instance.ncons, instance.nnz) == (8, 6, 16)
+    assert instance.var_names[3] == "x_1_1"
+
+    best = 0
+    for assignment in itertools.product([None, 0, 1], repeat=4):
+        loads = [0, 0]
+        for item, knapsack_index in enumerate(assignment):
+            if knapsack_index is not None:
+                loads[knapsack_index] += weights[item]
+        if all(load <= capacity for load, capacity in zip(loads, capacities)):
+            value = sum(p for p, j in zip(profits, assignment) if j is not None)
+            best = max(best, value)
+
+    model = multiple_knapsack(weights, profits, capacities)
+    model.hideOutput()
+    model.optimize()
+    assert model.getObjVal() == best == 17
+
+
+def test_multidimensional_params():
+    weights, profits, capacities = multidimensional_params(
+        20, 5, strongly_correlated_distribution, capacity_ratio=0.25, R=100, seed=0
+    )
+    assert weights.shape == (5, 20)
+    assert np.allclose(profits, weights.mean(axis=0) + 10)
+    assert np.allclose(capacities, weights.sum(axis=1) / 4)
+
+
+def test_multiple_params():
+    weights, profits, capacities = multiple_params(
+        20, 4, uncorrelated_distribution, seed=0
+    )
+    assert len(weights) == len(profits) == 20
+    assert len(capacities) == 4
+    assert capacities.sum() == pytest.approx(weights.sum() / 2)
+    assert (capacities >= 0.8 / 1.2 * capacities.max()).all()
+
+
+@pytest.mark.parametrize(
+    "generator,args",
+    [(multidimensional_instance, (30, 4)), (multiple_instance, (30, 3))],
+)
+def test_multi_instances(generator, args):
+    first = generator(*args, weakly_correlated_distribution, seed=0)
+    second = generator(*args, weakly_correlated_distribution, seed=0)
+    other = generator(*args, weakly_correlated_distribution, seed=1)
+    first, second, other = map(MIPInstance.from_scip, (first, second, other))
+    assert (first.A != second.A).nnz == 0 and (first.c == second.c).all()
+    assert not (first.c == other.c).all()
+    assert first.sense == "maximize"
+
+
+"""
+Batch Tests
+"""
+
+
+def test_yang_batch():
+    batch = yang_batch(100, 20, seed=0)
+    assert len(batch) == 100
+    assert batch.profits.shape == batch.weights.shape == (100, 20)
+    assert batch.profits.min() >= 1 and batch.profits.max() <= 200
+    assert (batch.capacities == batch.weights.sum(axis=1) // 5).all()
+    profits, weights, capacity = batch[-1]
+    assert profits == batch.profits[99].tolist()
+    assert capacity == math.floor(sum(weights) / 5)
+    with pytest.raises(IndexError):
+        batch[100]
+
+
+def test_pisinger_batch():
+    batch = pisinger_batch(
+        10, 30, strongly_correlated_distribution, capacity_ratio=0.25, R=100, seed=0
+    )
+    assert np.allclose(batch.profits, batch.weights + 10)
+    assert np.allclose(batch.capacities, batch.weights.sum(axis=1) / 4)
+
+
+def test_batch_seeding():
+    first, second = yang_batch(10, 5, seed=0), yang_batch(10, 5, seed=0)
+    assert list(first) == list(second)
+    assert list(first) != list(yang_batch(10, 5, seed=1))
+
+
+def test_batch_instances():
+    batch = yang_batch(3, 10, seed=0)
+    models = list(batch.instances())
+    assert len(models) == 3
+    for i, model in enumerate(models):
+        profits, weights, capacity = batch[i]
+        instance = MIPInstance.from_scip(model)
+        assert instance.c.tolist() == profits
+        assert instance.A.toarray()[0].tolist() == weights
+        assert instance.rhs.tolist() == [capacity]
+        sparse = batch.sparse_instance(i)
+        assert (sparse.A != instance.A).nnz == 0
+
+        model.hideOutput()
+        model.optimize()
+        assert model.getObjVal() == solve_knapsack(*batch[i]).value
+
+
+def test_batch_parallel_solve():
+    batch = yang_batch(20, 15, seed=0)
+    solutions = dict(parallel_solve_knapsack(batch, n_jobs=2))
+    assert [solutions[i] for i in range(20)] == [solve_knapsack(*p) for p in batch]
@@ -0,0 +1,140 @@
+import os
+import tempfile
+import time
+
+import pytest
+
+import geco.mips.set_cover as set_cover
+import geco.mips.set_packing as set_packing
+from geco.dataset import DatasetWriter
+from geco.mips.tests.test_writing import _bounds_instance
+from geco.mips.utilities.instance import InstanceBuilder, MIPInstance
+from geco.mips.utilities.properties import *
+from geco.mips.utilities.writing import write_problem
+
+
+def test_counts():
+    properties = instance_properties(_bounds_instance())
+    assert properties["num_vars"] == 6
+    assert properties["num_cons"] == 4
+    assert properties["num_binary_vars"] == 1
+    assert properties["num_integer_vars"] == 3
+    assert properties["num_continuous_vars"] == 2
+    assert properties["nnz"] == 10
+    assert properties["density"] == pytest.approx(10 / 24)
+    assert properties["min_row_degree"] == 0
+    assert properties["max_row_degree"] == 6
+    assert properties["avg_row_degree"] == pytest.approx(2.5)
+    assert properties["num_empty_rows"] == 1
+    assert properties["num_empty_cols"] == 0
+    assert properties["min_col_degree"] == 1
+    assert properties["max_col_degree"] == 2
+
+
+def test_coefficient_ranges():
+    properties = instance_properties(_bounds_instance())
+    assert properties["min_abs_coefficient"] == 1
+    assert properties["max_abs_coefficient"] == 6
+    assert properties["dynamism"] == 6
+    assert properties["max_row_dynamism"] == 6
+    assert properties["min_abs_objective"] == 1e-7
+    assert properties["max_abs_objective"] == 3
+    assert properties["min_abs_rhs"] == 1.25
+    assert properties["max_abs_rhs"] == 100
+
+
+def test_set_rows():
+    builder = InstanceBuilder()
+    x = builder.add_vars(4, vtype="B")
+    y = builder.add_var(lb=0, ub=1, vtype="I")
+    z = builder.add_var(lb=0, ub=2, vtype="I")
+    builder.add_cons(x[:3], [1, 1, 1], "=", 1)
+    builder.add_cons([*x[:2], y], [1, 1, 1], "<", 1)
+    builder.add_cons(x[1:], [-1, -1, -1], ">", -1)
+    builder.add_cons(x, [1, 1, 1, 1], ">", 1)
+    builder.add_cons(x[:2], [-1, -1], "<", -1)
+    # not set rows
+    builder.add_cons([x[0], z], [1, 1], "<", 1)
+    builder.add_cons(x[:2], [1, 2], "<", 1)
+    builder.add_cons(x[:2], [1, 1], "<", 2)
+    properties = instance_properties(builder.build())
+    assert properties["num_set_partitioning_rows"] == 1
+    assert properties["num_set_packing_rows"] == 2
+    assert properties["num_set_covering_rows"] == 2
+
+
+def test_set_cover_and_packing():
+    costs, sets = set_cover.yang_params(10, seed=0)
+    properties = instance_properties(set_cover.set_cover_sparse(costs, sets))
+    assert properties["num_set_covering_rows"] == properties["num_cons"]
+
+    properties = instance_properties(set_packing.yang_instance(10, seed=0))
+    assert properties["num_set_packing_rows"] == properties["num_cons"]
+    assert properties["num_binary_vars"] == properties["num_vars"]
+
+
+def test_scip_model_same_as_instance():
+    costs, sets = set_cover.yang_params(10, seed=0)
+    model = set_cover.set_cover(costs, sets)
+    instance = set_cover.set_cover_sparse(costs, sets)
+    assert instance_properties(model) == instance_properties(instance)
+
+
+def test_empty_instance():
+    properties = instance_properties(InstanceBuilder().build())
+    assert properties["num_vars"] == properties["num_cons"] == properties["nnz"] == 0
+    assert properties["density"] == 0
+    assert properties["dynamism"] == properties["max_row_dynamism"] == 0
+    assert properties["min_abs_coefficient"] == properties["max_abs_coefficient"] == 0
+
+
+def test_explicit_zeros_ignored():
+    instance = _bounds_instance()
+    A = instance.A.copy()
+    A.data[0] = 0
+    properties = instance_properties(
+        MIPInstance(
+            instance.c, A, instance.senses, instance.rhs, instance.lb, instance.ub
+        )
+    )
+    assert properties["nnz"] == 9
+    assert properties["max_row_dynamism"] == 3
+
+
+def test_million_nonzeros():
+    instance = set_cover.set_cover_sparse(
+        *set_cover.gasse_params(5000, 4000, 0.05, seed=0)
+    )
+    start = time.perf_counter()
+    properties = instance_properties(instance)
+    assert properties["nnz"] == 1_000_000
+    assert time.perf_counter() - start < 1
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_dataset_properties(n_jobs):
+    instances = [set_packing.yang_instance(m, seed=0) for m in (10, 15, 20)]
+    with tempfile.TemporaryDirectory() as directory:
+        with DatasetWriter(directory) as writer:
+            for i, instance in enumerate(instances):
+                writer.append(instance, f"instance-{i}")
+        results = list(dataset_properties(directory, n_jobs=n_jobs))
+    assert [key for key, _ in results] == [f"instance-{i}" for i in range(3)]
+    for instance, (_, properties) in zip(instances, results):
+        assert properties == instance_properties(instance)
+
+
+def test_dataset_properties_of_files():
+    instances = [
+        MIPInstance.from_scip(set_packing.yang_instance(m, seed=0)) for m in (10, 15)
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i, instance in enumerate(instances):
+            paths.append(os.path.join(directory, f"instance-{i}.mps"))
+            write_problem(instance, paths[-1])
+        results = dict(dataset_properties(directory, n_jobs=2, ordered=False))
+    assert sorted(results) == paths
+    for instance, path in zip(instances, paths):
+        assert results[path]["nnz"] == instance.nnz
+        assert results[path]["num_vars"] == instance.nvars
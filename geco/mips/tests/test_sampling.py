@@ -0,0 +1,253 @@
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+import scipy.stats
+
+from geco.mips.facility_location.cornuejols import cornuejols_params
+import geco.mips.knapsack.pisinger as pisinger
+from geco.mips.knapsack.batch import pisinger_batch, yang_batch
+from geco.mips.knapsack.yang import yang_params as knapsack_params
+from geco.mips.max_cut.tang import tang_params as max_cut_params
+from geco.mips.packing.tang import tang_params as packing_params
+from geco.mips.production_planning.tang import tang_params as lot_sizing_params
+from geco.mips.scheduling.generic import generate_params as scheduling_params
+from geco.mips.set_cover.sun import expand_sun_params, sun_params
+from geco.mips.set_cover.yang import yang_params as set_cover_params
+from geco.mips.set_packing.yang import yang_parameters as set_packing_params
+from geco.mips.utilities.sampling import *
+
+
+def _set_statistics(n, sets):
+    return {
+        "sizes": [len(s) for s in sets],
+        "frequencies": np.bincount([e for s in sets for e in s], minlength=n).tolist(),
+    }
+
+
+def _scheduling_statistics(params):
+    processing_times, _, assignment_costs, _, deadlines, requirements = params
+    return {
+        "first_processing_times": [
+            t for (_, i), t in processing_times.items() if i == 0
+        ],
+        "last_processing_times": [
+            t for (_, i), t in processing_times.items() if i == 2
+        ],
+        "assignment_costs": list(assignment_costs.values()),
+        "deadlines": deadlines,
+        "resource_requirements": list(requirements.values()),
+    }
+
+
+def _pisinger_params(distribution, seed, fast, **kwargs):
+    rng = numpy_generator(random.Random(seed)) if fast else None
+    items = distribution(R=1000, seed=seed, **kwargs)
+    return pisinger.generate_from_distribution(30, rng=rng, **items)
+
+
+def _pisinger_case(distribution, **kwargs):
+    return (
+        lambda seed, fast: _pisinger_params(distribution, seed, fast, **kwargs),
+        lambda params: {"profits": params[0], "weights": params[1]},
+    )
+
+
+def _batch_params(seed, fast, reference, batch):
+    # a batch is drawn at once, its instances follow the reference distribution
+    return batch(seed) if fast else reference(seed)
+
+
+def _expanded_sun_params(seed, fast):
+    # the expansion reusing the seed of the base would correlate their draws
+    base = sun_params(30, 20, seed=seed)
+    return expand_sun_params((50,), base, seed=seed + 1, fast=fast)
+
+
+# every case maps (seed, fast) to params and params to named samples of their values
+cases = {
+    "knapsack": (
+        lambda seed, fast: knapsack_params(50, seed=seed, fast=fast),
+        lambda params: {
+            "profits": params[0],
+            "weights": params[1],
+            "capacity": [params[2]],
+        },
+    ),
+    "set_cover_yang": (
+        lambda seed, fast: set_cover_params(20, seed=seed, fast=fast),
+        lambda params: {"costs": params[0], **_set_statistics(200, params[1])},
+    ),
+    "set_cover_sun": (
+        lambda seed, fast: sun_params(50, 30, seed=seed, fast=fast),
+        lambda params: {"costs": params[0], **_set_statistics(50, params[1])},
+    ),
+    "set_cover_sun_expansion": (
+        _expanded_sun_params,
+        lambda params: {"costs": params[0][30:], **_set_statistics(50, params[1])},
+    ),
+    "set_packing": (
+        lambda seed, fast: set_packing_params(20, seed=seed, fast=fast),
+        lambda params: {"values": params[1], **_set_statistics(100, params[2])},
+    ),
+    "packing_binary": (
+        lambda seed, fast: packing_params(20, 5, True, seed=seed, fast=fast),
+        lambda params: {
+            "costs": params[0],
+            "coefficients": np.ravel(params[1]).tolist(),
+            "limits": params[2],
+        },
+    ),
+    "packing_integer": (
+        lambda seed, fast: packing_params(20, 5, False, seed=seed, fast=fast),
+        lambda params: {
+            "costs": params[0],
+            "coefficients": np.ravel(params[1]).tolist(),
+            "limits": params[2],
+        },
+    ),
+    "production_planning": (
+        lambda seed, fast: lot_sizing_params(20, seed=seed, fast=fast),
+        lambda params: dict(zip("phqd", params[3:])),
+    ),
+    "scheduling_small": (
+        lambda seed, fast: scheduling_params(3, 10, seed=seed, fast=fast),
+        _scheduling_statistics,
+    ),
+    "scheduling_large": (
+        lambda seed, fast: scheduling_params(3, 25, seed=seed, fast=fast),
+        _scheduling_statistics,
+    ),
+    "max_cut": (
+        lambda seed, fast: max_cut_params(
+            nx.gnm_random_graph(20, 50, seed=0), seed=seed, fast=fast
+        ),
+        lambda params: {"weights": params},
+    ),
+    "facility_location": (
+        lambda seed, fast: cornuejols_params(20, 5, 3, seed=seed, fast=fast),
+        lambda params: {
+            "trans_costs": params[0].ravel(),
+            "demands": params[1],
+            "fixed_costs": params[2],
+            "capacities": params[3],
+        },
+    ),
+    "knapsack_batch": (
+        lambda seed, fast: _batch_params(
+            seed,
+            fast,
+            lambda seed: knapsack_params(50, seed=seed),
+            lambda seed: yang_batch(1, 50, seed=seed)[0],
+        ),
+        lambda params: {
+            "profits": params[0],
+            "weights": params[1],
+            "capacity": [params[2]],
+        },
+    ),
+    "pisinger_batch": (
+        lambda seed, fast: _batch_params(
+            seed,
+            fast,
+            lambda seed: _pisinger_params(
+                pisinger.strongly_correlated_distribution, seed, False
+            ),
+            lambda seed: pisinger_batch(
+                1, 30, pisinger.strongly_correlated_distribution, seed=seed
+            )[0][:2],
+        ),
+        lambda params: {"profits": params[0], "weights": params[1]},
+    ),
+    **{
+        f"pisinger_{name}": _pisinger_case(
+            getattr(pisinger, f"{name}_distribution"), **kwargs
+        )
+        for name, kwargs in [
+            ("uncorrelated", {}),
+            ("weakly_correlated", {}),
+            ("strongly_correlated", {}),
+            ("inverse_strongly_correlated", {}),
+            ("almost_strongly_correlated", {}),
+            ("subset_sum", {}),
+            ("uncorrelated_with_similar_weights", {}),
+            ("profit_ceiling", {"d": 7}),
+            ("circle", {}),
+            ("multiple_strongly_correlated", {"k1": 300, "k2": 200, "d": 6}),
+        ]
+    },
+}
+
+
+def _samples(case, fast, seeds):
+    generate, statistics = cases[case]
+    samples = {}
+    for seed in seeds:
+        for name, values in statistics(generate(seed, fast)).items():
+            samples.setdefault(name, []).extend(values)
+    return samples
+
+
+@pytest.mark.parametrize("case", cases)
+def test_same_distribution_as_reference(case):
+    # fixed seeds keep the test deterministic, a failure means the distributions differ
+    reference = _samples(case, False, range(200))
+    fast = _samples(case, True, range(1000, 1200))
+    assert reference.keys() == fast.keys()
+    for name in reference:
+        p_value = scipy.stats.ks_2samp(reference[name], fast[name]).pvalue
+        assert p_value > 1e-3, (name, p_value)
+
+
+@pytest.mark.parametrize("case", cases)
+def test_fast_reproducible(case):
+    generate, statistics = cases[case]
+    first, second = statistics(generate(0, True)), statistics(generate(0, True))
+    other = statistics(generate(1, True))
+    for name in first:
+        assert np.array_equal(first[name], second[name])
+    assert any(not np.array_equal(first[name], other[name]) for name in first)
+
+
+@pytest.mark.parametrize("case", cases)
+def test_same_types_as_reference(case):
+    generate, _ = cases[case]
+    for reference, fast in zip(generate(0, False), generate(0, True)):
+        assert type(reference) == type(fast)
+
+
+def test_numpy_generator():
+    assert isinstance(numpy_generator(random.Random(0)), np.random.Generator)
+    first = numpy_generator(random.Random(0)).integers(0, 2**32, size=4)
+    second = numpy_generator(random.Random(0)).integers(0, 2**32, size=4)
+    assert np.array_equal(first, second)
+
+    rng = np.random.default_rng(0)
+    assert knapsack_params(10, seed=rng, fast=True) != knapsack_params(
+        10, seed=rng, fast=True
+    )
+    assert knapsack_params(
+        10, seed=np.random.RandomState(0), fast=True
+    ) == knapsack_params(10, seed=np.random.RandomState(0), fast=True)
+
+
+def test_integers_inclusive():
+    values = integers(np.random.default_rng(0), 1, 3, size=1000)
+    assert set(values.tolist()) == {1, 2, 3}
+
+
+@pytest.mark.parametrize("n,size", [(10, 10), (1000, 100), (5, 0)])
+def test_random_subsets(n, size):
+    rng = np.random.default_rng(0)
+    subsets = random_subsets(rng, n, [size] * 50)
+    assert len(subsets) == 50
+    for subset in subsets:
+        assert len(subset) == size == len(set(subset.tolist()))
+        assert ((0 <= subset) & (subset < n)).all()
+
+
+def test_random_subsets_uniform():
+    subsets = random_subsets(np.random.default_rng(0), 20, [5] * 4000)
+    counts = np.bincount(np.concatenate(subsets), minlength=20)
+    assert scipy.stats.chisquare(counts).pvalue > 1e-3
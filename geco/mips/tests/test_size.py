@@ -0,0 +1,250 @@
+import functools
+
+import networkx as nx
+import pyscipopt as scip
+import pytest
+
+import geco.mips.combinatorial_auction as combinatorial_auction
+import geco.mips.facility_location as facility_location
+import geco.mips.graph_coloring as graph_coloring
+import geco.mips.independent_set as independent_set
+import geco.mips.knapsack as knapsack
+import geco.mips.max_cut as max_cut
+import geco.mips.packing as packing
+import geco.mips.scheduling as scheduling
+import geco.mips.set_cover as set_cover
+import geco.mips.set_packing as set_packing
+from geco.mips.production_planning.tang import tang_instance as lot_sizing_instance
+from geco.mips.production_planning.tang import tang_params as lot_sizing_params
+from geco.mips.production_planning.generic import uncapacitated_lot_sizing_sparse
+from geco.mips.utilities.instance import MIPInstance
+from geco.mips.utilities.size import *
+
+
+def _weighted_graph(n, m, seed, negative=False):
+    graph = nx.gnm_random_graph(n, m, seed=seed)
+    for i, (_, _, data) in enumerate(graph.edges(data=True)):
+        data["weight"] = -1 if negative and i % 3 == 0 else i % 5 + 1
+    return graph
+
+
+def _hooker_formulation_args(n_facilities, n_tasks, time_steps, seed):
+    params = scheduling.hooker_params(n_facilities, n_tasks, seed=seed)
+    return (n_facilities, n_tasks, time_steps, *params)
+
+
+def _late_release_args():
+    # release dates after the first time step and processing times longer than the horizon
+    pairs = [(j, i) for j in range(3) for i in range(2)]
+    processing_times = {(j, i): 3 + 4 * j + i for j, i in pairs}
+    assignment_costs = {(j, i): j + 1 for j, i in pairs}
+    return (
+        2,
+        3,
+        8,
+        processing_times,
+        [10, 10],
+        assignment_costs,
+        [1, 4, 2],
+        [9, 12, 15],
+    )
+
+
+def _scheduling_formulation_args(n_facilities, n_tasks, seed):
+    params = scheduling.generate_params(n_facilities, n_tasks, seed=seed)
+    return (n_facilities, n_tasks, *params)
+
+
+_graph = _weighted_graph(12, 30, seed=0)
+_subsets = [{i, (i + 5) % 12} for i in range(12)] + [{0, 3, 6, 9}]
+_bids = [([0, 1], 3.0), ([1, 3], 2.0), ([4], 1.0), ([1, 4], 2.5)]
+
+exact_cases = [
+    (max_cut.naive, (_graph,)),
+    (max_cut.naive, (_weighted_graph(12, 30, seed=1, negative=True),)),
+    (max_cut.naive_sparse, (_weighted_graph(12, 30, seed=1, negative=True),)),
+    (max_cut.triangle, (_graph,)),
+    (max_cut.triangle_sparse, (_graph,)),
+    (max_cut.tang_instance, (10, 20)),
+    (max_cut.tang_instance, (5, 100)),
+    (graph_coloring.assignment, (_graph, 4)),
+    (graph_coloring.assignment_sparse, (_graph, 4)),
+    (graph_coloring.assignment_asymmetric, (_graph, 4)),
+    (graph_coloring.assignment_asymmetric_sparse, (_graph, 4)),
+    (graph_coloring.partial_ordering, (_graph, 4)),
+    (graph_coloring.partial_ordering_sparse, (_graph, 4)),
+    (graph_coloring.hybrid_partial_ordering, (_graph, 4)),
+    (graph_coloring.hybrid_partial_ordering_sparse, (_graph, 4)),
+    (graph_coloring.set_covering, (_graph, _subsets)),
+    (graph_coloring.set_covering_sparse, (_graph, _subsets)),
+    (independent_set.independent_set, (_graph,)),
+    (independent_set.independent_set_sparse, (_graph,)),
+    (independent_set.barabasi_albert_instance, (30, 3)),
+    (combinatorial_auction.combinatorial_auction, (_bids, 1, 5)),
+    (combinatorial_auction.combinatorial_auction_sparse, (_bids, 1, 5)),
+    (scheduling.late_tasks_formulation, _hooker_formulation_args(2, 6, 15, 0)),
+    (scheduling.late_tasks_formulation_sparse, _hooker_formulation_args(3, 5, 40, 1)),
+    (scheduling.late_tasks_formulation, _late_release_args()),
+    (scheduling.late_tasks_formulation_sparse, _late_release_args()),
+    (scheduling.heinz_formulation, _scheduling_formulation_args(2, 5, 0)),
+    (scheduling.heinz_formulation_sparse, _scheduling_formulation_args(3, 10, 1)),
+    (scheduling.hooker_cost_formulation, _scheduling_formulation_args(2, 5, 0)),
+    (
+        scheduling.hooker_cost_formulation_sparse,
+        _scheduling_formulation_args(3, 10, 1),
+    ),
+    (knapsack.knapsack, ([3, 0, 5, 2], [1, 2, 3, 4], 6)),
+    (knapsack.knapsack_sparse, ([3, 0, 5, 2], [1, 2, 3, 4], 6)),
+    (knapsack.yang_instance, (20,)),
+    (
+        knapsack.multidimensional_knapsack,
+        ([[3, 0, 5, 2], [1, 2, 0, 4]], [1, 2, 3, 4], [6, 5]),
+    ),
+    (
+        knapsack.multidimensional_knapsack_sparse,
+        ([[3, 0, 5, 2], [1, 2, 0, 4]], [1, 2, 3, 4], [6, 5]),
+    ),
+    (knapsack.multiple_knapsack, ([3, 0, 5, 2], [1, 2, 3, 4], [6, 5, 4])),
+    (knapsack.multiple_knapsack_sparse, ([3, 0, 5, 2], [1, 2, 3, 4], [6, 5, 4])),
+    (knapsack.multidimensional_instance, (20, 3, knapsack.uncorrelated_distribution)),
+    (knapsack.multiple_instance, (20, 3, knapsack.uncorrelated_distribution)),
+    (knapsack.weakly_correlated, (20, 100)),
+    (knapsack.profit_ceiling, (20, 100)),
+    (knapsack.circle, (20, 100)),
+    (knapsack.multiple_strongly_correlated, (20, 100, 300, 200, 6)),
+    (knapsack.spanner, (2, 10, 20, knapsack.uncorrelated_distribution, 100)),
+    (set_cover.set_cover, set_cover.yang_params(10, seed=0)),
+    (set_cover.set_cover_sparse, set_cover.yang_params(10, seed=0)),
+    (set_cover.gasse_instance, (100, 200, 0.05)),
+    (set_packing.set_packing, (10, *set_packing.yang_parameters(10, seed=0))),
+    (set_packing.set_packing_sparse, (10, *set_packing.yang_parameters(10, seed=0))),
+    (
+        facility_location.capacitated_facility_location_sparse,
+        (15, 5, *facility_location.cornuejols_params(15, 5, 3, seed=0)),
+    ),
+    (facility_location.cornuejols_instance, (15, 5, 3)),
+    (
+        facility_location.capacitated_warehouse_location,
+        (15, 5, *facility_location.cornuejols_params(15, 5, 3, seed=0)),
+    ),
+    (
+        facility_location.capacitated_warehouse_location_sparse,
+        (15, 5, *facility_location.cornuejols_params(15, 5, 3, seed=0)),
+    ),
+    (packing.packing, (8, 3, *packing.tang_params(8, 3, False, seed=0), False)),
+    (packing.packing_sparse, (8, 3, *packing.tang_params(8, 3, False, seed=0), False)),
+    (packing.tang_instance, (8, 3, True)),
+    (lot_sizing_instance, (12,)),
+    (uncapacitated_lot_sizing_sparse, (12, *lot_sizing_params(12, seed=0))),
+]
+
+bound_cases = [
+    (scheduling.hooker_instance, (2, 6, 15)),
+    (scheduling.hooker_instance, (3, 25, 30)),
+    (scheduling.heinz_instance, (2, 6)),
+    (independent_set.gasse_instance, (30, 0.2)),
+    (combinatorial_auction.gasse_instance, (20, 50)),
+    (set_cover.yang_instance, (10,)),
+    (set_cover.sun_instance, (100, 50)),
+    (set_packing.yang_instance, (10,)),
+    (packing.tang_instance, (8, 3, False)),
+]
+
+
+def _actual_size(result):
+    # some formulations return the model together with their variables
+    if isinstance(result, tuple):
+        result = next(r for r in result if isinstance(r, (scip.Model, MIPInstance)))
+    if isinstance(result, scip.Model):
+        result = MIPInstance.from_scip(result)
+    return result.nvars, result.ncons, result.nnz
+
+
+def _name(case):
+    return case.__name__ if callable(case) else None
+
+
+@pytest.mark.parametrize("function,args", exact_cases, ids=_name)
+def test_exact(function, args):
+    size = estimate_size(function, *args)
+    assert size.exact
+    assert size[:3] == _actual_size(function(*args))
+
+
+@pytest.mark.parametrize("function,args", bound_cases, ids=_name)
+@pytest.mark.parametrize("seed", range(3))
+def test_upper_bound(function, args, seed):
+    size = estimate_size(function, *args)
+    assert not size.exact
+    n_vars, n_conss, nnz = _actual_size(function(*args, seed=seed))
+    assert n_vars <= size.n_vars
+    assert n_conss <= size.n_conss
+    assert nnz <= size.nnz
+
+
+@pytest.mark.parametrize(
+    "function", [graph_coloring.representatives, graph_coloring.representatives_sparse]
+)
+@pytest.mark.parametrize("n,m", [(12, 30), (15, 20), (8, 28)])
+def test_representatives_upper_bound(function, n, m):
+    graph = nx.gnm_random_graph(n, m, seed=0)
+    size = estimate_size(function, graph)
+    assert not size.exact
+    n_vars, n_conss, nnz = _actual_size(function(graph))
+    assert n_vars == size.n_vars
+    assert n_conss <= size.n_conss
+    assert nnz <= size.nnz
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        independent_set.clique_independent_set,
+        independent_set.clique_independent_set_sparse,
+    ],
+)
+def test_clique_independent_set_upper_bound(function):
+    graph = nx.gnm_random_graph(20, 60, seed=0)
+    size = estimate_size(function, graph)
+    assert not size.exact
+    n_vars, n_conss, nnz = _actual_size(function(graph))
+    assert (n_vars, nnz) == (size.n_vars, size.nnz)
+    assert n_conss <= size.n_conss
+
+
+def test_upper_bound_tight():
+    n_vars, n_conss, nnz = _actual_size(set_cover.sun_instance(1000, 100, seed=0))
+    size = estimate_size(set_cover.sun_instance, 1000, 100)
+    assert size.nnz < 1.1 * nnz
+
+
+def test_no_estimator():
+    assert estimate_size(set_cover.gasse_params, 100, 200, 0.05) is None
+    assert not exceeds(None, max_vars=0)
+
+
+def test_partial():
+    generator = functools.partial(max_cut.tang_instance, m=20)
+    assert estimate_size(generator, 10) == estimate_size(max_cut.tang_instance, 10, 20)
+
+
+def test_seed_ignored():
+    assert estimate_size(knapsack.yang_instance, 20, seed=3, fast=True) == (
+        estimate_size(knapsack.yang_instance, 20)
+    )
+
+
+def test_triangle_without_building():
+    size = estimate_size(max_cut.tang_instance, 10**6, 10**7)
+    assert size == InstanceSize(11 * 10**6, 2 * 10**7, 6 * 10**7, True)
+    size = estimate_size(max_cut.triangle, nx.empty_graph(1000))
+    assert size.n_conss == 2 * (1000 * 999 * 998 // 6)
+
+
+def test_exceeds():
+    size = InstanceSize(10, 20, 30, True)
+    assert not exceeds(size)
+    assert not exceeds(size, max_vars=10, max_conss=20, max_nnz=30)
+    assert exceeds(size, max_vars=9)
+    assert exceeds(size, max_conss=19)
+    assert exceeds(size, max_nnz=29)
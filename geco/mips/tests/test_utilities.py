@@ -1,7 +1,13 @@
 import tempfile
 
-from geco.mips.set_cover.yang import yang_instance
+import numpy as np
+import pytest
+
+from geco.mips.set_cover.generic import set_cover_sparse
+from geco.mips.set_cover.yang import yang_instance, yang_params
+from geco.mips.tests.test_instance import assert_equivalent
 from geco.mips.utilities.generic import *
+from geco.mips.utilities.instance import MIPInstance
 
 
 def test_saving_shuffled_instance():
@@ -23,8 +29,139 @@ def test_saving_shuffled_instance():
             assert False
 
 
+@pytest.mark.parametrize("cons,vars", [(True, True), (True, False), (False, True)])
+def test_in_memory_shuffle(cons, vars):
+    instance = set_cover_sparse(*yang_params(50, seed=0))
+    shuffled = shuffle(instance, seed=3, cons=cons, vars=vars)
+    assert shuffled is not instance
+    assert (shuffled.var_names != instance.var_names) == vars
+
+    # undoing the permutation gives back the original instance
+    var_order = np.argsort([int(name[2:]) for name in shuffled.var_names])
+    unshuffled = shuffled.permute(var_permutation=var_order)
+    assert ((unshuffled.A != instance.A).nnz > 0) == cons
+    assert {tuple(row) for row in unshuffled.A.toarray()} == {
+        tuple(row) for row in instance.A.toarray()
+    }
+    if not cons:
+        assert_equivalent(instance.to_scip(), unshuffled)
+
+
+def test_in_memory_shuffle_seeding():
+    model = yang_instance(50, seed=0)
+    first = shuffle(model, seed=1, in_memory=True)
+    assert type(first) == scip.Model
+    assert first.getProbName() == model.getProbName()
+    assert_equivalent(first, MIPInstance.from_scip(shuffle(model, 1, in_memory=True)))
+    with pytest.raises(AssertionError):
+        assert_equivalent(
+            first, MIPInstance.from_scip(shuffle(model, 2, in_memory=True))
+        )
+
+
+def test_shuffle_many():
+    model = yang_instance(50, seed=0)
+    copies = list(shuffle_many(model, seeds=[1, 2, 3]))
+    assert len(copies) == 3
+    for seed, copy in zip([1, 2, 3], copies):
+        assert type(copy) == scip.Model
+        expected = shuffle(model, seed, in_memory=True)
+        assert_equivalent(copy, MIPInstance.from_scip(expected))
+
+    instance = MIPInstance.from_scip(model)
+    for seed, copy in zip([1, 2], shuffle_many(instance, seeds=[1, 2], cons=False)):
+        assert isinstance(copy, MIPInstance)
+        assert np.array_equal(copy.rhs, instance.rhs)
+        assert copy.var_names == shuffle(instance, seed, cons=False).var_names
+
+
 def test_expand_parameters():
     def add(x, y):
         return x + y
 
     assert list(expand_parameters(add, x=[1, 2], y=[3, 4])) == [4, 5, 5, 6]
+
+
+def _add(x, y):
+    return x + y
+
+
+@pytest.mark.parametrize("n_jobs,ordered", [(1, True), (2, True), (2, False)])
+def test_parallel_expand_parameters(n_jobs, ordered):
+    results = list(
+        parallel_expand_parameters(
+            _add, n_jobs=n_jobs, ordered=ordered, chunksize=2, x=[1, 2], y=[3, 4]
+        )
+    )
+    expected = [
+        ({"x": 1, "y": 3}, 4),
+        ({"x": 1, "y": 4}, 5),
+        ({"x": 2, "y": 3}, 5),
+        ({"x": 2, "y": 4}, 6),
+    ]
+    if ordered:
+        assert results == expected
+    else:
+        assert sorted(results, key=lambda r: (r[0]["x"], r[0]["y"])) == expected
+
+
+def _pair(x, y):
+    return x, y
+
+
+def test_parallel_expand_parameters_resume(tmp_path):
+    manifest = str(tmp_path / "sweep.jsonl")
+    parameter_lists = {"x": [1, 2, 3], "y": [(1, 2), "a"]}
+
+    # interrupted while the consumer handles the third combination, with a partially
+    # written line
+    sweep = parallel_expand_parameters(
+        _pair, n_jobs=1, manifest=manifest, **parameter_lists
+    )
+    first = [next(sweep), next(sweep), next(sweep)]
+    sweep.close()
+    assert first == [
+        ({"x": 1, "y": (1, 2)}, (1, (1, 2))),
+        ({"x": 1, "y": "a"}, (1, "a")),
+        ({"x": 2, "y": (1, 2)}, (2, (1, 2))),
+    ]
+    with open(manifest, "a") as file:
+        file.write('{"params": {"x": 2')
+
+    rest = list(
+        parallel_expand_parameters(
+            _pair, n_jobs=2, manifest=manifest, **parameter_lists
+        )
+    )
+    assert [value for _, value in rest] == [
+        (2, (1, 2)),
+        (2, "a"),
+        (3, (1, 2)),
+        (3, "a"),
+    ]
+    assert (
+        list(
+            parallel_expand_parameters(
+                _pair, n_jobs=1, manifest=manifest, **parameter_lists
+            )
+        )
+        == []
+    )
+
+
+def test_parallel_expand_parameters_size_limits():
+    from geco.mips.knapsack.yang import yang_instance as knapsack_instance
+
+    results = parallel_expand_parameters(
+        knapsack_instance,
+        n_jobs=1,
+        size_limits={"max_vars": 30},
+        size_order="largest",
+        n=[5, 50, 20],
+    )
+    assert [(params, model.getNVars()) for params, model in results] == [
+        ({"n": 20}, 20),
+        ({"n": 5}, 5),
+    ]
+    with pytest.raises(ValueError):
+        list(parallel_expand_parameters(_add, size_limits={"max_nnz": 1}, x=[1], y=[2]))
@@ -0,0 +1,110 @@
+import os
+import tempfile
+
+import numpy as np
+import pyscipopt as scip
+import pytest
+
+import geco.mips.utilities.writing as writing
+from geco.mips.tests.test_instance import assert_equivalent, equivalence_cases
+from geco.mips.utilities.instance import *
+from geco.mips.utilities.writing import *
+
+# names that aren't valid in every file format
+_unsafe_names = {"independent_set", "clique_independent_set", "set_covering"}
+
+
+def _read(path):
+    model = scip.Model()
+    model.hideOutput()
+    model.readProblem(path)
+    return model
+
+
+def _bounds_instance():
+    builder = InstanceBuilder("bounds")
+    x = builder.add_vars(
+        6,
+        obj=[1, -2.5, 0, 0, 1e-7, 3],
+        lb=[0, -np.inf, -np.inf, 2, -3, 4],
+        ub=[1, np.inf, 7, 2, 10.5, np.inf],
+        vtype=["B", "C", "I", "C", "I", "I"],
+        names=[f"v{j}" for j in range(6)],
+    )
+    builder.add_cons(x, [1, 2, 3, 4, 5, 6], "<", 100)
+    builder.add_cons(x[:2], [1, -1], ">", -1.25)
+    builder.add_cons(x[2:4], [1, 1], "=", 0)
+    builder.add_cons([], [], ">", 0)
+    return builder.build("maximize")
+
+
+@pytest.mark.parametrize(
+    "extension,free",
+    [(".mps", False), (".mps", True), (".lp", False), (".mps.gz", True)],
+)
+@pytest.mark.parametrize("case", equivalence_cases)
+def test_write_read_back(case, extension, free):
+    _, sparse_formulation, params = equivalence_cases[case]
+    instance = sparse_formulation(*params)
+    # fixed MPS only allows short names
+    generic_names = case in _unsafe_names or (extension == ".mps" and not free)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "instance" + extension)
+        write_problem(instance, path, free_mps=free, generic_names=generic_names)
+        model = _read(path)
+    if generic_names:
+        instance.var_names = instance.cons_names = None
+    assert_equivalent(model, instance)
+
+
+@pytest.mark.parametrize("extension", [".mps", ".lp.gz"])
+def test_write_bounds(extension):
+    instance = _bounds_instance()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "instance" + extension)
+        write_problem(instance, path)
+        assert_equivalent(_read(path), instance)
+
+
+def test_same_as_scip():
+    instance = _bounds_instance()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "instance.mps")
+        write_mps(instance, path)
+        scip_path = os.path.join(directory, "scip.mps")
+        instance.to_scip().writeProblem(scip_path)
+        assert_equivalent(_read(path), MIPInstance.from_scip(_read(scip_path)))
+
+
+@pytest.mark.parametrize("extension", [".mps", ".lp"])
+@pytest.mark.parametrize("case", ["knapsack", "set_cover"])
+def test_write_blocks(case, extension, monkeypatch):
+    # rows and columns are formatted in blocks, which must not change the file
+    _, sparse_formulation, params = equivalence_cases[case]
+    instance = sparse_formulation(*params)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "instance" + extension)
+        write_problem(instance, path, free_mps=True)
+        with open(path) as file:
+            expected = file.read()
+        monkeypatch.setattr(writing, "_BLOCK_SIZE", 2)
+        write_problem(instance, path, free_mps=True)
+        with open(path) as file:
+            assert file.read() == expected
+
+
+def test_fixed_mps_long_names():
+    instance = _bounds_instance()
+    instance.var_names = [f"variable{j}" for j in range(instance.nvars)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "instance.mps")
+        with pytest.raises(ValueError):
+            write_mps(instance, path)
+        assert not os.path.exists(path)
+        write_mps(instance, path, free=True)
+        write_mps(instance, path, generic_names=True)
+
+
+def test_unsupported_format():
+    with pytest.raises(ValueError):
+        write_problem(_bounds_instance(), "instance.cip")
@@ -0,0 +1,166 @@
+import collections
+
+import numpy as np
+import pyscipopt as scip
+
+from geco.mips.utilities.instance import MIPInstance, SENSES, VTYPES
+
+VARIABLE_FEATURES = (
+    "objective",
+    "is_binary",
+    "is_integer",
+    "is_continuous",
+    "has_lower_bound",
+    "has_upper_bound",
+    "lower_bound",
+    "upper_bound",
+    "degree",
+)
+CONSTRAINT_FEATURES = (
+    "rhs",
+    "is_less_equal",
+    "is_greater_equal",
+    "is_equal",
+    "norm",
+    "objective_cosine",
+    "degree",
+)
+EDGE_FEATURES = ("coefficient",)
+
+BipartiteGraph = collections.namedtuple(
+    "BipartiteGraph",
+    [
+        "variable_features",
+        "constraint_features",
+        "edge_index",
+        "edge_features",
+        "n_variables",
+        "n_constraints",
+    ],
+)
+"""
+variable_features: np.ndarray of shape (total number of variables, len(VARIABLE_FEATURES))
+constraint_features: np.ndarray of shape (total number of constraints, len(CONSTRAINT_FEATURES))
+edge_index: np.ndarray of shape (2, total number of nonzeros)
+    Constraint index in the first and variable index in the second row, indices of later
+    instances of a batch are offset by the number of constraints and variables before them
+edge_features: np.ndarray of shape (total number of nonzeros, len(EDGE_FEATURES))
+n_variables, n_constraints: np.ndarray
+    Number of variables and constraints of every instance of the batch
+"""
+
+
+def bipartite_graph(instances, normalize=True, dtype=np.float32):
+    """
+    Extracts the variable-constraint bipartite graph with static features as used by [1].
+
+    All features are computed with vectorized operations on the sparse constraint
+    matrices, a batch of instances is processed at once as one block diagonal matrix.
+
+    Parameters
+    ----------
+    instances: MIPInstance, scip.Model or list of them
+        A single instance or a batch, pyscipopt models may only have linear constraints
+    normalize: bool
+        Whether to divide the objective coefficients by the norm of the objective and the
+        rhs and edge coefficients by the norm of their row, like [1]
+    dtype: np.dtype
+        Type of the feature matrices
+
+    Returns
+    -------
+    graph: BipartiteGraph
+        Feature matrices with columns as in VARIABLE_FEATURES, CONSTRAINT_FEATURES and
+        EDGE_FEATURES, for a batch the graphs of all instances are stacked
+
+    References
+    ----------
+    .. [1] Gasse, M., Chételat, D., Ferroni, N., Charlin, L., & Lodi, A. (2019).
+    Exact combinatorial optimization with graph convolutional neural networks.
+    Advances in Neural Information Processing Systems 32.
+    """
+    if isinstance(instances, (MIPInstance, scip.Model)):
+        instances = [instances]
+    instances = [
+        (
+            MIPInstance.from_scip(instance)
+            if isinstance(instance, scip.Model)
+            else instance
+        )
+        for instance in instances
+    ]
+    n_variables = np.array([instance.nvars for instance in instances], dtype=np.int64)
+    n_constraints = np.array([instance.ncons for instance in instances], dtype=np.int64)
+    n_nonzeros = np.array([instance.nnz for instance in instances], dtype=np.int64)
+
+    # the constraint matrices of the batch as one block diagonal matrix in COO format
+    row_degrees = _concatenate([np.diff(instance.A.indptr) for instance in instances])
+    rows = np.repeat(np.arange(n_constraints.sum()), row_degrees)
+    columns = _concatenate([instance.A.indices for instance in instances])
+    columns = columns + np.repeat(np.cumsum(n_variables) - n_variables, n_nonzeros)
+    data = _concatenate([instance.A.data for instance in instances], float)
+
+    c = _concatenate([instance.c for instance in instances], float)
+    lb = _concatenate([instance.lb for instance in instances], float)
+    ub = _concatenate([instance.ub for instance in instances], float)
+    vtypes = _concatenate([instance.vtypes for instance in instances], "U1")
+    senses = _concatenate([instance.senses for instance in instances], "U1")
+    rhs = _concatenate([instance.rhs for instance in instances], float)
+
+    n_rows = len(row_degrees)
+    row_norms = np.sqrt(np.bincount(rows, weights=data**2, minlength=n_rows))
+    row_objective_products = np.bincount(
+        rows, weights=data * c[columns], minlength=n_rows
+    )
+    objective_norms = np.array([np.linalg.norm(instance.c) for instance in instances])
+    row_objective_norms = np.repeat(objective_norms, n_constraints)
+    cosines = row_objective_products / (
+        _nonzero(row_norms) * _nonzero(row_objective_norms)
+    )
+
+    if normalize:
+        objective = c / _nonzero(np.repeat(objective_norms, n_variables))
+        row_rhs = rhs / _nonzero(row_norms)
+        coefficients = data / _nonzero(row_norms)[rows]
+    else:
+        objective, row_rhs, coefficients = c, rhs, data
+
+    has_lb, has_ub = np.isfinite(lb), np.isfinite(ub)
+    variable_features = np.column_stack(
+        [
+            objective,
+            *(vtypes == vtype for vtype in VTYPES),
+            has_lb,
+            has_ub,
+            np.where(has_lb, lb, 0),
+            np.where(has_ub, ub, 0),
+            np.bincount(columns, minlength=len(c)),
+        ]
+    ).astype(dtype)
+    constraint_features = np.column_stack(
+        [
+            row_rhs,
+            *(senses == sense for sense in SENSES),
+            row_norms,
+            cosines,
+            row_degrees,
+        ]
+    ).astype(dtype)
+
+    return BipartiteGraph(
+        variable_features=variable_features.reshape(-1, len(VARIABLE_FEATURES)),
+        constraint_features=constraint_features.reshape(-1, len(CONSTRAINT_FEATURES)),
+        edge_index=np.vstack([rows, columns]),
+        edge_features=coefficients.astype(dtype).reshape(-1, len(EDGE_FEATURES)),
+        n_variables=n_variables,
+        n_constraints=n_constraints,
+    )
+
+
+def _concatenate(arrays, dtype=np.int64):
+    return np.concatenate(arrays) if arrays else np.zeros(0, dtype=dtype)
+
+
+def _nonzero(values):
+    # avoids divisions by zero for empty rows and objectives
+    return np.where(values > 0, values, 1)
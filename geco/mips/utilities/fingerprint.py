@@ -0,0 +1,146 @@
+import hashlib
+
+import numpy as np
+import pyscipopt as scip
+
+from geco.mips.utilities.instance import MIPInstance
+
+
+def fingerprint(instance, iterations=3):
+    """
+    Computes a hash of an instance that doesn't depend on the order or names of its
+    variables and constraints.
+
+    Every variable and constraint is colored with a hash of its own data (objective
+    coefficient, bounds and type, or sense and rhs). The colors are then refined like in
+    the Weisfeiler-Lehman test [1] on the variable-constraint graph: in every iteration a
+    node's new color is a hash of its color and the multiset of (coefficient, color)
+    pairs of its neighbours. The fingerprint hashes the sorted final colors. All steps
+    are vectorized over the sparse constraint matrix.
+
+    Permuted copies of an instance always have the same fingerprint. Instances with the
+    same fingerprint are identical up to permutation with very high probability, but
+    like the Weisfeiler-Lehman test the refinement can't tell apart some highly regular
+    non-isomorphic instances.
+
+    Parameters
+    ----------
+    instance: MIPInstance or scip.Model
+        Instance to fingerprint, pyscipopt models may only have linear constraints
+    iterations: int
+        Number of refinement iterations
+
+    Returns
+    -------
+    fingerprint: str
+        Hex digest of the instance
+
+    References
+    ----------
+    .. [1] Shervashidze, N., Schweitzer, P., Van Leeuwen, E. J., Mehlhorn, K., &
+    Borgwardt, K. M. (2011). Weisfeiler-Lehman graph kernels.
+    Journal of Machine Learning Research, 12(9).
+    """
+    import scipy.sparse
+
+    if isinstance(instance, scip.Model):
+        instance = MIPInstance.from_scip(instance)
+    A = instance.A
+    if (A.data == 0).any():
+        A = A.copy()
+        A.eliminate_zeros()
+    m, n = A.shape
+    rows = np.repeat(np.arange(m), np.diff(A.indptr))
+    columns = A.indices
+    # converting the edge numbers to CSC sorts the edges by variable in linear time
+    edges_by_column = scipy.sparse.csr_matrix(
+        (np.arange(A.nnz), A.indices, A.indptr), shape=A.shape
+    ).tocsc()
+    column_order, column_starts = edges_by_column.data, edges_by_column.indptr
+
+    coefficients = _hash_floats(A.data)
+    var_colors = _combine(
+        _combine(_hash_floats(instance.c), _hash_floats(instance.lb)),
+        _combine(_hash_floats(instance.ub), _hash_strings(instance.vtypes)),
+    )
+    cons_colors = _combine(_hash_strings(instance.senses), _hash_floats(instance.rhs))
+
+    for _ in range(iterations):
+        cons_neighbours = _combine(coefficients, var_colors[columns])
+        var_neighbours = _combine(coefficients, cons_colors[rows])[column_order]
+        cons_colors = _combine(cons_colors, _segment_sums(cons_neighbours, A.indptr))
+        var_colors = _combine(var_colors, _segment_sums(var_neighbours, column_starts))
+
+    digest = hashlib.sha256()
+    digest.update(f"{instance.sense}:{m}:{n}:{A.nnz}".encode())
+    digest.update(np.sort(var_colors).tobytes())
+    digest.update(np.sort(cons_colors).tobytes())
+    return digest.hexdigest()
+
+
+def deduplicate(stream, seen=None, iterations=3):
+    """
+    Filters instances of a stream that are identical to an earlier one up to the order
+    and names of their variables and constraints, see `fingerprint`.
+
+    Parameters
+    ----------
+    stream: iterable
+        Instances (MIPInstance or scip.Model) or tuples ending with an instance, e.g.
+        (instance_number, instance) as yielded by generate_n
+    seen: set or None
+        Fingerprints of instances to filter out, new fingerprints are added to it, so it
+        can be shared between streams
+    iterations: int
+        Number of refinement iterations of the fingerprint
+
+    Returns
+    -------
+    stream: generator
+        The items of the stream whose instance wasn't seen before
+
+    Examples
+    --------
+    >>> instances = deduplicate(generate_n(lambda seed: knapsack.yang_instance(5, seed), 100))
+    """
+    if seen is None:
+        seen = set()
+    for item in stream:
+        instance = item[-1] if isinstance(item, tuple) else item
+        key = fingerprint(instance, iterations)
+        if key not in seen:
+            seen.add(key)
+            yield item
+
+
+def _mix(values):
+    # splitmix64 finalizer, integer overflow wraps around
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def _combine(first, second):
+    # not symmetric, _combine(a, b) != _combine(b, a)
+    return _mix(_mix(first) + second)
+
+
+def _hash_floats(values):
+    # adding 0.0 turns -0.0 into 0.0, so both get the same hash
+    values = np.ascontiguousarray(values, dtype=np.float64) + 0.0
+    return _mix(values.view(np.uint64))
+
+
+def _hash_strings(values):
+    return _mix(np.asarray(values, dtype="U1").view(np.uint32).astype(np.uint64))
+
+
+def _segment_sums(values, starts):
+    # sums are commutative, so the result doesn't depend on the order within segments
+    sums = np.zeros(len(starts) - 1, dtype=np.uint64)
+    nonempty = starts[1:] > starts[:-1]
+    if nonempty.any():
+        sums[nonempty] = np.add.reduceat(values, starts[:-1][nonempty])
+    return sums
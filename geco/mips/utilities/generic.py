@@ -1,32 +1,49 @@
+import contextlib
 import itertools
+import json
+import os
 import tempfile
 
+import numpy as np
 import pyscipopt as scip
 
+from geco.mips.utilities.instance import MIPInstance
+from geco.mips.utilities.size import select_by_size
+from geco.parallel import pool_map
 
-def shuffle(model, seed, cons=True, vars=True):
+
+def shuffle(model, seed, cons=True, vars=True, in_memory=False):
     """
     Shuffles a MIP instance's rows & columns
 
     Parameters
     ----------
-    model: scip.Model
-        A pyscipopt model of the to be shuffled instance
+    model: scip.Model or MIPInstance
+        A pyscipopt model or sparse representation of the to be shuffled instance
     seed: int
         Used in shuffling (must be bigger than 0)
     cons: bool
         Whether the columns should be shuffled
     vars: bool
         Whether the rows should be shuffled
+    in_memory: bool
+        Whether a pyscipopt model is permuted in memory through its sparse representation
+        instead of SCIP's permutation of a temporary file, requires linear constraints.
+        MIPInstances are always shuffled in memory.
 
     Returns
     -------
-    model: scip.Model
-        A pyscipopt model of the shuffled instance
+    model: scip.Model or MIPInstance
+        A pyscipopt model or sparse representation (same as the input) of the shuffled instance
     """
+    assert seed > 0
+    if isinstance(model, MIPInstance):
+        return _permute(model, seed, cons, vars)
+    if in_memory:
+        return _permute(MIPInstance.from_scip(model), seed, cons, vars).to_scip()
+
     # The following line of code does not correctly set the name! Leave commented until it's clear why.
     # shuffled = scip.Model(sourceModel=model, problemName=model.getProbName(), origcopy=True)
-    assert seed > 0
     shuffled = scip.Model()
     with tempfile.NamedTemporaryFile(suffix=".mps") as temp:
         model.writeProblem(temp.name)
@@ -38,6 +55,45 @@ def shuffle(model, seed, cons=True, vars=True):
     return shuffled
 
 
+def shuffle_many(model, seeds, cons=True, vars=True):
+    """
+    Shuffles a MIP instance's rows & columns once for each seed, in memory.
+
+    The sparse representation is only extracted once, so this is much cheaper than
+    calling `shuffle` repeatedly. Each copy is the same as `shuffle(model, seed, cons, vars,
+    in_memory=True)` for its seed.
+
+    Parameters
+    ----------
+    model: scip.Model or MIPInstance
+        A pyscipopt model with linear constraints or a sparse representation
+    seeds: iterable of int
+        Seeds used in shuffling (each must be bigger than 0)
+    cons: bool
+        Whether the rows should be shuffled
+    vars: bool
+        Whether the columns should be shuffled
+
+    Returns
+    -------
+    generator: Generator
+        Generator of shuffled copies, pyscipopt models or MIPInstances (same as the input)
+    """
+    is_instance = isinstance(model, MIPInstance)
+    instance = model if is_instance else MIPInstance.from_scip(model)
+    for seed in seeds:
+        assert seed > 0
+        shuffled = _permute(instance, seed, cons, vars)
+        yield shuffled if is_instance else shuffled.to_scip()
+
+
+def _permute(instance, seed, cons, vars):
+    rng = np.random.RandomState(seed)
+    var_permutation = rng.permutation(instance.nvars) if vars else None
+    cons_permutation = rng.permutation(instance.ncons) if cons else None
+    return instance.permute(var_permutation, cons_permutation)
+
+
 def expand_parameters(function, **parameter_lists):
     """
     Calls a function with every combination of params
@@ -57,3 +113,112 @@ def expand_parameters(function, **parameter_lists):
     all_possible_parameters = itertools.product(*parameter_lists.values())
     for params in all_possible_parameters:
         yield function(**{name: val for name, val in zip(parameter_names, params)})
+
+
+def parallel_expand_parameters(
+    function,
+    n_jobs=None,
+    ordered=True,
+    chunksize=1,
+    max_in_flight=None,
+    manifest=None,
+    size_limits=None,
+    size_order=None,
+    **parameter_lists,
+):
+    """
+    Calls a function with every combination of params using a process pool
+
+    Parameters
+    ----------
+    function: function
+        Picklable (module level) function, its return values must be picklable too
+        unless n_jobs is 1
+    n_jobs: int or None
+        Number of worker processes, None uses all cores, 1 runs in the current process
+    ordered: bool
+        Whether results are yielded in the order of the combinations or as soon as they complete
+    chunksize: int
+        Number of combinations submitted to a worker at once
+    max_in_flight: int or None
+        Maximum number of pending chunks, defaults to twice the number of workers
+    manifest: str or None
+        Path of a JSON lines file recording the params of every finished combination.
+        Combinations already recorded in it are skipped, so an interrupted sweep can be resumed.
+    size_limits: dict or None
+        Skips combinations whose predicted instance is too large, e.g. {"max_nnz": 10**7},
+        see geco.mips.utilities.size.select_by_size
+    size_order: str or None
+        "smallest" or "largest" to run the combinations by predicted size
+    parameter_lists: dict[str,list]
+        Maps parameter name to all values it might take
+
+    Returns
+    -------
+    generator: Generator
+        Generator of tuples (params, value) of each parameter combination and the
+        value returned from function
+    """
+    parameter_names = list(parameter_lists.keys())
+    all_possible_parameters = (
+        dict(zip(parameter_names, params))
+        for params in itertools.product(*parameter_lists.values())
+    )
+
+    done = set() if manifest is None else _read_manifest_keys(manifest)
+    pending = [
+        params for params in all_possible_parameters if _params_key(params) not in done
+    ]
+    pending = [
+        pending[i] for i in select_by_size(function, pending, size_limits, size_order)
+    ]
+    results = pool_map(
+        _call_with_params,
+        ((function, params) for params in pending),
+        n_jobs=n_jobs,
+        ordered=ordered,
+        chunksize=chunksize,
+        max_in_flight=max_in_flight,
+    )
+    records = contextlib.nullcontext() if manifest is None else _open_manifest(manifest)
+    with records as file:
+        for i, value in results:
+            yield pending[i], value
+            # recorded once the consumer is done with the value, so every combination
+            # is delivered at least once if the sweep is interrupted
+            if file is not None:
+                file.write(_params_key(pending[i]) + "\n")
+                file.flush()
+
+
+def _call_with_params(function, params):
+    return function(**params)
+
+
+def _params_key(params):
+    return json.dumps({"params": params}, sort_keys=True, default=repr)
+
+
+def _open_manifest(manifest):
+    file = open(manifest, "a")
+    if file.tell() > 0:
+        with open(manifest, "rb") as existing:
+            existing.seek(-1, os.SEEK_END)
+            if existing.read(1) != b"\n":
+                # terminate the incomplete last line of an interrupted sweep
+                file.write("\n")
+    return file
+
+
+def _read_manifest_keys(manifest):
+    if not os.path.exists(manifest):
+        return set()
+    keys = set()
+    with open(manifest) as file:
+        for line in file:
+            try:
+                keys.add(_params_key(json.loads(line)["params"]))
+            except (json.JSONDecodeError, KeyError):
+                # the last line of an interrupted sweep may be incomplete
+                continue
+    return keys
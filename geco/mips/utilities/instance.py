@@ -0,0 +1,604 @@
+import numpy as np
+import pyscipopt as scip
+from pyscipopt.scip import Expr, Term
+
+SENSES = ("<", ">", "=")
+VTYPES = ("B", "I", "C")
+
+_SCIP_VTYPES = {"BINARY": "B", "INTEGER": "I", "IMPLINT": "I", "CONTINUOUS": "C"}
+
+
+class MIPInstance:
+    """
+    Solver independent sparse representation of a linear MIP instance
+
+        min/max  c^T x
+        s.t.     A x (<=, >=, ==) rhs
+                 lb <= x <= ub
+                 x_j integral for vtypes "B" and "I"
+
+    All data is held in NumPy arrays and a scipy CSR matrix, a pyscipopt model is
+    only built when `to_scip` is called.
+
+    Parameters
+    ----------
+    c: array-like of size n
+        Objective coefficients
+    A: scipy.sparse matrix or array-like of shape (m, n)
+        Constraint matrix, converted to CSR
+    senses: array-like of size m
+        Sense of each row, one of "<", ">", "=" (or "<=", ">=", "==")
+    rhs: array-like of size m
+        Right hand side of each row
+    lb: array-like of size n or None
+        Lower bounds, -inf for none, defaults to 0
+    ub: array-like of size n or None
+        Upper bounds, inf for none, defaults to inf
+    vtypes: array-like of size n or None
+        Variable types, one of "B", "I", "C", defaults to "C"
+    var_names: list[str] or None
+        Variable names, None lets SCIP name them
+    cons_names: list[str] or None
+        Constraint names, None lets SCIP name them
+    sense: str
+        "minimize" or "maximize"
+    name: str
+        Name of the instance
+    """
+
+    def __init__(
+        self,
+        c,
+        A,
+        senses,
+        rhs,
+        lb=None,
+        ub=None,
+        vtypes=None,
+        var_names=None,
+        cons_names=None,
+        sense="minimize",
+        name="MIP",
+    ):
+        # imported here as scipy.sparse takes long to import and isn't needed by the
+        # pyscipopt formulations, which import this module too
+        import scipy.sparse
+
+        self.c = np.asarray(c, dtype=float)
+        n = len(self.c)
+        if not scipy.sparse.issparse(A):
+            A = np.asarray(A, dtype=float).reshape(-1, n)
+        self.A = scipy.sparse.csr_matrix(A, dtype=float)
+        self.senses = _normalize_senses(senses)
+        self.rhs = np.asarray(rhs, dtype=float)
+        self.lb = np.zeros(n) if lb is None else np.asarray(lb, dtype=float)
+        self.ub = np.full(n, np.inf) if ub is None else np.asarray(ub, dtype=float)
+        self.vtypes = (
+            np.full(n, "C") if vtypes is None else np.asarray(vtypes, dtype="U1")
+        )
+        self.var_names = None if var_names is None else list(var_names)
+        self.cons_names = None if cons_names is None else list(cons_names)
+        self.sense = sense
+        self.name = name
+
+        m = self.A.shape[0]
+        assert self.A.shape == (m, n)
+        assert len(self.senses) == len(self.rhs) == m
+        assert len(self.lb) == len(self.ub) == len(self.vtypes) == n
+        assert np.isin(self.vtypes, VTYPES).all()
+        assert self.var_names is None or len(self.var_names) == n
+        assert self.cons_names is None or len(self.cons_names) == m
+        assert sense in ("minimize", "maximize")
+
+    @property
+    def nvars(self):
+        return self.A.shape[1]
+
+    @property
+    def ncons(self):
+        return self.A.shape[0]
+
+    @property
+    def nnz(self):
+        return self.A.nnz
+
+    def __repr__(self):
+        return (
+            f"MIPInstance(name={self.name!r}, sense={self.sense!r}, "
+            f"nvars={self.nvars}, ncons={self.ncons}, nnz={self.nnz})"
+        )
+
+    def save(self, file):
+        """
+        Saves the instance in NumPy's npz format.
+
+        Parameters
+        ----------
+        file: str or file-like object
+            Where to save the instance
+        """
+        optional = {}
+        if self.var_names is not None:
+            optional["var_names"] = np.asarray(self.var_names, dtype=str)
+        if self.cons_names is not None:
+            optional["cons_names"] = np.asarray(self.cons_names, dtype=str)
+        np.savez(
+            file,
+            c=self.c,
+            data=self.A.data,
+            indices=self.A.indices,
+            indptr=self.A.indptr,
+            shape=np.asarray(self.A.shape),
+            senses=self.senses,
+            rhs=self.rhs,
+            lb=self.lb,
+            ub=self.ub,
+            vtypes=self.vtypes,
+            sense=np.asarray(self.sense),
+            name=np.asarray(self.name),
+            **optional,
+        )
+
+    @classmethod
+    def load(cls, file):
+        """
+        Loads an instance saved with `save`.
+
+        Parameters
+        ----------
+        file: str or file-like object
+            Where the instance was saved
+
+        Returns
+        -------
+        instance: MIPInstance
+            The loaded instance
+        """
+        import scipy.sparse
+
+        with np.load(file) as arrays:
+            return cls(
+                c=arrays["c"],
+                A=scipy.sparse.csr_matrix(
+                    (arrays["data"], arrays["indices"], arrays["indptr"]),
+                    shape=tuple(arrays["shape"]),
+                ),
+                senses=arrays["senses"],
+                rhs=arrays["rhs"],
+                lb=arrays["lb"],
+                ub=arrays["ub"],
+                vtypes=arrays["vtypes"],
+                var_names=(
+                    arrays["var_names"].tolist() if "var_names" in arrays else None
+                ),
+                cons_names=(
+                    arrays["cons_names"].tolist() if "cons_names" in arrays else None
+                ),
+                sense=str(arrays["sense"]),
+                name=str(arrays["name"]),
+            )
+
+    def permute(self, var_permutation=None, cons_permutation=None):
+        """
+        Returns a copy of the instance with reordered variables and constraints.
+
+        Parameters
+        ----------
+        var_permutation: array-like of size n or None
+            Variable j of the copy is variable var_permutation[j] of this instance,
+            None keeps the order
+        cons_permutation: array-like of size m or None
+            Constraint i of the copy is constraint cons_permutation[i] of this instance,
+            None keeps the order
+
+        Returns
+        -------
+        instance: MIPInstance
+            The permuted instance
+        """
+        var_permutation = (
+            np.arange(self.nvars)
+            if var_permutation is None
+            else np.asarray(var_permutation, dtype=np.int64)
+        )
+        cons_permutation = (
+            np.arange(self.ncons)
+            if cons_permutation is None
+            else np.asarray(cons_permutation, dtype=np.int64)
+        )
+        assert len(var_permutation) == self.nvars
+        assert len(cons_permutation) == self.ncons
+
+        def take(names, permutation):
+            return None if names is None else [names[k] for k in permutation.tolist()]
+
+        return MIPInstance(
+            c=self.c[var_permutation],
+            A=self.A[cons_permutation][:, var_permutation],
+            senses=self.senses[cons_permutation],
+            rhs=self.rhs[cons_permutation],
+            lb=self.lb[var_permutation],
+            ub=self.ub[var_permutation],
+            vtypes=self.vtypes[var_permutation],
+            var_names=take(self.var_names, var_permutation),
+            cons_names=take(self.cons_names, cons_permutation),
+            sense=self.sense,
+            name=self.name,
+        )
+
+    def to_scip(self):
+        """
+        Builds a pyscipopt model of the instance.
+
+        Returns
+        -------
+        model: scip.Model
+            A pyscipopt model of the instance
+        """
+        model = scip.Model(self.name)
+
+        names = [""] * self.nvars if self.var_names is None else self.var_names
+        variables = [
+            model.addVar(
+                lb=None if lb == -np.inf else lb,
+                ub=None if ub == np.inf else ub,
+                obj=obj,
+                name=name,
+                vtype=vtype,
+            )
+            for obj, lb, ub, vtype, name in zip(
+                self.c.tolist(),
+                self.lb.tolist(),
+                self.ub.tolist(),
+                self.vtypes.tolist(),
+                names,
+            )
+        ]
+
+        indptr = self.A.indptr.tolist()
+        indices = self.A.indices.tolist()
+        data = self.A.data.tolist()
+        cons_names = [""] * self.ncons if self.cons_names is None else self.cons_names
+        for i, (sense, rhs, name) in enumerate(
+            zip(self.senses.tolist(), self.rhs.tolist(), cons_names)
+        ):
+            start, end = indptr[i], indptr[i + 1]
+            expr = Expr(
+                {
+                    Term(variables[j]): coef
+                    for j, coef in zip(indices[start:end], data[start:end])
+                }
+            )
+            if sense == "<":
+                model.addCons(expr <= rhs, name=name)
+            elif sense == ">":
+                model.addCons(expr >= rhs, name=name)
+            else:
+                model.addCons(expr == rhs, name=name)
+
+        if self.sense == "maximize":
+            model.setMaximize()
+        else:
+            model.setMinimize()
+
+        return model
+
+    @classmethod
+    def from_scip(cls, model):
+        """
+        Extracts the sparse representation of a pyscipopt model with linear constraints.
+
+        Parameters
+        ----------
+        model: scip.Model
+            A pyscipopt model with only linear constraints
+
+        Returns
+        -------
+        instance: MIPInstance
+            The sparse representation, variables are in the order of `model.getVars()`
+        """
+        import scipy.sparse
+
+        infinity = model.infinity()
+
+        def to_inf(value):
+            if value >= infinity:
+                return np.inf
+            if value <= -infinity:
+                return -np.inf
+            return value
+
+        variables = model.getVars()
+        index = {var.name: j for j, var in enumerate(variables)}
+
+        senses, rhs, indptr, indices, data = [], [], [0], [], []
+        for cons in model.getConss():
+            if not cons.isLinear():
+                raise ValueError(f"Constraint {cons.name} is not linear")
+            lhs, rhs_value = to_inf(model.getLhs(cons)), to_inf(model.getRhs(cons))
+            if lhs == rhs_value:
+                senses.append("=")
+                rhs.append(rhs_value)
+            elif lhs == -np.inf:
+                senses.append("<")
+                rhs.append(rhs_value)
+            elif rhs_value == np.inf:
+                senses.append(">")
+                rhs.append(lhs)
+            else:
+                raise ValueError(f"Ranged constraint {cons.name} is not supported")
+
+            for var_name, coef in model.getValsLinear(cons).items():
+                indices.append(index[var_name])
+                data.append(coef)
+            indptr.append(len(indices))
+
+        A = scipy.sparse.csr_matrix(
+            (data, indices, indptr), shape=(len(senses), len(variables)), dtype=float
+        )
+        A.sum_duplicates()
+
+        return cls(
+            c=[var.getObj() for var in variables],
+            A=A,
+            senses=senses,
+            rhs=rhs,
+            lb=[to_inf(var.getLbOriginal()) for var in variables],
+            ub=[to_inf(var.getUbOriginal()) for var in variables],
+            vtypes=[_SCIP_VTYPES[var.vtype()] for var in variables],
+            var_names=[var.name for var in variables],
+            cons_names=[cons.name for cons in model.getConss()],
+            sense=model.getObjectiveSense(),
+            name=model.getProbName(),
+        )
+
+
+class InstanceBuilder:
+    """
+    Incrementally collects variables and constraints of a MIPInstance.
+
+    Parameters
+    ----------
+    name: str
+        Name of the instance
+    """
+
+    def __init__(self, name="MIP"):
+        self.name = name
+        self.nvars = 0
+        self.ncons = 0
+        self._var_columns = {"c": [], "lb": [], "ub": [], "vtypes": [], "names": []}
+        self._rows, self._cols, self._data = [], [], []
+        self._senses, self._rhs = [], []
+        self._base = None
+
+    @classmethod
+    def from_instance(cls, instance):
+        """
+        Creates a builder that starts with all variables and constraints of an instance.
+
+        The instance's arrays and constraint matrix aren't copied until `build`, which
+        merges them with the additions, so adding variables and nonzeros only costs time
+        for the additions while `build` still copies the whole instance.
+
+        Parameters
+        ----------
+        instance: MIPInstance
+            Instance to extend, it isn't modified
+
+        Returns
+        -------
+        builder: InstanceBuilder
+        """
+        builder = cls(instance.name)
+        builder._base = instance
+        columns = builder._var_columns
+        columns["c"].append(instance.c)
+        columns["lb"].append(instance.lb)
+        columns["ub"].append(instance.ub)
+        columns["vtypes"].append(instance.vtypes)
+        columns["names"].append(
+            [None] * instance.nvars
+            if instance.var_names is None
+            else list(instance.var_names)
+        )
+        builder._senses.append(instance.senses)
+        builder._rhs.append(instance.rhs)
+        builder.nvars, builder.ncons = instance.nvars, instance.ncons
+        return builder
+
+    def add_vars(self, n, obj=0, lb=0, ub=np.inf, vtype="C", names=None):
+        """
+        Adds n variables, scalar arguments are broadcast to all of them.
+
+        Parameters
+        ----------
+        n: int
+            Number of variables
+        obj: number or array-like of size n
+            Objective coefficients
+        lb: number or array-like of size n
+            Lower bounds, -inf for none
+        ub: number or array-like of size n
+            Upper bounds, inf for none
+        vtype: str or array-like of size n
+            Variable types, one of "B", "I", "C"
+        names: list[str] or None
+            Variable names
+
+        Returns
+        -------
+        indices: np.ndarray
+            Column indices of the added variables
+        """
+        columns = self._var_columns
+        columns["c"].append(np.broadcast_to(np.asarray(obj, dtype=float), n))
+        columns["lb"].append(np.broadcast_to(np.asarray(lb, dtype=float), n))
+        columns["ub"].append(np.broadcast_to(np.asarray(ub, dtype=float), n))
+        columns["vtypes"].append(np.broadcast_to(np.asarray(vtype, dtype="U1"), n))
+        columns["names"].append([None] * n if names is None else list(names))
+        indices = np.arange(self.nvars, self.nvars + n)
+        self.nvars += n
+        return indices
+
+    def add_var(self, obj=0, lb=0, ub=np.inf, vtype="C", name=None):
+        """
+        Adds a single variable, see `add_vars`.
+
+        Returns
+        -------
+        index: int
+            Column index of the added variable
+        """
+        return int(self.add_vars(1, obj, lb, ub, vtype, [name])[0])
+
+    def add_conss(self, rows, cols, coefs, senses, rhs):
+        """
+        Adds constraints given in coordinate format.
+
+        Parameters
+        ----------
+        rows: array-like of int
+            Row of each nonzero, relative to the added constraints (0 is the first one)
+        cols: array-like of int
+            Column of each nonzero
+        coefs: number or array-like of float
+            Value of each nonzero, duplicate entries are summed
+        senses: str or array-like of size k
+            Sense of each added constraint
+        rhs: array-like of size k
+            Right hand side of each added constraint
+
+        Returns
+        -------
+        indices: np.ndarray
+            Row indices of the added constraints
+        """
+        rhs = np.atleast_1d(np.asarray(rhs, dtype=float))
+        k = len(rhs)
+        rows = np.asarray(rows, dtype=np.int64)
+        self._rows.append(rows + self.ncons)
+        self._cols.append(np.asarray(cols, dtype=np.int64))
+        self._data.append(np.broadcast_to(np.asarray(coefs, dtype=float), len(rows)))
+        self._senses.append(np.broadcast_to(_normalize_senses(senses), k))
+        self._rhs.append(rhs)
+        indices = np.arange(self.ncons, self.ncons + k)
+        self.ncons += k
+        return indices
+
+    def add_coefs(self, rows, cols, coefs):
+        """
+        Adds nonzeros to constraints that were already added.
+
+        Parameters
+        ----------
+        rows: array-like of int
+            Row of each nonzero
+        cols: array-like of int
+            Column of each nonzero
+        coefs: number or array-like of float
+            Value of each nonzero, duplicate entries are summed
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        assert (rows < self.ncons).all()
+        self._rows.append(rows)
+        self._cols.append(np.asarray(cols, dtype=np.int64))
+        self._data.append(np.broadcast_to(np.asarray(coefs, dtype=float), len(rows)))
+
+    def add_cons(self, cols, coefs, sense, rhs):
+        """
+        Adds a single constraint, see `add_conss`.
+
+        Returns
+        -------
+        index: int
+            Row index of the added constraint
+        """
+        cols = np.asarray(cols, dtype=np.int64)
+        return int(
+            self.add_conss(
+                np.zeros(len(cols), dtype=np.int64), cols, coefs, sense, rhs
+            )[0]
+        )
+
+    def build(self, sense="minimize"):
+        """
+        Builds the instance, duplicate entries are summed and explicit zeros are removed.
+
+        Parameters
+        ----------
+        sense: str
+            "minimize" or "maximize"
+
+        Returns
+        -------
+        instance: MIPInstance
+            The collected instance
+        """
+        import scipy.sparse
+
+        names = [name for names in self._var_columns["names"] for name in names]
+        if all(name is None for name in names):
+            var_names = None
+        else:
+            var_names = [
+                f"x{j + 1}" if name is None else name for j, name in enumerate(names)
+            ]
+
+        A = scipy.sparse.coo_matrix(
+            (
+                _concatenate_or_empty(self._data, float),
+                (
+                    _concatenate_or_empty(self._rows, np.int64),
+                    _concatenate_or_empty(self._cols, np.int64),
+                ),
+            ),
+            shape=(self.ncons, self.nvars),
+        ).tocsr()
+        A.sum_duplicates()
+        if self._base is not None:
+            A = A + self._base_matrix()
+        A.eliminate_zeros()
+
+        cons_names = None
+        if self._base is not None and self._base.cons_names is not None:
+            cons_names = list(self._base.cons_names)
+            cons_names += [f"c{i + 1}" for i in range(len(cons_names), self.ncons)]
+
+        return MIPInstance(
+            c=_concatenate_or_empty(self._var_columns["c"], float),
+            A=A,
+            senses=_concatenate_or_empty(self._senses, "U1"),
+            rhs=_concatenate_or_empty(self._rhs, float),
+            lb=_concatenate_or_empty(self._var_columns["lb"], float),
+            ub=_concatenate_or_empty(self._var_columns["ub"], float),
+            vtypes=_concatenate_or_empty(self._var_columns["vtypes"], "U1"),
+            var_names=var_names,
+            cons_names=cons_names,
+            sense=sense,
+            name=self.name,
+        )
+
+    def _base_matrix(self):
+        import scipy.sparse
+
+        # the base rows padded with empty rows and columns for everything added later
+        A = self._base.A
+        indptr = np.concatenate(
+            [A.indptr, np.full(self.ncons - A.shape[0], A.indptr[-1], A.indptr.dtype)]
+        )
+        return scipy.sparse.csr_matrix(
+            (A.data, A.indices, indptr), shape=(self.ncons, self.nvars)
+        )
+
+
+def _concatenate_or_empty(arrays, dtype):
+    return np.concatenate(arrays) if arrays else np.zeros(0, dtype=dtype)
+
+
+def _normalize_senses(senses):
+    senses = np.asarray(senses, dtype="U2")
+    normalized = np.where(senses == "==", "=", senses).astype("U1")
+    assert np.isin(normalized, SENSES).all(), "senses must be one of <, >, ="
+    return normalized
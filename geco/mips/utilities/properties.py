@@ -0,0 +1,211 @@
+import functools
+import glob
+import os
+
+import numpy as np
+import pyscipopt as scip
+
+from geco.mips.utilities.instance import MIPInstance
+from geco.parallel import pool_map
+
+_INSTANCE_EXTENSIONS = (".mps", ".lp", ".cip", ".mps.gz", ".lp.gz", ".cip.gz")
+
+
+def instance_properties(instance):
+    """
+    Calculates size and structure statistics of a MIP instance.
+
+    All statistics are computed with vectorized operations on the sparse constraint
+    matrix, without iterating over rows or variables in Python.
+
+    Parameters
+    ----------
+    instance: MIPInstance or scip.Model
+        Instance to calculate the properties of, pyscipopt models may only have linear
+        constraints
+
+    Returns
+    -------
+    properties: dict
+    A dict with the following calculated properties:
+        num_vars, num_cons: int
+            Number of variables and constraints
+        num_binary_vars, num_integer_vars, num_continuous_vars: int
+            Number of variables of each type, integer variables don't include binaries
+        nnz: int
+            Number of nonzero coefficients of the constraint matrix
+        density: float
+            Number of nonzeros divided by the number of entries of the constraint matrix
+        min_row_degree, max_row_degree, avg_row_degree, std_row_degree: number
+            Distribution of the number of nonzeros per constraint
+        min_col_degree, max_col_degree, avg_col_degree, std_col_degree: number
+            Distribution of the number of nonzeros per variable
+        num_empty_rows, num_empty_cols: int
+            Number of constraints and variables without nonzero coefficients
+        min_abs_coefficient, max_abs_coefficient: float
+            Range of the absolute nonzero coefficients of the constraint matrix
+        dynamism: float
+            max_abs_coefficient divided by min_abs_coefficient
+        max_row_dynamism: float
+            Largest ratio of the largest and smallest absolute coefficient of a row
+        min_abs_objective, max_abs_objective: float
+            Range of the absolute nonzero objective coefficients
+        min_abs_rhs, max_abs_rhs: float
+            Range of the absolute nonzero right hand sides
+        num_set_partitioning_rows, num_set_packing_rows, num_set_covering_rows: int
+            Number of constraints sum x_j = 1, sum x_j <= 1 and sum x_j >= 1 over binary
+            variables x_j, including their negated forms, e.g. sum -x_j >= -1
+    """
+    if isinstance(instance, scip.Model):
+        instance = MIPInstance.from_scip(instance)
+    A = instance.A
+    if (A.data == 0).any():
+        A = A.copy()
+        A.eliminate_zeros()
+    m, n = A.shape
+
+    row_degrees = np.diff(A.indptr)
+    col_degrees = np.bincount(A.indices, minlength=n)
+    abs_data = np.abs(A.data)
+
+    binary = (instance.vtypes == "B") | (
+        (instance.vtypes == "I") & (instance.lb >= 0) & (instance.ub <= 1)
+    )
+
+    properties = {
+        "num_vars": n,
+        "num_cons": m,
+        "num_binary_vars": int(np.count_nonzero(instance.vtypes == "B")),
+        "num_integer_vars": int(np.count_nonzero(instance.vtypes == "I")),
+        "num_continuous_vars": int(np.count_nonzero(instance.vtypes == "C")),
+        "nnz": int(A.nnz),
+        "density": A.nnz / (m * n) if m * n else 0.0,
+        **_distribution("row_degree", row_degrees),
+        **_distribution("col_degree", col_degrees),
+        "num_empty_rows": int(np.count_nonzero(row_degrees == 0)),
+        "num_empty_cols": int(np.count_nonzero(col_degrees == 0)),
+        **_abs_range("coefficient", abs_data),
+        "dynamism": _ratio(abs_data.max(initial=0), abs_data.min(initial=np.inf)),
+        "max_row_dynamism": _max_row_dynamism(abs_data, A.indptr, row_degrees),
+        **_abs_range("objective", np.abs(instance.c)),
+        **_abs_range("rhs", np.abs(instance.rhs)),
+        **_set_rows(A, row_degrees, binary, instance.senses, instance.rhs),
+    }
+    return properties
+
+
+def _distribution(name, values):
+    if len(values) == 0:
+        return {f"{s}_{name}": 0 for s in ("min", "max", "avg", "std")}
+    return {
+        f"min_{name}": int(values.min()),
+        f"max_{name}": int(values.max()),
+        f"avg_{name}": float(values.mean()),
+        f"std_{name}": float(values.std()),
+    }
+
+
+def _abs_range(name, abs_values):
+    nonzero = abs_values[abs_values > 0]
+    return {
+        f"min_abs_{name}": float(nonzero.min()) if len(nonzero) else 0.0,
+        f"max_abs_{name}": float(nonzero.max(initial=0)),
+    }
+
+
+def _ratio(largest, smallest):
+    return float(largest / smallest) if largest > 0 else 0.0
+
+
+def _max_row_dynamism(abs_data, indptr, row_degrees):
+    # segments between the starts of the nonempty rows are exactly these rows
+    starts = indptr[:-1][row_degrees > 0]
+    if len(starts) == 0:
+        return 0.0
+    row_max = np.maximum.reduceat(abs_data, starts)
+    row_min = np.minimum.reduceat(abs_data, starts)
+    return float((row_max / row_min).max())
+
+
+def _set_rows(A, row_degrees, binary, senses, rhs):
+    rows = np.repeat(np.arange(A.shape[0]), row_degrees)
+    ones = np.bincount(rows, weights=A.data == 1, minlength=A.shape[0])
+    minus_ones = np.bincount(rows, weights=A.data == -1, minlength=A.shape[0])
+    non_binaries = np.bincount(rows, weights=~binary[A.indices], minlength=A.shape[0])
+
+    candidates = (row_degrees > 0) & (non_binaries == 0)
+    positive = candidates & (ones == row_degrees) & (rhs == 1)
+    # -sum x_j <= -1 is a covering and -sum x_j >= -1 a packing row
+    negative = candidates & (minus_ones == row_degrees) & (rhs == -1)
+    flipped = np.where(senses == "<", ">", np.where(senses == ">", "<", "="))
+    return {
+        "num_set_partitioning_rows": int(
+            np.count_nonzero((positive | negative) & (senses == "="))
+        ),
+        "num_set_packing_rows": int(
+            np.count_nonzero(positive & (senses == "<"))
+            + np.count_nonzero(negative & (flipped == "<"))
+        ),
+        "num_set_covering_rows": int(
+            np.count_nonzero(positive & (senses == ">"))
+            + np.count_nonzero(negative & (flipped == ">"))
+        ),
+    }
+
+
+def dataset_properties(directory, n_jobs=None, ordered=True):
+    """
+    Calculates `instance_properties` of all instances of a directory in a process pool.
+
+    Parameters
+    ----------
+    directory: str
+        Either a dataset written by geco.dataset.DatasetWriter or a directory of instance
+        files SCIP can read (.mps, .lp, .cip, optionally gzipped)
+    n_jobs: int or None
+        Number of worker processes, None uses all cores
+    ordered: bool
+        Whether results are yielded in order or as soon as they are completed
+
+    Returns
+    -------
+    properties: generator
+        Tuples (instance id or file path, properties)
+    """
+    # the dataset might have grown since a previous call
+    _dataset_reader.cache_clear()
+    reader = _dataset_reader(directory)
+    if len(reader):
+        keys = reader.ids()
+        tasks = ((directory, instance_id) for instance_id in keys)
+        function = _dataset_instance_properties
+    else:
+        keys = sorted(
+            path
+            for extension in _INSTANCE_EXTENSIONS
+            for path in glob.glob(os.path.join(directory, "*" + extension))
+        )
+        tasks = ((path,) for path in keys)
+        function = _file_instance_properties
+
+    for i, properties in pool_map(function, tasks, n_jobs=n_jobs, ordered=ordered):
+        yield keys[i], properties
+
+
+@functools.lru_cache(maxsize=None)
+def _dataset_reader(directory):
+    # every process opens the dataset once instead of unpickling its index per task
+    from geco.dataset import DatasetReader
+
+    return DatasetReader(directory)
+
+
+def _dataset_instance_properties(directory, instance_id):
+    return instance_properties(_dataset_reader(directory).instance(instance_id))
+
+
+def _file_instance_properties(path):
+    model = scip.Model()
+    model.hideOutput()
+    model.readProblem(path)
+    return instance_properties(model)
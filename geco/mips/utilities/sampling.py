@@ -0,0 +1,102 @@
+"""
+Helpers for the fast sampling mode of the parameter generators.
+
+Generators that support `fast=True` draw all their random numbers as whole arrays from
+a `numpy.random.Generator` instead of one Python `random` call per element. Both modes
+sample from the same distributions, but they consume randomness differently, so the
+same seed gives different instances in the two modes.
+
+Reproducibility: with `fast=False` (the default) instances stay identical to the ones
+of earlier GeCO versions. With `fast=True` the same seed always gives the same
+instance for a given GeCO and NumPy version. NumPy may change the streams of
+`numpy.random.Generator` methods between feature releases (NEP 19), so fast instances
+are only guaranteed to be reproducible with the same NumPy version.
+"""
+
+import numpy as np
+
+
+def numpy_generator(seed):
+    """
+    Converts the random state of a `py_random_state` decorated function to a NumPy
+    generator.
+
+    NumPy generators passed as seed are used directly, any other random state is used to
+    seed a new generator, so the result only depends on the seed.
+
+    Parameters
+    ----------
+    seed: random.Random
+        Random state created by networkx' py_random_state decorator
+
+    Returns
+    -------
+    rng: numpy.random.Generator
+    """
+    # networkx wraps numpy random states to look like random.Random
+    wrapped = getattr(seed, "_rng", None)
+    if isinstance(wrapped, np.random.Generator):
+        return wrapped
+    if isinstance(wrapped, np.random.RandomState):
+        entropy = wrapped.randint(0, 2**32, size=4, dtype=np.uint64)
+    else:
+        entropy = seed.getrandbits(128)
+    return np.random.default_rng(np.random.SeedSequence(entropy))
+
+
+def integers(rng, low, high, size=None):
+    """
+    Draws integers uniformly from [low, high], with both ends inclusive like
+    `random.randint`.
+
+    Parameters
+    ----------
+    rng: numpy.random.Generator
+    low, high: int or array-like
+        Inclusive bounds, arrays are broadcast against each other and size
+    size: int, tuple or None
+        Output shape
+
+    Returns
+    -------
+    values: np.ndarray or int
+    """
+    return rng.integers(low, high, size=size, endpoint=True)
+
+
+def random_subsets(rng, n, sizes):
+    """
+    Draws uniformly random subsets of range(n), like one `random.sample(range(n), k)`
+    call per size k.
+
+    All subsets are drawn at once with replacement, duplicates are dropped and redrawn
+    until every subset is complete, which converges within a few rounds for subsets
+    that are small compared to n.
+
+    Parameters
+    ----------
+    rng: numpy.random.Generator
+    n: int
+        Size of the population
+    sizes: array-like of int
+        Size of each subset, at most n
+
+    Returns
+    -------
+    subsets: list[np.ndarray]
+        Sorted elements of every subset
+    """
+    sizes = np.asarray(sizes, dtype=np.int64)
+    assert (sizes <= n).all()
+    m = len(sizes)
+    # every element is encoded as subset * n + element, so sorted duplicates are
+    # adjacent within their subset
+    keys = np.zeros(0, dtype=np.int64)
+    missing = sizes
+    while missing.any():
+        subsets = np.repeat(np.arange(m, dtype=np.int64), missing)
+        drawn = subsets * n + rng.integers(0, n, size=len(subsets))
+        keys = np.sort(np.concatenate([keys, drawn]))
+        keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])]
+        missing = sizes - np.bincount(keys // n, minlength=m)
+    return np.split(keys % n, np.cumsum(sizes)[:-1])
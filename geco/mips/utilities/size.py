@@ -0,0 +1,145 @@
+"""
+Predicts the number of variables, constraints and nonzeros of an instance from the
+arguments of its generator, without building it.
+
+Estimators are registered next to the formulations they describe with the
+`size_estimator` decorator and take the same arguments as the formulation.
+"""
+
+import collections
+import functools
+
+InstanceSize = collections.namedtuple(
+    "InstanceSize", ["n_vars", "n_conss", "nnz", "exact"]
+)
+"""
+n_vars, n_conss, nnz: int
+    Number of variables, constraints and nonzeros of the constraint matrix
+exact: bool
+    Whether the counts are exact, otherwise they are upper bounds
+"""
+
+_estimators = {}
+
+
+def size_estimator(function):
+    """
+    Decorator registering a size estimator of a formulation or instance generator.
+
+    The estimator is called with the same arguments as the function (seeds included,
+    which it ignores) and returns an InstanceSize. It should only use the sizes of its
+    arguments, e.g. the number of nodes and edges of a graph, so it runs in a fraction of
+    the time of building the instance.
+
+    Parameters
+    ----------
+    function: function
+        The formulation or instance generator whose size is estimated
+
+    Returns
+    -------
+    decorator: function
+    """
+
+    def decorator(estimator):
+        _estimators[_qualified_name(function)] = estimator
+        return estimator
+
+    return decorator
+
+
+def estimate_size(function, *args, **kwargs):
+    """
+    Predicts the size of the instance `function(*args, **kwargs)` without building it.
+
+    Parameters
+    ----------
+    function: function
+        A formulation or instance generator, arguments bound with functools.partial are
+        taken into account
+    args, kwargs:
+        Arguments the function would be called with
+
+    Returns
+    -------
+    size: InstanceSize or None
+        Predicted size, None if no estimator is registered for the function
+
+    Examples
+    --------
+    >>> estimate_size(max_cut.triangle, nx.complete_graph(100))
+    InstanceSize(n_vars=4950, n_conss=323400, nnz=970200, exact=True)
+    """
+    while isinstance(function, functools.partial):
+        args = (*function.args, *args)
+        kwargs = {**function.keywords, **kwargs}
+        function = function.func
+    estimator = _estimators.get(_qualified_name(function))
+    if estimator is None:
+        return None
+    return estimator(*args, **kwargs)
+
+
+def exceeds(size, max_vars=None, max_conss=None, max_nnz=None):
+    """
+    Checks a predicted size against limits.
+
+    Parameters
+    ----------
+    size: InstanceSize or None
+        Predicted size, None (unknown size) never exceeds the limits
+    max_vars, max_conss, max_nnz: int or None
+        Maximum number of variables, constraints and nonzeros, None for no limit
+
+    Returns
+    -------
+    exceeds: bool
+        Whether any count of the size is above its limit
+    """
+    if size is None:
+        return False
+    limits = [
+        (size.n_vars, max_vars),
+        (size.n_conss, max_conss),
+        (size.nnz, max_nnz),
+    ]
+    return any(limit is not None and count > limit for count, limit in limits)
+
+
+def select_by_size(function, params_list, limits=None, order=None):
+    """
+    Drops the parameter combinations whose predicted instance exceeds size limits and
+    sorts the others by their predicted number of nonzeros.
+
+    Parameters
+    ----------
+    function: function
+        Formulation or instance generator called with the params as keywords
+    params_list: list[dict]
+        Parameter combinations
+    limits: dict or None
+        Keyword arguments of `exceeds`, e.g. {"max_nnz": 10**7}
+    order: str or None
+        "smallest" or "largest" to start with the smallest or largest instances, None
+        keeps the order of params_list
+
+    Returns
+    -------
+    selected: list[int]
+        Indices into params_list of the combinations within the limits, in order
+    """
+    assert order in (None, "smallest", "largest")
+    if not limits and order is None:
+        return list(range(len(params_list)))
+    sizes = [estimate_size(function, **params) for params in params_list]
+    if None in sizes:
+        raise ValueError(f"No size estimator for {function!r}")
+    selected = [i for i, size in enumerate(sizes) if not exceeds(size, **limits or {})]
+    if order is not None:
+        selected.sort(key=lambda i: sizes[i].nnz, reverse=order == "largest")
+    return selected
+
+
+def _qualified_name(function):
+    # the profiling stages wrap functions with functools.wraps, which keeps the name
+    return f"{function.__module__}.{function.__qualname__}"
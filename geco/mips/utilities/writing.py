@@ -0,0 +1,292 @@
+import gzip
+import itertools
+
+import numpy as np
+
+from geco.profiling import stage
+
+_BUFFER_SIZE = 1 << 20
+_TERMS_PER_LINE = 8
+# number of rows or columns whose entries are formatted at once
+_BLOCK_SIZE = 4096
+# maximum length of names in fixed MPS
+_FIXED_MPS_NAME_LENGTH = 8
+_MPS_SENSES = {"<": "L", ">": "G", "=": "E"}
+_LP_SENSES = {"<": "<=", ">": ">=", "=": "="}
+
+
+def write_mps(instance, path, free=False, generic_names=False):
+    """
+    Writes a MIPInstance in MPS format without building a pyscipopt model.
+
+    The file is streamed column by column and the entries are only formatted for a
+    block of columns at a time. Apart from a column-wise copy of the constraint matrix
+    and an array indexing its distinct coefficients, no memory proportional to the
+    number of nonzeros is needed.
+
+    Parameters
+    ----------
+    instance: MIPInstance
+        Instance to write
+    path: str
+        File to write to, a ".gz" extension compresses the file on the fly
+    free: bool
+        Whether to write free MPS (whitespace separated) instead of fixed MPS (aligned
+        fields), which only allows names of up to 8 characters
+    generic_names: bool
+        Whether to name variables x1, x2, ... and constraints c1, c2, ... instead
+        of using the instance's names, e.g. if they contain whitespace
+    """
+    if not free:
+        for names in _names(instance, generic_names):
+            long_name = next(
+                (name for name in names if len(name) > _FIXED_MPS_NAME_LENGTH), None
+            )
+            if long_name is not None:
+                raise ValueError(
+                    f"Name {long_name} is too long for fixed MPS, write free MPS or "
+                    "use generic names"
+                )
+    with _open_text(path) as file:
+        file.writelines(_mps_lines(instance, free, generic_names))
+
+
+def write_lp(instance, path, generic_names=False):
+    """
+    Writes a MIPInstance in CPLEX LP format without building a pyscipopt model.
+
+    The file is streamed row by row and the entries are only formatted for a block of
+    rows at a time, like in `write_mps`. Names have to be valid LP names, e.g. they
+    must not start with a digit, otherwise use generic_names.
+
+    Parameters
+    ----------
+    instance: MIPInstance
+        Instance to write
+    path: str
+        File to write to, a ".gz" extension compresses the file on the fly
+    generic_names: bool
+        Whether to name variables x1, x2, ... and constraints c1, c2, ... instead
+        of using the instance's names
+    """
+    with _open_text(path) as file:
+        file.writelines(_lp_lines(instance, generic_names))
+
+
+@stage("write")
+def write_problem(instance, path, free_mps=False, generic_names=False):
+    """
+    Writes a MIPInstance, the format is given by the extension of path.
+
+    Parameters
+    ----------
+    instance: MIPInstance
+        Instance to write
+    path: str
+        File ending in ".mps" or ".lp", optionally followed by ".gz"
+    free_mps: bool
+        Whether MPS files are written in free format
+    generic_names: bool
+        Whether to write generic variable and constraint names
+    """
+    extension = path[: -len(".gz")] if path.endswith(".gz") else path
+    if extension.endswith(".mps"):
+        write_mps(instance, path, free=free_mps, generic_names=generic_names)
+    elif extension.endswith(".lp"):
+        write_lp(instance, path, generic_names=generic_names)
+    else:
+        raise ValueError(f"Unsupported file format of {path}, use .mps or .lp")
+
+
+def _open_text(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "wt", compresslevel=6, newline="\n")
+    return open(path, "w", buffering=_BUFFER_SIZE, newline="\n")
+
+
+def _format_number(value):
+    text = repr(value)
+    return text[: -len(".0")] if text.endswith(".0") else text
+
+
+def _number_strings(values):
+    # instances usually have few distinct coefficients, so each is only formatted once,
+    # returns the formatted distinct values and the index of each value among them
+    unique, inverse = np.unique(values, return_inverse=True)
+    strings = np.array([_format_number(v) for v in unique.tolist()], dtype=object)
+    return strings, inverse.ravel()
+
+
+def _format_numbers(values):
+    strings, inverse = _number_strings(values)
+    return strings[inverse].tolist()
+
+
+def _formatted_entries(matrix, names):
+    # names of the minor indices and formatted values of each row of a CSR matrix or
+    # column of a CSC matrix, only a block of them is formatted at a time
+    indptr = matrix.indptr.tolist()
+    strings, coefficients = _number_strings(matrix.data)
+    n = len(indptr) - 1
+    for first in range(0, n, _BLOCK_SIZE):
+        last = min(first + _BLOCK_SIZE, n)
+        offset = indptr[first]
+        indices = matrix.indices[offset : indptr[last]].tolist()
+        block_names = [names[i] for i in indices]
+        values = strings[coefficients[offset : indptr[last]]].tolist()
+        for k in range(first, last):
+            start, end = indptr[k] - offset, indptr[k + 1] - offset
+            yield block_names[start:end], values[start:end]
+
+
+def _names(instance, generic_names):
+    var_names = instance.var_names
+    if var_names is None or generic_names:
+        var_names = [f"x{j + 1}" for j in range(instance.nvars)]
+    cons_names = instance.cons_names
+    if cons_names is None or generic_names:
+        cons_names = [f"c{i + 1}" for i in range(instance.ncons)]
+    return var_names, cons_names
+
+
+def _mps_lines(instance, free, generic_names):
+    var_names, cons_names = _names(instance, generic_names)
+    if free:
+        entry, pair = " {} {} {}", " {} {}"
+        bound = " {} BND {} {}"
+    else:
+        entry, pair = "    {:<8}  {:<8}  {:>12}", "   {:<8}  {:>12}"
+        bound = " {} BND       {:<8}  {:>12}"
+
+    def entry_lines(column, entries):
+        for first, second in itertools.zip_longest(*[iter(entries)] * 2):
+            line = entry.format(column, *first)
+            if second is not None:
+                line += pair.format(*second)
+            yield line + "\n"
+
+    def bound_line(kind, name, value=""):
+        return bound.format(kind, name, value).rstrip() + "\n"
+
+    yield f"NAME          {instance.name}\n"
+    if instance.sense == "maximize":
+        yield "OBJSENSE\n    MAX\n"
+    yield "ROWS\n"
+    yield " N  OBJ\n"
+    for sense, name in zip(instance.senses.tolist(), cons_names):
+        yield f" {_MPS_SENSES[sense]}  {name}\n"
+
+    yield "COLUMNS\n"
+    A = instance.A.tocsc()
+    A.sort_indices()
+    costs = _format_numbers(instance.c)
+    integral = (instance.vtypes != "C").tolist()
+    in_marker = False
+    columns = zip(var_names, costs, _formatted_entries(A, cons_names))
+    for j, (name, cost, (rows, values)) in enumerate(columns):
+        if integral[j] != in_marker:
+            in_marker = integral[j]
+            marker = "INTORG" if in_marker else "INTEND"
+            yield f"    MARKER                 'MARKER'                 '{marker}'\n"
+        # every variable needs at least one entry to be defined
+        entries = [("OBJ", cost)] if cost != "0" or not rows else []
+        entries += zip(rows, values)
+        yield from entry_lines(name, entries)
+    if in_marker:
+        yield "    MARKER                 'MARKER'                 'INTEND'\n"
+
+    yield "RHS\n"
+    nonzero = np.flatnonzero(instance.rhs)
+    yield from entry_lines(
+        "RHS",
+        zip(
+            (cons_names[i] for i in nonzero.tolist()),
+            _format_numbers(instance.rhs[nonzero]),
+        ),
+    )
+
+    yield "BOUNDS\n"
+    for name, lb, ub, vtype in zip(
+        var_names, instance.lb.tolist(), instance.ub.tolist(), instance.vtypes.tolist()
+    ):
+        if vtype == "B" and lb == 0 and ub == 1:
+            yield bound_line("BV", name)
+        elif lb == ub:
+            yield bound_line("FX", name, _format_number(lb))
+        elif lb == -np.inf and ub == np.inf:
+            yield bound_line("FR", name)
+        else:
+            if lb == -np.inf:
+                yield bound_line("MI", name)
+            elif lb != 0:
+                yield bound_line("LO", name, _format_number(lb))
+            if ub != np.inf:
+                yield bound_line("UP", name, _format_number(ub))
+            elif vtype != "C":
+                yield bound_line("PL", name)
+    yield "ENDATA\n"
+
+
+def _lp_terms(names, values, var_names):
+    if not names:
+        # LP rows and objectives need at least one term
+        return [f"+ 0 {var_names[0]}"] if var_names else []
+    return [
+        f"- {value[1:]} {name}" if value.startswith("-") else f"+ {value} {name}"
+        for name, value in zip(names, values)
+    ]
+
+
+def _lp_expression(label, terms):
+    lines = [
+        " ".join(terms[k : k + _TERMS_PER_LINE])
+        for k in range(0, len(terms), _TERMS_PER_LINE)
+    ] or [""]
+    return f" {label}: " + "\n   ".join(lines)
+
+
+def _lp_lines(instance, generic_names):
+    var_names, cons_names = _names(instance, generic_names)
+
+    yield f"\\ Problem name: {instance.name}\n"
+    yield "Maximize\n" if instance.sense == "maximize" else "Minimize\n"
+    objective = np.flatnonzero(instance.c)
+    terms = _lp_terms(
+        [var_names[j] for j in objective.tolist()],
+        _format_numbers(instance.c[objective]),
+        var_names,
+    )
+    yield _lp_expression("obj", terms) + "\n"
+
+    yield "Subject To\n"
+    rows = zip(
+        cons_names,
+        instance.senses.tolist(),
+        _format_numbers(instance.rhs),
+        _formatted_entries(instance.A, var_names),
+    )
+    for name, sense, rhs, (columns, values) in rows:
+        terms = _lp_terms(columns, values, var_names)
+        yield f"{_lp_expression(name, terms)} {_LP_SENSES[sense]} {rhs}\n"
+
+    yield "Bounds\n"
+    for name, lb, ub, vtype in zip(
+        var_names, instance.lb.tolist(), instance.ub.tolist(), instance.vtypes.tolist()
+    ):
+        if lb == -np.inf and ub == np.inf:
+            yield f" {name} free\n"
+        elif lb == ub:
+            yield f" {name} = {_format_number(lb)}\n"
+        elif lb != 0 or ub != np.inf:
+            lower = "-inf" if lb == -np.inf else _format_number(lb)
+            upper = "+inf" if ub == np.inf else _format_number(ub)
+            yield f" {lower} <= {name} <= {upper}\n"
+
+    for section, vtype in (("Binaries", "B"), ("Generals", "I")):
+        selected = np.flatnonzero(instance.vtypes == vtype).tolist()
+        if selected:
+            yield f"{section}\n"
+            for k in range(0, len(selected), _TERMS_PER_LINE):
+                names = (var_names[j] for j in selected[k : k + _TERMS_PER_LINE])
+                yield " " + " ".join(names) + "\n"
+    yield "End\n"
@@ -0,0 +1,140 @@
+import collections
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+from networkx.utils import py_random_state
+
+
+@py_random_state("seed")
+def seed_stream(seed=0):
+    """
+    Infinite stream of independent child seeds derived from a root seed.
+
+    The children are spawned from a `numpy.random.SeedSequence` whose entropy is
+    drawn from the root seed, so the i-th child only depends on the root seed and on i.
+
+    Parameters
+    ----------
+    seed: int, random state or None
+        Root seed for randomization.
+
+    Returns
+    -------
+    generator: Generator
+        Generator of integer seeds in [0, 2**32)
+    """
+    sequence = np.random.SeedSequence(_root_entropy(seed))
+    while True:
+        for child in sequence.spawn(64):
+            yield int(child.generate_state(1)[0])
+
+
+def _root_entropy(seed):
+    # networkx wraps numpy random states to look like random.Random
+    wrapped = getattr(seed, "_rng", None)
+    if isinstance(wrapped, np.random.Generator):
+        return wrapped.integers(0, 2**32, size=4, dtype=np.uint64).tolist()
+    if isinstance(wrapped, np.random.RandomState):
+        return wrapped.randint(0, 2**32, size=4, dtype=np.uint64).tolist()
+    return seed.getrandbits(128)
+
+
+def spawn_seeds(seed, n):
+    """
+    Derives n independent child seeds from a root seed.
+
+    Parameters
+    ----------
+    seed: int, random state or None
+        Root seed for randomization.
+    n: int
+        Number of child seeds.
+
+    Returns
+    -------
+    seeds: list[int]
+        Child seeds in [0, 2**32), the same for the same root seed
+    """
+    return list(itertools.islice(seed_stream(seed), n))
+
+
+def _apply_chunk(function, chunk):
+    return [function(*args) for args in chunk]
+
+
+def pool_map(
+    function, iterable, n_jobs=None, ordered=True, chunksize=1, max_in_flight=None
+):
+    """
+    Maps a function over an iterable of argument tuples using a process pool.
+
+    Tasks are submitted lazily, so at most `max_in_flight` chunks are pending at any
+    time and the iterable may be infinite.
+
+    Parameters
+    ----------
+    function: function
+        Picklable (module level) function to call with each argument tuple
+    iterable: iterable of tuple
+        Positional arguments for each call
+    n_jobs: int or None
+        Number of worker processes, None uses all cores, 1 runs in the current process
+    ordered: bool
+        Whether results are yielded in input order or as soon as they complete
+    chunksize: int
+        Number of calls submitted to a worker at once
+    max_in_flight: int or None
+        Maximum number of pending chunks, defaults to twice the number of workers
+
+    Returns
+    -------
+    generator: Generator
+        Generator of tuples (index, result) where index is the position in the iterable
+    """
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    assert n_jobs >= 1 and chunksize >= 1
+
+    if n_jobs == 1:
+        for i, args in enumerate(iterable):
+            yield i, function(*args)
+        return
+
+    if max_in_flight is None:
+        max_in_flight = 2 * n_jobs
+    assert max_in_flight >= 1
+
+    indexed = enumerate(iterable)
+    chunks = iter(lambda: list(itertools.islice(indexed, chunksize)), [])
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        pending = collections.OrderedDict()
+        try:
+            for chunk in itertools.islice(chunks, max_in_flight):
+                _submit(executor, pending, function, chunk)
+
+            while pending:
+                if ordered:
+                    future = next(iter(pending))
+                    future.result()
+                    done = [future]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    indices = pending.pop(future)
+                    for index, result in zip(indices, future.result()):
+                        yield index, result
+                    for chunk in itertools.islice(chunks, 1):
+                        _submit(executor, pending, function, chunk)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _submit(executor, pending, function, chunk):
+    indices = [index for index, _ in chunk]
+    future = executor.submit(_apply_chunk, function, [args for _, args in chunk])
+    pending[future] = indices
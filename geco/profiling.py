@@ -0,0 +1,199 @@
+import collections
+import contextlib
+import functools
+import threading
+import time
+
+STAGES = ("instance", "params", "build", "write")
+
+StageRecord = collections.namedtuple(
+    "StageRecord",
+    ["stage", "function", "start", "end", "nested", "n_vars", "n_conss"],
+)
+"""
+stage: str
+    One of STAGES
+function: str
+    Fully qualified name of the decorated function
+start, end: float
+    time.perf_counter() timestamps of the call
+nested: bool
+    Whether the call happened inside another call of the same stage, e.g. a formulation
+    built on top of another one
+n_vars, n_conss: int or None
+    Number of variables and constraints of the model returned by a build stage
+"""
+
+_hooks = ()
+_hooks_lock = threading.Lock()
+_local = threading.local()
+
+
+def add_hook(hook):
+    """
+    Registers a function that is called with a StageRecord after every profiled call.
+
+    Parameters
+    ----------
+    hook: function
+        Callable taking a StageRecord
+    """
+    global _hooks
+    with _hooks_lock:
+        _hooks = _hooks + (hook,)
+
+
+def remove_hook(hook):
+    """
+    Unregisters a hook added with add_hook.
+
+    Parameters
+    ----------
+    hook: function
+        A previously registered hook
+    """
+    global _hooks
+    with _hooks_lock:
+        hooks = list(_hooks)
+        hooks.remove(hook)
+        _hooks = tuple(hooks)
+
+
+def stage(name):
+    """
+    Decorator marking a function as one stage of instance generation.
+
+    Without registered hooks the decorated function is called directly, so the only
+    overhead is a single check per call.
+
+    Parameters
+    ----------
+    name: str
+        One of STAGES
+
+    Returns
+    -------
+    decorator: function
+    """
+    assert name in STAGES
+
+    def decorator(function):
+        qualified_name = f"{function.__module__}.{function.__qualname__}"
+
+        @functools.wraps(function)
+        def wrapped(*args, **kwargs):
+            if not _hooks:
+                return function(*args, **kwargs)
+            return _profiled_call(name, qualified_name, function, args, kwargs)
+
+        return wrapped
+
+    return decorator
+
+
+def _profiled_call(name, qualified_name, function, args, kwargs):
+    stack = _local.__dict__.setdefault("stack", [])
+    nested = name in stack
+    stack.append(name)
+    start = time.perf_counter()
+    try:
+        result = function(*args, **kwargs)
+    finally:
+        end = time.perf_counter()
+        stack.pop()
+    n_vars, n_conss = _model_size(result) if name == "build" else (None, None)
+    record = StageRecord(name, qualified_name, start, end, nested, n_vars, n_conss)
+    for hook in _hooks:
+        hook(record)
+    return result
+
+
+def _model_size(result):
+    # some formulations return the model together with other objects, e.g. max_cut
+    for candidate in result if isinstance(result, tuple) else (result,):
+        if hasattr(candidate, "getNVars"):
+            return candidate.getNVars(), candidate.getNConss()
+        if hasattr(candidate, "nvars"):
+            return candidate.nvars, candidate.ncons
+    return None, None
+
+
+class Profile:
+    """
+    Collects the StageRecords of all profiled calls while registered as a hook.
+
+    Attributes
+    ----------
+    records: list[StageRecord]
+        All records in the order the calls finished
+    """
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        with self._lock:
+            self.records.append(record)
+
+    def counters(self):
+        """
+        Aggregates the records. Nested calls are left out, as their time is already
+        contained in the enclosing call of the same stage.
+
+        Returns
+        -------
+        counters: dict
+            Maps each stage to a dict with its number of "calls" and total "time" in
+            seconds, and "n_vars" and "n_conss" to the total number of variables and
+            constraints added by the build stages
+        """
+        counters = {name: {"calls": 0, "time": 0.0} for name in STAGES}
+        counters["n_vars"] = counters["n_conss"] = 0
+        for record in self.records:
+            if record.nested:
+                continue
+            counters[record.stage]["calls"] += 1
+            counters[record.stage]["time"] += record.end - record.start
+            counters["n_vars"] += record.n_vars or 0
+            counters["n_conss"] += record.n_conss or 0
+        return counters
+
+    def by_function(self):
+        """
+        Returns
+        -------
+        times: dict
+            Maps the name of every profiled function to its number of calls and total time
+        """
+        times = collections.defaultdict(lambda: {"calls": 0, "time": 0.0})
+        for record in self.records:
+            times[record.function]["calls"] += 1
+            times[record.function]["time"] += record.end - record.start
+        return dict(times)
+
+
+@contextlib.contextmanager
+def profile():
+    """
+    Profiles all instance generation stages of the current process within the context.
+
+    Calls in other processes, e.g. pool workers of parallel_generate_n, aren't recorded.
+
+    Yields
+    ------
+    profile: Profile
+        Collects the records, see Profile.counters for aggregated numbers
+
+    Examples
+    --------
+    >>> with profile() as p:
+    ...     set_cover.yang_instance(500, seed=0)
+    >>> p.counters()["build"]["time"]
+    """
+    profiler = Profile()
+    add_hook(profiler)
+    try:
+        yield profiler
+    finally:
+        remove_hook(profiler)
@@ -0,0 +1,125 @@
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from geco.async_generator import *
+from geco.generator import parallel_generate_n
+from geco.mips.knapsack.yang import yang_instance, yang_params
+from geco.mips.utilities.instance import MIPInstance
+
+_params = functools.partial(yang_params, 5)
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_async_generate_n(ordered):
+    results = asyncio.run(
+        _collect(async_generate_n(_params, 10, seed=0, n_jobs=2, ordered=ordered))
+    )
+    if ordered:
+        assert [i for i, _ in results] == list(range(10))
+    assert sorted(results) == list(parallel_generate_n(_params, 10, seed=0, n_jobs=1))
+
+
+def test_async_generate():
+    async def first(n):
+        instances = []
+        stream = async_generate(_params, n_jobs=2)
+        try:
+            async for instance in stream:
+                instances.append(instance)
+                if len(instances) == n:
+                    return instances
+        finally:
+            await stream.aclose()
+
+    expected = [params for _, params in parallel_generate_n(_params, 5, n_jobs=1)]
+    assert asyncio.run(first(5)) == expected
+
+
+def test_models_converted():
+    build = functools.partial(yang_instance, 5)
+    results = asyncio.run(_collect(async_generate_n(build, 3, n_jobs=2)))
+    for _, instance in results:
+        assert isinstance(instance, MIPInstance)
+        assert instance.nvars == 5
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def _slow_params(seed):
+    time.sleep(0.01)
+    return yang_params(5, seed=seed)
+
+
+def test_bounded_in_flight():
+    async def consume(executor):
+        # the consumer is slower than the workers, so only the bound limits submissions
+        async for i, _ in async_generate_n(
+            _slow_params, 20, executor=executor, max_in_flight=3
+        ):
+            await asyncio.sleep(0.05)
+            assert executor.submitted <= i + 1 + 3
+
+    with _CountingExecutor(max_workers=4) as executor:
+        asyncio.run(consume(executor))
+        assert executor.submitted == 20
+
+
+def test_cancellation():
+    started = threading.Event()
+
+    async def consume(executor):
+        async for _ in async_generate_n(
+            _slow_params, 100, executor=executor, max_in_flight=2
+        ):
+            started.set()
+            await asyncio.sleep(10)
+
+    async def cancel(executor):
+        task = asyncio.create_task(consume(executor))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with _CountingExecutor(max_workers=1) as executor:
+        asyncio.run(cancel(executor))
+        submitted = executor.submitted
+    assert submitted <= 1 + 2
+
+
+def test_event_loop_responsive():
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            await _collect(async_generate_n(_slow_params, 20, executor=executor))
+        task.cancel()
+        return ticks
+
+    # 20 instances taking 10ms each on two workers leave time for several ticks
+    assert asyncio.run(run()) >= 5
@@ -0,0 +1,48 @@
+import pytest
+
+from benchmarks.cases import CASES, SCALES
+from benchmarks.compare import compare
+from benchmarks.imports import measure_import
+from benchmarks.run import TIMINGS, measure, select_cases
+
+
+def test_cases_have_all_scales():
+    for case in CASES.values():
+        assert set(case.sizes) == set(SCALES)
+
+
+@pytest.mark.parametrize("name", ["knapsack/yang", "graphs/pegasus"])
+def test_measure(name):
+    result = measure(name, "small")
+    assert result["params_time"] >= 0
+    assert result["peak_rss_mb"] > 0
+    if CASES[name].build is not None:
+        assert result["nvars"] > 0
+        assert result["nnz"] > 0
+        assert all(timing in result for timing in TIMINGS)
+    else:
+        assert "build_time" not in result
+
+
+def test_select_cases():
+    assert select_cases([]) == list(CASES)
+    assert select_cases(["set_cover/"]) == [
+        "set_cover/yang",
+        "set_cover/sun",
+        "set_cover/gasse",
+    ]
+
+
+def test_compare():
+    base = {"results": {"a:small": {"build_time": 1.0, "params_time": 0.001}}}
+    new = {"results": {"a:small": {"build_time": 1.5, "params_time": 0.005}}}
+    ratios = compare(base, new)
+    assert ratios == {"a:small": {"build_time": 1.5}}
+    errored = {"results": {"a:small": {"error": "timeout"}}}
+    assert compare(base, errored) == {}
+
+
+def test_measure_import():
+    result = measure_import("geco", repeat=1)
+    assert result["import_time"] > 0
+    assert result["n_modules"] > 0
@@ -0,0 +1,131 @@
+import functools
+import multiprocessing
+import os
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from geco.cache import *
+from geco.mips.independent_set.generic import independent_set
+from geco.mips.knapsack.generic import knapsack_sparse
+from geco.mips.set_cover.gasse import gasse_instance, gasse_params
+from geco.mips.tests.test_instance import assert_equivalent
+from geco.mips.utilities.instance import MIPInstance
+
+
+def _sparse_knapsack(n, seed=0):
+    rng = np.random.RandomState(seed)
+    return knapsack_sparse(rng.randint(1, 100, n), rng.randint(1, 100, n), 10 * n)
+
+
+def test_model_cache(tmp_path):
+    cache = InstanceCache(str(tmp_path))
+    cached_gasse_instance = cache(gasse_instance)
+
+    first = cached_gasse_instance(50, 100, 0.05, seed=1)
+    second = cached_gasse_instance(50, 100, 0.05, seed=1)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert_equivalent(second, MIPInstance.from_scip(first))
+    assert second.getProbName() == first.getProbName()
+
+    # same call with positional and default arguments
+    cached_gasse_instance(50, 100, 0.05, 100, 1)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    cached_gasse_instance(50, 100, 0.05, seed=2)
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_instance_and_params_cache(tmp_path):
+    cache = InstanceCache(str(tmp_path))
+    instance = cache.get_or_generate(_sparse_knapsack, 20, seed=3)
+    cached = cache.get_or_generate(_sparse_knapsack, 20, seed=3)
+    assert isinstance(cached, MIPInstance)
+    assert_equivalent(instance.to_scip(), cached)
+
+    params = cache.get_or_generate(gasse_params, 50, 100, 0.05, seed=1)
+    cached_params = cache.get_or_generate(gasse_params, 50, 100, 0.05, seed=1)
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert repr(cached_params) == repr(params)
+
+
+def test_graph_arguments(tmp_path):
+    cache = InstanceCache(str(tmp_path))
+    cache.get_or_generate(independent_set, nx.cycle_graph(5))
+    cache.get_or_generate(independent_set, nx.cycle_graph(5))
+    cache.get_or_generate(independent_set, nx.path_graph(5))
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_not_reproducible_calls_bypass_cache(tmp_path):
+    cache = InstanceCache(str(tmp_path))
+    cache.get_or_generate(gasse_params, 50, 100, 0.05, seed=None)
+    cache.get_or_generate(gasse_params, 50, 100, 0.05, seed=np.random.RandomState(0))
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert cache_key(gasse_params, 50, 100, 0.05, seed=None) is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_partial_functions(tmp_path):
+    cache = InstanceCache(str(tmp_path))
+    partial = functools.partial(gasse_params, 50, 100)
+    cache.get_or_generate(partial, 0.05, seed=1)
+    cache.get_or_generate(gasse_params, 50, 100, 0.05, seed=1)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache_key(partial, 0.05, seed=1) == cache_key(
+        gasse_params, 50, 100, 0.05, seed=1
+    )
+    assert cache_key(functools.partial(partial, seed=None), 0.05) is None
+
+
+def test_lru_eviction(tmp_path):
+    def path(seed):
+        return tmp_path / (cache_key(_sparse_knapsack, 100, seed=seed) + ".npz")
+
+    cache = InstanceCache(str(tmp_path))
+    for seed in range(3):
+        cache.get_or_generate(_sparse_knapsack, 100, seed=seed)
+        os.utime(path(seed), (100 * (seed + 1), 100 * (seed + 1)))
+    entry_size = cache.size() // 3
+
+    # using seed 0 makes seed 1 the least recently used entry
+    cache.get_or_generate(_sparse_knapsack, 100, seed=0)
+    cache.max_size = 3 * entry_size + entry_size // 2
+    cache.get_or_generate(_sparse_knapsack, 100, seed=3)
+    assert cache.size() <= cache.max_size
+    assert [path(seed).exists() for seed in range(4)] == [True, False, True, True]
+
+
+def _fill_cache(directory):
+    cache = InstanceCache(directory)
+    for seed in range(5):
+        cache.get_or_generate(_sparse_knapsack, 50, seed=seed)
+
+
+def test_concurrent_processes(tmp_path):
+    processes = [
+        multiprocessing.Process(target=_fill_cache, args=(str(tmp_path),))
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        cache_key(_sparse_knapsack, 50, seed=seed) + ".npz" for seed in range(5)
+    )
+    cache = InstanceCache(str(tmp_path))
+    for seed in range(5):
+        cache.get_or_generate(_sparse_knapsack, 50, seed=seed)
+    assert (cache.hits, cache.misses) == (5, 0)
+
+
+def test_clear(tmp_path):
+    cache = InstanceCache(str(tmp_path))
+    cache.get_or_generate(_sparse_knapsack, 10)
+    cache.clear()
+    assert cache.size() == 0 and cache.misses == 0
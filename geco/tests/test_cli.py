@@ -0,0 +1,127 @@
+import json
+import os
+
+import pytest
+
+from geco.cli import *
+from geco.mips.set_cover.yang import yang_instance
+
+
+def test_resolve_generator():
+    assert resolve_generator("set_cover.yang_instance") is yang_instance
+    assert resolve_generator("geco.mips.set_cover.yang_instance") is yang_instance
+    assert resolve_generator("geco.mips.set_cover.yang:yang_instance") is yang_instance
+    with pytest.raises(ValueError):
+        resolve_generator("set_cover.not_a_generator")
+    with pytest.raises(ValueError):
+        resolve_generator("yang_instance")
+
+
+def test_parse_param():
+    assert parse_param("m=10") == ("m", [10])
+    assert parse_param("density = 0.05, 0.1") == ("density", [0.05, 0.1])
+    assert parse_param("sizes=[1,2],(3, 4)") == ("sizes", [[1, 2], (3, 4)])
+    assert parse_param("binary=True,name") == ("binary", [True, "name"])
+    with pytest.raises(ValueError):
+        parse_param("m")
+
+
+def test_parse_seeds_and_shard():
+    assert parse_seeds("5") == range(5)
+    assert parse_seeds("10:20") == range(10, 20)
+    assert parse_shard("1/4") == (1, 4)
+    with pytest.raises(ValueError):
+        parse_shard("4/4")
+
+
+def test_shards_partition_tasks():
+    parameter_lists = {"m": [10, 20, 30], "binary": [True, False]}
+    everything = list(generation_tasks(parameter_lists, range(5)))
+    assert len(everything) == 30
+    shards = [
+        list(generation_tasks(parameter_lists, range(5), (i, 4))) for i in range(4)
+    ]
+    assert sorted(map(repr, sum(shards, []))) == sorted(map(repr, everything))
+    assert max(map(len, shards)) - min(map(len, shards)) <= 1
+
+
+def test_generate_shards_and_resume(tmp_path, capsys):
+    arguments = ["generate", "set_cover.yang_instance", "--param", "m=5,10"]
+    arguments += ["--seeds", "0:3", "--output", str(tmp_path), "--jobs", "2"]
+    main(arguments + ["--shard", "0/2"])
+    main(arguments + ["--shard", "1/2"])
+    files = sorted(f for f in os.listdir(tmp_path) if f.endswith(".mps"))
+    assert len(files) == 6
+    assert "yang_instance-m=5-seed=0.mps" in files
+
+    records = []
+    for manifest in ("manifest-0-of-2.jsonl", "manifest-1-of-2.jsonl"):
+        with open(tmp_path / manifest) as file:
+            records += [json.loads(line) for line in file]
+    assert len(records) == 6
+    assert {(r["params"]["m"], r["seed"]) for r in records} == {
+        (m, seed) for m in (5, 10) for seed in range(3)
+    }
+
+    # nothing left to do, except for a deleted instance
+    os.remove(tmp_path / files[0])
+    capsys.readouterr()
+    main(arguments)
+    output = capsys.readouterr()
+    assert output.out.split() == [str(tmp_path / files[0])]
+    assert "wrote 1 instances, 5 already existed" in output.err
+
+
+def test_generate_compressed(tmp_path):
+    records = list(
+        generate(
+            resolve_generator("set_cover.yang_instance"),
+            {"m": [5]},
+            range(2),
+            str(tmp_path),
+            file_format="lp",
+            compress=True,
+            n_jobs=1,
+        )
+    )
+    assert len(records) == 2
+    assert all(record["path"].endswith(".lp.gz") for record in records)
+    assert not [f for f in os.listdir(tmp_path) if f.startswith(".tmp-")]
+
+
+def test_sized_generation_tasks():
+    generating_function = resolve_generator("set_cover.gasse_instance")
+    parameter_lists = {"nrows": [100, 1000, 200], "ncols": [100], "density": [0.05]}
+    tasks = sized_generation_tasks(
+        generating_function,
+        parameter_lists,
+        range(2),
+        size_limits={"max_nnz": 1000},
+        size_order="largest",
+    )
+    assert [(params["nrows"], seed) for params, seed in tasks] == [
+        (200, 0),
+        (200, 1),
+        (100, 0),
+        (100, 1),
+    ]
+    assert len(sized_generation_tasks(generating_function, parameter_lists, [0])) == 3
+
+
+def test_generate_size_limits(tmp_path, capsys):
+    arguments = ["generate", "set_cover.yang_instance", "--param", "m=5,10,200"]
+    arguments += ["--seeds", "2", "--output", str(tmp_path), "--jobs", "1"]
+    main(arguments + ["--max-vars", "100", "--size-order", "smallest"])
+    output = capsys.readouterr()
+    assert [os.path.basename(path) for path in output.out.split()] == [
+        f"yang_instance-m={m}-seed={seed}.mps" for m in (5, 10) for seed in range(2)
+    ]
+    assert "wrote 4 instances, 0 already existed, 2 exceeded the size limits" in (
+        output.err
+    )
+
+    # set cover params have no size estimator
+    arguments = ["generate", "set_cover.gasse_params", "--output", str(tmp_path)]
+    arguments += ["--param", "nrows=10", "--param", "ncols=10", "--param", "density=1"]
+    with pytest.raises(SystemExit):
+        main(arguments + ["--max-nnz", "10"])
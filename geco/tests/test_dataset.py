@@ -0,0 +1,144 @@
+import multiprocessing
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from geco.dataset import *
+from geco.mips.knapsack.generic import knapsack_sparse
+from geco.mips.set_cover.yang import yang_instance
+from geco.mips.tests.test_instance import assert_equivalent
+from geco.mips.utilities.instance import InstanceBuilder, MIPInstance
+from geco.parallel import spawn_seeds
+
+
+def _sparse_knapsack(n, seed=0):
+    rng = np.random.RandomState(seed)
+    return knapsack_sparse(rng.randint(1, 100, n), rng.randint(1, 100, n), 10 * n)
+
+
+def _assert_same(a, b):
+    assert a.name == b.name and a.sense == b.sense
+    assert (a.A != b.A).nnz == 0
+    for attribute in ("c", "senses", "rhs", "lb", "ub", "vtypes"):
+        assert np.array_equal(getattr(a, attribute), getattr(b, attribute))
+    assert a.var_names == b.var_names and a.cons_names == b.cons_names
+
+
+def test_write_read(tmp_path):
+    instances = [_sparse_knapsack(n, seed=n) for n in range(1, 30)]
+    with DatasetWriter(str(tmp_path), shard_size=2000) as writer:
+        for i, instance in enumerate(instances):
+            assert writer.append(instance, metadata={"n": i + 1}) == i
+    assert len([f for f in os.listdir(tmp_path) if f.endswith(".bin")]) > 1
+
+    reader = DatasetReader(str(tmp_path))
+    assert len(reader) == len(instances)
+    assert reader.ids() == list(range(len(instances)))
+    # random access in any order
+    for i in reversed(range(len(instances))):
+        _assert_same(reader[i], instances[i])
+        assert reader.metadata(i) == {"n": i + 1}
+    with pytest.raises(KeyError):
+        reader[len(instances)]
+
+
+def test_arrays_are_views(tmp_path):
+    with DatasetWriter(str(tmp_path)) as writer:
+        writer.append(_sparse_knapsack(10), "a")
+    arrays = DatasetReader(str(tmp_path)).arrays("a")
+    for array in arrays.values():
+        assert not array.flags.writeable
+        assert not array.flags.owndata
+        assert array.ctypes.data % 64 == 0
+
+
+def test_scip_model_and_names(tmp_path):
+    model = yang_instance(10, seed=0)
+    builder = InstanceBuilder("empty")
+    empty = builder.build()
+    with DatasetWriter(str(tmp_path)) as writer:
+        writer.append(model, "model")
+        writer.append(empty, "empty")
+        with pytest.raises(ValueError):
+            writer.append(empty, "empty")
+    reader = DatasetReader(str(tmp_path))
+    assert_equivalent(model, reader["model"])
+    assert reader["model"].var_names is not None
+    assert reader["empty"].nvars == reader["empty"].ncons == 0
+
+
+def test_interrupted_writer(tmp_path):
+    with DatasetWriter(str(tmp_path)) as writer:
+        writer.append(_sparse_knapsack(5))
+        writer.append(_sparse_knapsack(6))
+    # simulate an index line cut off by a crash
+    index_path = tmp_path / "shard-00000.index.jsonl"
+    lines = index_path.read_text().splitlines()
+    index_path.write_text(lines[0] + "\n" + lines[1][:20])
+
+    with DatasetWriter(str(tmp_path)) as writer:
+        assert 0 in writer and 1 not in writer
+        writer.append(_sparse_knapsack(7), 1)
+    reader = DatasetReader(str(tmp_path))
+    assert len(reader) == 2
+    assert reader[1].nvars == 7
+
+
+def test_write_dataset(tmp_path):
+    records = dict(
+        write_dataset(yang_instance, 4, str(tmp_path), seed=3, params={"m": 5})
+    )
+    assert sorted(records) == [0, 1, 2, 3]
+    seeds = spawn_seeds(3, 4)
+    reader = DatasetReader(str(tmp_path))
+    for i in range(4):
+        assert reader.metadata(i) == {"params": {"m": 5}, "seed": seeds[i]}
+        assert_equivalent(yang_instance(5, seed=seeds[i]), reader[i])
+
+    # resuming only generates the missing instances
+    assert dict(
+        write_dataset(yang_instance, 6, str(tmp_path), seed=3, params={"m": 5})
+    ).keys() == {4, 5}
+    assert len(DatasetReader(str(tmp_path))) == 6
+
+
+def _read_in_worker(reader, instance_id):
+    arrays = reader.arrays(instance_id)
+    return float(arrays["c"].sum()), reader.matrix(instance_id).nnz
+
+
+def test_zero_copy_matrix(tmp_path):
+    instance = _sparse_knapsack(20)
+    with DatasetWriter(str(tmp_path)) as writer:
+        writer.append(instance)
+    reader = DatasetReader(str(tmp_path))
+    arrays = reader.arrays(0)
+    A = reader.matrix(0)
+    for name in ("data", "indices", "indptr"):
+        assert np.shares_memory(getattr(A, name), arrays[name])
+    loaded = reader.instance(0)
+    for name in ("c", "lb", "ub", "rhs"):
+        assert np.shares_memory(getattr(loaded, name), arrays[name])
+    assert np.shares_memory(loaded.A.data, arrays["data"])
+    assert (A != instance.A).nnz == 0
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_reader_in_worker_processes(tmp_path, start_method):
+    instances = [_sparse_knapsack(n, seed=n) for n in range(1, 9)]
+    with DatasetWriter(str(tmp_path), shard_size=1000) as writer:
+        for instance in instances:
+            writer.append(instance)
+    reader = DatasetReader(str(tmp_path))
+    reader.arrays(0)
+    # only the index is pickled, not the mapped shards
+    assert pickle.loads(pickle.dumps(reader))._buffers == {}
+
+    context = multiprocessing.get_context(start_method)
+    with context.Pool(2) as pool:
+        results = pool.starmap(_read_in_worker, [(reader, i) for i in reader.ids()])
+    assert results == [(float(i.c.sum()), i.nnz) for i in instances]
+    reader.close()
+    assert reader[3].nvars == 4
@@ -1,9 +1,16 @@
+import functools
 import itertools
+import json
+import os
 
+import numpy as np
 import pytest
 
 from geco.generator import *
 from geco.mips.facility_location.cornuejols import cornuejols_instance
+from geco.mips.knapsack.generic import knapsack_sparse
+from geco.mips.knapsack.yang import yang_instance, yang_params
+from geco.parallel import spawn_seeds
 from geco.mips.set_cover.generic import *
 from geco.mips.set_cover.sun import *
 
@@ -45,3 +52,157 @@ def test_common_substructure_generator_set_cover(n, m, seed):
         assert model.getNVars() == n + 10
         assert model.getNConss() == m
         assert model.getObjectiveSense() == "minimize"
+
+
+@pytest.mark.parametrize("fast", [False, True])
+@pytest.mark.parametrize("n,m,seed", [(10, 10, 0), (100, 20, 1337), (200, 50, 1)])
+def test_incremental_substructure_generator_set_cover(n, m, seed, fast):
+    backbone = sun_params(n, m, seed=0)
+    reuse = {}
+    incremental = incremental_substructure_generator(
+        instance_generation_function=set_cover_sparse,
+        backbone=backbone,
+        expand_instance_function=lambda builder, backbone, seed: expand_sun_instance(
+            builder, (n + 10, m), backbone, seed=seed, fast=fast
+        ),
+        seed=seed,
+        reuse=reuse,
+    )
+    rebuilt = common_substructure_generator(
+        instance_generation_function=set_cover_sparse,
+        backbone=backbone,
+        expand_params_function=lambda backbone, seed: expand_sun_params(
+            (n + 10, m), backbone, seed=seed, fast=fast
+        ),
+        seed=seed,
+    )
+    for instance, expected in itertools.islice(zip(incremental, rebuilt), 5):
+        assert instance.nvars == n + 10
+        assert instance.ncons == m
+        assert instance.sense == "minimize"
+        assert instance.var_names == expected.var_names
+        assert np.array_equal(instance.c, expected.c)
+        assert (instance.A != expected.A).nnz == 0
+
+    assert reuse["instances"] == 5
+    assert reuse["reused_vars"] == 5 * n and reuse["added_vars"] == 50
+    assert reuse["reused_conss"] == 5 * m and reuse["added_conss"] == 0
+    assert reuse["reused_nnz"] == 5 * sum(len(s) for s in backbone[1])
+    assert reuse["added_nnz"] > 0
+
+
+def test_common_substructure_generator_keeps_backbone():
+    backbone = sun_params(20, 10, seed=0)
+    sets = [set(s) for s in backbone[1]]
+    gen = common_substructure_generator(
+        instance_generation_function=set_cover_sparse,
+        backbone=backbone,
+        expand_params_function=lambda backbone, seed: expand_sun_params(
+            (30, 10), backbone, seed=seed
+        ),
+        seed=0,
+    )
+    # expansions used to add their elements to the shared base sets
+    for _ in itertools.islice(gen, 3):
+        assert backbone[1] == sets
+
+
+@pytest.mark.parametrize("n_jobs,ordered", [(1, True), (2, True), (3, False)])
+def test_parallel_generate_n(n_jobs, ordered):
+    n = 20
+    generating_function = functools.partial(yang_params, 10)
+    gen = parallel_generate_n(
+        generating_function, n=n, seed=42, n_jobs=n_jobs, ordered=ordered
+    )
+    results = dict(gen)
+    assert sorted(results) == list(range(n))
+
+    serial = dict(parallel_generate_n(generating_function, n=n, seed=42, n_jobs=1))
+    assert results == serial
+    for params1, params2 in itertools.combinations(results.values(), 2):
+        assert params1 != params2
+
+
+def test_parallel_generate_n_order():
+    gen = parallel_generate_n(
+        functools.partial(yang_params, 5), n=10, seed=0, n_jobs=2, ordered=True
+    )
+    assert [i for i, _ in gen] == list(range(10))
+
+
+@pytest.mark.parametrize(
+    "file_format,compress,n_jobs", [("mps", False, 1), ("lp", True, 2)]
+)
+def test_write_n(tmp_path, file_format, compress, n_jobs):
+    n = 6
+    records = dict(
+        write_n(
+            yang_instance,
+            n=n,
+            directory=str(tmp_path),
+            seed=3,
+            params={"n": 15},
+            file_format=file_format,
+            compress=compress,
+            n_jobs=n_jobs,
+        )
+    )
+    assert sorted(records) == list(range(n))
+
+    with open(tmp_path / "manifest.jsonl") as manifest:
+        manifest_records = [json.loads(line) for line in manifest]
+    assert len(manifest_records) == n
+
+    for record in manifest_records:
+        assert record == {
+            "instance_number": record["instance_number"],
+            **records[record["instance_number"]],
+        }
+        assert record["params"] == {"n": 15}
+        assert record["nvars"] == 15
+        assert record["ncons"] == 1
+        assert record["nnz"] == 15
+        assert record["build_time"] >= 0 and record["write_time"] >= 0
+        assert record["path"].endswith(
+            f".{file_format}.gz" if compress else f".{file_format}"
+        )
+        assert os.path.exists(record["path"])
+
+        model = scip.Model()
+        model.readProblem(record["path"])
+        assert model.getNVars() == 15
+        assert model.getNConss() == 1
+        assert model.getObjectiveSense() == "maximize"
+
+
+def test_write_n_seeds_match_parallel_generate_n(tmp_path):
+    records = dict(
+        write_n(yang_instance, 4, str(tmp_path), seed=7, params={"n": 5}, n_jobs=1)
+    )
+    seeds = spawn_seeds(7, 4)
+    assert [records[i]["seed"] for i in range(4)] == seeds
+
+
+def _sparse_knapsack(n, seed):
+    return knapsack_sparse(*yang_params(n, seed=seed))
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_write_n_sparse(tmp_path, compress):
+    records = dict(
+        write_n(
+            _sparse_knapsack,
+            3,
+            str(tmp_path),
+            seed=5,
+            params={"n": 15},
+            compress=compress,
+            n_jobs=2,
+        )
+    )
+    for record in records.values():
+        assert (record["nvars"], record["ncons"], record["nnz"]) == (15, 1, 15)
+        model = scip.Model()
+        model.readProblem(record["path"])
+        assert model.getNVars() == 15
+        assert model.getObjectiveSense() == "maximize"
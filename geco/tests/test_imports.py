@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+import pytest
+
+_heavy = ["pyscipopt", "networkx", "scipy.sparse", "pandas", "dwave_networkx"]
+
+
+def _loaded_after(statement):
+    code = (
+        f"import sys\n{statement}\n"
+        f"print(' '.join(m for m in {_heavy!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+def test_import_geco_is_lazy():
+    assert _loaded_after("import geco") == set()
+    assert _loaded_after("import geco.graphs") == set()
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ["import geco.mips.knapsack", "from geco.mips.set_cover import gasse_instance"],
+)
+def test_import_family(statement):
+    assert _loaded_after(statement) == {"pyscipopt", "networkx"}
+
+
+def test_attribute_access():
+    import geco
+
+    assert geco.mips.set_cover.gasse_instance is geco.set_cover.gasse_instance
+    assert geco.knapsack.yang_instance(5, seed=0).getNVars() == 5
+    assert geco.MIPInstance is geco.mips.utilities.instance.MIPInstance
+    assert "set_cover" in dir(geco.mips)
+    with pytest.raises(AttributeError):
+        geco.mips.not_a_family
+
+
+def test_star_import():
+    namespace = {}
+    exec("from geco.mips import *", namespace)
+    assert "combinatorial_auction" in namespace
+    assert "write_problem" in namespace
+    exec("from geco.graphs import *", namespace)
+    assert "chimera" in namespace
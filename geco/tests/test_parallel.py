@@ -0,0 +1,48 @@
+import operator
+import random
+
+import numpy as np
+import pytest
+
+from geco.parallel import *
+
+
+def test_spawn_seeds():
+    seeds = spawn_seeds(0, 100)
+    assert len(seeds) == 100
+    assert len(set(seeds)) == 100
+    assert all(0 <= seed < 2**32 for seed in seeds)
+    assert seeds == spawn_seeds(0, 100)
+    assert seeds[:10] == spawn_seeds(0, 10)
+    assert seeds != spawn_seeds(1, 100)
+
+
+@pytest.mark.parametrize(
+    "make_state", [random.Random, np.random.RandomState, np.random.default_rng]
+)
+def test_spawn_seeds_random_state(make_state):
+    seeds = spawn_seeds(make_state(0), 10)
+    assert len(set(seeds)) == 10
+    assert all(0 <= seed < 2**32 for seed in seeds)
+    assert seeds == spawn_seeds(make_state(0), 10)
+    assert seeds != spawn_seeds(make_state(1), 10)
+
+
+@pytest.mark.parametrize(
+    "n_jobs,ordered,chunksize", [(1, True, 1), (2, True, 3), (2, False, 1)]
+)
+def test_pool_map(n_jobs, ordered, chunksize):
+    args = [(i, i) for i in range(25)]
+    results = list(
+        pool_map(
+            operator.mul,
+            iter(args),
+            n_jobs=n_jobs,
+            ordered=ordered,
+            chunksize=chunksize,
+            max_in_flight=2,
+        )
+    )
+    if ordered:
+        assert [i for i, _ in results] == list(range(25))
+    assert sorted(results) == [(i, i * i) for i in range(25)]
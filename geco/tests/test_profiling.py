@@ -0,0 +1,85 @@
+import os
+import tempfile
+
+import pytest
+
+import geco.mips.max_cut as max_cut
+import geco.mips.set_cover as set_cover
+from geco.generator import write_instance
+from geco.mips.utilities.writing import write_problem
+from geco.profiling import *
+
+
+def test_profile_stages():
+    with profile() as p:
+        model = set_cover.yang_instance(20, seed=0)
+    counters = p.counters()
+    for name in ("instance", "params", "build"):
+        assert counters[name]["calls"] == 1
+        assert counters[name]["time"] > 0
+    assert counters["write"]["calls"] == 0
+    assert counters["n_vars"] == model.getNVars()
+    assert counters["n_conss"] == model.getNConss()
+
+    instance, params, build = sorted(p.records, key=lambda record: record.start)
+    assert instance.function == "geco.mips.set_cover.yang.yang_instance"
+    assert params.stage == "params" and build.stage == "build"
+    assert instance.start <= params.start <= params.end <= build.start
+    assert build.end <= instance.end
+
+
+def test_profile_sparse_and_write():
+    with profile() as p, tempfile.TemporaryDirectory() as directory:
+        instance = set_cover.set_cover_sparse(*set_cover.yang_params(20, seed=0))
+        write_problem(instance, os.path.join(directory, "instance.mps"))
+    counters = p.counters()
+    assert counters["write"]["calls"] == 1
+    assert counters["n_vars"] == instance.nvars
+    assert counters["n_conss"] == instance.ncons
+
+
+def test_write_instance_profiled():
+    with profile() as p, tempfile.TemporaryDirectory() as directory:
+        write_instance(
+            set_cover.yang_instance, {"m": 10}, 0, os.path.join(directory, "a.lp.gz")
+        )
+    assert p.counters()["write"]["calls"] == 1
+    assert p.counters()["instance"]["calls"] == 1
+
+
+def test_model_in_tuple():
+    with profile() as p:
+        model = max_cut.tang_instance(10, 20, seed=0)
+    assert p.counters()["n_vars"] == model.getNVars()
+
+
+def test_nested_calls_counted_once():
+    with profile() as p:
+        set_cover.yang_instance(10, seed=0)
+        set_cover.yang_instance(10, seed=1)
+    assert p.counters()["instance"]["calls"] == 2
+    by_function = p.by_function()
+    assert by_function["geco.mips.set_cover.yang.yang_params"]["calls"] == 2
+
+
+def test_hooks():
+    records = []
+    add_hook(records.append)
+    try:
+        set_cover.yang_params(10, seed=0)
+    finally:
+        remove_hook(records.append)
+    set_cover.yang_params(10, seed=0)
+    assert [record.stage for record in records] == ["params"]
+
+
+def test_disabled_by_default():
+    with profile() as p:
+        pass
+    set_cover.yang_instance(10, seed=0)
+    assert p.records == []
+
+
+def test_unknown_stage():
+    with pytest.raises(AssertionError):
+        stage("unknown")
@@ -12,7 +12,17 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/CharJon/GeCO",
     license="MIT License",
-    packages=find_packages(exclude=("tests", "docs", "data", "notebooks", "examples")),
+    packages=find_packages(
+        exclude=(
+            "tests",
+            "docs",
+            "data",
+            "notebooks",
+            "examples",
+            "benchmarks",
+            "benchmarks.*",
+        )
+    ),
     install_requires=[
         "pyscipopt",
         "networkx",
@@ -21,4 +31,5 @@ setup(
         "pandas",
         "dwave_networkx",
     ],
+    entry_points={"console_scripts": ["geco=geco.cli:main"]},
 )